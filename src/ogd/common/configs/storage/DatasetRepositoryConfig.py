@@ -26,6 +26,7 @@ class DatasetRepositoryConfig(DataStoreConfig):
     {
         "files_base" : "path/to/folder/"
         "templates_base" : "URL/to/templates/"
+        "OGD_REVISION" : "1234567",
         "datasets" : {
             "GAME_NAME" : {
                 "DATASET_START_to_END" : { ... },
@@ -36,6 +37,9 @@ class DatasetRepositoryConfig(DataStoreConfig):
         }
     }
     ```
+
+    The optional "OGD_REVISION" element gives the revision to record for datasets exported to the repository,
+    for deployments that can't look it up from git.
     """
 
     # *** BUILT-INS & PROPERTIES ***
@@ -47,6 +51,7 @@ class DatasetRepositoryConfig(DataStoreConfig):
                  # params for class
                  indexing:Optional[RepositoryIndexingConfig | Map | Path | str],
                  datasets:Optional[Dict[str, DatasetCollectionSchema]],
+                 ogd_revision:Optional[str]=None,
                  # dict of leftovers
                  other_elements:Optional[Map]=None
         ):
@@ -54,6 +59,7 @@ class DatasetRepositoryConfig(DataStoreConfig):
 
         self._indexing : RepositoryIndexingConfig           = self._toIndexingConfig(indexing=indexing, fallbacks=fallbacks, schema_name=name)
         self._datasets : Dict[str, DatasetCollectionSchema] = datasets if datasets is not None else self._parseDatasets(unparsed_elements=fallbacks, schema_name=name)
+        self._ogd_revision : Optional[str]                  = ogd_revision if ogd_revision is not None else self._parseOGDRevision(unparsed_elements=fallbacks, schema_name=name)
         super().__init__(name=name, store_type="Repository", other_elements=other_elements)
 
     def __str__(self) -> str:
@@ -91,6 +97,15 @@ class DatasetRepositoryConfig(DataStoreConfig):
     def Games(self) -> Dict[str, DatasetCollectionSchema]:
         return self._datasets
 
+    @property
+    def OGDRevision(self) -> Optional[str]:
+        """The revision to record for datasets exported to the repository, in place of the one looked up by `RevisionProvider`.
+
+        :return: The configured revision, or None if the revision should be looked up as usual.
+        :rtype: Optional[str]
+        """
+        return self._ogd_revision
+
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
     @property
@@ -123,7 +138,7 @@ class DatasetRepositoryConfig(DataStoreConfig):
         :return: _description_
         :rtype: DatasetRepositoryConfig
         """
-        return DatasetRepositoryConfig(name=name, indexing=None, datasets=None, other_elements=unparsed_elements)
+        return DatasetRepositoryConfig(name=name, indexing=None, datasets=None, ogd_revision=None, other_elements=unparsed_elements)
 
     # *** PUBLIC STATICS ***
 
@@ -169,6 +184,18 @@ class DatasetRepositoryConfig(DataStoreConfig):
 
         return ret_val
 
+    @staticmethod
+    def _parseOGDRevision(unparsed_elements:Map, schema_name:Optional[str]=None) -> Optional[str]:
+        return DatasetRepositoryConfig.ParseElement(
+            unparsed_elements=unparsed_elements,
+            valid_keys=["OGD_REVISION"],
+            to_type=str,
+            default_value=None,
+            remove_target=True,
+            optional_element=True,
+            schema_name=schema_name
+        )
+
     @staticmethod
     def _parseDatasets(unparsed_elements:Map, schema_name:Optional[str]=None) -> Dict[str, DatasetCollectionSchema]:
         ret_val : Dict[str, DatasetCollectionSchema]
@@ -19,6 +19,7 @@ class FileStoreConfig(DataStoreConfig):
         other_elements=None
     )
     _DEFAULT_CREDENTIAL: Final[EmptyCredential] = EmptyCredential.Default()
+    _DEFAULT_COMPRESSION_LEVEL: Final[int] = 6
 
     # *** BUILT-INS & PROPERTIES ***
 
@@ -26,6 +27,7 @@ class FileStoreConfig(DataStoreConfig):
                  # params for class
                  location:Optional[FileLocationSchema | Path | str],
                  file_credential:Optional[FileCredential],
+                 compression_level:Optional[int]=None,
                  # dict of leftovers
                  other_elements:Optional[Map]=None
         ):
@@ -33,7 +35,7 @@ class FileStoreConfig(DataStoreConfig):
         
         If optional params are not given, data is searched for in `other_elements`.
 
-        In the format below, `FILE_CREDENTIAL` is optional.
+        In the format below, `FILE_CREDENTIAL` and `COMPRESSION_LEVEL` are optional.
 
         Expected format:
 
@@ -44,7 +46,8 @@ class FileStoreConfig(DataStoreConfig):
             "FILE_CREDENTIAL" : {
                 "USER" : "username",
                 "PASS" : "password"
-            }
+            },
+            "COMPRESSION_LEVEL" : 6
         }
         ```
 
@@ -54,6 +57,8 @@ class FileStoreConfig(DataStoreConfig):
         :type location: FileLocationSchema
         :param file_credential: _description_
         :type file_credential: FileCredential
+        :param compression_level: The zlib compression level, from 0 (none) to 9 (smallest), used when the file is zipped. Defaults to None, in which case a level of 6 is used.
+        :type compression_level: Optional[int], optional
         :param other_elements: _description_, defaults to None
         :type other_elements: Optional[Map], optional
         """
@@ -61,6 +66,7 @@ class FileStoreConfig(DataStoreConfig):
 
         self._location    : FileLocationSchema = self._toLocation(location=location, fallbacks=fallbacks, schema_name=f"{name}Location")
         self._credential  : FileCredential     = file_credential if file_credential is not None else self._parseCredential(unparsed_elements=fallbacks, schema_name=name)
+        self._compression_level : int          = compression_level if compression_level is not None else self._parseCompressionLevel(unparsed_elements=fallbacks, schema_name=name)
         super().__init__(name=name, store_type=self._STORE_TYPE, other_elements=fallbacks)
 
     @property
@@ -102,6 +108,15 @@ class FileStoreConfig(DataStoreConfig):
     def Credential(self) -> PasswordCredential | EmptyCredential:
         return self._credential
 
+    @property
+    def CompressionLevel(self) -> int:
+        """The zlib compression level to use when zipping the file, from 0 (no compression) to 9 (smallest output).
+
+        :return: The compression level for the file.
+        :rtype: int
+        """
+        return self._compression_level
+
     @property
     def AsMarkdown(self) -> str:
         ret_val : str
@@ -181,4 +196,18 @@ class FileStoreConfig(DataStoreConfig):
             ret_val = FileStoreConfig._DEFAULT_CREDENTIAL
         return ret_val
 
+    @staticmethod
+    def _parseCompressionLevel(unparsed_elements:Map, schema_name:Optional[str]=None) -> int:
+        ret_val : int = FileStoreConfig.ParseElement(
+            unparsed_elements=unparsed_elements,
+            valid_keys=["COMPRESSION_LEVEL"],
+            to_type=int,
+            default_value=FileStoreConfig._DEFAULT_COMPRESSION_LEVEL,
+            remove_target=True,
+            optional_element=True,
+            schema_name=schema_name
+        )
+        # zlib only accepts levels 0-9, so clamp anything else into range.
+        return min(max(ret_val, 0), 9)
+
     # *** PRIVATE METHODS ***
@@ -16,6 +16,9 @@ class GameData(abc.ABC):
     TODO : Consider whether to inherit from Schema. Would at least be good to have FromDict as a required function
     """
 
+    # GameData and its subclasses declare slots rather than a per-instance dict, since we often hold millions of them at once.
+    __slots__ = ("app_id", "user_id", "session_id")
+
     @staticmethod
     @abc.abstractmethod
     def ColumnNames() -> List[str]:
@@ -1,7 +1,7 @@
 # standard libraries
-import json
 from typing import List, Optional
 # OGD imports
+from ogd.common.utils.JSONCodec import JSONCodec
 from ogd.common.utils.typing import Map
 # local imports
 from coding.Coder import Coder
@@ -88,7 +88,7 @@ class Code:
 
     @property
     def JSON(self) -> str:
-        return json.dumps({
+        return JSONCodec.Dumps({
             "code_word":self.CodeWord,
             "id":self.ID,
             "coder":self.Coder,
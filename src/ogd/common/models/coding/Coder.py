@@ -1,5 +1,6 @@
-import json
 from typing import Any, Dict, Optional
+# OGD imports
+from ogd.common.utils.JSONCodec import JSONCodec
 
 class Coder:
 
@@ -36,7 +37,7 @@ class Coder:
 
     @property
     def JSON(self) -> str:
-        return json.dumps({
+        return JSONCodec.Dumps({
             "name":self.Name,
             "id":self.ID
         })
@@ -0,0 +1,419 @@
+## import standard libraries
+from array import array
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, Dict, Final, Hashable, Iterable, Iterator, List, Optional, Self
+# 3rd-party imports
+import numpy as np
+# import local files
+from ogd.common.filters.Filter import Filter
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.collections import *
+from ogd.common.models.events.Event import Event, EventSource
+from ogd.common.models.events.EventSet import EventSet
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.utils.JSONCodec import JSONCodec
+from ogd.common.utils.typing import ExportRow, LazyJSON, Map
+
+_EPOCH       : Final[datetime]  = datetime(1970, 1, 1)
+_EPOCH_UTC   : Final[datetime]  = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND : Final[timedelta] = timedelta(microseconds=1)
+_NULL_INT    : Final[int]       = np.iinfo(np.int64).min
+
+class DictionaryColumn:
+    """Column of values stored as an array of integer codes, each indexing into a list of the distinct values in the column.
+
+    Meant for columns with relatively few distinct values, such as session IDs or event names,
+    where each row then costs only the size of a code rather than the size of the full value.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, values:List[Any], codes:np.ndarray):
+        self._values : List[Any]  = values
+        self._codes  : np.ndarray = codes
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, index:int) -> Any:
+        return self._values[self._codes[index]]
+
+    @property
+    def Values(self) -> List[Any]:
+        """The list of distinct values in the column, in order of first appearance.
+
+        :return: The distinct values in the column.
+        :rtype: List[Any]
+        """
+        return self._values
+
+    @property
+    def Codes(self) -> np.ndarray:
+        """The array of codes for each row of the column, where each code is the index of the row's value in `Values`.
+
+        :return: The array of codes for the column.
+        :rtype: np.ndarray
+        """
+        return self._codes
+
+    # *** PUBLIC METHODS ***
+
+    def Mask(self, values:Iterable[Any]) -> np.ndarray:
+        """Get a boolean mask of which rows in the column have one of the given values.
+
+        :param values: The values to be matched.
+        :type values: Iterable[Any]
+        :return: An array with True for each row whose value was among the given values, and False otherwise.
+        :rtype: np.ndarray
+        """
+        _wanted = set(values)
+        _matched_codes = [code for code, value in enumerate(self._values) if value in _wanted]
+        return np.isin(self._codes, _matched_codes)
+
+    def Take(self, mask:np.ndarray) -> "DictionaryColumn":
+        """Get a new column with just the rows selected by the given mask.
+
+        The list of distinct values is shared with the new column, rather than copied.
+
+        :param mask: A boolean mask, or array of indices, for the rows to take.
+        :type mask: np.ndarray
+        :return: A column with just the selected rows.
+        :rtype: DictionaryColumn
+        """
+        return DictionaryColumn(values=self._values, codes=self._codes[mask])
+
+class _DictionaryColumnBuilder:
+    def __init__(self, key:Optional[Callable[[Any], Hashable]]=None):
+        self._key    : Optional[Callable[[Any], Hashable]] = key
+        self._lookup : Dict[Hashable, int] = {}
+        self._values : List[Any] = []
+        self._codes  : array     = array('i')
+
+    def Append(self, value:Any) -> None:
+        _key = self._key(value) if self._key else value
+        code = self._lookup.get(_key)
+        if code is None:
+            code = len(self._values)
+            self._lookup[_key] = code
+            self._values.append(value)
+        self._codes.append(code)
+
+    def Build(self) -> DictionaryColumn:
+        return DictionaryColumn(values=self._values, codes=np.array(self._codes, dtype=np.int32))
+
+class ColumnarEventSet:
+    """Alternative to `EventSet`, which stores the events column-by-column in typed arrays, rather than as a list of `Event` objects.
+
+    Session IDs, event names, versions, and other columns with few distinct values are dictionary-encoded,
+    timestamps and sequence indices are stored as int64 arrays,
+    and the event data, game state, and user data are stored as JSON text, only decoded back to a dict when an event is accessed.
+    This takes a small fraction of the memory of an equivalent `EventSet`.
+    Payloads given as `LazyJSON` are stored from their original text, without being parsed,
+    and any payload values that are not JSON types are stored as their strings.
+
+    Events are rebuilt as `Event` objects on access, so the set supports the same iteration and `EventLines` functions as `EventSet`.
+    Changes made to an `Event` taken from the set are not reflected in the set.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, columns:Dict[str, DictionaryColumn | np.ndarray], filters:DatasetFilterCollection) -> None:
+        """Constructor for a ColumnarEventSet.
+
+        Generally, `FromEvents` or `FromEventSet` should be used instead, to build the columns from a collection of events.
+
+        :param columns: Mapping of Event element names to the column data for the element.
+        :type columns: Dict[str, DictionaryColumn | np.ndarray]
+        :param filters: The filters used to define the dataset.
+        :type filters: DatasetFilterCollection
+        """
+        self._app_ids        : DictionaryColumn = columns["app_id"]
+        self._user_ids       : DictionaryColumn = columns["user_id"]
+        self._session_ids    : DictionaryColumn = columns["session_id"]
+        self._app_versions   : DictionaryColumn = columns["app_version"]
+        self._app_branches   : DictionaryColumn = columns["app_branch"]
+        self._log_versions   : DictionaryColumn = columns["log_version"]
+        self._timestamps     : np.ndarray       = columns["timestamp"]
+        self._timestamp_tzs  : DictionaryColumn = columns["timestamp_tz"]
+        self._time_offsets   : DictionaryColumn = columns["time_offset"]
+        self._indices        : np.ndarray       = columns["event_sequence_index"]
+        self._event_names    : DictionaryColumn = columns["event_name"]
+        self._event_sources  : np.ndarray       = columns["event_source"]
+        self._event_data     : np.ndarray       = columns["event_data"]
+        self._game_states    : DictionaryColumn = columns["game_state"]
+        self._user_data      : DictionaryColumn = columns["user_data"]
+        self._filters        : DatasetFilterCollection = filters
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def __iter__(self) -> Iterator[Event]:
+        for i in range(len(self)):
+            yield self._eventAt(i)
+
+    def __getitem__(self, key:int | str) -> Event:
+        ret_val : Event
+
+        if isinstance(key, int):
+            ret_val = self._eventAt(key if key >= 0 else len(self) + key)
+        elif isinstance(key, str):
+            _matches = np.flatnonzero(self._event_names.Mask([key]))
+            if len(_matches) == 0:
+                raise IndexError(f"No event named {key} in the ColumnarEventSet")
+            ret_val = self._eventAt(int(_matches[0]))
+
+        return ret_val
+
+    @property
+    def Events(self) -> List[Event]:
+        return list(self)
+
+    @property
+    def GameEvents(self) -> List[Event]:
+        return [self._eventAt(int(i)) for i in np.flatnonzero(self._event_sources == EventSource.GAME.value)]
+
+    def EventLines(self, schema:Optional[EventTableSchema]) -> List[ExportRow]:
+        return [event.ToRow(schema=schema) if schema is not None else event.ColumnValues for event in self]
+    def GameEventLines(self, schema:Optional[EventTableSchema]) -> List[ExportRow]:
+        return [event.ToRow(schema=schema) if schema is not None else event.ColumnValues for event in self.GameEvents]
+
+    @property
+    def Filters(self) -> DatasetFilterCollection:
+        return self._filters
+
+    @property
+    def EventsHeader(self) -> List[str]:
+        return Event.ColumnNames()
+
+    @property
+    def AsMarkdown(self):
+        _filters_clause = "* ".join([f"{key} : {val}" for key,val in self.Filters.AsDict.items()])
+        return f"## Event Dataset\n\n{_filters_clause}"
+
+    @property
+    def SessionIDs(self) -> List[str]:
+        """The distinct session IDs with events in the set.
+
+        :return: The list of session IDs.
+        :rtype: List[str]
+        """
+        return [self._session_ids.Values[code] for code in np.unique(self._session_ids.Codes)]
+
+    @property
+    def EventNames(self) -> List[str]:
+        """The distinct event names in the set.
+
+        :return: The list of event names.
+        :rtype: List[str]
+        """
+        return [self._event_names.Values[code] for code in np.unique(self._event_names.Codes)]
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def FromEvents(cls, events:Iterable[Event], filters:DatasetFilterCollection) -> "ColumnarEventSet":
+        """Build a ColumnarEventSet from a collection of events.
+
+        The events are consumed one at a time, so `events` may be a generator,
+        such as the events from each batch of `Interface.GetEventStream`, without ever holding all `Event` objects in memory at once.
+
+        :param events: The events to be stored in the set.
+        :type events: Iterable[Event]
+        :param filters: The filters used to define the dataset.
+        :type filters: DatasetFilterCollection
+        :return: A ColumnarEventSet containing the given events, in order.
+        :rtype: ColumnarEventSet
+        """
+        _version_key = lambda ver : (type(ver), str(ver))
+
+        app_ids       = _DictionaryColumnBuilder()
+        user_ids      = _DictionaryColumnBuilder()
+        session_ids   = _DictionaryColumnBuilder()
+        app_versions  = _DictionaryColumnBuilder(key=_version_key)
+        app_branches  = _DictionaryColumnBuilder()
+        log_versions  = _DictionaryColumnBuilder(key=_version_key)
+        timestamps    = array('q')
+        timestamp_tzs = _DictionaryColumnBuilder()
+        time_offsets  = _DictionaryColumnBuilder()
+        indices       = array('q')
+        event_names   = _DictionaryColumnBuilder()
+        event_sources = array('b')
+        event_data    : List[str] = []
+        game_states   = _DictionaryColumnBuilder()
+        user_data     = _DictionaryColumnBuilder()
+
+        for event in events:
+            app_ids.Append(event.app_id)
+            user_ids.Append(event.user_id)
+            session_ids.Append(event.session_id)
+            app_versions.Append(event.app_version)
+            app_branches.Append(event.app_branch)
+            log_versions.Append(event.log_version)
+            timestamps.append(cls._encodeTimestamp(event.timestamp))
+            timestamp_tzs.Append(event.timestamp.tzinfo if event.timestamp is not None else None)
+            time_offsets.Append(event.time_offset)
+            indices.append(event.event_sequence_index if event.event_sequence_index is not None else _NULL_INT)
+            event_names.Append(event.event_name)
+            event_sources.append(int(event.event_source))
+            event_data.append(cls._encodePayload(event.event_data))
+            game_states.Append(cls._encodePayload(event.game_state))
+            user_data.Append(cls._encodePayload(event.user_data))
+
+        _event_data = np.empty(len(event_data), dtype=object)
+        _event_data[:] = event_data
+        return ColumnarEventSet(
+            columns={
+                "app_id"               : app_ids.Build(),
+                "user_id"              : user_ids.Build(),
+                "session_id"           : session_ids.Build(),
+                "app_version"          : app_versions.Build(),
+                "app_branch"           : app_branches.Build(),
+                "log_version"          : log_versions.Build(),
+                "timestamp"            : np.array(timestamps, dtype=np.int64),
+                "timestamp_tz"         : timestamp_tzs.Build(),
+                "time_offset"          : time_offsets.Build(),
+                "event_sequence_index" : np.array(indices, dtype=np.int64),
+                "event_name"           : event_names.Build(),
+                "event_source"         : np.array(event_sources, dtype=np.int8),
+                "event_data"           : _event_data,
+                "game_state"           : game_states.Build(),
+                "user_data"            : user_data.Build(),
+            },
+            filters=filters
+        )
+
+    @classmethod
+    def FromEventSet(cls, event_set:EventSet) -> "ColumnarEventSet":
+        """Build a ColumnarEventSet with the same events and filters as an EventSet.
+
+        :param event_set: The EventSet to be converted.
+        :type event_set: EventSet
+        :return: A ColumnarEventSet containing the events of the given EventSet, in order.
+        :rtype: ColumnarEventSet
+        """
+        return cls.FromEvents(events=event_set.Events, filters=event_set.Filters)
+
+    # *** PUBLIC METHODS ***
+
+    def Filter(self, filters:DatasetFilterCollection) -> Self:
+        """Get a subset of the events, based on session IDs, event names, and time range.
+
+        Each filter is applied to the whole column at once, so this is much faster than checking each event in turn.
+        Any other filters in the collection are ignored.
+        The returned set shares the distinct values of each dictionary-encoded column with this set, and has the same `Filters`.
+
+        :param filters: A collection of filters, whose `Sessions`, `EventNames`, and `Timestamps` filters are applied to the events.
+        :type filters: DatasetFilterCollection
+        :return: A new ColumnarEventSet, with only the events that passed all filters.
+        :rtype: ColumnarEventSet
+        """
+        mask = np.ones(len(self), dtype=bool)
+        mask &= self._setMask(column=self._session_ids, set_filter=filters.IDFilters.Sessions)
+        mask &= self._setMask(column=self._event_names, set_filter=filters.Events.EventNames)
+        mask &= self._timestampMask(time_filter=filters.Sequences.Timestamps)
+        return self._take(mask)
+
+    def ToEventSet(self) -> EventSet:
+        """Convert the set back to a regular EventSet, with a full `Event` object for each event.
+
+        :return: An EventSet with the same events and filters as this set.
+        :rtype: EventSet
+        """
+        return EventSet(events=self.Events, filters=self.Filters)
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _encodeTimestamp(timestamp:Optional[datetime]) -> int:
+        if timestamp is None:
+            return _NULL_INT
+        elif timestamp.tzinfo is None:
+            return (timestamp - _EPOCH) // _MICROSECOND
+        else:
+            return (timestamp - _EPOCH_UTC) // _MICROSECOND
+
+    @staticmethod
+    def _decodeTimestamp(microseconds:int, tz:Optional[tzinfo]) -> Optional[datetime]:
+        if microseconds == _NULL_INT:
+            return None
+        elif tz is None:
+            return _EPOCH + timedelta(microseconds=microseconds)
+        else:
+            return (_EPOCH_UTC + timedelta(microseconds=microseconds)).astimezone(tz)
+
+    @staticmethod
+    def _encodePayload(payload:Map) -> str:
+        if isinstance(payload, LazyJSON):
+            return payload.JSON
+        return JSONCodec.Dumps(payload, default=str)
+
+    @staticmethod
+    def _setMask(column:DictionaryColumn, set_filter:Filter) -> np.ndarray | bool:
+        ret_val : np.ndarray | bool = True
+
+        if set_filter.Active and set_filter.AsSet is not None:
+            match set_filter.FilterMode:
+                case FilterMode.INCLUDE:
+                    ret_val = column.Mask(set_filter.AsSet)
+                case FilterMode.EXCLUDE:
+                    ret_val = ~column.Mask(set_filter.AsSet)
+                case FilterMode.NOFILTER:
+                    pass
+
+        return ret_val
+
+    # *** PRIVATE METHODS ***
+
+    def _timestampMask(self, time_filter:Filter) -> np.ndarray | bool:
+        ret_val : np.ndarray | bool = True
+
+        if time_filter.Active and (time_filter.Min is not None or time_filter.Max is not None):
+            in_range : np.ndarray = self._timestamps != _NULL_INT
+            if time_filter.Min is not None:
+                in_range &= self._timestamps >= self._encodeTimestamp(time_filter.Min)
+            if time_filter.Max is not None:
+                in_range &= self._timestamps <= self._encodeTimestamp(time_filter.Max)
+            ret_val = ~in_range if time_filter.FilterMode == FilterMode.EXCLUDE else in_range
+
+        return ret_val
+
+    def _take(self, mask:np.ndarray) -> Self:
+        return ColumnarEventSet(
+            columns={
+                "app_id"               : self._app_ids.Take(mask),
+                "user_id"              : self._user_ids.Take(mask),
+                "session_id"           : self._session_ids.Take(mask),
+                "app_version"          : self._app_versions.Take(mask),
+                "app_branch"           : self._app_branches.Take(mask),
+                "log_version"          : self._log_versions.Take(mask),
+                "timestamp"            : self._timestamps[mask],
+                "timestamp_tz"         : self._timestamp_tzs.Take(mask),
+                "time_offset"          : self._time_offsets.Take(mask),
+                "event_sequence_index" : self._indices[mask],
+                "event_name"           : self._event_names.Take(mask),
+                "event_source"         : self._event_sources[mask],
+                "event_data"           : self._event_data[mask],
+                "game_state"           : self._game_states.Take(mask),
+                "user_data"            : self._user_data.Take(mask),
+            },
+            filters=self.Filters
+        )
+
+    def _eventAt(self, i:int) -> Event:
+        index = int(self._indices[i])
+        return Event(
+            app_id=self._app_ids[i],
+            user_id=self._user_ids[i],
+            session_id=self._session_ids[i],
+            app_version=self._app_versions[i],
+            app_branch=self._app_branches[i],
+            log_version=self._log_versions[i],
+            timestamp=self._decodeTimestamp(microseconds=int(self._timestamps[i]), tz=self._timestamp_tzs[i]),
+            time_offset=self._time_offsets[i],
+            event_sequence_index=index if index != _NULL_INT else None,
+            event_name=self._event_names[i],
+            event_source=EventSource(int(self._event_sources[i])),
+            event_data=JSONCodec.Loads(self._event_data[i]),
+            game_state=JSONCodec.Loads(self._game_states[i]),
+            user_data=JSONCodec.Loads(self._user_data[i])
+        )
@@ -1,13 +1,14 @@
 ## import standard libraries
+import hashlib
 from datetime import datetime, timedelta, timezone
 from enum import IntEnum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 # import local files
 from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
 from ogd.common.schemas.tables.ColumnMapSchema import ColumnMapElement
 from ogd.common.models.GameData import GameData
 from ogd.common.models import SemanticVersion as SV
-from ogd.common.utils.typing import ExportRow, Map, conversions, Version
+from ogd.common.utils.typing import ExportRow, LazyJSON, Map, conversions, Version
 
 class EventSource(IntEnum):
     """Enum for the possible sources of an event - a game, or a generator.
@@ -25,6 +26,11 @@ class Event(GameData):
 
     # *** BUILT-INS & PROPERTIES ***
 
+    __slots__ = ("app_version", "app_branch", "log_version",
+                 "timestamp", "time_offset", "event_sequence_index",
+                 "event_name", "event_source", "event_data",
+                 "game_state", "user_data", "_fingerprint")
+
     _latest_session = None
     _latest_index   = 0
     def __init__(self, app_id:str,              user_id:Optional[str],          session_id:str,
@@ -75,7 +81,7 @@ class Event(GameData):
         self.event_data           : Map           = event_data
         self.game_state           : Map           = game_state if game_state is not None else {}
         self.user_data            : Map           = user_data if user_data is not None else {}
-        self._hash                : Optional[int] = None
+        self._fingerprint         : Optional[int] = None
 
     def __str__(self):
         return f"app_id       : {self.app_id}\n"\
@@ -94,16 +100,25 @@ class Event(GameData):
              + f"user_data    : {self.user_data}\n"\
 
     def __hash__(self):
-        _elems = [self.AppID, self.UserID, self.SessionID,
-                  self.AppVersion, self.AppBranch, self.LogVersion,
-                  self.Timestamp, self.TimeOffset, self.EventSequenceIndex,
-                  self.EventName, self.EventSource, self.EventData,
-                  self.GameState, self.UserData]
-        _str_elems = [str(elem) for elem in _elems]
-        return hash("".join(_str_elems))
+        return self.Fingerprint
 
     # *** PROPERTIES ***
 
+    @GameData.AppID.setter
+    def AppID(self, val:str):
+        self.app_id = val
+        self._fingerprint = None
+
+    @GameData.UserID.setter
+    def UserID(self, val:Optional[str]):
+        self.user_id = val
+        self._fingerprint = None
+
+    @GameData.SessionID.setter
+    def SessionID(self, val:str):
+        self.session_id = val
+        self._fingerprint = None
+
     @property
     def ColumnValues(self) -> Tuple[Optional[str | datetime | timezone | Map | int], ...]:
         """A list of all values for the row, in order they appear in the `ColumnNames` function.
@@ -120,9 +135,26 @@ class Event(GameData):
 
     @property
     def Hash(self) -> int:
-        if not self._hash:
-            self._hash = hash(self)
-        return self._hash
+        return self.Fingerprint
+
+    @property
+    def Fingerprint(self) -> int:
+        """A stable 64-bit fingerprint of the Event, for identifying duplicate events.
+
+        The fingerprint is computed from the identifying elements of the Event:
+        the app, user, session, versions, timestamp, offset, sequence index, event name, and event source.
+        The event data, game state, and user data are not included,
+        since two events from the same session with the same sequence index and timestamp are the same event, whatever their payload.
+        Unlike Python's built-in `hash` of a string, the fingerprint is the same across processes and runs.
+
+        The fingerprint is computed once, the first time it is needed, and cached until one of the elements it depends on is set through its property.
+
+        :return: A stable 64-bit fingerprint of the Event
+        :rtype: int
+        """
+        if self._fingerprint is None:
+            self._fingerprint = self._computeFingerprint()
+        return self._fingerprint
 
     @property
     def AppVersion(self) -> Version:
@@ -134,6 +166,10 @@ class Event(GameData):
         :rtype: str
         """
         return self.app_version
+    @AppVersion.setter
+    def AppVersion(self, val:Version):
+        self.app_version = val
+        self._fingerprint = None
     @property
     def AppVersionString(self) -> str:
         """The semantic versioning string for the game that generated this Event.
@@ -154,6 +190,10 @@ class Event(GameData):
         :rtype: str
         """
         return self.app_branch
+    @AppBranch.setter
+    def AppBranch(self, val:str):
+        self.app_branch = val
+        self._fingerprint = None
 
     @property
     def LogVersion(self) -> Version:
@@ -165,6 +205,10 @@ class Event(GameData):
         :rtype: str
         """
         return self.log_version
+    @LogVersion.setter
+    def LogVersion(self, val:Version):
+        self.log_version = val
+        self._fingerprint = None
     @property
     def LogVersionString(self) -> str:
         """The versioning string of the logging schema implemented in the game that generated the Event.
@@ -185,6 +229,10 @@ class Event(GameData):
         :rtype: datetime
         """
         return self.timestamp
+    @Timestamp.setter
+    def Timestamp(self, val:datetime):
+        self.timestamp = val
+        self._fingerprint = None
 
     @property
     def TimeOffset(self) -> Optional[timezone]:
@@ -196,6 +244,10 @@ class Event(GameData):
         :rtype: Optional[timedelta]
         """
         return self.time_offset
+    @TimeOffset.setter
+    def TimeOffset(self, val:Optional[timezone]):
+        self.time_offset = val
+        self._fingerprint = None
 
     @property
     def TimeOffsetString(self) -> Optional[str]:
@@ -218,6 +270,10 @@ class Event(GameData):
         :rtype: int
         """
         return self.event_sequence_index
+    @EventSequenceIndex.setter
+    def EventSequenceIndex(self, val:Optional[int]):
+        self.event_sequence_index = val
+        self._fingerprint = None
 
     @property
     def EventName(self) -> str:
@@ -231,6 +287,10 @@ class Event(GameData):
         :rtype: str
         """
         return self.event_name
+    @EventName.setter
+    def EventName(self, val:str):
+        self.event_name = val
+        self._fingerprint = None
 
     @property
     def EventData(self) -> Map:
@@ -243,6 +303,9 @@ class Event(GameData):
         :rtype: Dict[str, Any]
         """
         return self.event_data
+    @EventData.setter
+    def EventData(self, val:Map):
+        self.event_data = val
 
     @property
     def EventSource(self) -> EventSource:
@@ -252,6 +315,10 @@ class Event(GameData):
         :rtype: EventSource
         """
         return self.event_source
+    @EventSource.setter
+    def EventSource(self, val:EventSource):
+        self.event_source = val
+        self._fingerprint = None
 
     @property
     def UserData(self) -> Map:
@@ -261,6 +328,9 @@ class Event(GameData):
         :rtype: Dict[str, Any]
         """
         return self.user_data
+    @UserData.setter
+    def UserData(self, val:Map):
+        self.user_data = val
 
     @property
     def GameState(self) -> Map:
@@ -273,6 +343,9 @@ class Event(GameData):
         :rtype: Dict[str, Any]
         """
         return self.game_state
+    @GameState.setter
+    def GameState(self, val:Map):
+        self.game_state = val
 
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
@@ -321,7 +394,7 @@ class Event(GameData):
         )
 
     @classmethod
-    def FromRow(cls, row:ExportRow, schema:EventTableSchema, fallbacks:Map={}) -> "Event":
+    def FromRow(cls, row:ExportRow, schema:EventTableSchema, fallbacks:Map={}, timestamp:Optional[datetime]=None, lazy_payloads:bool=False) -> "Event":
         """Function to convert a row to an Event, based on the loaded schema.
         In general, columns specified in the schema's column_map are mapped to corresponding elements of the Event.
         If the column_map gave a list, rather than a single column name, the values from each column are concatenated in order with '.' character separators.
@@ -337,6 +410,12 @@ class Event(GameData):
         :type concatenator: str, optional
         :param fallbacks: _description_, defaults to {}
         :type fallbacks: Map, optional
+        :param timestamp: The already-parsed timestamp of the row, e.g. from `TimestampsFromRows`, or None to decode it from the row, defaults to None
+        :type timestamp: Optional[datetime], optional
+        :param lazy_payloads: Whether to keep event data and game state that arrive as JSON text as a `LazyJSON`, defaults to False.
+            A LazyJSON is only parsed when something reads inside it, and can be written back out as its original text,
+            but it is not a `dict`, so only enable this when the payloads go to code that accepts any Mapping, such as the Parquet and CSV outerfaces.
+        :type lazy_payloads: bool, optional
         :raises TypeError: _description_
         :return: _description_
         :rtype: Event
@@ -358,81 +437,99 @@ class Event(GameData):
         state       : Optional[Map]
         udata       : Optional[Map]
 
+        # The schema compiles its column map into per-element decoders once, so each row is just a handful of index lookups.
+        # Decoded values of an unexpected type are reported in the branches that convert them, so the common case costs nothing extra.
+        decoder = schema.Decoder
+
         # 1. Get ID data
-        app_id = schema.ColumnValueFromRow(row=row, mapping=schema.Map.AppIDColumn, concatenator=".",
-                                           column_name="app_id", expected_type=str, fallback=fallbacks.get("app_id"))
+        app_id = decoder.AppID(row) if decoder.AppID else fallbacks.get("app_id")
         if not isinstance(app_id, str):
+            if decoder.AppID:
+                schema.WarnUnexpectedType(value=app_id, column_name="app_id", expected_type=str)
             app_id = conversions.ToString(name="app_id", value=app_id)
 
-        user_id = schema.ColumnValueFromRow(row=row, mapping=schema.Map.UserIDColumn, concatenator=".",
-                                            column_name="user_id", expected_type=str, fallback=fallbacks.get("user_id"))
+        user_id = decoder.UserID(row) if decoder.UserID else fallbacks.get("user_id")
         if user_id is not None and not isinstance(user_id, str):
+            if decoder.UserID:
+                schema.WarnUnexpectedType(value=user_id, column_name="user_id", expected_type=str)
             user_id = conversions.ToString(name="user_id", value=user_id)
 
-        sess_id = schema.ColumnValueFromRow(row=row, mapping=schema.Map.SessionIDColumn, concatenator=".",
-                                            column_name="sess_id", expected_type=str, fallback=fallbacks.get("session_id"))
+        sess_id = decoder.SessionID(row) if decoder.SessionID else fallbacks.get("session_id")
         if not isinstance(sess_id, str):
+            if decoder.SessionID:
+                schema.WarnUnexpectedType(value=sess_id, column_name="sess_id", expected_type=str)
             sess_id = conversions.ToString(name="session_id", value=sess_id)
         if cls._latest_session != sess_id:
             cls._latest_session = sess_id
             cls._next_index = 0
 
         # 2. Get versioning data
-        expected_types = [str, int, SV.SemanticVersion]
-        log_ver = schema.ColumnValueFromRow(row=row, mapping=schema.Map.LogVersionColumn, concatenator=".",
-                                            column_name="log_ver", expected_type=SV.SemanticVersion, fallback=fallbacks.get('log_version', "0"))
-        if not any(isinstance(log_ver, t) for t in expected_types):
+        log_ver = decoder.LogVersion(row) if decoder.LogVersion else fallbacks.get('log_version', "0")
+        if not isinstance(log_ver, (str, int, SV.SemanticVersion)):
+            if decoder.LogVersion:
+                schema.WarnUnexpectedType(value=log_ver, column_name="log_ver", expected_type=SV.SemanticVersion)
             log_ver = SV.SemanticVersion.FromString(semver=str(log_ver))
 
-        app_ver = schema.ColumnValueFromRow(row=row, mapping=schema.Map.AppVersionColumn, concatenator=".",
-                                            column_name="app_ver", expected_type=SV.SemanticVersion, fallback=fallbacks.get('app_version'))
-        if not any(isinstance(app_ver, t) for t in expected_types):
+        app_ver = decoder.AppVersion(row) if decoder.AppVersion else fallbacks.get('app_version')
+        if not isinstance(app_ver, (str, int, SV.SemanticVersion)):
+            if decoder.AppVersion:
+                schema.WarnUnexpectedType(value=app_ver, column_name="app_ver", expected_type=SV.SemanticVersion)
             app_ver = SV.SemanticVersion.FromString(semver=str(app_ver))
 
-        app_br = schema.ColumnValueFromRow(row=row, mapping=schema.Map.AppBranchColumn, concatenator=".",
-                                           column_name="app_br", expected_type=str, fallback=fallbacks.get('app_branch'))
+        app_br = decoder.AppBranch(row) if decoder.AppBranch else fallbacks.get('app_branch')
         if not isinstance(app_br, str):
+            if decoder.AppBranch:
+                schema.WarnUnexpectedType(value=app_br, column_name="app_br", expected_type=str)
             app_br = conversions.ToString(name="app_branch", value=app_br)
 
         # 3. Get sequencing data
-        tstamp  = schema.ColumnValueFromRow(row=row, mapping=schema.Map.TimestampColumn, concatenator=".",
-                                            column_name="timestamp", expected_type=datetime, fallback=None)
+        tstamp = timestamp if timestamp is not None else decoder.Timestamp(row) if decoder.Timestamp else None
         if not isinstance(tstamp, datetime):
+            if decoder.Timestamp:
+                schema.WarnUnexpectedType(value=tstamp, column_name="timestamp", expected_type=datetime)
             tstamp = conversions.time.ToDatetime(name="timestamp", value=tstamp, force=True)
 
-        offset = schema.ColumnValueFromRow(row=row, mapping=schema.Map.TimeOffsetColumn, concatenator=".",
-                                           column_name="offset", expected_type=str, fallback=fallbacks.get('time_offset'))
+        offset = decoder.TimeOffset(row) if decoder.TimeOffset else fallbacks.get('time_offset')
         if isinstance(offset, timedelta):
             offset = conversions.time.ToTimezone(name="offset", value=offset, force=True)
 
-        event_index = schema.ColumnValueFromRow(row=row, mapping=schema.Map.EventSequenceIndexColumn, concatenator=".",
-                                                column_name="index", expected_type=int, fallback=fallbacks.get('event_sequence_index', cls._next_index))
+        event_index = decoder.EventSequenceIndex(row) if decoder.EventSequenceIndex else fallbacks.get('event_sequence_index', cls._next_index)
         if not isinstance(event_index, int):
+            if decoder.EventSequenceIndex:
+                schema.WarnUnexpectedType(value=event_index, column_name="index", expected_type=int)
             event_index = conversions.ToInt(name="event_sequence_index", value=event_index or cls._next_index, force=True)
 
         # 4. Get event-specific data
-        ename   = schema.ColumnValueFromRow(row=row, mapping=schema.Map.EventNameColumn, concatenator=".",
-                                            column_name="ename", expected_type=str, fallback=fallbacks.get('event_name'))
+        ename = decoder.EventName(row) if decoder.EventName else fallbacks.get('event_name')
         if not isinstance(ename, str):
+            if decoder.EventName:
+                schema.WarnUnexpectedType(value=ename, column_name="ename", expected_type=str)
             ename = conversions.ToString(name="event_name", value=ename)
 
-        esrc = schema.ColumnValueFromRow(row=row, mapping=schema.Map.EventSourceColumn, concatenator=".",
-                                         column_name="esrc", expected_type=str, fallback=fallbacks.get('event_source', EventSource.GAME))
+        esrc = decoder.EventSource(row) if decoder.EventSource else fallbacks.get('event_source', EventSource.GAME)
         if not isinstance(esrc, EventSource):
+            if decoder.EventSource and not isinstance(esrc, str):
+                schema.WarnUnexpectedType(value=esrc, column_name="esrc", expected_type=str)
             esrc = EventSource.GENERATED if esrc == "GENERATED" else EventSource.GAME
 
-        raw_data = schema.ColumnValueFromRow(row=row, mapping=schema.Map.EventDataColumn, concatenator=".",
-                                             column_name="edata", expected_type=dict, fallback=fallbacks.get('event_data'))
-        edata   = conversions.ToJSON(name="event_data", value=raw_data, force=True, sort=True) or {}
+        # lazy payloads are decoded without conversion, so JSON text stays unparsed until something reads it.
+        decode_data = decoder.RawEventData if lazy_payloads else decoder.EventData
+        raw_data = decode_data(row) if decode_data else fallbacks.get('event_data')
+        if decode_data and not isinstance(raw_data, dict) and not Event._isLazyPayload(value=raw_data, lazy=lazy_payloads):
+            schema.WarnUnexpectedType(value=raw_data, column_name="edata", expected_type=dict)
+        edata    = Event._payloadFromValue(name="event_data", value=raw_data, lazy=lazy_payloads)
 
         # 5. Get context data
 
-        udata   = schema.ColumnValueFromRow(row=row, mapping=schema.Map.UserDataColumn, concatenator=".",
-                                            column_name="udata", expected_type=dict, fallback=fallbacks.get('user_data'))
+        udata = decoder.UserData(row) if decoder.UserData else fallbacks.get('user_data')
+        if decoder.UserData and not isinstance(udata, dict):
+            schema.WarnUnexpectedType(value=udata, column_name="udata", expected_type=dict)
 
-        raw_state = schema.ColumnValueFromRow(row=row, mapping=schema.Map.GameStateColumn, concatenator=".",
-                                            column_name="state", expected_type=dict, fallback=fallbacks.get('game_state'))
-        state     = conversions.ToJSON(name="game_state", value=raw_state, force=True, sort=True) or {}
+        decode_state = decoder.RawGameState if lazy_payloads else decoder.GameState
+        raw_state = decode_state(row) if decode_state else fallbacks.get('game_state')
+        if decode_state and not isinstance(raw_state, dict) and not Event._isLazyPayload(value=raw_state, lazy=lazy_payloads):
+            schema.WarnUnexpectedType(value=raw_state, column_name="state", expected_type=dict)
+        state     = Event._payloadFromValue(name="game_state", value=raw_state, lazy=lazy_payloads)
 
         ret_val = Event(app_id=app_id, user_id=user_id, session_id=sess_id,
                         timestamp=tstamp, time_offset=offset, event_sequence_index=event_index,
@@ -444,6 +541,33 @@ class Event(GameData):
 
         return ret_val
 
+    @staticmethod
+    def TimestampsFromRows(rows:Sequence[ExportRow], schema:EventTableSchema) -> List[Optional[datetime]]:
+        """Function to parse the timestamps of a whole batch of rows at once, to be passed on to `FromRow`.
+
+        Parsing the batch together lets the timestamp strings be converted with a single vectorized call, rather than one call per row.
+        Any timestamp that could not be parsed is given as None, so that `FromRow` will decode it from the row, and report any error as usual.
+
+        :param rows: The rows whose timestamps should be parsed.
+        :type rows: Sequence[ExportRow]
+        :param schema: The schema of the table the rows came from.
+        :type schema: EventTableSchema
+        :return: The timestamp of each row, in the same order as `rows`.
+        :rtype: List[Optional[datetime]]
+        """
+        _decode = schema.Decoder.Timestamps
+        return _decode(rows) if _decode is not None else [None] * len(rows)
+
+    @classmethod
+    def ResetSequence(cls) -> None:
+        """Function to forget the session and fallback sequence index carried over from previous calls to `FromRow`.
+
+        Rows without a sequence index are numbered from the last index seen in the same session,
+        so this should be called before converting a new set of rows, so that their numbering does not depend on what was converted before.
+        """
+        cls._latest_session = None
+        cls._next_index     = 0
+
     # *** PUBLIC METHODS ***
 
     def ApplyFallbackDefaults(self, app_id:Optional[str]=None, index:Optional[int]=None, in_place:bool=True) -> "Event":
@@ -452,8 +576,10 @@ class Event(GameData):
         if in_place:
             if self.app_id == None and app_id != None:
                 self.app_id = app_id
+                self._fingerprint = None
             if self.event_sequence_index == None:
                 self.event_sequence_index = index
+                self._fingerprint = None
             ret_val = self
         else:
             ret_val = Event(
@@ -498,5 +624,39 @@ class Event(GameData):
 
     # *** PRIVATE STATICS ***
 
+    @staticmethod
+    def _payloadFromValue(name:str, value:Any, lazy:bool=False) -> Map:
+        """Turn a decoded event data or game state value into a Map.
+
+        If `lazy`, JSON object strings are wrapped in a `LazyJSON`, so they are only parsed if something looks inside them,
+        and can be written back out unchanged. Anything else is converted right away, with `conversions.ToJSON`.
+
+        :param name: The name of the element, used for debug outputs.
+        :type name: str
+        :param value: The value decoded from a row.
+        :type value: Any
+        :param lazy: Whether to wrap JSON object strings in a LazyJSON, rather than parsing them to a dict, defaults to False
+        :type lazy: bool, optional
+        :return: The payload, as a LazyJSON or a dict.
+        :rtype: Map
+        """
+        if Event._isLazyPayload(value=value, lazy=lazy):
+            return LazyJSON(raw=value, name=name)
+        return conversions.ToJSON(name=name, value=value, force=True, sort=True) or {}
+
+    @staticmethod
+    def _isLazyPayload(value:Any, lazy:bool) -> bool:
+        return lazy and isinstance(value, str) and value.startswith("{")
+
     # *** PRIVATE METHODS ***
 
+    def _computeFingerprint(self) -> int:
+        _elems = (self.app_id, self.user_id, self.session_id,
+                  self.app_version, self.app_branch, self.log_version,
+                  self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else self.timestamp,
+                  self.TimeOffsetString, self.event_sequence_index,
+                  self.event_name, int(self.event_source))
+        # unit separator between elements, so e.g. ("ab", "c") and ("a", "bc") don't give the same fingerprint.
+        _canonical = "\x1f".join("" if elem is None else str(elem) for elem in _elems)
+        return int.from_bytes(hashlib.blake2b(_canonical.encode("utf-8"), digest_size=8).digest(), "big")
+
@@ -1,5 +1,5 @@
 ## import standard libraries
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Set
 # import local files
 from ogd.common.filters.collections import *
 from ogd.common.models.events.Event import Event, EventSource
@@ -84,3 +84,23 @@ class EventSet:
 
     def ClearEvents(self):
         self._events = []
+
+    def Deduplicate(self) -> "EventSet":
+        """Remove any duplicate events from the set, keeping the first copy of each event, in order.
+
+        Duplicates are found by `Event.Fingerprint`, so this is a single pass over the events,
+        with no comparison of event data.
+        This is meant for merging results of overlapping requests, e.g. `(first_range + second_range).Deduplicate()`.
+
+        :return: The set itself, with duplicates removed.
+        :rtype: EventSet
+        """
+        _seen : Set[int] = set()
+        _unique : List[Event] = []
+        for event in self.Events:
+            _fingerprint = event.Fingerprint
+            if _fingerprint not in _seen:
+                _seen.add(_fingerprint)
+                _unique.append(event)
+        self._events = _unique
+        return self
@@ -9,6 +9,7 @@ from ogd.common.filters.Filter import Filter
 from ogd.common.models.DatasetKey import DatasetKey
 from ogd.common.schemas.Schema import Schema
 from ogd.common.utils.Logger import Logger
+from ogd.common.utils.RevisionProvider import RevisionProvider
 from ogd.common.utils.typing import Map
 
 class DatasetSchema(Schema):
@@ -180,6 +181,14 @@ class DatasetSchema(Schema):
 
     @property
     def OGDRevision(self) -> str:
+        """The revision of the OGD code that exported the dataset.
+
+        For a new dataset, this comes from `RevisionProvider.Current()`, which `Default` uses,
+        so it matches the revision in the name of the dataset's `.meta` file.
+
+        :return: The short revision hash, or "UNKNOWN REVISION" if it was not recorded.
+        :rtype: str
+        """
         return self._ogd_revision
 
     @property
@@ -406,7 +415,7 @@ Last modified {self.DateModified.strftime('%m/%d/%Y') if type(self.DateModified)
             date_modified       = cls._DEFAULT_DATE_MODIFIED,
             start_date          = cls._DEFAULT_START_DATE,
             end_date            = cls._DEFAULT_END_DATE,
-            ogd_revision        = cls._DEFAULT_OGD_REVISION,
+            ogd_revision        = RevisionProvider.Current() or cls._DEFAULT_OGD_REVISION,
             filters             = cls._DEFAULT_FILTERS,
             session_ct          = cls._DEFAULT_SESSION_COUNT,
             player_ct           = cls._DEFAULT_PLAYER_COUNT,
@@ -1,10 +1,38 @@
 ## import standard libraries
-from typing import Dict, List, Optional, Self
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Self
 ## import local files
 from ogd.common.schemas.tables.ColumnSchema import ColumnSchema
-from ogd.common.schemas.tables.TableSchema import TableSchema
+from ogd.common.schemas.tables.TableSchema import TableSchema, ColumnDecoder, RowDecoder
 from ogd.common.schemas.tables.EventMapSchema import EventMapSchema
 from ogd.common.utils import typing
+from ogd.common.utils.typing import conversions
+
+@dataclass(frozen=True)
+class EventRowDecoder:
+    """Set of compiled functions to decode each Event element from a row of an EventTableSchema's table.
+
+    An element whose mapping is None has a decoder of None, indicating a fallback value should be used instead.
+    `Timestamps` decodes the timestamps of a whole batch of rows at once, which is faster than decoding them row-by-row with `Timestamp`.
+    `RawEventData` and `RawGameState` decode the payloads without type conversion, so JSON text can be kept as-is, e.g. in a `LazyJSON`.
+    """
+    AppID              : Optional[RowDecoder]
+    UserID             : Optional[RowDecoder]
+    SessionID          : Optional[RowDecoder]
+    AppVersion         : Optional[RowDecoder]
+    AppBranch          : Optional[RowDecoder]
+    LogVersion         : Optional[RowDecoder]
+    Timestamp          : Optional[RowDecoder]
+    TimeOffset         : Optional[RowDecoder]
+    EventSequenceIndex : Optional[RowDecoder]
+    EventName          : Optional[RowDecoder]
+    EventSource        : Optional[RowDecoder]
+    EventData          : Optional[RowDecoder]
+    GameState          : Optional[RowDecoder]
+    UserData           : Optional[RowDecoder]
+    Timestamps         : Optional[ColumnDecoder] = None
+    RawEventData       : Optional[RowDecoder]    = None
+    RawGameState       : Optional[RowDecoder]    = None
 
 ## @class TableSchema
 class EventTableSchema(TableSchema):
@@ -65,8 +93,16 @@ class EventTableSchema(TableSchema):
         # a couple other vars used in the row->event conversion
         self._latest_session : Optional[str] = None
         self._next_index     : int           = 0
+        self._decoder        : Optional[EventRowDecoder] = None
         super().__init__(name=name, columns=columns, other_elements=unparsed_elements)
 
+    def __getstate__(self) -> typing.Map:
+        # The compiled decoder is made of closures, which can't be pickled, so leave it out and let it recompile on first use.
+        # This lets the schema be sent to worker processes, e.g. for parallel conversion of rows in `Interface.GetEventSet`.
+        state = self.__dict__.copy()
+        state["_decoder"] = None
+        return state
+
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
     @property
@@ -94,6 +130,20 @@ class EventTableSchema(TableSchema):
         """
         return self.ColumnMap
 
+    @property
+    def Decoder(self) -> EventRowDecoder:
+        """Compiled decoders for each Event element, used to convert rows to Events.
+
+        The column map is compiled into decoders on first use, and cached thereafter,
+        so the column lookups and type resolution are only done once per schema rather than once per row.
+
+        :return: The set of decoders for each Event element.
+        :rtype: EventRowDecoder
+        """
+        if self._decoder is None:
+            self._decoder = self._compileDecoder()
+        return self._decoder
+
     @property
     def AsMarkdown(self) -> str:
         ret_val : str
@@ -153,6 +203,43 @@ class EventTableSchema(TableSchema):
 
     # *** PRIVATE METHODS ***
 
+    def _compileDecoder(self, concatenator:str=".") -> EventRowDecoder:
+        return EventRowDecoder(
+            AppID              = self.CompileMapping(mapping=self.Map.AppIDColumn,              concatenator=concatenator),
+            UserID             = self.CompileMapping(mapping=self.Map.UserIDColumn,             concatenator=concatenator),
+            SessionID          = self.CompileMapping(mapping=self.Map.SessionIDColumn,          concatenator=concatenator),
+            AppVersion         = self.CompileMapping(mapping=self.Map.AppVersionColumn,         concatenator=concatenator),
+            AppBranch          = self.CompileMapping(mapping=self.Map.AppBranchColumn,          concatenator=concatenator),
+            LogVersion         = self.CompileMapping(mapping=self.Map.LogVersionColumn,         concatenator=concatenator),
+            Timestamp          = self.CompileMapping(mapping=self.Map.TimestampColumn,          concatenator=concatenator),
+            TimeOffset         = self.CompileMapping(mapping=self.Map.TimeOffsetColumn,         concatenator=concatenator),
+            EventSequenceIndex = self.CompileMapping(mapping=self.Map.EventSequenceIndexColumn, concatenator=concatenator),
+            EventName          = self.CompileMapping(mapping=self.Map.EventNameColumn,          concatenator=concatenator),
+            EventSource        = self.CompileMapping(mapping=self.Map.EventSourceColumn,        concatenator=concatenator),
+            EventData          = self.CompileMapping(mapping=self.Map.EventDataColumn,          concatenator=concatenator),
+            GameState          = self.CompileMapping(mapping=self.Map.GameStateColumn,          concatenator=concatenator),
+            UserData           = self.CompileMapping(mapping=self.Map.UserDataColumn,           concatenator=concatenator),
+            Timestamps         = self._compileTimestamps(concatenator=concatenator),
+            RawEventData       = self.CompileMapping(mapping=self.Map.EventDataColumn,          concatenator=concatenator, convert_types=False),
+            RawGameState       = self.CompileMapping(mapping=self.Map.GameStateColumn,          concatenator=concatenator, convert_types=False),
+        )
+
+    def _compileTimestamps(self, concatenator:str=".") -> Optional[ColumnDecoder]:
+        ret_val : Optional[ColumnDecoder] = None
+
+        raw_timestamp = self.CompileMapping(mapping=self.Map.TimestampColumn, concatenator=concatenator, convert_types=False)
+        if raw_timestamp is not None:
+            _parser = conversions.time.DatetimeParser(name="timestamp")
+            def _rawTimestamp(row:typing.ExportRow) -> Any:
+                # leave malformed rows as None, so the error is reported when the row itself is decoded.
+                try:
+                    return raw_timestamp(row)
+                except (IndexError, TypeError):
+                    return None
+            ret_val = lambda rows : _parser.ParseMany([_rawTimestamp(row) for row in rows])
+
+        return ret_val
+
     @staticmethod
     def _parseColumnMap(unparsed_elements:typing.Map, schema_name:Optional[str]=None) -> EventMapSchema:
         ret_val : EventMapSchema
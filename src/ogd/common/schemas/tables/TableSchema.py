@@ -5,7 +5,7 @@ import json
 import logging
 from collections import Counter
 from pathlib import Path
-from typing import Any, Callable, Dict, Final, List, Optional, Tuple, Type, TypeAlias
+from typing import Any, Callable, Dict, Final, List, Optional, Sequence, Tuple, Type, TypeAlias
 ## import local files
 from ogd.common.schemas.tables import presets
 from ogd.common.schemas.Schema import Schema
@@ -16,6 +16,8 @@ from ogd.common.utils.Logger import Logger
 from ogd.common.utils.typing import ExportRow, Map, conversions
 
 ColumnMapIndex   : TypeAlias = Optional[int | List[int] | Dict[str,int]]
+RowDecoder       : TypeAlias = Callable[[ExportRow], Any]
+ColumnDecoder    : TypeAlias = Callable[[Sequence[ExportRow]], List[Any]]
 
 ## @class TableSchema
 class TableSchema(Schema):
@@ -168,6 +170,7 @@ class TableSchema(Schema):
         # declare and initialize vars
         # self._schema            : Optional[Dict[str, Any]] = all_elements
         self._table_columns : List[ColumnSchema] = columns if columns is not None else self._parseColumns(unparsed_elements=unparsed_elements, schema_name=name)
+        self._column_indices : Optional[Dict[str, int]] = None
 
         # after loading the file, take the stuff we need and store.
         super().__init__(name=name, other_elements=other_elements)
@@ -185,6 +188,19 @@ class TableSchema(Schema):
         """
         return [col.Name for col in self._table_columns]
 
+    @property
+    def ColumnIndices(self) -> Dict[str, int]:
+        """Mapping from the name of each column in the schema to the index of the column.
+
+        The mapping is built on first use, and cached thereafter.
+
+        :return: Dictionary mapping each column name to its index in a row.
+        :rtype: Dict[str, int]
+        """
+        if self._column_indices is None:
+            self._column_indices = {col.Name : i for i, col in enumerate(self._table_columns)}
+        return self._column_indices
+
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
     # *** PUBLIC STATICS ***
@@ -211,33 +227,47 @@ class TableSchema(Schema):
                     ret_val.update(_val if isinstance(_val, dict) else {key:_val})
 
             if column_name and expected_type and not isinstance(ret_val, expected_type):
-                if column_name not in self._conversion_warnings:
-                    _msg = f"{self.Name} event table schema set {column_name} as {type(ret_val)}, but {column_name} was requested to use type {expected_type.__name__}"
-                    Logger.Log(_msg, logging.WARN)
-                self._conversion_warnings[column_name] += 1
+                self.WarnUnexpectedType(value=ret_val, column_name=column_name, expected_type=expected_type)
         else:
             ret_val = fallback
         return ret_val
 
+    def WarnUnexpectedType(self, value:Any, column_name:str, expected_type:Type) -> None:
+        """Function to report that a value decoded from a row did not have the type it was requested as.
+
+        The warning is only logged the first time for each column, but every occurrence is counted.
+
+        :param value: The decoded value.
+        :type value: Any
+        :param column_name: The name of the element the value was decoded for.
+        :type column_name: str
+        :param expected_type: The type the value was requested as.
+        :type expected_type: Type
+        """
+        if column_name not in self._conversion_warnings:
+            _msg = f"{self.Name} event table schema set {column_name} as {type(value)}, but {column_name} was requested to use type {expected_type.__name__}"
+            Logger.Log(_msg, logging.WARN)
+        self._conversion_warnings[column_name] += 1
+
     def ColumnValueToRow(self, raw_value:Any, mapping:ColumnMapElement, concatenator:str, element_name:Optional[str]) -> Dict[int, Any]:
         ret_val : Dict[int, Any] = {}
 
         if isinstance(mapping, str):
-            ret_val[self.ColumnNames.index(mapping)] = raw_value
+            ret_val[self._columnIndex(mapping)] = raw_value
         elif isinstance(mapping, list):
             if isinstance(raw_value, str):
-                indices = [self.ColumnNames.index(col) for col in mapping]
+                indices = [self._columnIndex(col) for col in mapping]
                 pieces = raw_value.split(concatenator, len(indices))
                 for i in range(len(pieces)):
                     ret_val[indices[i]] = pieces[i]
             else:
-                idx = self.ColumnNames.index(mapping[0])
+                idx = self._columnIndex(mapping[0])
                 _msg = f"{element_name} of type {type(raw_value)} was not splittable, {self.Name} will reverse-map it to the {self.Columns[idx].Name} column, instead of splitting amongst {mapping}"
                 Logger.Log(_msg)
                 ret_val[idx] = raw_value
         elif isinstance(mapping, dict):
             # TODO : support reversing the mapping of dict data
-            idx = self.ColumnNames.index(list(mapping.keys())[0])
+            idx = self._columnIndex(list(mapping.keys())[0])
             _msg = f"Reverse-mapping is not supported generally for dicts, {self.Name} will map {element_name} to the {self.Columns[idx].Name}, rather than splitting amongst {mapping}"
             Logger.Log(_msg)
             ret_val[idx] = raw_value
@@ -259,11 +289,56 @@ class TableSchema(Schema):
         ret_val : ColumnMapIndex = None
 
         if isinstance(mapping, str):
-            ret_val = self.ColumnNames.index(mapping)
+            ret_val = self._columnIndex(mapping)
         elif isinstance(mapping, list):
-            ret_val = [self.ColumnNames.index(col_name) for col_name in mapping]
+            ret_val = [self._columnIndex(col_name) for col_name in mapping]
         elif isinstance(mapping, dict):
-            ret_val = {key:self.ColumnNames.index(val) for key,val in mapping.items()}
+            ret_val = {key:self._columnIndex(val) for key,val in mapping.items()}
+
+        return ret_val
+
+    def CompileMapping(self, mapping:ColumnMapElement, concatenator:str, convert_types:bool=True) -> Optional[RowDecoder]:
+        """Function to turn a ColumnMapElement into a function that decodes the mapped value from a row.
+
+        The returned function gives the same value as `ColumnValueFromRow` with the same `mapping` and `concatenator`,
+        but the column indices and the type conversion for each column are resolved once, here,
+        rather than on every row.
+
+        :param mapping: The column(s) mapped to some element.
+        :type mapping: ColumnMapElement
+        :param concatenator: The string used to join values, if the mapping is a list of columns.
+        :type concatenator: str
+        :param convert_types: Whether a single mapped column's value should be converted to the column's type, defaults to True.
+            If False, the raw value is given back, for callers that convert a whole batch of values at once.
+        :type convert_types: bool, optional
+        :return: A function taking a row, and returning the mapped value from the row, or None if the mapping was None.
+        :rtype: Optional[RowDecoder]
+        """
+        ret_val : Optional[RowDecoder] = None
+
+        indices = self.IndexFromMapping(mapping)
+        if isinstance(indices, int):
+            index   = indices
+            if convert_types:
+                convert = conversions.ConverterFor(to_type=self.Columns[index].ValueType, name=self.Columns[index].Name)
+                ret_val = lambda row : convert(row[index])
+            else:
+                ret_val = lambda row : row[index]
+        elif isinstance(indices, list):
+            index_list = indices
+            ret_val = lambda row : concatenator.join([str(row[i]) for i in index_list])
+        elif isinstance(indices, dict):
+            converters = [
+                (key, column_index, conversions.ConverterFor(to_type=self.Columns[column_index].ValueType, name=self.Columns[column_index].Name))
+                for key, column_index in indices.items()
+            ]
+            def _decodeDict(row:ExportRow) -> Dict[str, Any]:
+                _decoded = {}
+                for key, column_index, convert_column in converters:
+                    _val = convert_column(row[column_index])
+                    _decoded.update(_val if isinstance(_val, dict) else {key:_val})
+                return _decoded
+            ret_val = _decodeDict
 
         return ret_val
 
@@ -271,6 +346,12 @@ class TableSchema(Schema):
 
     # *** PRIVATE METHODS ***
 
+    def _columnIndex(self, column_name:str) -> int:
+        ret_val : Optional[int] = self.ColumnIndices.get(column_name)
+        if ret_val is None:
+            raise ValueError(f"'{column_name}' is not a column in {self.Name}")
+        return ret_val
+
     def _formatMappedColumn(self, index:ColumnMapIndex):
         """Takes a column mapping index, and returns a nicely-formatted string of the columns included in the index.
 
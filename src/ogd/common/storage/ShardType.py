@@ -0,0 +1,24 @@
+"""ShardType Module
+"""
+
+# import standard libraries
+from enum import IntEnum
+
+class ShardType(IntEnum):
+    """Enum representing the different ways to split a data request into shards that can be retrieved in parallel.
+
+    Namely:
+
+    * By day, splitting the timestamp range into one shard per calendar day
+    * By session, splitting the list of sessions into several smaller lists
+
+    :param IntEnum: _description_
+    :type IntEnum: _type_
+    :return: _description_
+    :rtype: _type_
+    """
+    DAY = 1
+    SESSION = 2
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,171 @@
+"""BigQueryClientRegistry Module
+"""
+
+# import standard libraries
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+# 3rd-party imports
+from google.cloud import bigquery
+# import locals
+from ogd.common.utils.Logger import Logger
+
+type ClientKey     = Tuple[Optional[str], Optional[str]]
+type ClientFactory = Callable[[Optional[str], Optional[str]], bigquery.Client]
+
+@dataclass
+class _SharedClient:
+    client    : bigquery.Client
+    ref_count : int = 0
+
+class BigQueryClientRegistry:
+    """Registry of BigQuery clients, shared by everything in a process that talks to BigQuery.
+
+    Clients are keyed by the path to their service account key and the project they bill to.
+    Building a client loads credentials and sets up an HTTP session, so rather than each connector building its own,
+    connectors `Acquire` a client from the registry and `Release` it when done.
+    Released clients stay in the registry, with their HTTP connection pools, for the next connector with the same key;
+    they are only closed by an explicit call to `Clear`, or when the process exits.
+
+    Clients are built from the key file directly, rather than through the `GOOGLE_APPLICATION_CREDENTIALS` environment variable,
+    so connectors with different credentials can be opened side by side, including from different threads.
+
+    Most code should use the process-wide registry from `Default`.
+    The client factory can be replaced, e.g. to register fake clients in testing.
+    """
+
+    _default      : Optional["BigQueryClientRegistry"] = None
+    _default_lock : threading.Lock = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, client_factory:Optional[ClientFactory]=None):
+        """Constructor for a BigQueryClientRegistry.
+
+        :param client_factory: Function to build a new client from a key file path and project, defaults to `_createClient`
+        :type client_factory: Optional[ClientFactory], optional
+        """
+        self._create  : ClientFactory                  = client_factory or BigQueryClientRegistry._createClient
+        self._lock    : threading.Lock                 = threading.Lock()
+        self._clients : Dict[ClientKey, _SharedClient] = {}
+
+    @property
+    def ClientCount(self) -> int:
+        """The number of clients currently held by the registry, whether or not they are in use.
+
+        :return: The number of clients in the registry.
+        :rtype: int
+        """
+        return len(self._clients)
+
+    def References(self, credential_path:Optional[str], project:Optional[str]) -> int:
+        """The number of times the client for the given key has been acquired and not yet released.
+
+        :param credential_path: The path to the service account key file, or None for default credentials.
+        :type credential_path: Optional[str]
+        :param project: The project ID, or None for the credential's default project.
+        :type project: Optional[str]
+        :return: The number of outstanding references to the client, or 0 if there is no such client.
+        :rtype: int
+        """
+        with self._lock:
+            shared = self._clients.get(self._clientKey(credential_path=credential_path, project=project))
+            return shared.ref_count if shared is not None else 0
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "BigQueryClientRegistry":
+        """Get the process-wide client registry, creating it on first use.
+
+        All clients in the default registry are closed when the process exits.
+
+        :return: The process-wide client registry.
+        :rtype: BigQueryClientRegistry
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = BigQueryClientRegistry()
+                atexit.register(cls._default.Clear, force=True)
+            return cls._default
+
+    # *** PUBLIC METHODS ***
+
+    def Acquire(self, credential_path:Optional[str], project:Optional[str]) -> Optional[bigquery.Client]:
+        """Get the shared client for the given credentials and project, building it if the registry does not have one yet.
+
+        Each call should be matched by a call to `Release` once the client is no longer needed, rather than closing the client.
+
+        :param credential_path: The path to the service account key file, or None to use the environment's default credentials.
+        :type credential_path: Optional[str]
+        :param project: The project ID, or None for the credential's default project.
+        :type project: Optional[str]
+        :return: The shared client, or None if a client could not be built.
+        :rtype: Optional[bigquery.Client]
+        """
+        key = self._clientKey(credential_path=credential_path, project=project)
+        # Hold the lock while building, so concurrent openers with the same key wait for the one client instead of each building their own.
+        with self._lock:
+            shared = self._clients.get(key)
+            if shared is None:
+                try:
+                    shared = _SharedClient(client=self._create(key[0], key[1]))
+                except Exception as err: # pylint: disable=broad-exception-caught
+                    Logger.Log(f"Could not create BigQuery client for project {project}, with credential {credential_path}: {type(err)} {str(err)}", logging.ERROR)
+                    return None
+                self._clients[key] = shared
+                Logger.Log(f"Created BigQuery client for project {project}.", logging.DEBUG)
+            else:
+                Logger.Log(f"Reusing BigQuery client for project {project}.", logging.DEBUG)
+            shared.ref_count += 1
+            return shared.client
+
+    def Release(self, client:bigquery.Client) -> None:
+        """Give back a client from `Acquire`.
+
+        The client stays open in the registry, for reuse by the next caller with the same key.
+
+        :param client: The client to give back.
+        :type client: bigquery.Client
+        """
+        with self._lock:
+            for shared in self._clients.values():
+                if shared.client is client:
+                    shared.ref_count = max(shared.ref_count - 1, 0)
+                    return
+        Logger.Log("Released a BigQuery client that does not belong to the registry, closing it.", logging.DEBUG)
+        client.close()
+
+    def Clear(self, force:bool=False) -> None:
+        """Close and remove the clients in the registry.
+
+        :param force: Whether to close clients that are still in use, defaults to False, in which case only unused clients are closed.
+        :type force: bool, optional
+        """
+        _closing : List[bigquery.Client] = []
+        with self._lock:
+            for key in list(self._clients.keys()):
+                if force or self._clients[key].ref_count <= 0:
+                    _closing.append(self._clients.pop(key).client)
+        for client in _closing:
+            try:
+                client.close()
+            except Exception as err: # pylint: disable=broad-exception-caught
+                Logger.Log(f"Error while closing BigQuery client: {err}", logging.DEBUG)
+        if len(_closing) > 0:
+            Logger.Log(f"Closed {len(_closing)} BigQuery client(s).", logging.DEBUG)
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _clientKey(credential_path:Optional[str], project:Optional[str]) -> ClientKey:
+        return (credential_path or None, project or None)
+
+    @staticmethod
+    def _createClient(credential_path:Optional[str], project:Optional[str]) -> bigquery.Client:
+        if credential_path is not None:
+            return bigquery.Client.from_service_account_json(credential_path, project=project)
+        else:
+            return bigquery.Client(project=project)
@@ -3,6 +3,7 @@ import os
 from google.cloud import bigquery
 from typing import Final, Optional
 # import locals
+from ogd.common.storage.connectors.BigQueryClientRegistry import BigQueryClientRegistry
 from ogd.common.storage.connectors.StorageConnector import StorageConnector
 from ogd.common.configs.storage.BigQueryConfig import BigQueryConfig
 from ogd.common.utils.Logger import Logger
@@ -13,9 +14,17 @@ class BigQueryConnector(StorageConnector):
 
     # *** BUILT-INS & PROPERTIES ***
 
-    def __init__(self, config:BigQueryConfig):
+    def __init__(self, config:BigQueryConfig, registry:Optional[BigQueryClientRegistry]=None):
+        """Constructor for a BigQueryConnector.
+
+        :param config: The config for the BigQuery project to connect to.
+        :type config: BigQueryConfig
+        :param registry: The registry from which to get a client when opened, defaults to the process-wide `BigQueryClientRegistry.Default()`
+        :type registry: Optional[BigQueryClientRegistry], optional
+        """
         self._config = config
-        self._client : Optional[bigquery.Client] = None
+        self._registry : BigQueryClientRegistry   = registry if registry is not None else BigQueryClientRegistry.Default()
+        self._client   : Optional[bigquery.Client] = None
         super().__init__()
 
     @property
@@ -30,12 +39,10 @@ class BigQueryConnector(StorageConnector):
 
     def _open(self, writeable:bool=True) -> bool:
         if not self._is_open:
-            if "GITHUB_ACTIONS" in os.environ:
-                self._client = bigquery.Client()
-            else:
+            _keypath : Optional[str] = None
+            if "GITHUB_ACTIONS" not in os.environ:
                 _keypath = str(self.StoreConfig.Credential.Filepath)
-                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = _keypath or "NO CREDENTIAL CONFIGURED!"
-                self._client = bigquery.Client()
+            self._client = self._registry.Acquire(credential_path=_keypath, project=self.StoreConfig.Location.DatabaseName)
             if self._client != None:
                 self._is_open = True
                 Logger.Log("Connected to BigQuery database.", logging.DEBUG)
@@ -48,8 +55,9 @@ class BigQueryConnector(StorageConnector):
 
     def _close(self) -> bool:
         if self._client is not None:
-            self._client.close()
-            Logger.Log("Closed connection to BigQuery.", logging.DEBUG)
+            self._registry.Release(self._client)
+            self._client = None
+            Logger.Log("Released BigQuery client.", logging.DEBUG)
         else:
             Logger.Log("No BigQuery client to close.", logging.WARNING)
         self._is_open = False
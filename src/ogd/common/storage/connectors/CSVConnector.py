@@ -1,16 +1,36 @@
 import logging
 import os
+import time
 import traceback
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, IO, Set
+from typing import Dict, List, Optional, IO, Set, Tuple
 ## import local files
 from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
 from ogd.common.models.features.AggregationMode import AggregationMode
 from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.storage.connectors.CSVIndex import CSVIndex
+from ogd.common.storage.connectors.DelimitedLineWriter import DelimitedLineWriter
+from ogd.common.storage.connectors.ExportCheckpoint import ExportCheckpoint
 from ogd.common.storage.connectors.StorageConnector import StorageConnector
+from ogd.common.storage.connectors.StreamingZipWriter import StreamingZipWriter
 from ogd.common.utils.Logger import Logger
 
+@dataclass(frozen=True)
+class ZipReport:
+    """Time taken and sizes for a file zipped up by a `CSVConnector`."""
+    ZipPath     : Path
+    Seconds     : float
+    RawBytes    : int
+    ZippedBytes : int
+
+    @property
+    def Ratio(self) -> float:
+        """The size of the zip file, as a fraction of the size of the original file."""
+        return self.ZippedBytes / self.RawBytes if self.RawBytes > 0 else 1.0
+
 class CSVConnector(StorageConnector):
 
     # *** BUILT-INS & PROPERTIES ***
@@ -22,7 +42,36 @@ class CSVConnector(StorageConnector):
     def __init__(self, config:FileStoreConfig,
                  with_secondary_files:Optional[Set[ExportMode | AggregationMode]]=None,
                  with_zipping:bool=False,
-                 existing_meta:Optional[Dict]=None):
+                 existing_meta:Optional[Dict]=None,
+                 with_index:bool=False,
+                 stream_compression:bool=False,
+                 zip_workers:int=4,
+                 with_checkpoints:bool=False):
+        """Constructor for a CSVConnector.
+
+        :param config: The config for the file location.
+        :type config: FileStoreConfig
+        :param with_secondary_files: The kinds of secondary files to open alongside the main file, defaults to None
+        :type with_secondary_files: Optional[Set[ExportMode  |  AggregationMode]], optional
+        :param with_zipping: Whether to zip up the files when the connector is closed, defaults to False
+        :type with_zipping: bool, optional
+        :param existing_meta: Metadata of a previous export of the same dataset, whose zip files are renamed when zipping, defaults to None
+        :type existing_meta: Optional[Dict], optional
+        :param with_index: Whether to write a sidecar `CSVIndex` next to each indexed event file when the connector is closed.
+            Indices only apply to files left unzipped, so none are saved when the files are zipped. Defaults to False
+        :type with_index: bool, optional
+        :param stream_compression: Whether to compress lines into the zip files as they are written, on background threads,
+            instead of writing plain files and zipping them when the connector is closed. Only applies `with_zipping`.
+            In this mode, the plain files are never written, so no sidecar indices are saved. Defaults to False
+        :type stream_compression: bool, optional
+        :param zip_workers: The most files to zip at the same time, when zipping at close, defaults to 4
+        :type zip_workers: int, optional
+        :param with_checkpoints: Whether to resume from the `ExportCheckpoint` of an earlier, unfinished export when opened for writing,
+            appending to its files instead of starting them over. Checkpoints are saved with `SaveCheckpoint`,
+            and files are only zipped at close once the export is marked finished with `ClearCheckpoint`.
+            Not available with `stream_compression`, since a zip entry cannot be appended to. Defaults to False
+        :type with_checkpoints: bool, optional
+        """
         # set up data from params
         super().__init__()
         self._config               : FileStoreConfig          = config
@@ -32,6 +81,18 @@ class CSVConnector(StorageConnector):
         self._secondary_files      : Dict[str,Optional[IO]]   = {mode.name:None for mode in CSVConnector._VALID_SECONDARY_FILES}
         self._with_zipping         : bool                     = with_zipping
         self._zip_paths            : Dict[str,Optional[Path]] = {mode.name:None for mode in CSVConnector._VALID_SECONDARY_FILES}
+        self._secondary_paths      : Dict[str,Optional[Path]] = {mode.name:None for mode in CSVConnector._VALID_SECONDARY_FILES}
+        self._with_index           : bool                     = with_index
+        self._indices              : Dict[str,CSVIndex]       = {}
+        self._stream_compression   : bool                     = with_zipping and stream_compression
+        self._zip_workers          : int                      = zip_workers
+        self._zip_reports          : Dict[str,ZipReport]      = {}
+        self._writer               : Optional[DelimitedLineWriter]          = None
+        self._secondary_writers    : Dict[str,Optional[DelimitedLineWriter]] = {mode.name:None for mode in CSVConnector._VALID_SECONDARY_FILES}
+        self._with_checkpoints     : bool                         = with_checkpoints and not self._stream_compression
+        self._resumed_from         : Optional[ExportCheckpoint]   = None
+        if with_checkpoints and self._stream_compression:
+            Logger.Log("Checkpoints are not available when streaming compression, the export will not be resumable.", logging.WARNING)
 
     # *** PROPERTIES ***
 
@@ -51,44 +112,105 @@ class CSVConnector(StorageConnector):
     @property
     def SecondaryFiles(self) -> Dict[str, Optional[IO]]:
         return self._secondary_files
+
+    @property
+    def Writer(self) -> Optional[DelimitedLineWriter]:
+        """The buffered line writer for the primary file, when the connector is open for writing.
+
+        Lines given to the writer may sit in its buffer until the connector is closed,
+        so anything written straight to `File` as well will be out of order.
+
+        :return: The writer for the primary file, or None if the connector is not open for writing.
+        :rtype: Optional[DelimitedLineWriter]
+        """
+        return self._writer
+
+    @property
+    def SecondaryWriters(self) -> Dict[str, Optional[DelimitedLineWriter]]:
+        return self._secondary_writers
     @property
     def ZipPaths(self) -> Dict[str, Optional[Path]]:
         return self._zip_paths
 
+    @property
+    def Indices(self) -> Dict[str, CSVIndex]:
+        """The sidecar indices being built for the secondary files, keyed by the name of the file's mode.
+
+        :return: A mapping of mode names to indices, for each secondary file on which `StartIndex` was called.
+        :rtype: Dict[str, CSVIndex]
+        """
+        return self._indices
+
+    @property
+    def ResumedFrom(self) -> Optional[ExportCheckpoint]:
+        """The checkpoint the files were resumed from, when the connector was opened `with_checkpoints` and an earlier export was unfinished.
+
+        :return: The checkpoint of the earlier export, or None if the files were started over.
+        :rtype: Optional[ExportCheckpoint]
+        """
+        return self._resumed_from
+
+    @property
+    def ZipReports(self) -> Dict[str, ZipReport]:
+        """The time taken and sizes for each file zipped when the connector was closed, keyed by the name of the zip file.
+
+        :return: A mapping of zip file names to reports, which is empty until the connector is closed with zipping on.
+        :rtype: Dict[str, ZipReport]
+        """
+        return self._zip_reports
+
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
     def _open(self, writeable:bool=True) -> bool:
         ret_val = True
-        try:
-            self._file = open(self.StoreConfig.Filepath, mode="w+" if writeable else "r", encoding="utf-8")
-        except FileNotFoundError:
-            Logger.Log(f"Could not find file {self.StoreConfig.Filepath}.", logging.ERROR)
-            ret_val = False
+        if writeable and self._stream_compression:
+            ret_val = self._openStreams()
         else:
-            # FIXME : This is dumb, we should have a way to use the DatasetKey. Also, StoreConfig.Filename currently doesn't have the hash included. For features, it at least has _feature at end, though maybe that shouldn't be there yet either...
-            base_file_name : str  = "_".join(self.StoreConfig.Filename.split("_")[:-1])
+            self._resumed_from = self._loadCheckpoint() if writeable and self._with_checkpoints else None
+            try:
+                self._file = self._openFile(path=Path(self.StoreConfig.Filepath), writeable=writeable)
+            except FileNotFoundError:
+                Logger.Log(f"Could not find file {self.StoreConfig.Filepath}.", logging.ERROR)
+                ret_val = False
+            else:
+                # FIXME : This is dumb, we should have a way to use the DatasetKey. Also, StoreConfig.Filename currently doesn't have the hash included. For features, it at least has _feature at end, though maybe that shouldn't be there yet either...
+                base_file_name : str  = "_".join(self.StoreConfig.Filename.split("_")[:-1])
 
-            for mode in CSVConnector._VALID_SECONDARY_FILES:
-                if mode in self._with_secondary_files:
-                    suffix = self._SECONDARY_FILE_SUFFIXES[mode.name]
-                    file = self.StoreConfig.Folder / f"{base_file_name}_{suffix}.{self.FileExtension}"
-                    _zip  = self.StoreConfig.Folder / f"{base_file_name}_{suffix}.zip"
-                    try:
-                        self._secondary_files[mode.name] = open(file, "w+", encoding="utf-8")
-                    except FileNotFoundError:
-                        Logger.Log(f"Could not find file {file}.", logging.ERROR)
-                    else:
-                        self._zip_paths[mode.name] = _zip
+                for mode in CSVConnector._VALID_SECONDARY_FILES:
+                    if mode in self._with_secondary_files:
+                        suffix = self._SECONDARY_FILE_SUFFIXES[mode.name]
+                        file = self.StoreConfig.Folder / f"{base_file_name}_{suffix}.{self.FileExtension}"
+                        _zip  = self.StoreConfig.Folder / f"{base_file_name}_{suffix}.zip"
+                        try:
+                            self._secondary_files[mode.name] = self._openFile(path=file, writeable=True)
+                        except FileNotFoundError:
+                            Logger.Log(f"Could not find file {file}.", logging.ERROR)
+                        else:
+                            self._zip_paths[mode.name] = _zip
+                            self._secondary_paths[mode.name] = file
+        if writeable and ret_val:
+            self._openWriters()
 
         return ret_val
 
     def _close(self) -> bool:
         Logger.Log("Closing TSV connector...")
+        self._flushWriters()
         if self.File:
-            self.File.close()
-            self._closeSecondaryFiles()
-            if self._with_zipping:
-                self._zipFiles()
+            if isinstance(self.File, StreamingZipWriter):
+                self._closeStreams()
+            else:
+                self.File.close()
+                self._closeSecondaryFiles()
+                if self._with_zipping and self._with_checkpoints and ExportCheckpoint.PathFor(self.StoreConfig.Filepath).is_file():
+                    Logger.Log("Export was not finished, leaving files unzipped so it can be resumed from its checkpoint.", logging.WARNING)
+                    self._saveIndices()
+                elif self._with_zipping:
+                    # the indexed files are removed once zipped, so an index would have nothing to point into.
+                    self._removeIndices()
+                    self._zipFiles()
+                else:
+                    self._saveIndices()
 
         self._is_open = False
         return True
@@ -97,11 +219,70 @@ class CSVConnector(StorageConnector):
 
     # *** PUBLIC METHODS ***
 
+    def StartIndex(self, mode:ExportMode | AggregationMode, header:List[str]) -> Optional[CSVIndex]:
+        """Start building a sidecar index for a secondary file, once its header has been written.
+
+        Does nothing unless the connector was created `with_index`.
+
+        :param mode: The mode of the secondary file to index.
+        :type mode: ExportMode | AggregationMode
+        :param header: The column names of the file.
+        :type header: List[str]
+        :return: The new index, to which rows should be added with `CSVIndex.Observe` as they are written, or None if the file is not indexed.
+        :rtype: Optional[CSVIndex]
+        """
+        ret_val : Optional[CSVIndex] = None
+
+        f = self._secondary_files.get(mode.name)
+        if self._with_index and f is not None:
+            _writer = self._secondary_writers.get(mode.name)
+            ret_val = CSVIndex(columns=header, header_size=_writer.Tell() if _writer is not None else f.tell())
+            self._indices[mode.name] = ret_val
+        return ret_val
+
+    def SaveCheckpoint(self, last_session:str, session_count:int) -> Optional[ExportCheckpoint]:
+        """Record that every line up to and including a session has been written, so the export can be resumed after it.
+
+        All buffered lines are written out and synced to disk first, so the recorded file sizes are safe to cut back to.
+        Does nothing unless the connector was created `with_checkpoints`.
+
+        :param last_session: The ID of the last session whose lines were all written.
+        :type last_session: str
+        :param session_count: The number of sessions written so far, including earlier runs of the export.
+        :type session_count: int
+        :return: The saved checkpoint, or None if checkpoints are off or the connector is not open.
+        :rtype: Optional[ExportCheckpoint]
+        """
+        ret_val : Optional[ExportCheckpoint] = None
+
+        if self._with_checkpoints and self.IsOpen and self._file is not None:
+            self._flushWriters()
+            _offsets : Dict[str, int] = {}
+            _files = [(Path(self.StoreConfig.Filepath), self._file)] + [(self._secondary_paths[mode.name], self._secondary_files[mode.name]) for mode in self._VALID_SECONDARY_FILES]
+            for path, f in _files:
+                if path is not None and f is not None:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    _offsets[path.name] = f.tell()
+            ret_val = ExportCheckpoint(last_session=last_session, session_count=session_count, offsets=_offsets)
+            ret_val.Save(file_path=self.StoreConfig.Filepath)
+        return ret_val
+
+    def ClearCheckpoint(self) -> None:
+        """Mark the export as finished, removing its checkpoint so the next export starts over, and so the files are zipped at close.
+        """
+        if self._with_checkpoints:
+            ExportCheckpoint.Remove(file_path=self.StoreConfig.Filepath)
+
     def RemoveSecondaryFile(self, mode:ExportMode):
+        _writer = self._secondary_writers[mode.name]
+        if _writer is not None:
+            _writer.Flush()
         f = self._secondary_files[mode.name]
         if f is not None:
             f.close()
 
+        self._secondary_writers[mode.name] = None
         self._secondary_files[mode.name] = None
         if mode in self._with_secondary_files:
             self._with_secondary_files.remove(mode)
@@ -110,13 +291,150 @@ class CSVConnector(StorageConnector):
 
     # *** PRIVATE METHODS ***
 
+    def _openStreams(self) -> bool:
+        """Open a `StreamingZipWriter` for the primary file and each secondary file, in place of plain files.
+
+        :return: True if the primary stream was opened, otherwise False.
+        :rtype: bool
+        """
+        ret_val = True
+
+        base_file_name : str = "_".join(self.StoreConfig.Filename.split("_")[:-1]) # everything up to suffix
+        dataset_id     : str = "_".join(base_file_name.split("_")[:-1]) # everything up to short hash
+        _level = self.StoreConfig.CompressionLevel
+        for mode in CSVConnector._VALID_SECONDARY_FILES:
+            if mode in self._with_secondary_files:
+                self._zip_paths[mode.name] = self.StoreConfig.Folder / f"{base_file_name}_{self._SECONDARY_FILE_SUFFIXES[mode.name]}.zip"
+        # the streams write straight into the new zip files, so old zips of the dataset must be handled before they are opened.
+        self._renameExistingZips()
+        try:
+            self._file = StreamingZipWriter(
+                zip_path=Path(str(self.StoreConfig.Filepath).split(".")[0]+".zip"),
+                path_in_zip=Path(dataset_id) / self.StoreConfig.Filename,
+                compression_level=_level
+            )
+        except FileNotFoundError:
+            Logger.Log(f"Could not create zip file for {self.StoreConfig.Filepath}.", logging.ERROR)
+            ret_val = False
+        else:
+            for mode in CSVConnector._VALID_SECONDARY_FILES:
+                if mode in self._with_secondary_files:
+                    file_name = f"{base_file_name}_{self._SECONDARY_FILE_SUFFIXES[mode.name]}.{self.FileExtension}"
+                    _zip = self._zip_paths[mode.name]
+                    try:
+                        self._secondary_files[mode.name] = StreamingZipWriter(zip_path=_zip, path_in_zip=Path(dataset_id) / file_name, compression_level=_level)
+                    except FileNotFoundError:
+                        Logger.Log(f"Could not create zip file {_zip}.", logging.ERROR)
+                        self._zip_paths[mode.name] = None
+
+        return ret_val
+
+    def _expectedPaths(self) -> List[Path]:
+        """Get the paths of the primary file and each secondary file the connector writes.
+
+        :return: A list of paths, with the primary file first.
+        :rtype: List[Path]
+        """
+        base_file_name : str = "_".join(self.StoreConfig.Filename.split("_")[:-1])
+        return [Path(self.StoreConfig.Filepath)] + [
+            self.StoreConfig.Folder / f"{base_file_name}_{self._SECONDARY_FILE_SUFFIXES[mode.name]}.{self.FileExtension}"
+            for mode in CSVConnector._VALID_SECONDARY_FILES if mode in self._with_secondary_files
+        ]
+
+    def _loadCheckpoint(self) -> Optional[ExportCheckpoint]:
+        """Load the checkpoint of an earlier, unfinished export, if every file it covers is still at least as large as it recorded.
+
+        Otherwise, any old checkpoint is removed, since the files will be started over.
+
+        :return: The checkpoint to resume from, or None if the export should start over.
+        :rtype: Optional[ExportCheckpoint]
+        """
+        ret_val = ExportCheckpoint.Load(file_path=self.StoreConfig.Filepath)
+
+        if ret_val is not None:
+            for path in self._expectedPaths():
+                _offset = ret_val.Offsets.get(path.name)
+                _size = path.stat().st_size if path.is_file() else None
+                if _offset is None or _size is None or _size < _offset:
+                    Logger.Log(f"Checkpoint does not match {path}, so the export will start over.", logging.WARNING)
+                    ret_val = None
+                    break
+        if ret_val is not None:
+            Logger.Log(f"Resuming export after {ret_val.SessionCount} sessions, from session {ret_val.LastSession}", logging.INFO)
+        else:
+            ExportCheckpoint.Remove(file_path=self.StoreConfig.Filepath)
+        return ret_val
+
+    def _openFile(self, path:Path, writeable:bool) -> IO:
+        """Open one of the connector's files, cutting it back to its checkpointed size and appending when resuming an export.
+
+        :param path: The path of the file to open.
+        :type path: Path
+        :param writeable: Whether to open the file for writing, rather than reading.
+        :type writeable: bool
+        :return: The open file.
+        :rtype: IO
+        """
+        if not writeable:
+            return open(path, "r", encoding="utf-8")
+        elif self._resumed_from is not None:
+            # anything after the checkpoint belongs to a session that was not finished, and will be written again.
+            os.truncate(path, self._resumed_from.Offsets[path.name])
+            return open(path, "a+", encoding="utf-8")
+        else:
+            return open(path, "w+", encoding="utf-8")
+
+    def _openWriters(self) -> None:
+        self._writer = DelimitedLineWriter(file=self._file) if self._file is not None else None
+        for mode in CSVConnector._VALID_SECONDARY_FILES:
+            f = self._secondary_files[mode.name]
+            self._secondary_writers[mode.name] = DelimitedLineWriter(file=f) if f is not None else None
+
+    def _flushWriters(self) -> None:
+        for _writer in [self._writer] + list(self._secondary_writers.values()):
+            if _writer is not None:
+                _writer.Flush()
+
+    def _closeStreams(self) -> None:
+        """Finish each `StreamingZipWriter`, adding the folder's README to each archive if there is one.
+        """
+        base_file_name : str = "_".join(self.StoreConfig.Filename.split("_")[:-1]) # everything up to suffix
+        dataset_id     : str = "_".join(base_file_name.split("_")[:-1]) # everything up to short hash
+        readme_path = self.StoreConfig.Folder / "README.md"
+        _extras = [(readme_path, str(Path(dataset_id) / "README.md"))] if readme_path.is_file() else []
+        if not readme_path.is_file():
+            Logger.Log(f"Missing readme in {self.StoreConfig.Folder}, consider generating readme...", logging.WARNING, depth=1)
+        for stream in [self._file] + [self._secondary_files[mode.name] for mode in self._VALID_SECONDARY_FILES]:
+            if isinstance(stream, StreamingZipWriter):
+                try:
+                    stream.close(extra_files=_extras)
+                except Exception as err:
+                    Logger.Log(f"Could not finish zip file {stream.ZipPath}: {type(err)} {err}", logging.ERROR)
+
     def _closeSecondaryFiles(self) -> None:
         for mode in self._VALID_SECONDARY_FILES:
             f = self._secondary_files[mode.name]
             if f is not None:
                 f.close()
 
-    def _zipFiles(self) -> None:
+    def _saveIndices(self) -> None:
+        for mode_name, index in self._indices.items():
+            _path = self._secondary_paths.get(mode_name)
+            if _path is not None and _path.is_file():
+                try:
+                    index.Save(file_path=_path)
+                except OSError as err:
+                    Logger.Log(f"Could not write index for {_path}: {err}", logging.WARNING)
+
+    def _removeIndices(self) -> None:
+        for mode_name in self._indices.keys():
+            _path = self._secondary_paths.get(mode_name)
+            if _path is not None:
+                CSVIndex.PathFor(_path).unlink(missing_ok=True)
+        if len(self._indices) > 0:
+            Logger.Log("Sidecar indices only apply to unzipped files, so no index was saved for the zipped export.", logging.INFO)
+
+    def _renameExistingZips(self) -> None:
         # if we have already done this dataset before, rename old zip files
         # (of course, first check if we ever exported this game before).
         if self._existing_meta is not None:
@@ -127,21 +445,21 @@ class CSVConnector(StorageConnector):
             _existing_players_file = self._existing_meta.get('players_file', None)
             _existing_pop_file     = self._existing_meta.get('population_file', None)
             try:
-                if _existing_game_events_file is not None and Path(_existing_game_events_file).is_file() and self._zip_paths['game_events'] is not None:
-                    Logger.Log(f"Renaming {str(_existing_game_events_file)} -> {self._zip_paths['game_events']}", logging.DEBUG)
-                    os.rename(_existing_game_events_file, str(self._zip_paths['game_events']))
+                if _existing_game_events_file is not None and Path(_existing_game_events_file).is_file() and self._zip_paths[ExportMode.EVENTS.name] is not None:
+                    Logger.Log(f"Renaming {str(_existing_game_events_file)} -> {self._zip_paths[ExportMode.EVENTS.name]}", logging.DEBUG)
+                    os.rename(_existing_game_events_file, str(self._zip_paths[ExportMode.EVENTS.name]))
                 # if _existing_all_events_file is not None and Path(_existing_all_events_file).is_file() and self._zip_paths['all_events'] is not None:
                 #     Logger.Log(f"Renaming {str(_existing_all_events_file)} -> {self._zip_paths['all_events']}", logging.DEBUG)
                 #     os.rename(_existing_all_events_file, str(self._zip_paths['all_events']))
-                if _existing_sess_file is not None and Path(_existing_sess_file).is_file() and self._zip_paths['sessions'] is not None:
-                    Logger.Log(f"Renaming {str(_existing_sess_file)} -> {self._zip_paths['sessions']}", logging.DEBUG)
-                    os.rename(_existing_sess_file, str(self._zip_paths['sessions']))
-                if _existing_players_file is not None and Path(_existing_players_file).is_file() and self._zip_paths['players'] is not None:
-                    Logger.Log(f"Renaming {str(_existing_players_file)} -> {self._zip_paths['players']}", logging.DEBUG)
-                    os.rename(_existing_players_file, str(self._zip_paths['players']))
-                if _existing_pop_file is not None and Path(_existing_pop_file).is_file() and self._zip_paths['population'] is not None:
-                    Logger.Log(f"Renaming {str(_existing_pop_file)} -> {self._zip_paths['population']}", logging.DEBUG)
-                    os.rename(_existing_pop_file, str(self._zip_paths['population']))
+                if _existing_sess_file is not None and Path(_existing_sess_file).is_file() and self._zip_paths[AggregationMode.SESSION.name] is not None:
+                    Logger.Log(f"Renaming {str(_existing_sess_file)} -> {self._zip_paths[AggregationMode.SESSION.name]}", logging.DEBUG)
+                    os.rename(_existing_sess_file, str(self._zip_paths[AggregationMode.SESSION.name]))
+                if _existing_players_file is not None and Path(_existing_players_file).is_file() and self._zip_paths[AggregationMode.PLAYER.name] is not None:
+                    Logger.Log(f"Renaming {str(_existing_players_file)} -> {self._zip_paths[AggregationMode.PLAYER.name]}", logging.DEBUG)
+                    os.rename(_existing_players_file, str(self._zip_paths[AggregationMode.PLAYER.name]))
+                if _existing_pop_file is not None and Path(_existing_pop_file).is_file() and self._zip_paths[AggregationMode.POPULATION.name] is not None:
+                    Logger.Log(f"Renaming {str(_existing_pop_file)} -> {self._zip_paths[AggregationMode.POPULATION.name]}", logging.DEBUG)
+                    os.rename(_existing_pop_file, str(self._zip_paths[AggregationMode.POPULATION.name]))
             except FileExistsError as err:
                 msg = f"Error while setting up zip files, could not rename an existing file because another file is already using the target name! {err}"
                 Logger.Log(msg, logging.ERROR)
@@ -149,55 +467,66 @@ class CSVConnector(StorageConnector):
                 msg = f"Unexpected error while setting up zip files! {type(err)} : {err}"
                 Logger.Log(msg, logging.ERROR)
                 traceback.print_tb(err.__traceback__)
+
+    def _zipFiles(self) -> None:
+        self._renameExistingZips()
         # for each file, try to save out the csv/tsv to a file - if it's one that should be exported, that is.
-        readme_path = self.StoreConfig.Folder / "README.md"
+        base_file_name : str  = "_".join(self.StoreConfig.Filename.split("_")[:-1]) # everything up to suffix
+        dataset_id     : str  = "_".join(base_file_name.split("_")[:-1]) # everything up to short hash
+        readme_path    : Path = self.StoreConfig.Folder / "README.md"
+        if not readme_path.is_file():
+            Logger.Log(f"Missing readme in {self.StoreConfig.Folder}, consider generating readme...", logging.WARNING, depth=1)
+        _jobs : List[Tuple[Path, Path, Path]] = []
         for mode in self._VALID_SECONDARY_FILES:
             z_path = self._zip_paths[mode.name]
             if z_path is not None:
-                with zipfile.ZipFile(z_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
-                    base_file_name : str = "_".join(self.StoreConfig.Filename.split("_")[:-1]) # everything up to suffix
-                    dataset_id     : str = "_".join(base_file_name.split("_")[:-1]) # everything up to short hash
-                    file_name = f"{base_file_name}_{self._SECONDARY_FILE_SUFFIXES[mode.name]}.{self.FileExtension}"
-                    try:
-                        self._addToZip(
-                            path=self.StoreConfig.Folder / file_name,
-                            zip_file=zip_file,
-                            path_in_zip=Path(dataset_id) / file_name
-                        )
-                        if readme_path.is_file():
-                            self._addToZip(
-                                path=self.StoreConfig.Folder / "README.md",
-                                zip_file=zip_file,
-                                path_in_zip=Path(dataset_id) / "README.md"
-                            )
-                        else:
-                            Logger.Log(f"Missing readme in {self.StoreConfig.Folder}, consider generating readme...", logging.WARNING, depth=1)
-                        zip_file.close()
-                        os.remove(self.StoreConfig.Folder / file_name)
-                    except FileNotFoundError as err:
-                        Logger.Log(f"FileNotFoundError Exception: {err}", logging.ERROR)
-                        traceback.print_tb(err.__traceback__)
+                file_name = f"{base_file_name}_{self._SECONDARY_FILE_SUFFIXES[mode.name]}.{self.FileExtension}"
+                _jobs.append((z_path, self.StoreConfig.Folder / file_name, Path(dataset_id) / file_name))
         # finally, zip up the primary output file.
-        with zipfile.ZipFile(str(self.StoreConfig.Filepath).split(".")[0]+".zip", "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
-            try:
-                self._addToZip(
-                    path=self.StoreConfig.Filepath,
-                    zip_file=zip_file,
-                    path_in_zip=Path(dataset_id) / self.StoreConfig.Filename
-                )
+        _jobs.append((Path(str(self.StoreConfig.Filepath).split(".")[0]+".zip"), Path(self.StoreConfig.Filepath), Path(dataset_id) / self.StoreConfig.Filename))
+        # each archive is independent, and zlib releases the GIL while compressing, so a pool of threads can zip them side by side.
+        _start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self._zip_workers, len(_jobs))), thread_name_prefix="zip") as pool:
+            _reports = list(pool.map(
+                lambda job : self._zipFile(zip_path=job[0], path=job[1], path_in_zip=job[2], readme_path=readme_path, readme_in_zip=Path(dataset_id) / "README.md"),
+                _jobs
+            ))
+        self._zip_reports = {report.ZipPath.name : report for report in _reports if report is not None}
+        Logger.Log(f"Zipped {len(self._zip_reports)} of {len(_jobs)} files in {time.perf_counter() - _start:.2f}s", logging.INFO)
+
+    def _zipFile(self, zip_path:Path, path:Path, path_in_zip:Path, readme_path:Path, readme_in_zip:Path) -> Optional[ZipReport]:
+        """Zip up a single output file, along with the readme if there is one, and remove the original.
+
+        :param zip_path: The path of the zip file to create.
+        :type zip_path: Path
+        :param path: The path of the file to zip.
+        :type path: Path
+        :param path_in_zip: The path of the file within the zip.
+        :type path_in_zip: Path
+        :param readme_path: The path of the readme to include, which is skipped if it does not exist.
+        :type readme_path: Path
+        :param readme_in_zip: The path of the readme within the zip.
+        :type readme_in_zip: Path
+        :return: The time taken and sizes for the file, or None if the file could not be zipped.
+        :rtype: Optional[ZipReport]
+        """
+        ret_val : Optional[ZipReport] = None
+
+        _start = time.perf_counter()
+        try:
+            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=self.StoreConfig.CompressionLevel) as zip_file:
+                self._addToZip(path=path, zip_file=zip_file, path_in_zip=path_in_zip)
                 if readme_path.is_file():
-                    self._addToZip(
-                        path=self.StoreConfig.Folder / "README.md",
-                        zip_file=zip_file,
-                        path_in_zip=Path(dataset_id) / "README.md"
-                    )
-                else:
-                    Logger.Log(f"Missing readme in {self.StoreConfig.Folder}, consider generating readme...", logging.WARNING, depth=1)
-                zip_file.close()
-                os.remove(self.StoreConfig.Filepath)
-            except FileNotFoundError as err:
-                Logger.Log(f"FileNotFoundError Exception: {err}", logging.ERROR)
-                traceback.print_tb(err.__traceback__)
+                    self._addToZip(path=readme_path, zip_file=zip_file, path_in_zip=readme_in_zip)
+            _raw_size = path.stat().st_size
+            os.remove(path)
+        except FileNotFoundError as err:
+            Logger.Log(f"FileNotFoundError Exception: {err}", logging.ERROR)
+            traceback.print_tb(err.__traceback__)
+        else:
+            ret_val = ZipReport(ZipPath=zip_path, Seconds=time.perf_counter() - _start, RawBytes=_raw_size, ZippedBytes=zip_path.stat().st_size)
+            Logger.Log(f"Zipped {path.name} in {ret_val.Seconds:.2f}s, {ret_val.RawBytes} -> {ret_val.ZippedBytes} bytes ({ret_val.Ratio:.1%} of original)", logging.INFO)
+        return ret_val
 
     @staticmethod
     def _addToZip(path, zip_file, path_in_zip) -> None:
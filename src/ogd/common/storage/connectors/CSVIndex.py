@@ -0,0 +1,283 @@
+"""CSVIndex Module
+"""
+
+# import standard libraries
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, List, Optional, Set
+# import locals
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow, Pair
+
+class _SessionEntry:
+    """Index data for a single session: where its lines are in the file, and when it ran."""
+    __slots__ = ("ranges", "min_time", "max_time", "users")
+
+    def __init__(self):
+        self.ranges   : List[List[int]]    = []
+        self.min_time : Optional[datetime] = None
+        self.max_time : Optional[datetime] = None
+        self.users    : Set[str]           = set()
+
+class CSVIndex:
+    """Sidecar index for an exported file of events, to answer metadata queries and single-session fetches without scanning the file.
+
+    For each session, the index holds the byte ranges of the session's lines in the file, the minimum and maximum event timestamps,
+    and the players seen in the session.
+    For the file as a whole, it holds the distinct app versions, log versions, branches, and event names.
+
+    An index is built while the file is written, by passing each batch of rows to `Observe` along with the lines written for them,
+    and saved next to the file with `Save`.
+    When reading, `Load` only returns an index whose recorded file size matches the file, so an index left behind by an older export is ignored.
+    """
+
+    _VERSION : Final[int] = 1
+    _SUFFIX  : Final[str] = ".index.json"
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, columns:List[str], header_size:int=0):
+        """Constructor for a CSVIndex.
+
+        :param columns: The column names of the indexed file, in file order.
+        :type columns: List[str]
+        :param header_size: The size, in bytes, of the header line(s) at the start of the file, defaults to 0
+        :type header_size: int, optional
+        """
+        self._columns      : List[str]                  = list(columns)
+        self._header_size  : int                        = header_size
+        self._file_size    : int                        = header_size
+        self._sessions     : Dict[str, _SessionEntry]   = {}
+        self._app_versions : Set[str]                   = set()
+        self._log_versions : Set[str]                   = set()
+        self._app_branches : Set[str]                   = set()
+        self._event_names  : Set[str]                   = set()
+
+        _positions = {name:i for i, name in enumerate(self._columns)}
+        self._session_col     : Optional[int] = _positions.get("session_id")
+        self._user_col        : Optional[int] = _positions.get("user_id")
+        self._timestamp_col   : Optional[int] = _positions.get("timestamp")
+        self._app_version_col : Optional[int] = _positions.get("app_version")
+        self._log_version_col : Optional[int] = _positions.get("log_version")
+        self._app_branch_col  : Optional[int] = _positions.get("app_branch")
+        self._event_name_col  : Optional[int] = _positions.get("event_name")
+
+    @property
+    def Columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def HeaderSize(self) -> int:
+        return self._header_size
+
+    @property
+    def FileSize(self) -> int:
+        """The size of the indexed file, in bytes, as of when the index was saved, or of the last line observed if not yet saved.
+
+        :return: The size of the indexed file.
+        :rtype: int
+        """
+        return self._file_size
+
+    @property
+    def SessionIDs(self) -> List[str]:
+        return list(self._sessions.keys())
+
+    @property
+    def AppVersions(self) -> List[str]:
+        return sorted(self._app_versions)
+
+    @property
+    def LogVersions(self) -> List[str]:
+        return sorted(self._log_versions)
+
+    @property
+    def AppBranches(self) -> List[str]:
+        return sorted(self._app_branches)
+
+    @property
+    def EventNames(self) -> List[str]:
+        return sorted(self._event_names)
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def PathFor(file_path:Path | str) -> Path:
+        """Get the path of the sidecar index for a given file.
+
+        :param file_path: The path to the indexed file.
+        :type file_path: Path | str
+        :return: The path to the file's sidecar index.
+        :rtype: Path
+        """
+        _path = Path(file_path)
+        return _path.with_name(_path.name + CSVIndex._SUFFIX)
+
+    @staticmethod
+    def Load(file_path:Path | str) -> Optional["CSVIndex"]:
+        """Load the sidecar index for a given file, if there is an up-to-date one.
+
+        :param file_path: The path to the indexed file (not to the index itself).
+        :type file_path: Path | str
+        :return: The index, or None if there is no index, it could not be read, or it does not match the current file.
+        :rtype: Optional[CSVIndex]
+        """
+        ret_val : Optional[CSVIndex] = None
+
+        _index_path = CSVIndex.PathFor(file_path)
+        if _index_path.is_file():
+            try:
+                with open(_index_path, "r", encoding="utf-8") as index_file:
+                    ret_val = CSVIndex.FromDict(json.load(index_file))
+            except (OSError, ValueError, KeyError, TypeError) as err:
+                Logger.Log(f"Could not load index {_index_path}, it will be ignored: {type(err)} {err}", logging.WARNING)
+            else:
+                _size = Path(file_path).stat().st_size if Path(file_path).is_file() else None
+                if ret_val.FileSize != _size:
+                    Logger.Log(f"Index {_index_path} is for a {ret_val.FileSize}-byte file, but {file_path} is {_size} bytes; the index will be ignored.", logging.WARNING)
+                    ret_val = None
+        return ret_val
+
+    @staticmethod
+    def FromDict(unparsed:Dict[str, Any]) -> "CSVIndex":
+        if unparsed.get("version") != CSVIndex._VERSION:
+            raise ValueError(f"Unsupported index version {unparsed.get('version')}")
+        ret_val = CSVIndex(columns=unparsed["columns"], header_size=unparsed["header_size"])
+        ret_val._file_size    = unparsed["file_size"]
+        ret_val._app_versions = set(unparsed["app_versions"])
+        ret_val._log_versions = set(unparsed["log_versions"])
+        ret_val._app_branches = set(unparsed["app_branches"])
+        ret_val._event_names  = set(unparsed["event_names"])
+        for session_id, raw_entry in unparsed["sessions"].items():
+            entry = _SessionEntry()
+            entry.ranges   = [list(byte_range) for byte_range in raw_entry["ranges"]]
+            entry.min_time = datetime.fromisoformat(raw_entry["min"]) if raw_entry["min"] else None
+            entry.max_time = datetime.fromisoformat(raw_entry["max"]) if raw_entry["max"] else None
+            entry.users    = set(raw_entry["users"])
+            ret_val._sessions[session_id] = entry
+        return ret_val
+
+    # *** PUBLIC METHODS ***
+
+    def Observe(self, offset:int, rows:List[ExportRow], lines:List[str]) -> None:
+        """Add a batch of rows to the index.
+
+        :param offset: The byte offset in the file at which the first line of the batch was written.
+        :type offset: int
+        :param rows: The rows that were written, with elements in the order of the index columns.
+        :type rows: List[ExportRow]
+        :param lines: The lines that were written for the rows, one per row, in the same order.
+        :type lines: List[str]
+        """
+        _position = offset
+        for row, line in zip(rows, lines):
+            _end = _position + len(line.encode("utf-8"))
+            session_id = str(row[self._session_col]) if self._session_col is not None else ""
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                entry = _SessionEntry()
+                self._sessions[session_id] = entry
+            if entry.ranges and entry.ranges[-1][1] == _position:
+                entry.ranges[-1][1] = _end
+            else:
+                entry.ranges.append([_position, _end])
+            if self._user_col is not None and row[self._user_col] is not None:
+                entry.users.add(str(row[self._user_col]))
+            if self._timestamp_col is not None:
+                _time = self._toDatetime(row[self._timestamp_col])
+                if _time is not None:
+                    if entry.min_time is None or self._utcKey(_time) < self._utcKey(entry.min_time):
+                        entry.min_time = _time
+                    if entry.max_time is None or self._utcKey(_time) > self._utcKey(entry.max_time):
+                        entry.max_time = _time
+            if self._app_version_col is not None:
+                self._app_versions.add(str(row[self._app_version_col]))
+            if self._log_version_col is not None:
+                self._log_versions.add(str(row[self._log_version_col]))
+            if self._app_branch_col is not None:
+                self._app_branches.add(str(row[self._app_branch_col]))
+            if self._event_name_col is not None:
+                self._event_names.add(str(row[self._event_name_col]))
+            _position = _end
+        self._file_size = max(self._file_size, _position)
+
+    def SessionRanges(self, session_ids:Iterable[str]) -> List[Pair[int, int]]:
+        """Get the byte ranges of all lines for the given sessions, in file order.
+
+        :param session_ids: The sessions whose lines are wanted. Sessions not in the index are ignored.
+        :type session_ids: Iterable[str]
+        :return: A list of (start, end) byte offsets, with `end` exclusive.
+        :rtype: List[Pair[int, int]]
+        """
+        return sorted(
+            (start, end)
+            for session_id in session_ids if session_id in self._sessions
+            for start, end in self._sessions[session_id].ranges
+        )
+
+    def SessionTimes(self, session_id:str) -> Pair[Optional[datetime], Optional[datetime]]:
+        entry = self._sessions.get(session_id)
+        return (entry.min_time, entry.max_time) if entry is not None else (None, None)
+
+    def SessionUsers(self, session_id:str) -> Set[str]:
+        entry = self._sessions.get(session_id)
+        return entry.users if entry is not None else set()
+
+    def AsDict(self) -> Dict[str, Any]:
+        return {
+            "version"      : CSVIndex._VERSION,
+            "columns"      : self._columns,
+            "header_size"  : self._header_size,
+            "file_size"    : self._file_size,
+            "app_versions" : self.AppVersions,
+            "log_versions" : self.LogVersions,
+            "app_branches" : self.AppBranches,
+            "event_names"  : self.EventNames,
+            "sessions"     : {
+                session_id : {
+                    "ranges" : entry.ranges,
+                    "min"    : entry.min_time.isoformat() if entry.min_time is not None else None,
+                    "max"    : entry.max_time.isoformat() if entry.max_time is not None else None,
+                    "users"  : sorted(entry.users)
+                }
+                for session_id, entry in self._sessions.items()
+            }
+        }
+
+    def Save(self, file_path:Path | str) -> Path:
+        """Write the index next to the file it indexes.
+
+        The file should be complete and closed, since its current size is recorded in the index,
+        and `Load` ignores the index if the file size changes.
+
+        :param file_path: The path to the indexed file (not to the index itself).
+        :type file_path: Path | str
+        :return: The path to which the index was written.
+        :rtype: Path
+        """
+        _index_path = CSVIndex.PathFor(file_path)
+        if Path(file_path).is_file():
+            self._file_size = Path(file_path).stat().st_size
+        with open(_index_path, "w", encoding="utf-8") as index_file:
+            json.dump(self.AsDict(), index_file)
+        Logger.Log(f"Wrote index of {len(self._sessions)} sessions to {_index_path}", logging.DEBUG)
+        return _index_path
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _toDatetime(value:Any) -> Optional[datetime]:
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _utcKey(value:datetime) -> datetime:
+        return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo is not None else value
+
+    # *** PRIVATE METHODS ***
@@ -0,0 +1,110 @@
+"""DelimitedLineWriter Module
+"""
+
+# import standard libraries
+from functools import lru_cache
+from typing import Any, Dict, Final, IO, Iterable, List
+# import locals
+from ogd.common.utils.typing import ExportRow
+
+class DelimitedLineWriter:
+    """Buffered writer of delimited lines, for the files of a `CSVConnector`.
+
+    Each field is converted to a string and escaped in a single pass, with a precomputed `str.translate` table
+    that turns newlines into spaces and tabs into a few spaces, so no field can break a line apart.
+    Lines are collected in a reusable buffer, and only handed to the file once a block of text is ready,
+    so writing many small batches of rows costs about the same as writing a few large ones.
+
+    Since text may still be in the buffer, anything that needs the file's position should use `Tell`, which flushes first,
+    and the writer must be flushed before its file is closed.
+    """
+
+    _DEFAULT_BLOCK_SIZE : Final[int] = 1 << 20
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, file:IO, delimiter:str="\t", tab_width:int=3, block_size:int=_DEFAULT_BLOCK_SIZE):
+        """Constructor for a DelimitedLineWriter.
+
+        :param file: The text file to write to.
+        :type file: IO
+        :param delimiter: The delimiter placed between fields, defaults to "\\t"
+        :type delimiter: str, optional
+        :param tab_width: The number of spaces to put in place of each tab within a field, defaults to 3
+        :type tab_width: int, optional
+        :param block_size: The number of characters to collect before writing to the file, defaults to 1MiB
+        :type block_size: int, optional
+        """
+        self._file        : IO                = file
+        self._delimiter   : str               = delimiter
+        self._table       : Dict[int, str]    = DelimitedLineWriter.EscapeTable(tab_width=tab_width)
+        self._block_size  : int               = block_size
+        self._buffer      : List[str]         = []
+        self._buffer_len  : int               = 0
+
+    @property
+    def File(self) -> IO:
+        return self._file
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def EscapeTable(tab_width:int=3) -> Dict[int, str]:
+        """Get the `str.translate` table used to escape fields, so they contain no newlines or tabs.
+
+        :param tab_width: The number of spaces to put in place of each tab, defaults to 3
+        :type tab_width: int, optional
+        :return: A translation table mapping newlines to a space, and tabs to `tab_width` spaces.
+        :rtype: Dict[int, str]
+        """
+        return str.maketrans({"\n":" ", "\t":" "*tab_width})
+
+    # *** PUBLIC METHODS ***
+
+    def FormatLine(self, row:ExportRow | List[Any]) -> str:
+        """Turn a row into a single, newline-terminated line of escaped fields.
+
+        :param row: The values of the row.
+        :type row: ExportRow | List[Any]
+        :return: The line for the row.
+        :rtype: str
+        """
+        _table = self._table
+        return self._delimiter.join([str(value).translate(_table) for value in row]) + "\n"
+
+    def FormatLines(self, rows:Iterable[ExportRow | List[Any]]) -> List[str]:
+        return [self.FormatLine(row) for row in rows]
+
+    def WriteLines(self, lines:Iterable[str]) -> None:
+        """Add already-formatted lines to the buffer, writing the buffer out each time it holds a full block.
+
+        :param lines: The lines to write, each of which should end with a newline.
+        :type lines: Iterable[str]
+        """
+        _buffer = self._buffer
+        for line in lines:
+            _buffer.append(line)
+            self._buffer_len += len(line)
+            if self._buffer_len >= self._block_size:
+                self.Flush()
+
+    def WriteRows(self, rows:Iterable[ExportRow | List[Any]]) -> None:
+        self.WriteLines(self.FormatLine(row) for row in rows)
+
+    def Tell(self) -> int:
+        """Get the position in the file at which the next line will be written.
+
+        This writes out the buffer first, so the file's own position is accurate.
+
+        :return: The position of the file, after all lines written so far.
+        :rtype: int
+        """
+        self.Flush()
+        return self._file.tell()
+
+    def Flush(self) -> None:
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffer_len = 0
@@ -0,0 +1,157 @@
+"""ExportCheckpoint Module
+"""
+
+# import standard libraries
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, List, Optional
+# import locals
+from ogd.common.utils.Logger import Logger
+
+class ExportCheckpoint:
+    """Small manifest of how far an export got, so an interrupted export can pick up where it left off.
+
+    A checkpoint holds the last session whose lines were fully written, the number of sessions written so far,
+    and the size in bytes of each output file at that point.
+    When an export is resumed, each file is cut back to its recorded size, to drop any lines written after the checkpoint,
+    and the export continues with the sessions after the last one in the checkpoint.
+
+    The manifest is saved next to the primary output file, and is replaced atomically, so a crash while saving leaves the previous checkpoint intact.
+    """
+
+    _VERSION : Final[int] = 1
+    _SUFFIX  : Final[str] = ".checkpoint.json"
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, last_session:Optional[str]=None, session_count:int=0, offsets:Optional[Dict[str, int]]=None):
+        """Constructor for an ExportCheckpoint.
+
+        :param last_session: The ID of the last session whose lines were fully written, defaults to None
+        :type last_session: Optional[str], optional
+        :param session_count: The number of sessions written so far, defaults to 0
+        :type session_count: int, optional
+        :param offsets: The size in bytes of each output file, keyed by file, defaults to None
+        :type offsets: Optional[Dict[str, int]], optional
+        """
+        self._last_session  : Optional[str]  = last_session
+        self._session_count : int            = session_count
+        self._offsets       : Dict[str, int] = offsets or {}
+
+    @property
+    def LastSession(self) -> Optional[str]:
+        return self._last_session
+
+    @property
+    def SessionCount(self) -> int:
+        return self._session_count
+
+    @property
+    def Offsets(self) -> Dict[str, int]:
+        return self._offsets
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def PathFor(file_path:Path | str) -> Path:
+        """Get the path of the checkpoint manifest for a given output file.
+
+        :param file_path: The path to the primary output file of the export.
+        :type file_path: Path | str
+        :return: The path to the export's checkpoint manifest.
+        :rtype: Path
+        """
+        _path = Path(file_path)
+        return _path.with_name(_path.name + ExportCheckpoint._SUFFIX)
+
+    @staticmethod
+    def Load(file_path:Path | str) -> Optional["ExportCheckpoint"]:
+        """Load the checkpoint manifest for a given output file, if there is one.
+
+        :param file_path: The path to the primary output file of the export (not to the manifest itself).
+        :type file_path: Path | str
+        :return: The checkpoint, or None if there is no manifest or it could not be read.
+        :rtype: Optional[ExportCheckpoint]
+        """
+        ret_val : Optional[ExportCheckpoint] = None
+
+        _manifest_path = ExportCheckpoint.PathFor(file_path)
+        if _manifest_path.is_file():
+            try:
+                with open(_manifest_path, "r", encoding="utf-8") as manifest_file:
+                    ret_val = ExportCheckpoint.FromDict(json.load(manifest_file))
+            except (OSError, ValueError, KeyError, TypeError) as err:
+                Logger.Log(f"Could not load checkpoint {_manifest_path}, it will be ignored: {type(err)} {err}", logging.WARNING)
+        return ret_val
+
+    @staticmethod
+    def FromDict(unparsed:Dict[str, Any]) -> "ExportCheckpoint":
+        if unparsed.get("version") != ExportCheckpoint._VERSION:
+            raise ValueError(f"Unsupported checkpoint version {unparsed.get('version')}")
+        return ExportCheckpoint(
+            last_session=unparsed["last_session"],
+            session_count=int(unparsed["session_count"]),
+            offsets={str(key) : int(offset) for key, offset in unparsed["offsets"].items()}
+        )
+
+    @staticmethod
+    def Remove(file_path:Path | str) -> None:
+        """Delete the checkpoint manifest for a given output file, once the export is finished.
+
+        :param file_path: The path to the primary output file of the export (not to the manifest itself).
+        :type file_path: Path | str
+        """
+        _manifest_path = ExportCheckpoint.PathFor(file_path)
+        try:
+            _manifest_path.unlink(missing_ok=True)
+        except OSError as err:
+            Logger.Log(f"Could not remove checkpoint {_manifest_path}: {err}", logging.WARNING)
+
+    # *** PUBLIC METHODS ***
+
+    def RemainingSessions(self, session_ids:Iterable[str]) -> List[str]:
+        """Get the sessions still to be exported, out of all the sessions in the export.
+
+        :param session_ids: The IDs of all sessions in the export, in the order they are exported.
+        :type session_ids: Iterable[str]
+        :return: The IDs of the sessions after the last one in the checkpoint, or all of them if the checkpoint has no session.
+        :rtype: List[str]
+        """
+        ret_val = list(session_ids)
+
+        if self._last_session is not None:
+            try:
+                ret_val = ret_val[ret_val.index(self._last_session) + 1:]
+            except ValueError:
+                Logger.Log(f"Last checkpointed session {self._last_session} is not in the export, so no sessions will be skipped.", logging.WARNING)
+        return ret_val
+
+    def AsDict(self) -> Dict[str, Any]:
+        return {
+            "version"       : ExportCheckpoint._VERSION,
+            "last_session"  : self._last_session,
+            "session_count" : self._session_count,
+            "offsets"       : self._offsets
+        }
+
+    def Save(self, file_path:Path | str) -> Path:
+        """Write the checkpoint manifest next to the primary output file.
+
+        The manifest is written to a temporary file, which then replaces the old manifest in one step.
+
+        :param file_path: The path to the primary output file of the export (not to the manifest itself).
+        :type file_path: Path | str
+        :return: The path to which the manifest was written.
+        :rtype: Path
+        """
+        _manifest_path = ExportCheckpoint.PathFor(file_path)
+        _temp_path     = _manifest_path.with_name(_manifest_path.name + ".tmp")
+        with open(_temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(self.AsDict(), manifest_file)
+            manifest_file.flush()
+            os.fsync(manifest_file.fileno())
+        os.replace(_temp_path, _manifest_path)
+        Logger.Log(f"Checkpointed export after {self._session_count} sessions, at session {self._last_session}", logging.DEBUG)
+        return _manifest_path
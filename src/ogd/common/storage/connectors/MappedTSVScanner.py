@@ -0,0 +1,108 @@
+"""MappedTSVScanner Module
+"""
+
+# import standard libraries
+import logging
+import mmap
+from typing import Callable, Dict, IO, Iterator, List, Optional, Tuple
+# import locals
+from ogd.common.utils.Logger import Logger
+
+type FieldPredicate = Callable[[Optional[str]], bool]
+
+class MappedTSVScanner:
+    """Reader for uncompressed delimited files, which memory-maps the file and decodes only the fields asked for.
+
+    Lines are read straight from the memory map, and each is split only as far as the last column needed,
+    so trailing columns (typically the large JSON columns of an event file) are never split apart or decoded unless requested.
+    Fields used to filter lines are decoded first, and the other requested fields only for lines that pass the filters.
+
+    Fields are returned as strings, or None for empty fields, without any type conversion;
+    that is left to whatever consumes the rows, e.g. an `EventTableSchema` decoder, so JSON in particular is only parsed when an `Event` is built.
+    The scanner does not handle quoted fields, so it is only suitable for files written without them, such as the TSV files from `CSVOuterface`.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, file:IO, delimiter:str="\t", encoding:str="utf-8"):
+        """Constructor for a MappedTSVScanner.
+
+        :param file: An open file, which must be a real file on disk (i.e. have a `fileno`). The scanner does not move the file's own position.
+        :type file: IO
+        :param delimiter: The field delimiter, defaults to "\\t"
+        :type delimiter: str, optional
+        :param encoding: The text encoding of the file, defaults to "utf-8"
+        :type encoding: str, optional
+        """
+        self._encoding   : str                 = encoding
+        self._delimiter  : bytes               = delimiter.encode(encoding)
+        self._map        : Optional[mmap.mmap] = None
+        self._header     : List[str]           = []
+        self._body_start : int                 = 0
+
+        try:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses to map empty files, in which case there is nothing to scan anyway.
+            Logger.Log("File to scan was empty, no lines will be read.", logging.DEBUG)
+        else:
+            _header_line = self._map.readline()
+            self._header = _header_line.rstrip(b"\r\n").decode(self._encoding).split(delimiter)
+            self._body_start = self._map.tell()
+        self._positions : Dict[str, int] = {name:i for i, name in enumerate(self._header)}
+
+    def __enter__(self) -> "MappedTSVScanner":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.Close()
+
+    @property
+    def Header(self) -> List[str]:
+        return self._header
+
+    # *** PUBLIC METHODS ***
+
+    def Scan(self, columns:List[Optional[str]], where:Optional[Dict[str, FieldPredicate]]=None) -> Iterator[Tuple[Optional[str], ...]]:
+        """Scan the file for the given columns, from the lines that pass all of the given field predicates.
+
+        :param columns: The names of the columns to return, in the order they should appear in each returned tuple.
+            Columns that are None, or not in the file, are returned as None.
+        :type columns: List[Optional[str]]
+        :param where: A mapping of column names to predicates, each taking the decoded field (or None, if empty) and returning whether to keep the line.
+            Predicates for columns not in the file are ignored. Defaults to None, in which case all lines are kept.
+        :type where: Optional[Dict[str, FieldPredicate]], optional
+        :return: An iterator over tuples of the requested fields, one tuple per kept line.
+        :rtype: Iterator[Tuple[Optional[str], ...]]
+        """
+        if self._map is None:
+            return
+        _indices    : List[Optional[int]]             = [self._positions.get(column) if column is not None else None for column in columns]
+        _predicates : List[Tuple[int, FieldPredicate]] = [(self._positions[column], predicate) for column, predicate in (where or {}).items() if column in self._positions]
+        _used = [i for i in _indices if i is not None] + [i for i, _ in _predicates]
+        # split one past the last needed field, so everything after it stays in a single, unsplit remainder.
+        _max_split = max(_used) + 1 if len(_used) > 0 else 0
+
+        _decode    = self._decodeField
+        _delimiter = self._delimiter
+        _readline  = self._map.readline
+        self._map.seek(self._body_start)
+        while True:
+            line = _readline()
+            if not line:
+                break
+            fields = line.rstrip(b"\r\n").split(_delimiter, _max_split)
+            if all(predicate(_decode(fields, i)) for i, predicate in _predicates):
+                yield tuple(_decode(fields, i) for i in _indices)
+
+    def Close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    # *** PRIVATE METHODS ***
+
+    def _decodeField(self, fields:List[bytes], index:Optional[int]) -> Optional[str]:
+        if index is None or index >= len(fields) or len(fields[index]) == 0:
+            return None
+        return fields[index].decode(self._encoding)
@@ -0,0 +1,382 @@
+"""MySQLConnectionPool Module
+"""
+
+# import standard libraries
+import atexit
+import logging
+import threading
+import time
+import traceback
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Final, List, Optional, Tuple
+# 3rd-party imports
+import sshtunnel
+from mysql.connector import connection
+# import locals
+from ogd.common.configs.storage.MySQLConfig import MySQLConfig
+from ogd.common.utils.Logger import Logger
+
+type PoolKey   = Tuple[str, Optional[int], str, Optional[str], Optional["TunnelKey"]]
+type TunnelKey = Tuple[Optional[str], Optional[int], str, Optional[str], str, Optional[int]]
+type ConnectionFactory = Callable[[MySQLConfig, str, Optional[int]], Optional[connection.MySQLConnection]]
+type TunnelFactory     = Callable[[MySQLConfig], Optional[sshtunnel.SSHTunnelForwarder]]
+
+@dataclass
+class _SharedTunnel:
+    tunnel    : sshtunnel.SSHTunnelForwarder
+    ref_count : int = 0
+
+@dataclass
+class _IdleConnection:
+    connection : connection.MySQLConnection
+    idle_since : float
+
+class MySQLConnectionPool:
+    """Pool of open MySQL connections, shared by all `MySQLConnector`s in a process.
+
+    Connections are pooled by database host, port, and login, and by the SSH tunnel they run through, if any.
+    Connections that go through the same SSH host to the same database share a single tunnel,
+    which is stopped once no pooled connection uses it.
+
+    When a connection is acquired, an idle connection is reused if one passes a health check.
+    Otherwise, a new connection is made, unless there are already `max_size` connections for the same database,
+    in which case `Acquire` waits for one to be released.
+    Connections left idle for longer than `idle_timeout` are closed the next time the pool is used.
+
+    Most code should use the process-wide pool from `Default`.
+    The connection and tunnel factories can be replaced, e.g. to pool fake connections in testing.
+    """
+
+    DEFAULT_MAX_SIZE        : Final[int]   = 8
+    DEFAULT_IDLE_TIMEOUT    : Final[float] = 300.0
+    DEFAULT_ACQUIRE_TIMEOUT : Final[float] = 30.0
+    _SSH_MAX_TRIES          : Final[int]   = 5
+
+    _default      : Optional["MySQLConnectionPool"] = None
+    _default_lock : threading.Lock = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, max_size:int=DEFAULT_MAX_SIZE, idle_timeout:float=DEFAULT_IDLE_TIMEOUT, acquire_timeout:float=DEFAULT_ACQUIRE_TIMEOUT,
+                 connection_factory:Optional[ConnectionFactory]=None, tunnel_factory:Optional[TunnelFactory]=None):
+        """Constructor for a MySQLConnectionPool.
+
+        :param max_size: The maximum number of connections, in use or idle, to any one database, defaults to 8
+        :type max_size: int, optional
+        :param idle_timeout: The number of seconds a connection may sit idle in the pool before it is closed, defaults to 300
+        :type idle_timeout: float, optional
+        :param acquire_timeout: The number of seconds `Acquire` waits for a connection when the pool is full, defaults to 30
+        :type acquire_timeout: float, optional
+        :param connection_factory: Function to open a new connection to a given host and port, defaults to `_openConnection`
+        :type connection_factory: Optional[ConnectionFactory], optional
+        :param tunnel_factory: Function to open a new SSH tunnel for a given config, defaults to `_openTunnel`
+        :type tunnel_factory: Optional[TunnelFactory], optional
+        """
+        self._max_size        : int               = max_size
+        self._idle_timeout    : float             = idle_timeout
+        self._acquire_timeout : float             = acquire_timeout
+        self._connect         : ConnectionFactory = connection_factory or MySQLConnectionPool._openConnection
+        self._open_tunnel     : TunnelFactory     = tunnel_factory     or MySQLConnectionPool._openTunnel
+
+        self._lock         : threading.Condition                   = threading.Condition()
+        self._tunnel_lock  : threading.Lock                        = threading.Lock()
+        self._idle         : Dict[PoolKey, List[_IdleConnection]]  = defaultdict(list)
+        self._counts       : Dict[PoolKey, int]                    = defaultdict(int)
+        self._tunnels      : Dict[TunnelKey, _SharedTunnel]        = {}
+        self._conn_tunnels : Dict[int, TunnelKey]                  = {}
+
+    @property
+    def MaxSize(self) -> int:
+        return self._max_size
+
+    @property
+    def TunnelCount(self) -> int:
+        """The number of SSH tunnels currently held open by the pool.
+
+        :return: The number of open SSH tunnels.
+        :rtype: int
+        """
+        return len(self._tunnels)
+
+    def ConnectionCount(self, config:MySQLConfig) -> int:
+        """The number of connections, in use or idle, currently held by the pool for the database of the given config.
+
+        :param config: The config for the database.
+        :type config: MySQLConfig
+        :return: The number of connections for the database.
+        :rtype: int
+        """
+        with self._lock:
+            return self._counts[self._poolKey(config)]
+
+    def IdleCount(self, config:MySQLConfig) -> int:
+        """The number of idle connections currently in the pool for the database of the given config.
+
+        :param config: The config for the database.
+        :type config: MySQLConfig
+        :return: The number of idle connections for the database.
+        :rtype: int
+        """
+        with self._lock:
+            return len(self._idle[self._poolKey(config)])
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "MySQLConnectionPool":
+        """Get the process-wide connection pool, creating it on first use.
+
+        The default pool is cleared when the process exits.
+
+        :return: The process-wide connection pool.
+        :rtype: MySQLConnectionPool
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = MySQLConnectionPool()
+                atexit.register(cls._default.Clear)
+            return cls._default
+
+    # *** PUBLIC METHODS ***
+
+    def Acquire(self, config:MySQLConfig) -> Optional[connection.MySQLConnection]:
+        """Borrow a connection to the database of the given config.
+
+        The connection must be given back with `Release` when no longer needed, rather than closed.
+
+        :param config: The config for the database to which a connection is needed.
+        :type config: MySQLConfig
+        :return: An open connection to the database, or None if no connection could be made.
+        :rtype: Optional[connection.MySQLConnection]
+        """
+        key      = self._poolKey(config)
+        deadline = time.monotonic() + self._acquire_timeout
+        self._evictIdle()
+        while True:
+            candidate : Optional[connection.MySQLConnection] = None
+            with self._lock:
+                while len(self._idle[key]) == 0 and self._counts[key] >= self._max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        Logger.Log(f"Timed out waiting for a pooled MySQL connection to {config.Location}, all {self._max_size} connections are in use!", logging.ERROR)
+                        return None
+                    self._lock.wait(timeout=remaining)
+                if len(self._idle[key]) > 0:
+                    candidate = self._idle[key].pop().connection
+                else:
+                    # reserve a place in the pool for the new connection, so other threads don't overfill it while we connect.
+                    self._counts[key] += 1
+            # Health checks and new connections are slow, so do them outside the lock.
+            if candidate is not None:
+                if self._isHealthy(candidate):
+                    Logger.Log(f"Reusing pooled MySQL connection to {config.Location}", logging.DEBUG)
+                    return candidate
+                Logger.Log(f"Pooled MySQL connection to {config.Location} failed its health check, discarding it.", logging.DEBUG)
+                self._discard(key=key, conn=candidate)
+            else:
+                return self._newConnection(key=key, config=config)
+
+    def Release(self, config:MySQLConfig, conn:connection.MySQLConnection, discard:bool=False) -> None:
+        """Give back a connection borrowed with `Acquire`.
+
+        Any unread results are cleared and any open transaction is rolled back before the connection returns to the pool.
+        If the connection was dropped, or that fails, or `discard` is True, the connection is closed instead.
+
+        :param config: The config used to acquire the connection.
+        :type config: MySQLConfig
+        :param conn: The connection to give back.
+        :type conn: connection.MySQLConnection
+        :param discard: Whether to close the connection rather than keep it for reuse, defaults to False
+        :type discard: bool, optional
+        """
+        key = self._poolKey(config)
+        if not discard and not self._isHealthy(conn):
+            Logger.Log(f"Released MySQL connection to {config.Location} was dropped, it will be closed instead.", logging.DEBUG)
+            discard = True
+        if not discard:
+            try:
+                if conn.unread_result:
+                    conn.consume_results()
+                if conn.in_transaction:
+                    conn.rollback()
+            except Exception as err: # pylint: disable=broad-exception-caught
+                Logger.Log(f"Could not reset MySQL connection to {config.Location} for reuse, it will be closed instead: {err}", logging.DEBUG)
+                discard = True
+        if discard:
+            self._discard(key=key, conn=conn)
+        else:
+            with self._lock:
+                self._idle[key].append(_IdleConnection(connection=conn, idle_since=time.monotonic()))
+                self._lock.notify()
+        self._evictIdle()
+
+    def Clear(self) -> None:
+        """Close all idle connections in the pool, and stop any tunnels no longer in use.
+
+        Connections that are currently borrowed are unaffected, and return to the pool as usual when released.
+        """
+        with self._lock:
+            _closing = [(key, idle.connection) for key, idles in self._idle.items() for idle in idles]
+            self._idle.clear()
+        for key, conn in _closing:
+            self._discard(key=key, conn=conn)
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _poolKey(config:MySQLConfig) -> PoolKey:
+        return (config.DBHost, config.DBPort, config.DBUser, config.DBPass, MySQLConnectionPool._tunnelKey(config))
+
+    @staticmethod
+    def _tunnelKey(config:MySQLConfig) -> Optional[TunnelKey]:
+        if config.HasSSH and config.SSH.Host and config.SSH.User and config.SSH.Pass:
+            return (config.SSH.Host, config.SSH.Port, config.SSH.User, config.SSH.Pass, config.DBHost, config.DBPort)
+        else:
+            return None
+
+    @staticmethod
+    def _isHealthy(conn:connection.MySQLConnection) -> bool:
+        try:
+            return conn.is_connected()
+        except Exception: # pylint: disable=broad-exception-caught
+            return False
+
+    @staticmethod
+    def _openConnection(config:MySQLConfig, host:str, port:Optional[int]) -> Optional[connection.MySQLConnection]:
+        """Function to open a new connection to a MySQL server.
+
+        Simply tries to make a connection, and prints an error in case of failure.
+
+        :param config: The config with the login for the database.
+        :type config: MySQLConfig
+        :param host: The host to connect to.
+        :type host: str
+        :param port: The port to connect to, which is the local end of the SSH tunnel if connecting via SSH.
+        :type port: Optional[int]
+        :return: If successful, a MySQLConnection object, otherwise None.
+        :rtype: Optional[connection.MySQLConnection]
+        """
+        ret_val : Optional[connection.MySQLConnection] = None
+        try:
+            Logger.Log(f"Connecting to SQL at {config.DBUser}@{host}:{port}...", logging.DEBUG)
+            ret_val = connection.MySQLConnection(host     = host,          port     = port,
+                                                 user     = config.DBUser, password = config.DBPass,
+                                                 charset  = 'utf8')
+            Logger.Log("Connected.", logging.DEBUG)
+        except Exception as err:
+            msg = f"""Could not connect to the MySql database.
+            Login info: {config.AsConnectionInfo} w/port type={type(config.DBPort)}.
+            Full error: {type(err)} {str(err)}"""
+            Logger.Log(msg, logging.ERROR)
+            traceback.print_tb(err.__traceback__)
+        return ret_val
+
+    @staticmethod
+    def _openTunnel(config:MySQLConfig) -> Optional[sshtunnel.SSHTunnelForwarder]:
+        """Function to open a new SSH tunnel to the database host, retrying a few times in case of failure.
+
+        :param config: The config with the SSH login and database location.
+        :type config: MySQLConfig
+        :return: A started SSH tunnel, or None if the tunnel could not be started.
+        :rtype: Optional[sshtunnel.SSHTunnelForwarder]
+        """
+        tries : int = 0
+        while tries < MySQLConnectionPool._SSH_MAX_TRIES:
+            if tries > 0:
+                Logger.Log("Re-attempting to connect to SSH.", logging.INFO)
+            try:
+                Logger.Log(f"Connecting to SSH at {config.SSHConf.AsConnectionInfo}...", logging.DEBUG)
+                _tunnel = sshtunnel.SSHTunnelForwarder(
+                    (config.SSH.Host, config.SSH.Port), ssh_username=config.SSH.User, ssh_password=config.SSH.Pass,
+                    remote_bind_address=(config.DBHost, config.DBPort), logger=Logger.std_logger
+                )
+                _tunnel.start()
+                Logger.Log("Connected.", logging.DEBUG)
+                return _tunnel
+            except Exception as err:
+                msg = f"Could not connect via SSH: {type(err)} {str(err)}"
+                Logger.Log(msg, logging.ERROR)
+                Logger.Print(msg, logging.ERROR)
+                traceback.print_tb(err.__traceback__)
+                tries = tries + 1
+        return None
+
+    # *** PRIVATE METHODS ***
+
+    def _newConnection(self, key:PoolKey, config:MySQLConfig) -> Optional[connection.MySQLConnection]:
+        ret_val : Optional[connection.MySQLConnection] = None
+
+        tunnel_key = self._tunnelKey(config)
+        if tunnel_key is not None:
+            Logger.Log(f"Preparing to connect to MySQL via SSH, on host {config.SSH.Host}", level=logging.DEBUG)
+            tunnel = self._acquireTunnel(key=tunnel_key, config=config)
+            if tunnel is not None:
+                ret_val = self._connect(config, config.DBHost, tunnel.local_bind_port)
+                if ret_val is not None:
+                    self._conn_tunnels[id(ret_val)] = tunnel_key
+                else:
+                    self._releaseTunnel(key=tunnel_key)
+        else:
+            Logger.Log(f"Preparing to connect to MySQL directly, on host {config.DBHost}", level=logging.DEBUG)
+            ret_val = self._connect(config, config.DBHost, config.DBPort)
+
+        if ret_val is None:
+            # give up the place reserved for this connection.
+            with self._lock:
+                self._counts[key] -= 1
+                self._lock.notify()
+        return ret_val
+
+    def _discard(self, key:PoolKey, conn:connection.MySQLConnection) -> None:
+        try:
+            conn.close()
+        except Exception as err: # pylint: disable=broad-exception-caught
+            Logger.Log(f"Error while closing pooled MySQL connection: {err}", logging.DEBUG)
+        tunnel_key = self._conn_tunnels.pop(id(conn), None)
+        if tunnel_key is not None:
+            self._releaseTunnel(key=tunnel_key)
+        with self._lock:
+            self._counts[key] -= 1
+            self._lock.notify()
+
+    def _evictIdle(self) -> None:
+        _expired : List[Tuple[PoolKey, connection.MySQLConnection]] = []
+        _cutoff = time.monotonic() - self._idle_timeout
+        with self._lock:
+            for key, idles in self._idle.items():
+                _expired += [(key, idle.connection) for idle in idles if idle.idle_since < _cutoff]
+                idles[:] = [idle for idle in idles if idle.idle_since >= _cutoff]
+        for key, conn in _expired:
+            Logger.Log("Closing MySQL connection that was idle in the pool for too long.", logging.DEBUG)
+            self._discard(key=key, conn=conn)
+
+    def _acquireTunnel(self, key:TunnelKey, config:MySQLConfig) -> Optional[sshtunnel.SSHTunnelForwarder]:
+        with self._tunnel_lock:
+            shared = self._tunnels.get(key)
+            if shared is not None and not shared.tunnel.is_active:
+                Logger.Log(f"Shared SSH tunnel to {config.SSH.Host} is no longer active, restarting it.", logging.INFO)
+                try:
+                    shared.tunnel.restart()
+                except Exception as err: # pylint: disable=broad-exception-caught
+                    Logger.Log(f"Could not restart SSH tunnel: {err}", logging.WARNING)
+            if shared is None:
+                tunnel = self._open_tunnel(config)
+                if tunnel is None:
+                    return None
+                shared = _SharedTunnel(tunnel=tunnel)
+                self._tunnels[key] = shared
+            else:
+                Logger.Log(f"Reusing shared SSH tunnel to {config.SSH.Host}", logging.DEBUG)
+            shared.ref_count += 1
+            return shared.tunnel
+
+    def _releaseTunnel(self, key:TunnelKey) -> None:
+        with self._tunnel_lock:
+            shared = self._tunnels.get(key)
+            if shared is not None:
+                shared.ref_count -= 1
+                if shared.ref_count <= 0:
+                    del self._tunnels[key]
+                    shared.tunnel.stop()
+                    Logger.Log("Stopped MySQL tunnel connection", logging.DEBUG)
@@ -0,0 +1,203 @@
+"""ParquetConnector Module
+"""
+
+# import standard libraries
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+# 3rd-party imports
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:
+    # pyarrow is an optional dependency, only needed when Parquet files are actually used.
+    pa = None
+    pq = None
+# import locals
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.models.features.AggregationMode import AggregationMode
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.storage.connectors.StorageConnector import StorageConnector
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow
+
+class ParquetConnector(StorageConnector):
+    """Connector for Parquet files.
+
+    When opened for reading, the connector opens the file given by its config.
+    When opened for writing, the connector writes one file per export mode, named in the same way as the secondary files of a `CSVConnector`.
+    A file is created once its table is started with `StartTable`, since the file schema must be known up front,
+    and rows given to `WriteRows` are buffered and written out a row group at a time.
+
+    Requires the `pyarrow` package, which can be installed with the `parquet` extra of this package.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    _VALID_SECONDARY_FILES = [ ExportMode.EVENTS, ExportMode.DETECTORS, ExportMode.FEATURES, AggregationMode.SESSION, AggregationMode.PLAYER, AggregationMode.POPULATION ]
+    _SECONDARY_FILE_SUFFIXES = {ExportMode.EVENTS.name:"game-events", ExportMode.DETECTORS.name:"all-events",
+                                ExportMode.FEATURES.name:"all-features", AggregationMode.SESSION.name:"session-features",
+                                AggregationMode.PLAYER.name:"player-features", AggregationMode.POPULATION.name:"population-features"}
+
+    def __init__(self, config:FileStoreConfig,
+                 with_secondary_files:Optional[Set[ExportMode | AggregationMode]]=None,
+                 row_group_size:int=65536,
+                 compression:str="zstd"):
+        """Constructor for a ParquetConnector.
+
+        :param config: The config for the file location.
+        :type config: FileStoreConfig
+        :param with_secondary_files: The kinds of files to write, when opened for writing, defaults to None
+        :type with_secondary_files: Optional[Set[ExportMode  |  AggregationMode]], optional
+        :param row_group_size: The number of rows to buffer for each file before writing them out as a row group, defaults to 65536
+        :type row_group_size: int, optional
+        :param compression: The compression codec for written files, defaults to "zstd"
+        :type compression: str, optional
+        :raises ModuleNotFoundError: If the `pyarrow` package is not installed.
+        """
+        super().__init__()
+        if pa is None or pq is None:
+            raise ModuleNotFoundError("ParquetConnector requires the pyarrow package, which can be installed with the `parquet` extra of opengamedata-common.")
+        self._config               : FileStoreConfig                   = config
+        self._file                 : Optional["pq.ParquetFile"]        = None
+        self._with_secondary_files : Set[ExportMode | AggregationMode] = with_secondary_files or set()
+        self._row_group_size       : int                               = row_group_size
+        self._compression          : str                               = compression
+        self._secondary_paths      : Dict[str,Optional[Path]]          = {mode.name:None for mode in ParquetConnector._VALID_SECONDARY_FILES}
+        self._writers              : Dict[str,"pq.ParquetWriter"]      = {}
+        self._buffers              : Dict[str,List[ExportRow]]         = {}
+
+    # *** PROPERTIES ***
+
+    @property
+    def StoreConfig(self) -> FileStoreConfig:
+        return self._config
+
+    @property
+    def File(self) -> Optional["pq.ParquetFile"]:
+        """The file given by the config, when the connector is opened for reading.
+
+        :return: The open Parquet file, or None if the connector is not open for reading.
+        :rtype: Optional[pq.ParquetFile]
+        """
+        return self._file
+
+    @property
+    def FileExtension(self) -> str:
+        return "parquet"
+
+    @property
+    def RowGroupSize(self) -> int:
+        return self._row_group_size
+
+    @property
+    def SecondaryPaths(self) -> Dict[str, Optional[Path]]:
+        return self._secondary_paths
+
+    # *** IMPLEMENT ABSTRACT FUNCTIONS ***
+
+    def _open(self, writeable:bool=True) -> bool:
+        ret_val = True
+        if writeable:
+            # FIXME : Same as in CSVConnector, we should have a way to use the DatasetKey, rather than picking apart the file name.
+            base_file_name : str = "_".join(self.StoreConfig.Filename.split("_")[:-1])
+            for mode in ParquetConnector._VALID_SECONDARY_FILES:
+                if mode in self._with_secondary_files:
+                    suffix = self._SECONDARY_FILE_SUFFIXES[mode.name]
+                    self._secondary_paths[mode.name] = self.StoreConfig.Folder / f"{base_file_name}_{suffix}.{self.FileExtension}"
+        else:
+            try:
+                self._file = pq.ParquetFile(self.StoreConfig.Filepath)
+            except (FileNotFoundError, pa.ArrowInvalid) as err:
+                Logger.Log(f"Could not open Parquet file {self.StoreConfig.Filepath}: {err}", logging.ERROR)
+                ret_val = False
+        return ret_val
+
+    def _close(self) -> bool:
+        Logger.Log("Closing Parquet connector...")
+        for mode_name in list(self._writers.keys()):
+            self._flush(mode_name=mode_name)
+            self._writers.pop(mode_name).close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._is_open = False
+        return True
+
+    # *** PUBLIC STATICS ***
+
+    # *** PUBLIC METHODS ***
+
+    def StartTable(self, mode:ExportMode | AggregationMode, schema:"pa.Schema", dictionary_columns:Optional[List[str]]=None) -> bool:
+        """Create the file for an export mode, with the given schema.
+
+        :param mode: The export mode whose file should be created.
+        :type mode: ExportMode | AggregationMode
+        :param schema: The schema of the file.
+        :type schema: pa.Schema
+        :param dictionary_columns: The names of the columns to dictionary-encode, defaults to None, in which case all columns are dictionary-encoded.
+        :type dictionary_columns: Optional[List[str]], optional
+        :return: True if the file was created, or False if the mode does not have a file.
+        :rtype: bool
+        """
+        ret_val = False
+
+        _path = self._secondary_paths.get(mode.name)
+        if _path is not None:
+            if mode.name in self._writers:
+                Logger.Log(f"Table for {mode} was already started, the old file will be replaced.", logging.WARNING)
+                self._writers.pop(mode.name).close()
+            self._writers[mode.name] = pq.ParquetWriter(
+                _path, schema=schema, compression=self._compression,
+                use_dictionary=dictionary_columns if dictionary_columns is not None else True
+            )
+            self._buffers[mode.name] = []
+            ret_val = True
+        return ret_val
+
+    def WriteRows(self, mode:ExportMode | AggregationMode, rows:List[ExportRow]) -> bool:
+        """Add rows to the file for an export mode.
+
+        Rows are buffered, and written out whenever a full row group is ready, or when the connector is closed.
+
+        :param mode: The export mode whose file the rows belong to.
+        :type mode: ExportMode | AggregationMode
+        :param rows: The rows, with one element per column of the file schema, in schema order.
+        :type rows: List[ExportRow]
+        :return: True if the rows were taken, or False if the mode's table was never started.
+        :rtype: bool
+        """
+        _buffer = self._buffers.get(mode.name)
+        if _buffer is None:
+            return False
+        _buffer.extend(rows)
+        if len(_buffer) >= self._row_group_size:
+            self._flush(mode_name=mode.name)
+        return True
+
+    def RemoveSecondaryFile(self, mode:ExportMode | AggregationMode):
+        _writer = self._writers.pop(mode.name, None)
+        if _writer is not None:
+            _writer.close()
+        self._buffers.pop(mode.name, None)
+        self._secondary_paths[mode.name] = None
+        self._with_secondary_files.discard(mode)
+
+    # *** PRIVATE STATICS ***
+
+    # *** PRIVATE METHODS ***
+
+    def _flush(self, mode_name:str) -> None:
+        """Write the buffered rows for a mode, in row groups of at most `RowGroupSize` rows.
+
+        :param mode_name: The name of the mode whose rows should be written.
+        :type mode_name: str
+        """
+        _writer = self._writers.get(mode_name)
+        _buffer = self._buffers.get(mode_name)
+        if _writer is not None and _buffer:
+            _columns = list(zip(*_buffer))
+            _arrays  = [pa.array(column, type=field.type) for column, field in zip(_columns, _writer.schema)]
+            _writer.write_table(pa.Table.from_arrays(_arrays, schema=_writer.schema), row_group_size=self._row_group_size)
+            Logger.Log(f"Wrote {len(_buffer)} rows to {self._secondary_paths.get(mode_name)}", logging.DEBUG)
+            _buffer.clear()
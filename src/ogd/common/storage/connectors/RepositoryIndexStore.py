@@ -0,0 +1,315 @@
+"""RepositoryIndexStore Module
+"""
+
+# import standard libraries
+import copy
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Final, Iterator, List, Optional, Tuple
+try:
+    import fcntl
+except ModuleNotFoundError:
+    # fcntl is POSIX-only, elsewhere writers are only kept apart within a single process.
+    fcntl = None
+# import locals
+from ogd.common.configs.storage.RepositoryIndexingConfig import RepositoryIndexingConfig
+from ogd.common.utils.Logger import Logger
+
+type DatasetUpdate = Callable[[Dict[str, Any]], Dict[str, Any]]
+class RepositoryIndexStore:
+    """Store for the index of datasets in a repository, i.e. the `file_list.json` file.
+
+    Rather than parsing and rewriting the whole index for every change, the index is kept in one shard file per game,
+    in a `file_list.d` folder next to `file_list.json`, plus a shard for the `CONFIG` element.
+    Reading a game's datasets only parses that game's shard, and shards are cached in memory until their file changes.
+    Updating a dataset rewrites only its game's shard, and then rebuilds `file_list.json` by copying in the text of each shard,
+    so consumers of the single file still see the full index, without it ever being re-encoded.
+    The size and modification time of `file_list.json` are recorded each time the store writes it,
+    and if the file is later changed by something other than the store, the shards are rebuilt from it, so the edit is not overwritten.
+
+    Reads never write anything, so a read-only repository can still be queried:
+    while there are no shards, or they are out of date with `file_list.json`, reads parse `file_list.json` itself.
+    Shards are only made or rebuilt by `UpdateDataset`, which holds an exclusive lock on the repository folder,
+    so concurrent exports cannot lose each other's changes.
+    Each file is written to a temporary file and moved into place, so readers never see a half-written file.
+    The metadata returned by the store is a copy, so changing it does not affect the cached shards.
+    """
+
+    _INDEX_NAME  : Final[str] = "file_list.json"
+    _SHARD_DIR   : Final[str] = "file_list.d"
+    _LOCK_NAME   : Final[str] = "file_list.lock"
+    _STAMP_NAME  : Final[str] = "file_list.stamp"
+    _CONFIG_KEY  : Final[str] = "CONFIG"
+
+    _cache       : Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+    _local_lock  : threading.Lock = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, indexing:RepositoryIndexingConfig):
+        """Constructor for a RepositoryIndexStore.
+
+        :param indexing: The indexing config of the repository, whose local directory holds the index.
+        :type indexing: RepositoryIndexingConfig
+        """
+        self._indexing : RepositoryIndexingConfig = indexing
+
+    @property
+    def Indexing(self) -> RepositoryIndexingConfig:
+        return self._indexing
+
+    @property
+    def Folder(self) -> Path:
+        return self._indexing.LocalDirectory.FolderPath
+
+    @property
+    def IndexPath(self) -> Path:
+        return self.Folder / RepositoryIndexStore._INDEX_NAME
+
+    @property
+    def ShardFolder(self) -> Path:
+        return self.Folder / RepositoryIndexStore._SHARD_DIR
+
+    # *** PUBLIC STATICS ***
+
+    # *** PUBLIC METHODS ***
+
+    def Config(self) -> Dict[str, Any]:
+        """Get the `CONFIG` element of the index, or a default one from the indexing config if there is none.
+
+        :return: The config element, with the base URLs for files and templates.
+        :rtype: Dict[str, Any]
+        """
+        return self._readEntry(key=RepositoryIndexStore._CONFIG_KEY) or self._defaultConfig()
+
+    def GameDatasets(self, game_id:str) -> Dict[str, Any]:
+        """Get the metadata of every dataset for a game.
+
+        :param game_id: The ID of the game.
+        :type game_id: str
+        :return: A mapping of dataset IDs to dataset metadata, which is empty if the game has no datasets.
+        :rtype: Dict[str, Any]
+        """
+        return self._readEntry(key=game_id) or {}
+
+    def DatasetMeta(self, game_id:str, dataset_id:str) -> Optional[Dict[str, Any]]:
+        return self.GameDatasets(game_id=game_id).get(dataset_id)
+
+    def UpdateDataset(self, game_id:str, dataset_id:str, update:DatasetUpdate) -> Dict[str, Any]:
+        """Update the metadata of one dataset, while holding the repository's lock.
+
+        :param game_id: The ID of the game the dataset belongs to.
+        :type game_id: str
+        :param dataset_id: The ID of the dataset.
+        :type dataset_id: str
+        :param update: A function taking the current metadata of the dataset (an empty dict for a new dataset), and returning the new metadata.
+        :type update: DatasetUpdate
+        :return: The new metadata of the dataset.
+        :rtype: Dict[str, Any]
+        """
+        with self._locked():
+            self._ensureShards()
+            if not self._shardPath(key=RepositoryIndexStore._CONFIG_KEY).is_file():
+                Logger.Log(f"No CONFIG found in {RepositoryIndexStore._INDEX_NAME}, adding default CONFIG...", logging.WARNING)
+                self._writeShard(key=RepositoryIndexStore._CONFIG_KEY, content=self._defaultConfig())
+            _datasets = dict(self._readShard(key=game_id) or {})
+            ret_val = update(dict(_datasets.get(dataset_id, {})))
+            _datasets[dataset_id] = ret_val
+            self._writeShard(key=game_id, content=_datasets)
+            self._writeIndex()
+        Logger.Log(f"Updated {dataset_id} in index at {self.IndexPath}", logging.INFO)
+        return ret_val
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _writeAtomic(path:Path, text:str) -> None:
+        _temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(_temp_path, "w", encoding="utf-8") as temp_file:
+                temp_file.write(text)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(_temp_path, path)
+        finally:
+            _temp_path.unlink(missing_ok=True)
+
+    # *** PRIVATE METHODS ***
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the repository's index, across threads and (where supported) processes.
+        """
+        self.Folder.mkdir(parents=True, exist_ok=True)
+        with RepositoryIndexStore._local_lock, open(self.Folder / RepositoryIndexStore._LOCK_NAME, "a+", encoding="utf-8") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _defaultConfig(self) -> Dict[str, Any]:
+        return {
+            "files_base"     : self.Indexing.RemoteURL.Location if self.Indexing.RemoteURL is not None else None,
+            "templates_base" : self.Indexing.TemplatesURL.Location
+        }
+
+    def _shardPath(self, key:str) -> Path:
+        return self.ShardFolder / f"{key}.json"
+
+    def _ensureShards(self) -> None:
+        """Split `file_list.json` into shards, if there are no shards yet, or the file was changed since the store last wrote it.
+
+        This writes to the repository folder, so it is only called while holding the repository's lock.
+        """
+        if self._indexChanged():
+            if self.ShardFolder.is_dir():
+                Logger.Log(f"{self.IndexPath} was changed outside of the index store, rebuilding shards from it.", logging.WARNING)
+            self._splitIndex()
+
+    def _readEntry(self, key:str) -> Optional[Dict[str, Any]]:
+        """Read one element of the index, from its shard if the shards are up to date, and from `file_list.json` otherwise.
+
+        :param key: The game ID of the element, or `CONFIG`.
+        :type key: str
+        :return: A copy of the element, or None if there is no such element.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        ret_val : Optional[Dict[str, Any]]
+
+        if self._indexChanged():
+            # the shards are only brought up to date by the next update, so nothing is written while reading.
+            ret_val = copy.deepcopy(self._readIndex().get(key))
+        else:
+            ret_val = self._readShard(key=key)
+        return ret_val
+
+    def _indexChanged(self) -> bool:
+        """Check whether `file_list.json` has content that is not in the shards.
+
+        :return: True if the file exists, and either there are no shards, or the file's size or modification time differ from when the store last wrote it.
+        :rtype: bool
+        """
+        ret_val : bool = False
+
+        try:
+            _stat = self.IndexPath.stat()
+        except FileNotFoundError:
+            ret_val = False
+        else:
+            if not self.ShardFolder.is_dir():
+                ret_val = True
+            else:
+                try:
+                    _stamp = (self.Folder / RepositoryIndexStore._STAMP_NAME).read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    _stamp = None
+                ret_val = _stamp != f"{_stat.st_mtime_ns} {_stat.st_size}"
+        return ret_val
+
+    def _readIndex(self) -> Dict[str, Any]:
+        """Read the whole of `file_list.json`, from the cache if the file has not changed since it was cached.
+
+        :return: The content of the index, which is empty if there is no index file, or it could not be read.
+        :rtype: Dict[str, Any]
+        """
+        ret_val : Dict[str, Any] = {}
+
+        try:
+            _stat = self.IndexPath.stat()
+        except FileNotFoundError:
+            RepositoryIndexStore._cache.pop(self.IndexPath, None)
+        else:
+            _cached = RepositoryIndexStore._cache.get(self.IndexPath)
+            if _cached is not None and _cached[0] == _stat.st_mtime_ns and _cached[1] == _stat.st_size:
+                ret_val = _cached[2]
+            else:
+                try:
+                    with open(self.IndexPath, "r", encoding="utf-8") as index_file:
+                        ret_val = json.load(index_file)
+                except json.decoder.JSONDecodeError as err:
+                    Logger.Log(f"{RepositoryIndexStore._INDEX_NAME} has invalid format: {str(err)}.", logging.WARNING)
+                # an invalid file is cached too, so it is only reported once.
+                RepositoryIndexStore._cache[self.IndexPath] = (_stat.st_mtime_ns, _stat.st_size, ret_val)
+        return ret_val
+
+    def _splitIndex(self) -> None:
+        """Replace the shards with the content of `file_list.json`, and record the file's current state.
+        """
+        try:
+            with open(self.IndexPath, "r", encoding="utf-8") as index_file:
+                _index : Dict[str, Any] = json.load(index_file)
+        except json.decoder.JSONDecodeError as err:
+            Logger.Log(f"{RepositoryIndexStore._INDEX_NAME} has invalid format: {str(err)}.", logging.WARNING)
+        else:
+            for key, content in _index.items():
+                self._writeShard(key=key, content=content)
+            # games removed from the file are removed from the shards, too.
+            for path in self.ShardFolder.glob("*.json"):
+                if path.stem not in _index:
+                    path.unlink(missing_ok=True)
+                    RepositoryIndexStore._cache.pop(path, None)
+            Logger.Log(f"Split {self.IndexPath} into {len(_index)} shards in {self.ShardFolder}", logging.INFO)
+        # an invalid file is stamped too, so it is only reported once, and is replaced from the shards on this update.
+        self._writeStamp()
+
+    def _writeStamp(self) -> None:
+        _stat = self.IndexPath.stat()
+        RepositoryIndexStore._writeAtomic(path=self.Folder / RepositoryIndexStore._STAMP_NAME, text=f"{_stat.st_mtime_ns} {_stat.st_size}")
+
+    def _readShard(self, key:str) -> Optional[Dict[str, Any]]:
+        """Read one shard of the index, from the cache if the shard file has not changed since it was cached.
+
+        :param key: The game ID of the shard, or `CONFIG`.
+        :type key: str
+        :return: The content of the shard, or None if there is no such shard, or it could not be read.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        ret_val : Optional[Dict[str, Any]] = None
+
+        _path = self._shardPath(key=key)
+        try:
+            _stat = _path.stat()
+        except FileNotFoundError:
+            RepositoryIndexStore._cache.pop(_path, None)
+        else:
+            _cached = RepositoryIndexStore._cache.get(_path)
+            if _cached is not None and _cached[0] == _stat.st_mtime_ns and _cached[1] == _stat.st_size:
+                ret_val = _cached[2]
+            else:
+                try:
+                    with open(_path, "r", encoding="utf-8") as shard_file:
+                        ret_val = json.load(shard_file)
+                except json.decoder.JSONDecodeError as err:
+                    Logger.Log(f"Index shard {_path} has invalid format: {str(err)}.", logging.WARNING)
+                else:
+                    RepositoryIndexStore._cache[_path] = (_stat.st_mtime_ns, _stat.st_size, ret_val)
+        # the cached content is shared by every store in the process, so callers get their own copy to change.
+        return copy.deepcopy(ret_val)
+
+    def _writeShard(self, key:str, content:Dict[str, Any]) -> None:
+        _path = self._shardPath(key=key)
+        self.ShardFolder.mkdir(parents=True, exist_ok=True)
+        RepositoryIndexStore._writeAtomic(path=_path, text=json.dumps(content, indent=4))
+        _stat = _path.stat()
+        RepositoryIndexStore._cache[_path] = (_stat.st_mtime_ns, _stat.st_size, copy.deepcopy(content))
+
+    def _writeIndex(self) -> None:
+        """Rebuild `file_list.json` from the text of the shards, with the `CONFIG` shard first and games in alphabetical order.
+
+        .. note:: The whole file is still rewritten on each update, though only by copying text, so an update takes time in proportion to the size of the whole index.
+        """
+        _keys : List[str] = sorted(path.stem for path in self.ShardFolder.glob("*.json") if path.stem != RepositoryIndexStore._CONFIG_KEY)
+        _parts : List[str] = []
+        for key in [RepositoryIndexStore._CONFIG_KEY] + _keys:
+            _path = self._shardPath(key=key)
+            if _path.is_file():
+                _parts.append(f"    {json.dumps(key)}: {_path.read_text(encoding='utf-8')}")
+        RepositoryIndexStore._writeAtomic(path=self.IndexPath, text="{\n" + ",\n".join(_parts) + "\n}")
+        self._writeStamp()
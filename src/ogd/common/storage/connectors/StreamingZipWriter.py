@@ -0,0 +1,153 @@
+"""StreamingZipWriter Module
+"""
+
+# import standard libraries
+import logging
+import queue
+import threading
+import zipfile
+from pathlib import Path
+from typing import Final, IO, Iterable, List, Optional
+# import locals
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import Pair
+
+class StreamingZipWriter:
+    """Text file writer that compresses lines into a zip entry as they are written, on a background thread.
+
+    Written text is encoded and collected into blocks, which are handed to a worker thread through a bounded queue.
+    The worker writes each block into a zip entry, so compression (which releases the GIL) overlaps with producing the next lines,
+    and the uncompressed file never touches the disk.
+    If the worker falls behind, writes block until there is room in the queue, so memory use stays bounded.
+
+    The writer has the `write`, `writelines`, `tell`, and `close` methods of a text file,
+    so it can stand in for the files of a `CSVConnector`.
+    """
+
+    _BLOCK_SIZE  : Final[int] = 1 << 20
+    _QUEUE_SIZE  : Final[int] = 8
+    _END         : Final[None] = None
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, zip_path:Path, path_in_zip:Path | str, compression_level:int=6, encoding:str="utf-8"):
+        """Constructor for a StreamingZipWriter.
+
+        :param zip_path: The path of the zip file to create. Any existing file at the path is replaced.
+        :type zip_path: Path
+        :param path_in_zip: The path of the entry, within the zip file, to which lines are written.
+        :type path_in_zip: Path | str
+        :param compression_level: The zlib compression level, from 0 to 9, defaults to 6
+        :type compression_level: int, optional
+        :param encoding: The text encoding for the entry, defaults to "utf-8"
+        :type encoding: str, optional
+        """
+        self._zip_path    : Path                    = Path(zip_path)
+        self._path_in_zip : str                     = str(path_in_zip)
+        self._encoding    : str                     = encoding
+        self._position    : int                     = 0
+        self._pending     : List[bytes]             = []
+        self._pending_len : int                     = 0
+        self._closed      : bool                    = False
+        self._error       : Optional[BaseException] = None
+        self._blocks      : queue.Queue             = queue.Queue(maxsize=StreamingZipWriter._QUEUE_SIZE)
+
+        self._zip_file    : zipfile.ZipFile = zipfile.ZipFile(self._zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+        self._entry       : IO[bytes]       = self._zip_file.open(self._path_in_zip, mode="w", force_zip64=True)
+        self._worker      : threading.Thread = threading.Thread(target=self._compressBlocks, name=f"zip-{self._zip_path.name}", daemon=True)
+        self._worker.start()
+
+    @property
+    def name(self) -> str:
+        return str(self._zip_path)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def ZipPath(self) -> Path:
+        return self._zip_path
+
+    # *** PUBLIC METHODS ***
+
+    def write(self, text:str) -> int:
+        """Add text to the entry.
+
+        :param text: The text to write.
+        :type text: str
+        :raises ValueError: If the writer was already closed.
+        :return: The number of characters written.
+        :rtype: int
+        """
+        if self._closed:
+            raise ValueError(f"Cannot write to closed StreamingZipWriter for {self._zip_path}")
+        _data = text.encode(self._encoding)
+        self._pending.append(_data)
+        self._pending_len += len(_data)
+        self._position    += len(_data)
+        if self._pending_len >= StreamingZipWriter._BLOCK_SIZE:
+            self._sendPending()
+        return len(text)
+
+    def writelines(self, lines:Iterable[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+    def tell(self) -> int:
+        """Get the number of (uncompressed) bytes written so far, which is the position at which the next text will be written.
+
+        :return: The uncompressed size of the entry so far.
+        :rtype: int
+        """
+        return self._position
+
+    def flush(self) -> None:
+        self._sendPending()
+
+    def close(self, extra_files:Optional[List[Pair[Path, str]]]=None) -> None:
+        """Finish the entry, add any extra files to the archive, and close it.
+
+        Waits for the worker thread to compress all remaining text.
+        If the worker hit an error, it is raised here.
+
+        :param extra_files: Pairs of file paths and paths in the zip, for files to add to the archive after the entry, defaults to None
+        :type extra_files: Optional[List[Pair[Path, str]]], optional
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._sendPending()
+        self._blocks.put(StreamingZipWriter._END)
+        self._worker.join()
+        try:
+            self._entry.close()
+            if self._error is None:
+                for path, path_in_zip in extra_files or []:
+                    self._zip_file.write(path, path_in_zip)
+        finally:
+            self._zip_file.close()
+        if self._error is not None:
+            raise self._error
+        Logger.Log(f"Finished streaming {self._position} bytes into {self._zip_path}", logging.DEBUG)
+
+    # *** PRIVATE METHODS ***
+
+    def _sendPending(self) -> None:
+        if self._pending:
+            self._blocks.put(b"".join(self._pending))
+            self._pending     = []
+            self._pending_len = 0
+
+    def _compressBlocks(self) -> None:
+        while True:
+            block = self._blocks.get()
+            if block is StreamingZipWriter._END:
+                break
+            # after an error, keep draining the queue so writers never block, but drop the data.
+            if self._error is None:
+                try:
+                    self._entry.write(block)
+                except Exception as err:
+                    Logger.Log(f"Error while compressing into {self._zip_path}: {type(err)} {err}", logging.ERROR)
+                    self._error = err
@@ -1,7 +1,6 @@
-import json
 import logging
 from datetime import datetime
-from typing import Dict, Final, List, LiteralString, Tuple, Optional
+from typing import Dict, Final, Iterator, List, LiteralString, Tuple, Optional
 # 3rd-party imports
 from google.cloud import bigquery
 from google.api_core.exceptions import BadRequest
@@ -139,22 +138,13 @@ class BQFirebaseInterface(BigQueryInterface):
             query = self._generateRowFromIDQuery(id_list=id_list, id_type=id_mode, exclude_rows=exclude_rows)
             Logger.Log(f"BQ-Firebase: Running query for rows from IDs:\n{query}", logging.DEBUG, depth=3)
             data = self._client.query(query)
-            events = []
-            for row in data:
-                items = tuple(row.items())
-                event = []
-                for item in items:
-                    match item[0]:
-                        case "event_params":
-                            _params = {param['key']:param['value'] for param in item[1]}
-                            event.append(json.dumps(_params, sort_keys=True))
-                        case "device":
-                            event.append(json.dumps(item[1], sort_keys=True))
-                        case _:
-                            event.append(item[1])
-                events.append(tuple(event))
+            events = list(self._eventRowsFromResults(data))
         return events if events != None else []
 
+    def _iterEventRows(self, filters:DatasetFilterCollection, batch_size:int) -> Iterator[Tuple]:
+        # The Firebase query does not go through BigQueryInterface's paged query, so just fall back on the full list of rows.
+        yield from self._getEventRows(filters=filters)
+
 
     # *** PUBLIC STATICS ***
 
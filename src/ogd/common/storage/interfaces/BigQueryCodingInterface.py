@@ -5,6 +5,7 @@ from typing import Dict, List, Tuple, Optional
 # import locals
 from ogd.common.models.coding.Code import Code
 from ogd.common.models.coding.Coder import Coder
+from ogd.common.storage.connectors.BigQueryClientRegistry import BigQueryClientRegistry
 from ogd.common.storage.interfaces.CodingInterface import CodingInterface
 from ogd.common.storage.IDType import IDType
 from ogd.common.configs.DataTableConfig import DataTableConfig
@@ -26,14 +27,11 @@ class BigQueryCodingInterface(CodingInterface):
 
     def _open(self, writeable:bool=True) -> bool:
         if not self._is_open:
-            if "GITHUB_ACTIONS" in os.environ:
-                self._client = bigquery.Client()
-            else:
-                credential_path : str
+            credential_path : Optional[str] = None
+            if "GITHUB_ACTIONS" not in os.environ:
                 if self._settings.StoreConfig:
                     credential_path = self._settings.StoreConfig.NonStandardElements.get("credential", default_settings["GAME_SOURCE_MAP"][self._game_id]["credential"])
-                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credential_path
-                self._client = bigquery.Client()
+            self._client = BigQueryClientRegistry.Default().Acquire(credential_path=credential_path, project=None)
             if self._client != None:
                 self._is_open = True
                 Logger.Log("Connected to BigQuery database.", logging.DEBUG)
@@ -45,7 +43,7 @@ class BigQueryCodingInterface(CodingInterface):
             return True
 
     def _close(self) -> bool:
-        self._client.close()
+        BigQueryClientRegistry.Default().Release(self._client)
         self._is_open = False
         Logger.Log("Closed connection to BigQuery.", logging.DEBUG)
         return True
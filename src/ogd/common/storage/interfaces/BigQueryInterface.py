@@ -1,14 +1,14 @@
 # standard imports
 import builtins
-import json
 import logging
 import textwrap
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from itertools import chain
-from typing import Dict, Final, List, LiteralString, Optional, Tuple, Type, override, Sequence
+from typing import Any, Callable, Dict, Final, Iterable, Iterator, List, LiteralString, Optional, Tuple, Type, override, Sequence
 # 3rd-party imports
 from google.cloud import bigquery
+from google.cloud.bigquery.table import RowIterator
 from google.api_core.exceptions import BadRequest
 # OGD imports
 from ogd.common.filters import *
@@ -27,6 +27,7 @@ from ogd.common.utils.Logger import Logger
 AQUALAB_MIN_VERSION : Final[float] = 6.2
 
 type BigQueryParameter = bigquery.ScalarQueryParameter | bigquery.ArrayQueryParameter | bigquery.RangeQueryParameter
+type ResultLayout = Tuple[int, List[Tuple[int, Callable[[Any], Any]]]]
 @dataclass
 class ParamaterizedClause:
     clause: LiteralString = ""
@@ -176,44 +177,9 @@ class BigQueryInterface(Interface):
         ret_val = []
 
         if self.Connector.Client:
-            # 1. Create query & config
-            where_clause : ParamaterizedClause = self._generateWhereClause(filters=filters)
-            # TODO Order by user_id, and by timestamp within that.
-            # Note that this could prove to be wonky when we have more games without user ids,
-            # will need to really rethink this when we start using new system.
-            # Still, not a huge deal because most of these will be rewritten at that time anyway.
-            query = textwrap.dedent(f"""\
-                SELECT *
-                FROM `{self.DBPath}`
-                {where_clause.clause}
-                ORDER BY `user_id`, `session_id`, `event_sequence_index` ASC
-            """)
-            cfg = bigquery.QueryJobConfig(query_parameters=where_clause.params)
-
-            # 2. Actually run the thing
-            Logger.Log(f"Running query for rows from IDs:\n{query}\nWith Params:\n{where_clause.params}", logging.DEBUG, depth=3, whitespace_adjust="lstrip")
-            try:
-                job = self.Connector.Client.query(query, job_config=cfg)
-                data = job.result()
-            except BadRequest as err:
-                Logger.Log(f"In _rowsFromIDs, got a BadRequest error when trying to retrieve data from BigQuery, defaulting to empty result!\n{err}")
-            except Exception as err:
-                Logger.Log(f"Unexpected error in BigQuery of type {type(err)} occurred: {err}", logging.ERROR)
-            else:
-                Logger.Log(f"...Query yielded results, with query in state: {job.state}", logging.DEBUG, depth=3)
-                for row in data:
-                    items = tuple(row.items())
-                    event = []
-                    for item in items:
-                        match item[0]:
-                            case "event_params":
-                                _params = {param['key']:param['value'] for param in item[1]}
-                                event.append(json.dumps(_params, sort_keys=True))
-                            case "device":
-                                event.append(json.dumps(item[1], sort_keys=True))
-                            case _:
-                                event.append(item[1])
-                    ret_val.append(tuple(event))
+            data = self._queryEventRows(filters=filters)
+            if data is not None:
+                ret_val = list(self._eventRowsFromResults(data))
         else:
             Logger.Log(f"Can't retrieve collection of events from {self.Connector.ResourceName}, the storage connection client is null!", logging.WARNING, depth=3)
 
@@ -222,12 +188,98 @@ class BigQueryInterface(Interface):
     def _getFeatureRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
         return []
 
+    @override
+    def _iterEventRows(self, filters:DatasetFilterCollection, batch_size:int) -> Iterator[Tuple]:
+        if self.Connector.Client:
+            data = self._queryEventRows(filters=filters, page_size=batch_size)
+            if data is not None:
+                # Go page-by-page, so only one page of results is downloaded and held at a time.
+                yield from self._eventRowsFromResults(row for page in data.pages for row in page)
+        else:
+            Logger.Log(f"Can't stream events from {self.Connector.ResourceName}, the storage connection client is null!", logging.WARNING, depth=3)
+
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
 
     # *** PRIVATE STATICS ***
 
+    @staticmethod
+    def _eventRowsFromResults(rows:Iterable[bigquery.Row]) -> Iterator[Tuple]:
+        """Function to flatten rows of BigQuery results into plain tuples of values.
+
+        The positions of the nested columns are found from the first row, and reused for the rest of the results.
+
+        :param rows: The rows of results from an events query.
+        :type rows: Iterable[bigquery.Row]
+        :return: A tuple of the values in each row.
+        :rtype: Iterator[Tuple]
+        """
+        _layout : Optional[ResultLayout] = None
+        for row in rows:
+            if _layout is None:
+                _layout = BigQueryInterface._resultLayout(row)
+            yield BigQueryInterface._eventRowFromResult(row, layout=_layout)
+
+    @staticmethod
+    def _eventRowFromResult(row:bigquery.Row, layout:Optional[ResultLayout]=None) -> Tuple:
+        """Function to flatten a row of BigQuery results into a plain tuple of values, with nested event params and device data given as dicts.
+
+        The nested records are passed on as already-decoded dicts, with their keys sorted, rather than encoded as JSON text,
+        so they don't need to be decoded again when the row is made into an Event.
+        Values are read by column index, since `Row.items()` makes a deep copy of every value.
+
+        :param row: A single row of results from an events query.
+        :type row: bigquery.Row
+        :param layout: The layout of the row's columns, from `_resultLayout`, or None to find it from the row itself, defaults to None
+        :type layout: Optional[ResultLayout], optional
+        :return: A tuple of the values in the row.
+        :rtype: Tuple
+        """
+        _count, _nested = layout or BigQueryInterface._resultLayout(row)
+        event = [row[i] for i in range(_count)]
+        for i, convert in _nested:
+            event[i] = convert(event[i])
+        return tuple(event)
+
+    @staticmethod
+    def _resultLayout(row:bigquery.Row) -> ResultLayout:
+        """Function to find the number of columns in a row of BigQuery results, and the index and converter of each nested column.
+
+        :param row: A single row of results from an events query.
+        :type row: bigquery.Row
+        :return: The number of columns, and a list of the index and converter for each nested column.
+        :rtype: ResultLayout
+        """
+        _nested : List[Tuple[int, Callable[[Any], Any]]] = []
+        _columns = list(row.keys())
+        for i, column in enumerate(_columns):
+            match column:
+                case "event_params":
+                    _nested.append((i, BigQueryInterface._paramsFromRecords))
+                case "device":
+                    _nested.append((i, BigQueryInterface._sortedRecord))
+        return (len(_columns), _nested)
+
+    @staticmethod
+    def _paramsFromRecords(records:Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        return BigQueryInterface._sortedRecord({param['key']:param['value'] for param in records or []})
+
+    @staticmethod
+    def _sortedRecord(value:Any) -> Any:
+        """Function to copy a nested record with the keys of each level sorted, giving the same value as encoding with sorted keys and decoding again.
+
+        :param value: A record, list, or plain value from a row of results.
+        :type value: Any
+        :return: The value, with the keys of any records in sorted order.
+        :rtype: Any
+        """
+        if isinstance(value, dict):
+            return {key:BigQueryInterface._sortedRecord(value[key]) for key in sorted(value)}
+        if isinstance(value, list):
+            return [BigQueryInterface._sortedRecord(elem) for elem in value]
+        return value
+
     @staticmethod
     def _generateSuffixClause(date_filter:RangeFilter[datetime], extra_bound:int=0) -> ParamaterizedClause:
         """Function to generate a BigQuery clause representing a bound on table suffixes.
@@ -499,3 +551,34 @@ class BigQueryInterface(Interface):
         return ret_val
 
     # *** PRIVATE METHODS ***
+
+    def _queryEventRows(self, filters:DatasetFilterCollection, page_size:Optional[int]=None) -> Optional[RowIterator]:
+        ret_val : Optional[RowIterator] = None
+
+        # 1. Create query & config
+        where_clause : ParamaterizedClause = self._generateWhereClause(filters=filters)
+        # TODO Order by user_id, and by timestamp within that.
+        # Note that this could prove to be wonky when we have more games without user ids,
+        # will need to really rethink this when we start using new system.
+        # Still, not a huge deal because most of these will be rewritten at that time anyway.
+        query = textwrap.dedent(f"""\
+            SELECT *
+            FROM `{self.DBPath}`
+            {where_clause.clause}
+            ORDER BY `user_id`, `session_id`, `event_sequence_index` ASC
+        """)
+        cfg = bigquery.QueryJobConfig(query_parameters=where_clause.params)
+
+        # 2. Actually run the thing
+        Logger.Log(f"Running query for rows from IDs:\n{query}\nWith Params:\n{where_clause.params}", logging.DEBUG, depth=3, whitespace_adjust="lstrip")
+        try:
+            job = self.Connector.Client.query(query, job_config=cfg)
+            ret_val = job.result(page_size=page_size)
+        except BadRequest as err:
+            Logger.Log(f"In _queryEventRows, got a BadRequest error when trying to retrieve data from BigQuery, defaulting to empty result!\n{err}")
+        except Exception as err:
+            Logger.Log(f"Unexpected error in BigQuery of type {type(err)} occurred: {err}", logging.ERROR)
+        else:
+            Logger.Log(f"...Query yielded results, with query in state: {job.state}", logging.DEBUG, depth=3)
+
+        return ret_val
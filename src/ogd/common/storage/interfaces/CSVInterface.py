@@ -1,22 +1,29 @@
+import io
 import logging
 from collections import defaultdict
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Union
+from datetime import datetime, timezone
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple, Optional, Union, override
 # 3rd-party imports
 import numpy as np
 import pandas as pd
 ## import local files
 from ogd.common.filters import *
 from ogd.common.filters.collections import *
+from ogd.common.filters.Filter import Filter
 from ogd.common.configs.DataTableConfig import DataTableConfig
 from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
 from ogd.common.models.features.ExportMode import ExportMode
 from ogd.common.storage.IDType import IDType
+from ogd.common.storage.ShardType import ShardType
 from ogd.common.filters.FilterMode import FilterMode
 from ogd.common.storage.VersionType import VersionType
 from ogd.common.models.SemanticVersion import SemanticVersion
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
 from ogd.common.storage.interfaces.Interface import Interface
 from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.CSVIndex import CSVIndex
+from ogd.common.storage.connectors.MappedTSVScanner import FieldPredicate, MappedTSVScanner
 from ogd.common.utils.Logger import Logger
 
 type PDMask = Union[pd.Series, bool]
@@ -24,12 +31,39 @@ class CSVInterface(Interface):
 
     # *** BUILT-INS & PROPERTIES ***
 
-    def __init__(self, config:DataTableConfig, fail_fast:bool, extension:str="tsv", store:Optional[CSVConnector]=None):
+    def __init__(self, config:DataTableConfig, fail_fast:bool, extension:str="tsv", store:Optional[CSVConnector]=None,
+                 lazy:bool=False, chunk_size:int=100000, use_index:bool=True, mapped:bool=False):
+        """Constructor for a CSVInterface.
+
+        :param config: The config for the table to read, including the file location and table schema.
+        :type config: DataTableConfig
+        :param fail_fast: Whether to stop on the first bad row, rather than skipping it.
+        :type fail_fast: bool
+        :param extension: The file extension, which determines the delimiter, defaults to "tsv"
+        :type extension: str, optional
+        :param store: A connector to an already-open file, defaults to None, in which case a connector is made from the config.
+        :type store: Optional[CSVConnector], optional
+        :param lazy: Whether to read events a chunk at a time, keeping only the rows that pass the filters, instead of loading the whole file.
+            In lazy mode, only the columns used by the table schema's column map are read. Defaults to False
+        :type lazy: bool, optional
+        :param chunk_size: The number of lines to read at a time in lazy mode, defaults to 100000
+        :type chunk_size: int, optional
+        :param use_index: Whether to use the file's sidecar `CSVIndex`, if it has an up-to-date one,
+            to answer metadata queries and fetch sessions without scanning the file. Defaults to True
+        :type use_index: bool, optional
+        :param mapped: Whether to scan the file through a memory map with a `MappedTSVScanner`, instead of reading it with pandas.
+            Only the fields needed for each request are decoded, and rows are returned as strings for the schema to convert.
+            Only suitable for uncompressed files without quoted fields, such as OGD's own TSV exports. Defaults to False
+        :type mapped: bool, optional
+        """
         self._store : CSVConnector
 
         super().__init__(config=config, fail_fast=fail_fast)
-        self._extension = extension
-        self._data = pd.DataFrame()
+        self._extension  : str  = extension
+        self._lazy       : bool = lazy
+        self._chunk_size : int  = chunk_size
+        self._mapped     : bool = mapped
+        self._data : Optional[pd.DataFrame] = None
         if store:
             self._store = store
         elif isinstance(self.Config.StoreConfig, FileStoreConfig):
@@ -40,38 +74,43 @@ class CSVInterface(Interface):
         else:
             raise ValueError(f"CSVInterface config was for a connector other than CSV/TSV files! Found config type {type(self.Config.StoreConfig)}")
         self.Connector.Open(writeable=False)
-
-        # We always just read the file right away.
-        if self.Connector.IsOpen and self.Connector.File:
-            # TODO should include option for access to the TableConfig in the interface, because obviously it should know what form the table takes.
-            _default = lambda : np.dtype("object")
-            _mapping : Dict[str, np.dtype] = {
-                column.Name : np.dtype(column.ValueType if column.ValueType in {"str", "int", "float"} else "object")
-                for column in self.Config.TableSchema.Columns
-            }
-            target_types = defaultdict(_default, _mapping)
-
-            date_columns = [
-                column.Name for column in self.Config.TableSchema.Columns if column.ValueType in {"datetime", "timezone"}
-            ] if self.Config.TableSchema is not None else []
-
-            self._data = pd.read_csv(
-                filepath_or_buffer=self.Connector.File,
-                delimiter=self.Delimiter,
-                dtype=target_types,
-                parse_dates=date_columns
-            )
-            Logger.Log(f"Loaded from CSV, columns are: {self._data.dtypes}", logging.INFO)
-            Logger.Log(f"First few rows are:\n{self._data.head(n=3)}")
+        self._use_index : bool               = use_index
+        self._index     : Optional[CSVIndex] = CSVIndex.Load(self.Connector.StoreConfig.Filepath) if use_index else None
+        if self._index is not None:
+            Logger.Log(f"Using sidecar index for {self.Connector.StoreConfig.Filepath}, with {len(self._index.SessionIDs)} sessions.", logging.DEBUG)
 
     @property
     def DataFrame(self) -> pd.DataFrame:
+        """The full contents of the file, as a DataFrame.
+
+        The file is read the first time the data is needed, rather than when the interface is created,
+        so that streaming events with `GetEventStream` can read the file in chunks without ever loading all of it.
+
+        :return: A DataFrame of the file contents, or an empty DataFrame if the file is not open.
+        :rtype: pd.DataFrame
+        """
+        if self._data is None:
+            self._data = pd.DataFrame()
+            if self.Connector.IsOpen and self.Connector.File:
+                self.Connector.File.seek(0)
+                self._data = pd.read_csv(filepath_or_buffer=self.Connector.File, **self._readOptions())
+                Logger.Log(f"Loaded from CSV, columns are: {self._data.dtypes}", logging.INFO)
+                Logger.Log(f"First few rows are:\n{self._data.head(n=3)}")
         return self._data
 
     @property
     def Extension(self) -> str:
         return self._extension
 
+    @property
+    def Index(self) -> Optional[CSVIndex]:
+        """The sidecar index of the file, if it has an up-to-date one and the interface was created to use it.
+
+        :return: The file's index, or None if the file is not indexed.
+        :rtype: Optional[CSVIndex]
+        """
+        return self._index
+
     @property
     def Delimiter(self) -> str:
         match self.Extension:
@@ -92,19 +131,22 @@ class CSVInterface(Interface):
     def _availableIDs(self, id_type:IDType, filters:DatasetFilterCollection) -> List[str]:
         ret_val : List[str] = []
 
-        if not self.DataFrame.empty:
-            dates = pd.to_datetime(self.DataFrame['timestamp'], format='ISO8601').dt.tz_convert(None) # HACK : need to handle this better elsewhere, pretty sure we've got someplace else giving us filters with dates rather than datetime
-            mask = None
-            if filters.Sequences.Timestamps.Active:
-                if filters.Sequences.Timestamps.Min and filters.Sequences.Timestamps.Max:
-                    mask = (dates >= filters.Sequences.Timestamps.Min) & (dates <= filters.Sequences.Timestamps.Max)
-                if filters.Sequences.Timestamps.Min:
-                    mask = dates >= filters.Sequences.Timestamps.Min
-                if filters.Sequences.Timestamps.Min and filters.Sequences.Timestamps.Max:
-                    mask = dates <= filters.Sequences.Timestamps.Max
+        if self._index is not None and self._data is None:
+            _sessions = self._indexedSessions(index=self._index, filters=filters)
+            if id_type == IDType.USER:
+                ret_val = sorted({user for session_id in _sessions for user in self._index.SessionUsers(session_id)})
+            else:
+                ret_val = _sessions
+        elif self._mapped and self._data is None:
+            _column = "user_id" if id_type == IDType.USER else "session_id"
+            with self._scanner() as scanner:
+                _ids = scanner.Scan(columns=[_column], where=self._fieldPredicates(filters=filters, sessions=False, players=False, event_names=False))
+                ret_val = [str(found) for found in dict.fromkeys(found for found, in _ids if found is not None)]
+        elif not self.DataFrame.empty:
+            mask = self._timestampMask(data=self.DataFrame, time_filter=filters.Sequences.Timestamps)
             # if versions is not None and versions is not []:
             #     mask = mask & (self._data['app_version'].isin(versions))
-            data_masked = self.DataFrame.loc[mask] if mask is not None else self.DataFrame
+            data_masked = self.DataFrame.loc[mask] if isinstance(mask, pd.Series) else self.DataFrame
             ret_val = [str(id) for id in data_masked['session_id'].unique().tolist()]
 
         return ret_val
@@ -112,7 +154,17 @@ class CSVInterface(Interface):
     def _availableDates(self, filters:DatasetFilterCollection) -> Dict[str,datetime]:
         ret_val : Dict[str,datetime] = {}
 
-        if self.Connector.IsOpen:
+        if self._index is not None and self._data is None:
+            _times = [self._index.SessionTimes(session_id) for session_id in self._indexedSessions(index=self._index, filters=filters, with_times=False)]
+            _mins = [pd.to_datetime(min_time) for min_time, _ in _times if min_time is not None]
+            _maxs = [pd.to_datetime(max_time) for _, max_time in _times if max_time is not None]
+            ret_val = {'min':min(_mins) if _mins else pd.NaT, 'max':max(_maxs) if _maxs else pd.NaT}
+        elif self._mapped and self._data is None:
+            with self._scanner() as scanner:
+                _times = scanner.Scan(columns=["timestamp"], where=self._fieldPredicates(filters=filters, event_names=False, timestamps=False))
+                _parsed = [pd.Timestamp(when) for when, in _times if when is not None]
+            ret_val = {'min':min(_parsed, key=self._utcKey) if _parsed else pd.NaT, 'max':max(_parsed, key=self._utcKey) if _parsed else pd.NaT}
+        elif self.Connector.IsOpen:
             sess_mask : PDMask = True
             if filters.IDFilters.Sessions.AsSet is not None:
                 match filters.IDFilters.Sessions.FilterMode:
@@ -142,7 +194,15 @@ class CSVInterface(Interface):
     def _availableVersions(self, mode:VersionType, filters:DatasetFilterCollection) -> List[SemanticVersion | str]:
         ret_val : List[SemanticVersion | str] = []
 
-        if self.Connector.IsOpen:
+        if self._index is not None and self._data is None:
+            _versions = self._index.LogVersions if mode==VersionType.LOG else self._index.AppVersions if mode==VersionType.APP else self._index.AppBranches
+            ret_val = [SemanticVersion.FromString(ver) for ver in _versions]
+        elif self._mapped and self._data is None:
+            version_col  : str = "log_version" if mode==VersionType.LOG else "app_version" if mode==VersionType.APP else "app_branch"
+            with self._scanner() as scanner:
+                _versions = dict.fromkeys(str(ver) for ver, in scanner.Scan(columns=[version_col]))
+            ret_val = [SemanticVersion.FromString(ver) for ver in _versions]
+        elif self.Connector.IsOpen:
             version_col  : str = "log_version" if mode==VersionType.LOG else "app_version" if mode==VersionType.APP else "app_branch"
             ret_val = [SemanticVersion.FromString(str(ver)) for ver in self.DataFrame[version_col].unique().tolist()]
 
@@ -152,41 +212,37 @@ class CSVInterface(Interface):
     def _getEventRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
         ret_val : List[Tuple] = []
 
-        if self.Connector.IsOpen and not self.DataFrame.empty:
-            sess_mask : PDMask = True
-            if filters.IDFilters.Sessions.AsSet is not None:
-                match filters.IDFilters.Sessions.FilterMode:
-                    case FilterMode.INCLUDE:
-                        sess_mask = self.DataFrame['session_id'].isin(filters.IDFilters.Sessions.AsSet)
-                    case FilterMode.EXCLUDE:
-                        sess_mask = ~self.DataFrame['session_id'].isin(filters.IDFilters.Sessions.AsSet)
-                    case FilterMode.NOFILTER:
-                        pass
-            user_mask : PDMask = True
-            if filters.IDFilters.Players.AsSet is not None:
-                match filters.IDFilters.Players.FilterMode:
-                    case FilterMode.INCLUDE:
-                        user_mask = self.DataFrame['user_id'].isin(filters.IDFilters.Players.AsSet)
-                    case FilterMode.EXCLUDE:
-                        user_mask = ~self.DataFrame['user_id'].isin(filters.IDFilters.Players.AsSet)
-                    case FilterMode.NOFILTER:
-                        pass
-            event_mask : PDMask = True
-            if filters.Events.EventNames.AsSet is not None:
-                match filters.Events.EventNames.FilterMode:
-                    case FilterMode.INCLUDE:
-                        event_mask = self.DataFrame['event_name'].isin(filters.Events.EventNames.AsSet)
-                    case FilterMode.EXCLUDE:
-                        event_mask = ~self.DataFrame['event_name'].isin(filters.Events.EventNames.AsSet)
-                    case FilterMode.NOFILTER:
-                        pass
-            _data = self.DataFrame[sess_mask & user_mask & event_mask]
+        if self._data is None and self._canSeekSessions(filters=filters):
+            ret_val = list(self._seekEventRows(filters=filters))
+        elif self._mapped and self._data is None:
+            ret_val = list(self._scanEventRows(filters=filters))
+        elif self._lazy and self._data is None:
+            ret_val = list(self._iterEventRows(filters=filters, batch_size=self._chunk_size))
+        elif self.Connector.IsOpen and not self.DataFrame.empty:
+            _data = self.DataFrame[self._eventMask(data=self.DataFrame, filters=filters)]
             ret_val = list(_data.itertuples(index=False, name=None))
         return ret_val
 
     def _getFeatureRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
         return []
 
+    @override
+    def _iterEventRows(self, filters:DatasetFilterCollection, batch_size:int) -> Iterator[Tuple]:
+        if self.Connector.IsOpen and self.Connector.File:
+            if self._data is not None:
+                # if the whole file was already loaded, there's no sense in reading it all again.
+                yield from self._getEventRows(filters=filters)
+            elif self._canSeekSessions(filters=filters):
+                yield from self._seekEventRows(filters=filters)
+            elif self._mapped:
+                yield from self._scanEventRows(filters=filters)
+            else:
+                _columns = self._projectedColumns()
+                self.Connector.File.seek(0)
+                with pd.read_csv(filepath_or_buffer=self.Connector.File, chunksize=batch_size, **self._readOptions(columns=_columns)) as reader:
+                    for chunk in reader:
+                        yield from self._filteredRows(data=chunk, filters=filters, columns=_columns)
+
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
@@ -206,4 +262,312 @@ class CSVInterface(Interface):
         """
         return
 
+    @staticmethod
+    def _eventMask(data:pd.DataFrame, filters:DatasetFilterCollection) -> pd.Series:
+        sess_mask : PDMask = True
+        if filters.IDFilters.Sessions.AsSet is not None:
+            match filters.IDFilters.Sessions.FilterMode:
+                case FilterMode.INCLUDE:
+                    sess_mask = data['session_id'].isin(filters.IDFilters.Sessions.AsSet)
+                case FilterMode.EXCLUDE:
+                    sess_mask = ~data['session_id'].isin(filters.IDFilters.Sessions.AsSet)
+                case FilterMode.NOFILTER:
+                    pass
+        user_mask : PDMask = True
+        if filters.IDFilters.Players.AsSet is not None:
+            match filters.IDFilters.Players.FilterMode:
+                case FilterMode.INCLUDE:
+                    user_mask = data['user_id'].isin(filters.IDFilters.Players.AsSet)
+                case FilterMode.EXCLUDE:
+                    user_mask = ~data['user_id'].isin(filters.IDFilters.Players.AsSet)
+                case FilterMode.NOFILTER:
+                    pass
+        event_mask : PDMask = True
+        if filters.Events.EventNames.AsSet is not None:
+            match filters.Events.EventNames.FilterMode:
+                case FilterMode.INCLUDE:
+                    event_mask = data['event_name'].isin(filters.Events.EventNames.AsSet)
+                case FilterMode.EXCLUDE:
+                    event_mask = ~data['event_name'].isin(filters.Events.EventNames.AsSet)
+                case FilterMode.NOFILTER:
+                    pass
+        time_mask : PDMask = CSVInterface._timestampMask(data=data, time_filter=filters.Sequences.Timestamps)
+        ret_val = sess_mask & user_mask & event_mask & time_mask
+        # if no filters applied, we'd just have a plain True, which can't index a DataFrame, so expand to a mask of all rows.
+        return ret_val if isinstance(ret_val, pd.Series) else pd.Series(ret_val, index=data.index)
+
+    @staticmethod
+    def _timestampMask(data:pd.DataFrame, time_filter:Filter) -> PDMask:
+        """Get a mask of the rows whose timestamp passes a timestamp range filter.
+
+        Timezone-aware timestamps, in the data or the filter, are compared in UTC, and naive timestamps are compared as they are.
+
+        :param data: The rows to be filtered.
+        :type data: pd.DataFrame
+        :param time_filter: The timestamp filter to apply.
+        :type time_filter: Filter
+        :return: A mask of the rows in the filtered range, or True if the filter is not active.
+        :rtype: PDMask
+        """
+        ret_val : PDMask = True
+
+        if time_filter.Active and (time_filter.Min is not None or time_filter.Max is not None) and 'timestamp' in data.columns:
+            def _utc(when:Any) -> pd.Timestamp:
+                _when = pd.Timestamp(when)
+                return _when.tz_convert(None) if _when.tzinfo is not None else _when
+            dates = pd.to_datetime(data['timestamp'], format='ISO8601', utc=True, errors='coerce').dt.tz_convert(None)
+            in_range = dates.notna()
+            if time_filter.Min is not None:
+                in_range &= dates >= _utc(time_filter.Min)
+            if time_filter.Max is not None:
+                in_range &= dates <= _utc(time_filter.Max)
+            ret_val = ~in_range if time_filter.FilterMode == FilterMode.EXCLUDE else in_range
+
+        return ret_val
+
+    @staticmethod
+    def _indexedSessions(index:CSVIndex, filters:DatasetFilterCollection, with_times:bool=True) -> List[str]:
+        """Get the sessions in an index that pass the session, player, and (optionally) timestamp filters.
+
+        A session passes the timestamp filter if any part of its time range overlaps the filtered range.
+
+        :param index: The index of the file.
+        :type index: CSVIndex
+        :param filters: The filters to apply.
+        :type filters: DatasetFilterCollection
+        :param with_times: Whether to apply the timestamp filter, defaults to True
+        :type with_times: bool, optional
+        :return: The IDs of the sessions that pass the filters, in file order.
+        :rtype: List[str]
+        """
+        ret_val : List[str] = index.SessionIDs
+
+        _sessions = filters.IDFilters.Sessions
+        if _sessions.Active and _sessions.AsSet is not None:
+            match _sessions.FilterMode:
+                case FilterMode.INCLUDE:
+                    ret_val = [session_id for session_id in ret_val if session_id in _sessions.AsSet]
+                case FilterMode.EXCLUDE:
+                    ret_val = [session_id for session_id in ret_val if session_id not in _sessions.AsSet]
+        _players = filters.IDFilters.Players
+        if _players.Active and _players.AsSet is not None:
+            match _players.FilterMode:
+                case FilterMode.INCLUDE:
+                    ret_val = [session_id for session_id in ret_val if not index.SessionUsers(session_id).isdisjoint(_players.AsSet)]
+                case FilterMode.EXCLUDE:
+                    ret_val = [session_id for session_id in ret_val if not index.SessionUsers(session_id).issubset(_players.AsSet) or not index.SessionUsers(session_id)]
+        _times = filters.Sequences.Timestamps
+        if with_times and _times.Active and (_times.Min is not None or _times.Max is not None):
+            _utc = lambda when : CSVInterface._utcKey(pd.Timestamp(when))
+            def _overlaps(session_id:str) -> bool:
+                min_time, max_time = index.SessionTimes(session_id)
+                if min_time is None or max_time is None:
+                    return False
+                return (_times.Max is None or _utc(min_time) <= _utc(_times.Max)) and (_times.Min is None or _utc(max_time) >= _utc(_times.Min))
+            if _times.FilterMode != FilterMode.EXCLUDE:
+                ret_val = [session_id for session_id in ret_val if _overlaps(session_id)]
+
+        return ret_val
+
+    @staticmethod
+    def _fieldPredicates(filters:DatasetFilterCollection, sessions:bool=True, players:bool=True, event_names:bool=True, timestamps:bool=True) -> Dict[str, FieldPredicate]:
+        """Turn the session, player, event name, and timestamp filters into predicates on raw text fields, for a `MappedTSVScanner`.
+
+        :param filters: The filters to apply.
+        :type filters: DatasetFilterCollection
+        :param sessions: Whether to include the session filter, defaults to True
+        :type sessions: bool, optional
+        :param players: Whether to include the player filter, defaults to True
+        :type players: bool, optional
+        :param event_names: Whether to include the event name filter, defaults to True
+        :type event_names: bool, optional
+        :param timestamps: Whether to include the timestamp filter, defaults to True
+        :type timestamps: bool, optional
+        :return: A mapping of column names to predicates on the column's fields.
+        :rtype: Dict[str, FieldPredicate]
+        """
+        ret_val : Dict[str, FieldPredicate] = {}
+
+        _set_filters : List[Tuple[str, Filter]] = []
+        if sessions:
+            _set_filters.append(("session_id", filters.IDFilters.Sessions))
+        if players:
+            _set_filters.append(("user_id", filters.IDFilters.Players))
+        if event_names:
+            _set_filters.append(("event_name", filters.Events.EventNames))
+        for column, set_filter in _set_filters:
+            if set_filter.Active and set_filter.AsSet is not None:
+                _elements = set_filter.AsSet
+                match set_filter.FilterMode:
+                    case FilterMode.INCLUDE:
+                        ret_val[column] = lambda field, _elements=_elements : field in _elements
+                    case FilterMode.EXCLUDE:
+                        ret_val[column] = lambda field, _elements=_elements : field not in _elements
+        _times = filters.Sequences.Timestamps
+        if timestamps and _times.Active and (_times.Min is not None or _times.Max is not None):
+            _min = CSVInterface._utcKey(pd.Timestamp(_times.Min)) if _times.Min is not None else None
+            _max = CSVInterface._utcKey(pd.Timestamp(_times.Max)) if _times.Max is not None else None
+            _exclude = _times.FilterMode == FilterMode.EXCLUDE
+            def _inRange(field:Optional[str]) -> bool:
+                try:
+                    when = CSVInterface._utcKey(datetime.fromisoformat(field)) if field is not None else None
+                except ValueError:
+                    when = None
+                in_range = when is not None and (_min is None or when >= _min) and (_max is None or when <= _max)
+                return in_range != _exclude
+            ret_val["timestamp"] = _inRange
+
+        return ret_val
+
+    @staticmethod
+    def _utcKey(when:datetime) -> datetime:
+        return when.astimezone(timezone.utc).replace(tzinfo=None) if when.tzinfo is not None else when
+
     # *** PRIVATE METHODS ***
+
+    @override
+    def _getEventRowsSharded(self, filters:DatasetFilterCollection, shard_by:ShardType, max_workers:int) -> List[Tuple]:
+        """Retrieve event rows for a sharded request, without sharding.
+
+        Each shard would need its own interface, which would open and read the whole file again,
+        so the request is retrieved in one pass instead, and given in the same merged order as a sharded request.
+
+        :param filters: The filters for the request.
+        :type filters: DatasetFilterCollection
+        :param shard_by: The way the request would be split into shards.
+        :type shard_by: ShardType
+        :param max_workers: The maximum number of shards that would be retrieved at once.
+        :type max_workers: int
+        :return: The rows for the request, in `user_id`, `session_id`, `event_sequence_index` order.
+        :rtype: List[Tuple]
+        """
+        Logger.Log(f"Sharding by {shard_by} is not supported for file-backed storage, {self.Connector.ResourceName} will be read without sharding.", logging.INFO, depth=3)
+        return sorted(self._getEventRows(filters=filters), key=self._rowOrderKey)
+
+    def _scanner(self) -> MappedTSVScanner:
+        return MappedTSVScanner(file=self.Connector.File, delimiter=self.Delimiter)
+
+    def _scanEventRows(self, filters:DatasetFilterCollection) -> Iterator[Tuple]:
+        """Read the rows that pass the filters by scanning the memory-mapped file.
+
+        The filter columns are decoded for every line, but the other columns only for lines that pass the filters.
+        Rows are given in the column order of the table schema, with None for columns the schema's column map does not use.
+
+        :param filters: The filters for the request.
+        :type filters: DatasetFilterCollection
+        :return: An iterator over the rows that pass the filters.
+        :rtype: Iterator[Tuple]
+        """
+        _needed  = self._projectedColumns()
+        _columns = [name if _needed is None or name in _needed else None for name in self.Config.TableSchema.ColumnNames]
+        with self._scanner() as scanner:
+            yield from scanner.Scan(columns=_columns, where=self._fieldPredicates(filters=filters))
+
+    def _canSeekSessions(self, filters:DatasetFilterCollection) -> bool:
+        """Check whether the rows for a request can be read by seeking to the requested sessions, rather than scanning the file.
+
+        :param filters: The filters for the request.
+        :type filters: DatasetFilterCollection
+        :return: True if the file has an index, and the request includes a specific set of sessions, else False.
+        :rtype: bool
+        """
+        _sessions = filters.IDFilters.Sessions
+        return self._index is not None and _sessions.Active and _sessions.AsSet is not None and _sessions.FilterMode == FilterMode.INCLUDE
+
+    def _seekEventRows(self, filters:DatasetFilterCollection) -> Iterator[Tuple]:
+        """Read the rows for the requested sessions by seeking to each session's lines, as given by the file's index.
+
+        The lines are parsed in one batch, and the rest of the filters are applied to them, just as for a chunk of the whole file.
+
+        :param filters: The filters for the request, which must include a specific set of sessions.
+        :type filters: DatasetFilterCollection
+        :return: An iterator over the rows that pass the filters.
+        :rtype: Iterator[Tuple]
+        """
+        if self._index is None:
+            return
+        _ranges = self._index.SessionRanges(self._indexedSessions(index=self._index, filters=filters))
+        Logger.Log(f"Seeking to {len(_ranges)} indexed byte range(s) in {self.Connector.StoreConfig.Filepath}", logging.DEBUG)
+        if len(_ranges) > 0:
+            with open(self.Connector.StoreConfig.Filepath, "rb") as raw_file:
+                _chunks : List[bytes] = []
+                for start, end in _ranges:
+                    raw_file.seek(start)
+                    _chunks.append(raw_file.read(end - start))
+            _text    = b"".join(_chunks).decode("utf-8")
+            _columns = self._projectedColumns()
+            _data    = pd.read_csv(io.StringIO(_text), header=None, names=self._index.Columns, **self._readOptions(columns=_columns))
+            yield from self._filteredRows(data=_data, filters=filters, columns=_columns)
+
+    def _filteredRows(self, data:pd.DataFrame, filters:DatasetFilterCollection, columns:Optional[Set[str]]) -> Iterable[Tuple]:
+        _data = data[self._eventMask(data=data, filters=filters)]
+        if columns is not None:
+            return self._schemaRows(data=_data)
+        else:
+            return _data.itertuples(index=False, name=None)
+
+    def _projectedColumns(self) -> Optional[Set[str]]:
+        """Get the names of the columns needed to build events, and to apply filters, in lazy or mapped mode.
+
+        :return: The set of columns used by the table schema's column map, or None if all columns should be read.
+        :rtype: Optional[Set[str]]
+        """
+        ret_val : Optional[Set[str]] = None
+
+        if (self._lazy or self._mapped) and isinstance(self.Config.TableSchema, EventTableSchema):
+            ret_val = {"session_id", "user_id", "event_name", "timestamp"} & set(self.Config.TableSchema.ColumnNames)
+            for mapping in self.Config.TableSchema.ColumnMap.Mapping.values():
+                if isinstance(mapping, str):
+                    ret_val.add(mapping)
+                elif isinstance(mapping, list):
+                    ret_val.update(mapping)
+                elif isinstance(mapping, dict):
+                    ret_val.update(mapping.values())
+
+        return ret_val
+
+    def _schemaRows(self, data:pd.DataFrame) -> Iterable[Tuple]:
+        """Turn a chunk of projected columns back into rows with one element per table schema column.
+
+        Columns that were not read are filled with None, so the schema's column indices still line up with each row.
+
+        :param data: The chunk of rows, with only the projected columns.
+        :type data: pd.DataFrame
+        :return: The rows, as tuples in the column order of the table schema.
+        :rtype: Iterable[Tuple]
+        """
+        _columns = [
+            data[name].tolist() if name in data.columns else repeat(None, len(data))
+            for name in self.Config.TableSchema.ColumnNames
+        ]
+        return zip(*_columns)
+
+    def _readOptions(self, columns:Optional[Set[str]]=None) -> Dict[str, Any]:
+        """Get the options for `pd.read_csv` that give each column the type given by the table schema.
+
+        :param columns: The names of the columns to read, defaults to None, in which case all columns are read.
+        :type columns: Optional[Set[str]], optional
+        :return: Keyword arguments for `pd.read_csv`.
+        :rtype: Dict[str, Any]
+        """
+        # TODO should include option for access to the TableConfig in the interface, because obviously it should know what form the table takes.
+        _default = lambda : np.dtype("object")
+        _mapping : Dict[str, np.dtype] = {
+            column.Name : np.dtype(column.ValueType if column.ValueType in {"str", "int", "float"} else "object")
+            for column in self.Config.TableSchema.Columns
+        }
+        target_types = defaultdict(_default, _mapping)
+
+        date_columns = [
+            column.Name for column in self.Config.TableSchema.Columns
+            if column.ValueType in {"datetime", "timezone"} and (columns is None or column.Name in columns)
+        ] if self.Config.TableSchema is not None else []
+
+        ret_val : Dict[str, Any] = {
+            "delimiter"   : self.Delimiter,
+            "dtype"       : target_types,
+            "parse_dates" : date_columns
+        }
+        if columns is not None:
+            ret_val["usecols"] = lambda name : name in columns
+        return ret_val
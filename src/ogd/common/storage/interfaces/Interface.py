@@ -3,22 +3,29 @@
 ## import standard libraries
 import abc
 import logging
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, time, timedelta
+from math import ceil
 from pprint import pformat
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 ## import external libraries
 from deprecated.sphinx import deprecated
 
 # import local files
 from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
 from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
 from ogd.common.models.events.Event import Event
 from ogd.common.models.events.EventSet import EventSet
 from ogd.common.models.features.Feature import Feature
 from ogd.common.models.features.FeatureSet import FeatureSet
 from ogd.common.storage.IDType import IDType
+from ogd.common.storage.ShardType import ShardType
 from ogd.common.filters.FilterMode import FilterMode
 from ogd.common.storage.VersionType import VersionType
 from ogd.common.models.SemanticVersion import SemanticVersion
@@ -156,27 +163,34 @@ class Interface(abc.ABC):
             Logger.Log(f"Could not retrieve data versions from {self.Connector.ResourceName}, the storage connection is not open!", logging.WARNING, depth=3)
         return ret_val
 
-    def GetEventSet(self, filters:DatasetFilterCollection, fallbacks:Map) -> EventSet:
+    def GetEventSet(self, filters:DatasetFilterCollection, fallbacks:Map, shard_by:Optional[ShardType]=None, shard_workers:int=4, workers:int=1, lazy_payloads:bool=False) -> EventSet:
         """Get a set of events based on the given filters.
 
+        If `shard_by` is given, the request is split into shards, by day or by session,
+        which are retrieved concurrently, each through its own connection to the storage.
+        The rows from all shards are then merged in `user_id`, `session_id`, `event_sequence_index` order.
+
+        If `workers` is more than 1, the retrieved rows are split into chunks, which are converted to Events in a pool of `workers` processes.
+        The events are still returned in the order of the rows.
+        When not failing fast, rows that could not be converted are counted and reported once at the end, rather than individually.
+        The worker processes are spawned rather than forked, so a script that uses `workers` must guard its entry point with `if __name__ == "__main__":`.
+
         :param filters: _description_
         :type filters: DatasetFilterCollection
         :param fallbacks: _description_
         :type fallbacks: Map
+        :param shard_by: The way to split the request into shards, or None to retrieve all events with a single request, defaults to None
+        :type shard_by: Optional[ShardType], optional
+        :param shard_workers: The maximum number of shards to retrieve at once, defaults to 4
+        :type shard_workers: int, optional
+        :param workers: The number of processes to use when converting rows to Events, defaults to 1
+        :type workers: int, optional
+        :param lazy_payloads: Whether to keep JSON-text event data and game state as `LazyJSON`, parsed only when read, defaults to False.
+            See `Event.FromRow`.
+        :type lazy_payloads: bool, optional
         :return: _description_
         :rtype: EventSet
         """
-        def convert(row, schema:EventTableSchema, fallbacks:Map) -> Optional[Event]:
-            try:
-                return Event.FromRow(row=row, schema=schema, fallbacks=fallbacks)
-            except Exception as err: # pylint: disable=broad-exception-caught
-                if self._fail_fast:
-                    Logger.Log(f"Error while converting row to Event! Cancelling data retrieval.\nFull error: {err}\nRow data: {pformat(row)}", logging.ERROR, depth=2)
-                    raise err
-                else:
-                    Logger.Log(f"Error while converting row ({row}) to Event! This row will be skipped.\nFull error: {err}", logging.WARNING, depth=2)
-                    return None
-
         events : List[Event] = []
         if self.Connector.IsOpen:
             self._safeguardFilters(filters=filters)
@@ -184,8 +198,15 @@ class Interface(abc.ABC):
                 _msg = f"Retrieving event data from {self.Connector.ResourceName}."
                 Logger.Log(_msg, logging.INFO, depth=3)
 
-                rows = self._getEventRows(filters=filters)
-                events = [event for row in rows if (event := convert(row=row, schema=self.Config.TableSchema, fallbacks=fallbacks)) is not None]
+                if shard_by is None:
+                    rows = self._getEventRows(filters=filters)
+                else:
+                    rows = self._getEventRowsSharded(filters=filters, shard_by=shard_by, max_workers=shard_workers)
+                Event.ResetSequence()
+                if workers > 1:
+                    events = self._eventsFromRowsParallel(rows=rows, schema=self.Config.TableSchema, fallbacks=fallbacks, workers=workers, lazy_payloads=lazy_payloads)
+                else:
+                    events = self._eventsFromRows(rows=rows, schema=self.Config.TableSchema, fallbacks=fallbacks, lazy_payloads=lazy_payloads)
 
             else:
                 Logger.Log(f"Could not retrieve Event data from {self.Connector.ResourceName}, this interface is not configured for Event data!", logging.WARNING, depth=3)
@@ -209,6 +230,52 @@ class Interface(abc.ABC):
         """
         return self.GetEventSet(filters=filters, fallbacks=fallbacks)
 
+    def GetEventStream(self, filters:DatasetFilterCollection, fallbacks:Map, batch_size:int=1000, lazy_payloads:bool=False) -> Iterator[EventSet]:
+        """Get events based on the given filters, as a stream of sets of at most `batch_size` events.
+
+        Unlike `GetEventSet`, events are converted and yielded as rows come off of the storage,
+        so only one batch of events needs to be held in memory at a time.
+        Interfaces that implement `_iterEventRows` will also avoid holding the full set of raw rows in memory.
+
+        :param filters: _description_
+        :type filters: DatasetFilterCollection
+        :param fallbacks: _description_
+        :type fallbacks: Map
+        :param batch_size: The maximum number of events in each yielded EventSet, defaults to 1000
+        :type batch_size: int, optional
+        :param lazy_payloads: Whether to keep JSON-text event data and game state as `LazyJSON`, parsed only when read, defaults to False.
+            See `Event.FromRow`.
+        :type lazy_payloads: bool, optional
+        :yield: Successive sets of events retrieved from the storage, in the order they were retrieved.
+        :rtype: Iterator[EventSet]
+        """
+        if self.Connector.IsOpen:
+            self._safeguardFilters(filters=filters)
+            if isinstance(self.Config.TableSchema, EventTableSchema):
+                _msg = f"Streaming event data from {self.Connector.ResourceName}, in batches of {batch_size}."
+                Logger.Log(_msg, logging.INFO, depth=3)
+
+                Event.ResetSequence()
+                # rows are converted a chunk at a time, so the chunk's timestamps can be parsed together.
+                batch : List[Event] = []
+                chunk : List[Tuple] = []
+                for row in self._iterEventRows(filters=filters, batch_size=batch_size):
+                    chunk.append(row)
+                    if len(chunk) >= batch_size:
+                        batch += self._eventsFromRows(rows=chunk, schema=self.Config.TableSchema, fallbacks=fallbacks, lazy_payloads=lazy_payloads)
+                        chunk = []
+                        if len(batch) >= batch_size:
+                            yield EventSet(events=batch[:batch_size], filters=filters)
+                            batch = batch[batch_size:]
+                batch += self._eventsFromRows(rows=chunk, schema=self.Config.TableSchema, fallbacks=fallbacks, lazy_payloads=lazy_payloads)
+                while len(batch) > 0:
+                    yield EventSet(events=batch[:batch_size], filters=filters)
+                    batch = batch[batch_size:]
+            else:
+                Logger.Log(f"Could not stream Event data from {self.Connector.ResourceName}, this interface is not configured for Event data!", logging.WARNING, depth=3)
+        else:
+            Logger.Log(f"Could not stream Event data from {self.Connector.ResourceName}, the storage connection is not open!", logging.WARNING, depth=3)
+
     def GetFeatureSet(self, filters:DatasetFilterCollection, fallbacks:Map) -> FeatureSet:
         """Get a set of features based on the given filters.
 
@@ -219,17 +286,6 @@ class Interface(abc.ABC):
         :return: _description_
         :rtype: FeatureSet
         """
-        def convert(row, schema:FeatureTableSchema, fallbacks:Map) -> Optional[Feature]:
-            try:
-                return Feature.FromRow(row=row, schema=schema, fallbacks=fallbacks)
-            except Exception as err: # pylint: disable=broad-exception-caught
-                if self._fail_fast:
-                    Logger.Log(f"Error while converting row to Feature! Cancelling data retrieval.\nFull error: {err}\nRow data: {pformat(row)}", logging.ERROR, depth=2)
-                    raise err
-                else:
-                    Logger.Log(f"Error while converting row ({row}) to Feature! This row will be skipped.\nFull error: {err}", logging.WARNING, depth=2)
-                    return None
-
         features : List[Feature] = []
         if self.Connector.IsOpen:
             self._safeguardFilters(filters=filters)
@@ -238,7 +294,7 @@ class Interface(abc.ABC):
                 Logger.Log(_msg, logging.INFO, depth=3)
 
                 rows = self._getFeatureRows(filters=filters)
-                features = [feature for row in rows if (feature := convert(row=row, schema=self.Config.TableSchema, fallbacks=fallbacks)) is not None]
+                features = [feature for row in rows if (feature := self._featureFromRow(row=row, schema=self.Config.TableSchema, fallbacks=fallbacks)) is not None]
             else:
                 Logger.Log(f"Could not retrieve Feature data from {self.Connector.ResourceName}, this interface is not configured for Feature data!", logging.WARNING, depth=3)
         else:
@@ -261,6 +317,43 @@ class Interface(abc.ABC):
         """
         return self.GetFeatureSet(filters=filters, fallbacks=fallbacks)
 
+    def GetFeatureStream(self, filters:DatasetFilterCollection, fallbacks:Map, batch_size:int=1000) -> Iterator[FeatureSet]:
+        """Get features based on the given filters, as a stream of sets of at most `batch_size` features.
+
+        Unlike `GetFeatureSet`, features are converted and yielded as rows come off of the storage,
+        so only one batch of features needs to be held in memory at a time.
+        Interfaces that implement `_iterFeatureRows` will also avoid holding the full set of raw rows in memory.
+
+        :param filters: _description_
+        :type filters: DatasetFilterCollection
+        :param fallbacks: _description_
+        :type fallbacks: Map
+        :param batch_size: The maximum number of features in each yielded FeatureSet, defaults to 1000
+        :type batch_size: int, optional
+        :yield: Successive sets of features retrieved from the storage, in the order they were retrieved.
+        :rtype: Iterator[FeatureSet]
+        """
+        if self.Connector.IsOpen:
+            self._safeguardFilters(filters=filters)
+            if isinstance(self.Config.TableSchema, FeatureTableSchema):
+                _msg = f"Streaming feature data from {self.Connector.ResourceName}, in batches of {batch_size}."
+                Logger.Log(_msg, logging.INFO, depth=3)
+
+                batch : List[Feature] = []
+                for row in self._iterFeatureRows(filters=filters, batch_size=batch_size):
+                    feature = self._featureFromRow(row=row, schema=self.Config.TableSchema, fallbacks=fallbacks)
+                    if feature is not None:
+                        batch.append(feature)
+                        if len(batch) >= batch_size:
+                            yield FeatureSet(features=batch, filters=filters)
+                            batch = []
+                if len(batch) > 0:
+                    yield FeatureSet(features=batch, filters=filters)
+            else:
+                Logger.Log(f"Could not stream Feature data from {self.Connector.ResourceName}, this interface is not configured for Feature data!", logging.WARNING, depth=3)
+        else:
+            Logger.Log(f"Could not stream Feature data from {self.Connector.ResourceName}, the storage connection is not open!", logging.WARNING, depth=3)
+
     # *** PRIVATE STATICS ***
 
     @classmethod
@@ -282,4 +375,296 @@ class Interface(abc.ABC):
             yesterday = datetime.combine(datetime.now().date(), time(0)) - timedelta(days=1)
             filters.Sequences.Timestamps = RangeFilter[datetime](mode=FilterMode.INCLUDE, minimum=yesterday, maximum=datetime.now())
 
+    @staticmethod
+    def _shardFilters(filters:DatasetFilterCollection, shard_by:ShardType, shard_count:int) -> List[DatasetFilterCollection]:
+        """Function to split a filter set into several smaller filter sets, whose results together match the original filters.
+
+        Sharding by day requires an included timestamp range with both a min and a max,
+        and gives one shard per calendar day in the range.
+        Sharding by session requires an included set of sessions, and gives `shard_count` shards with roughly equal numbers of sessions.
+        If the filters can't be split in the given way, the original filters are returned as the only shard.
+
+        :param filters: The filters to be split into shards.
+        :type filters: DatasetFilterCollection
+        :param shard_by: The way in which to split the filters.
+        :type shard_by: ShardType
+        :param shard_count: The number of shards to make, when sharding by session.
+        :type shard_count: int
+        :return: A list of filter sets, one for each shard.
+        :rtype: List[DatasetFilterCollection]
+        """
+        ret_val : List[DatasetFilterCollection] = [filters]
+
+        match shard_by:
+            case ShardType.DAY:
+                _times = filters.Sequences.Timestamps
+                if isinstance(_times, RangeFilter) and _times.FilterMode == FilterMode.INCLUDE and _times.Min and _times.Max:
+                    ret_val = []
+                    _start = _times.Min
+                    while _start <= _times.Max:
+                        _next_day = datetime.combine(_start.date() + timedelta(days=1), time(0), tzinfo=_start.tzinfo)
+                        # end each shard just before midnight, since range filters include both endpoints.
+                        _end = min(_next_day - timedelta(microseconds=1), _times.Max)
+                        ret_val.append(Interface._shardOf(filters=filters, timestamps=RangeFilter[datetime](mode=FilterMode.INCLUDE, minimum=_start, maximum=_end)))
+                        _start = _next_day
+                else:
+                    Logger.Log("Could not shard request by day, the filters did not include a timestamp range with both a min and max. Request will not be sharded.", logging.WARNING)
+            case ShardType.SESSION:
+                _sessions = filters.IDFilters.Sessions
+                if isinstance(_sessions, SetFilter) and _sessions.FilterMode == FilterMode.INCLUDE and _sessions.AsSet:
+                    _session_list = sorted(_sessions.AsSet)
+                    _shard_size   = ceil(len(_session_list) / max(shard_count, 1))
+                    ret_val = [
+                        Interface._shardOf(filters=filters, sessions=SetFilter[str](mode=FilterMode.INCLUDE, set_elements=_session_list[i:i+_shard_size]))
+                        for i in range(0, len(_session_list), _shard_size)
+                    ]
+                else:
+                    Logger.Log("Could not shard request by session, the filters did not include a set of sessions. Request will not be sharded.", logging.WARNING)
+
+        return ret_val
+
+    @staticmethod
+    def _convertEventRows(rows:List[Tuple], schema:EventTableSchema, fallbacks:Map, fail_fast:bool, lazy_payloads:bool=False) -> Tuple[List[Event], int, Optional[str]]:
+        """Function to convert a chunk of rows to Events, run in a worker process by `_eventsFromRowsParallel`.
+
+        :return: The converted events, the number of rows that were skipped, and a description of the first error, if any rows were skipped.
+        :rtype: Tuple[List[Event], int, Optional[str]]
+        """
+        events      : List[Event]   = []
+        skipped     : int           = 0
+        first_error : Optional[str] = None
+        # worker processes are reused between chunks, and each chunk starts on a new session, so drop the state left by the last chunk.
+        Event.ResetSequence()
+        timestamps = Event.TimestampsFromRows(rows=rows, schema=schema)
+        for row, timestamp in zip(rows, timestamps):
+            try:
+                events.append(Event.FromRow(row=row, schema=schema, fallbacks=fallbacks, timestamp=timestamp, lazy_payloads=lazy_payloads))
+            except Exception as err: # pylint: disable=broad-exception-caught
+                if fail_fast:
+                    raise err
+                skipped += 1
+                if first_error is None:
+                    first_error = f"{err}\nRow data: {pformat(row)}"
+        return events, skipped, first_error
+
+    @staticmethod
+    def _shardOf(filters:DatasetFilterCollection, timestamps:Optional[RangeFilter[datetime]]=None, sessions:Optional[SetFilter[str]]=None) -> DatasetFilterCollection:
+        return DatasetFilterCollection(
+            id_filters=IDFilterCollection(
+                session_filter=sessions or filters.IDFilters.Sessions,
+                player_filter=filters.IDFilters.Players,
+                app_filter=filters.IDFilters.AppIDs
+            ),
+            sequence_filters=SequencingFilterCollection(
+                timestamp_filter=timestamps or filters.Sequences.Timestamps,
+                session_index_filter=filters.Sequences.SessionIndices
+            ),
+            version_filters=filters.Versions,
+            event_filters=filters.Events
+        )
+
     # *** PRIVATE METHODS ***
+
+    def _shardInterface(self) -> "Interface":
+        """Create a new interface to the same storage, with its own connection, for retrieving one shard of a sharded request.
+
+        By default, this creates a new instance of the interface's class from the same config.
+        Subclasses whose constructor takes other parameters should override it.
+
+        :return: A new interface, with an open connection to the same storage.
+        :rtype: Interface
+        """
+        return type(self)(config=self.Config, fail_fast=self._fail_fast)
+
+    def _getEventRowsSharded(self, filters:DatasetFilterCollection, shard_by:ShardType, max_workers:int) -> List[Tuple]:
+        """Retrieve event rows by splitting the request into shards, and retrieving the shards concurrently.
+
+        Each shard is retrieved on a worker thread, through its own interface from `_shardInterface`,
+        and the rows of all shards are merged in `user_id`, `session_id`, `event_sequence_index` order.
+
+        :param filters: _description_
+        :type filters: DatasetFilterCollection
+        :param shard_by: The way to split the request into shards.
+        :type shard_by: ShardType
+        :param max_workers: The maximum number of shards to retrieve at once.
+        :type max_workers: int
+        :return: The rows from all shards, in merged order.
+        :rtype: List[Tuple]
+        """
+        ret_val : List[Tuple] = []
+
+        shards = self._shardFilters(filters=filters, shard_by=shard_by, shard_count=max_workers)
+        if len(shards) <= 1:
+            ret_val = self._getEventRows(filters=filters)
+        else:
+            Logger.Log(f"Retrieving event data from {self.Connector.ResourceName} in {len(shards)} shards, with up to {max_workers} at once.", logging.INFO, depth=3)
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(shards)))) as pool:
+                results = list(pool.map(self._getShardRows, shards))
+            # each shard is typically in order already, and sorting a concatenation of sorted runs is close to linear.
+            ret_val = sorted((row for rows in results for row in rows), key=self._rowOrderKey)
+
+        return ret_val
+
+    def _getShardRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
+        ret_val : List[Tuple] = []
+
+        shard = self._shardInterface()
+        try:
+            ret_val = shard._getEventRows(filters=filters)
+            Logger.Log(f"Retrieved {len(ret_val)} rows for shard with {filters.Sequences}, {filters.IDFilters}.", logging.DEBUG, depth=3)
+        except Exception as err: # pylint: disable=broad-exception-caught
+            if self._fail_fast:
+                Logger.Log(f"Error while retrieving shard with {filters.Sequences}, {filters.IDFilters}! Cancelling data retrieval.\nFull error: {err}", logging.ERROR, depth=3)
+                raise err
+            else:
+                Logger.Log(f"Error while retrieving shard with {filters.Sequences}, {filters.IDFilters}! This shard will be skipped.\nFull error: {err}", logging.WARNING, depth=3)
+        finally:
+            shard.Connector.Close()
+
+        return ret_val
+
+    def _eventsFromRowsParallel(self, rows:List[Tuple], schema:EventTableSchema, fallbacks:Map, workers:int, lazy_payloads:bool=False) -> List[Event]:
+        """Convert rows to Events in a pool of worker processes.
+
+        The rows are split into contiguous chunks, without splitting any session across chunks,
+        so that fallback sequence indices are assigned as they would be in a single process.
+
+        :param rows: The rows to convert.
+        :type rows: List[Tuple]
+        :param schema: The schema to use for conversion.
+        :type schema: EventTableSchema
+        :param fallbacks: _description_
+        :type fallbacks: Map
+        :param workers: The number of worker processes.
+        :type workers: int
+        :param lazy_payloads: Whether to keep JSON-text payloads as `LazyJSON`, defaults to False
+        :type lazy_payloads: bool, optional
+        :return: The converted events, in the order of the rows.
+        :rtype: List[Event]
+        """
+        ret_val : List[Event] = []
+
+        # use a few chunks per worker, so one slow chunk doesn't leave the other workers idle.
+        chunks = self._chunkRows(rows=rows, chunk_count=workers * 4)
+        Logger.Log(f"Converting {len(rows)} rows to Events in {len(chunks)} chunks, with {workers} workers.", logging.DEBUG, depth=3)
+        skipped     : int           = 0
+        first_error : Optional[str] = None
+        # spawn fresh workers, rather than forking a copy of a process that may hold open connections and worker threads.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(Interface._convertEventRows, chunk, schema, fallbacks, self._fail_fast, lazy_payloads) for chunk in chunks]
+            try:
+                for future in futures:
+                    _events, _skipped, _error = future.result()
+                    ret_val += _events
+                    skipped += _skipped
+                    first_error = first_error or _error
+            except Exception as err:
+                pool.shutdown(wait=False, cancel_futures=True)
+                Logger.Log(f"Error while converting row to Event! Cancelling data retrieval.\nFull error: {err}", logging.ERROR, depth=3)
+                raise err
+        if skipped > 0:
+            Logger.Log(f"Skipped {skipped} of {len(rows)} rows that could not be converted to Events! First error was: {first_error}", logging.WARNING, depth=3)
+
+        return ret_val
+
+    def _chunkRows(self, rows:List[Tuple], chunk_count:int) -> List[List[Tuple]]:
+        ret_val : List[List[Tuple]] = []
+
+        _target = max(ceil(len(rows) / max(chunk_count, 1)), 1)
+        _start  = 0
+        while _start < len(rows):
+            _end = min(_start + _target, len(rows))
+            # extend the chunk to the end of the session it stops in.
+            _session = self._rowOrderKey(rows[_end - 1])[1]
+            while _end < len(rows) and self._rowOrderKey(rows[_end])[1] == _session:
+                _end += 1
+            ret_val.append(rows[_start:_end])
+            _start = _end
+
+        return ret_val
+
+    def _rowOrderKey(self, row:Tuple) -> Tuple[str, str, int]:
+        _decoder = self.Config.TableSchema.Decoder if isinstance(self.Config.TableSchema, EventTableSchema) else None
+        _user  : Any = None
+        _sess  : Any = None
+        _index : Any = None
+        if _decoder is not None:
+            try:
+                _user  = _decoder.UserID(row)             if _decoder.UserID             else None
+                _sess  = _decoder.SessionID(row)          if _decoder.SessionID          else None
+                _index = _decoder.EventSequenceIndex(row) if _decoder.EventSequenceIndex else None
+            except Exception: # pylint: disable=broad-exception-caught
+                # a bad row will fail again, and be reported, when it is converted to an Event; just sort it to the front.
+                pass
+        return (str(_user or ""), str(_sess or ""), _index if isinstance(_index, int) else -1)
+
+    def _iterEventRows(self, filters:DatasetFilterCollection, batch_size:int) -> Iterator[Tuple]:
+        """Private implementation of the logic to retrieve event rows from the connected storage one at a time.
+
+        By default, this just iterates over the results of `_getEventRows`.
+        Subclasses should override it if their storage can hand back rows a batch at a time,
+        so that a stream never holds the full set of rows in memory.
+
+        :param filters: _description_
+        :type filters: DatasetFilterCollection
+        :param batch_size: A suggested number of rows to retrieve from storage at once.
+        :type batch_size: int
+        :yield: Each row matching the filters.
+        :rtype: Iterator[Tuple]
+        """
+        yield from self._getEventRows(filters=filters)
+
+    def _iterFeatureRows(self, filters:DatasetFilterCollection, batch_size:int) -> Iterator[Tuple]:
+        """Private implementation of the logic to retrieve feature rows from the connected storage one at a time.
+
+        By default, this just iterates over the results of `_getFeatureRows`.
+        Subclasses should override it if their storage can hand back rows a batch at a time,
+        so that a stream never holds the full set of rows in memory.
+
+        :param filters: _description_
+        :type filters: DatasetFilterCollection
+        :param batch_size: A suggested number of rows to retrieve from storage at once.
+        :type batch_size: int
+        :yield: Each row matching the filters.
+        :rtype: Iterator[Tuple]
+        """
+        yield from self._getFeatureRows(filters=filters)
+
+    def _eventsFromRows(self, rows:List[Tuple], schema:EventTableSchema, fallbacks:Map, lazy_payloads:bool=False) -> List[Event]:
+        """Convert a batch of rows to Events, skipping any rows that could not be converted.
+
+        :param rows: The rows to convert.
+        :type rows: List[Tuple]
+        :param schema: The schema to use for conversion.
+        :type schema: EventTableSchema
+        :param fallbacks: _description_
+        :type fallbacks: Map
+        :param lazy_payloads: Whether to keep JSON-text payloads as `LazyJSON`, defaults to False
+        :type lazy_payloads: bool, optional
+        :return: The converted events, in the order of the rows.
+        :rtype: List[Event]
+        """
+        timestamps = Event.TimestampsFromRows(rows=rows, schema=schema)
+        return [event for row, timestamp in zip(rows, timestamps) if (event := self._eventFromRow(row=row, schema=schema, fallbacks=fallbacks, timestamp=timestamp, lazy_payloads=lazy_payloads)) is not None]
+
+    def _eventFromRow(self, row:Tuple, schema:EventTableSchema, fallbacks:Map, timestamp:Optional[datetime]=None, lazy_payloads:bool=False) -> Optional[Event]:
+        try:
+            return Event.FromRow(row=row, schema=schema, fallbacks=fallbacks, timestamp=timestamp, lazy_payloads=lazy_payloads)
+        except Exception as err: # pylint: disable=broad-exception-caught
+            if self._fail_fast:
+                Logger.Log(f"Error while converting row to Event! Cancelling data retrieval.\nFull error: {err}\nRow data: {pformat(row)}", logging.ERROR, depth=2)
+                raise err
+            else:
+                Logger.Log(f"Error while converting row ({row}) to Event! This row will be skipped.\nFull error: {err}", logging.WARNING, depth=2)
+                return None
+
+    def _featureFromRow(self, row:Tuple, schema:FeatureTableSchema, fallbacks:Map) -> Optional[Feature]:
+        try:
+            return Feature.FromRow(row=row, schema=schema, fallbacks=fallbacks)
+        except Exception as err: # pylint: disable=broad-exception-caught
+            if self._fail_fast:
+                Logger.Log(f"Error while converting row to Feature! Cancelling data retrieval.\nFull error: {err}\nRow data: {pformat(row)}", logging.ERROR, depth=2)
+                raise err
+            else:
+                Logger.Log(f"Error while converting row ({row}) to Feature! This row will be skipped.\nFull error: {err}", logging.WARNING, depth=2)
+                return None
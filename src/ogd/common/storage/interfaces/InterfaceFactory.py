@@ -1,11 +1,13 @@
 from typing import Any, Dict
 
 from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
 from ogd.common.storage.interfaces.Interface import Interface
 from ogd.common.storage.interfaces.CSVInterface import CSVInterface
 from ogd.common.storage.interfaces.BigQueryInterface import BigQueryInterface
 from ogd.common.storage.interfaces.BQFirebaseInterface import BQFirebaseInterface
 from ogd.common.storage.interfaces.MySQLInterface import MySQLInterface
+from ogd.common.storage.interfaces.ParquetInterface import ParquetInterface
 from ogd.common.schemas.tables.TableSchema import TableSchema
 from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
 from ogd.common.schemas.tables.FeatureTableSchema import FeatureTableSchema
@@ -22,6 +24,8 @@ class InterfaceFactory:
                 case "BIGQUERY":
                     return BigQueryInterface(config=config, fail_fast=fail_fast)
                 case "FILE" | "CSV" | "TSV":
+                    if isinstance(config.StoreConfig, FileStoreConfig) and config.StoreConfig.FileExtension == "parquet":
+                        return ParquetInterface(config=config, fail_fast=fail_fast)
                     return CSVInterface(config=config, fail_fast=fail_fast)
                 case _:
                     raise ValueError(f"Could not generate Interface from DataTableConfig, the underlying StoreConfig was unrecognized type {config.StoreConfig.Type}!")
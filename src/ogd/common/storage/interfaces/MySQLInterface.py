@@ -3,7 +3,7 @@ import logging
 import textwrap
 from datetime import datetime, time, timedelta
 from itertools import chain
-from typing import Dict, List, LiteralString, Optional, override, Tuple
+from typing import Dict, Iterator, List, LiteralString, Optional, override, Tuple
 # 3rd-party imports
 from mysql.connector import cursor
 # import locals
@@ -24,8 +24,20 @@ class MySQLInterface(Interface):
 
     # *** BUILT-INS & PROPERTIES ***
 
-    def __init__(self, config:DataTableConfig, fail_fast:bool, store:Optional[MySQLConnector]=None):
+    def __init__(self, config:DataTableConfig, fail_fast:bool, store:Optional[MySQLConnector]=None, batch_size:int=10000):
+        """Constructor for a MySQLInterface.
+
+        :param config: _description_
+        :type config: DataTableConfig
+        :param fail_fast: _description_
+        :type fail_fast: bool
+        :param store: _description_, defaults to None
+        :type store: Optional[MySQLConnector], optional
+        :param batch_size: The number of rows to fetch from the server at once, when retrieving events, defaults to 10000
+        :type batch_size: int, optional
+        """
         super().__init__(config=config, fail_fast=fail_fast)
+        self._batch_size : int = batch_size
         if store:
             self._store = store
         elif isinstance(self.Config.StoreConfig, MySQLConfig):
@@ -131,32 +143,10 @@ class MySQLInterface(Interface):
     def _getEventRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
         ret_val = []
 
-        # grab data for the given session range. Sort by event time, so
-        if self.Connector.Cursor is not None and isinstance(self.Config.StoreConfig, MySQLConfig):
-            # filt = f"app_id='{self._game_id}' AND (session_id  BETWEEN '{next_slice[0]}' AND '{next_slice[-1]}'){ver_filter}"
-
-            where_clause, params = self._generateWhereClause(filters=filters)
-            app_ids = filters.IDFilters.AppIDs.AsList
-            if app_ids and len(app_ids) > 0 and self.Config.TableName not in app_ids:
-                if len(app_ids) == 1 and filters.IDFilters.AppIDs.FilterMode == FilterMode.INCLUDE:
-                    where_clause += "\nAND `app_id`=%s"
-                    params.append(app_ids[0])
-                else:
-                    exclude = "NOT" if filters.IDFilters.AppIDs.FilterMode == FilterMode.EXCLUDE else ""
-                    app_param_string : LiteralString = ("%s, " * len(app_ids))[:-2] # take all but the trailing ', '.
-                    where_clause += f"\nAND `app_id` {exclude} in ({app_param_string})"
-                    params += app_ids
-
-            query = textwrap.dedent(f"""
-                SELECT *
-                FROM `{self.Config.TableLocation.Location}`
-                {where_clause}
-                ORDER BY `user_id`, `session_id`, `event_sequence_index` ASC
-            """)
-            data = MySQLInterface.Query(cursor=self.Connector.Cursor, query=query, params=tuple(params))
-            if data is not None:
-                ret_val = data
-            # self._select_queries.append(select_query) # this doesn't appear to be used???
+        if self.Connector.Connection is not None and isinstance(self.Config.StoreConfig, MySQLConfig):
+            # Read through a streaming cursor even when collecting every row,
+            # so the driver never holds a buffered copy of the whole result alongside our list.
+            ret_val = list(self._iterEventRows(filters=filters, batch_size=self._batch_size))
         else:
             Logger.Log(f"Could not get data for {len(filters.IDFilters.Sessions.AsList or [])} requested sessions, MySQL connection is not open or config was not for MySQL.", logging.WARN)
         return ret_val
@@ -164,6 +154,21 @@ class MySQLInterface(Interface):
     def _getFeatureRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
         return []
 
+    @override
+    def _iterEventRows(self, filters:DatasetFilterCollection, batch_size:int) -> Iterator[Tuple]:
+        _cursor = self.Connector.StreamingCursor()
+        if _cursor is not None and isinstance(self.Config.StoreConfig, MySQLConfig):
+            query, params = self._generateEventRowsQuery(filters=filters)
+            try:
+                for batch in MySQLInterface.QueryBatches(cursor=_cursor, query=query, params=tuple(params), batch_size=batch_size):
+                    yield from batch
+            finally:
+                # If the stream was abandoned partway, any unread rows must be cleared before the connection can be used again.
+                self.Connector.ClearUnreadResult()
+                _cursor.close()
+        else:
+            Logger.Log(f"Could not stream data for {len(filters.IDFilters.Sessions.AsList or [])} requested sessions, MySQL connection is not open or config was not for MySQL.", logging.WARN)
+
     # *** PUBLIC STATICS ***
 
     @staticmethod
@@ -182,6 +187,42 @@ class MySQLInterface(Interface):
             Logger.Log(f"Query fetch completed, total query time:    {time_delta} to get {len(ret_val) if ret_val is not None else 0:d} rows", logging.DEBUG)
         return ret_val
 
+    @staticmethod
+    def QueryBatches(cursor:cursor.MySQLCursor, query:str, params:Optional[Tuple], batch_size:int) -> Iterator[List[Tuple]]:
+        """Run a query, and yield the results in batches of at most `batch_size` rows.
+
+        Meant for use with an unbuffered cursor, such as one from `MySQLConnector.StreamingCursor`,
+        so that each batch is only fetched from the server when it is needed.
+        The time to fetch each batch is logged at the debug level.
+
+        :param cursor: The cursor with which to run the query.
+        :type cursor: cursor.MySQLCursor
+        :param query: The query to run.
+        :type query: str
+        :param params: The parameters for the query.
+        :type params: Optional[Tuple]
+        :param batch_size: The maximum number of rows to fetch at a time.
+        :type batch_size: int
+        :yield: Successive batches of result rows.
+        :rtype: Iterator[List[Tuple]]
+        """
+        Logger.Log(f"Running streamed query: {query}\nWith params: {params}", logging.DEBUG, depth=3)
+        start = datetime.now()
+        cursor.execute(query, params)
+        Logger.Log(f"Query execution completed, time to execute: {datetime.now() - start}", logging.DEBUG)
+        batch_count : int = 0
+        row_count   : int = 0
+        batch_start = datetime.now()
+        batch = cursor.fetchmany(size=batch_size)
+        while batch:
+            batch_count += 1
+            row_count   += len(batch)
+            Logger.Log(f"Fetched batch {batch_count} of {len(batch)} rows in {datetime.now() - batch_start}, {row_count} rows so far", logging.DEBUG)
+            yield batch
+            batch_start = datetime.now()
+            batch = cursor.fetchmany(size=batch_size)
+        Logger.Log(f"Query fetch completed, total query time:    {datetime.now() - start} to get {row_count:d} rows in {batch_count} batches", logging.DEBUG)
+
     # *** PUBLIC METHODS ***
 
     # *** PROPERTIES ***
@@ -355,3 +396,28 @@ class MySQLInterface(Interface):
 
 
     # *** PRIVATE METHODS ***
+
+    @override
+    def _shardInterface(self) -> "MySQLInterface":
+        return MySQLInterface(config=self.Config, fail_fast=self._fail_fast, batch_size=self._batch_size)
+
+    def _generateEventRowsQuery(self, filters:DatasetFilterCollection) -> Pair[str, List[str | int]]:
+        where_clause, params = self._generateWhereClause(filters=filters)
+        app_ids = filters.IDFilters.AppIDs.AsList
+        if app_ids and len(app_ids) > 0 and self.Config.TableName not in app_ids:
+            if len(app_ids) == 1 and filters.IDFilters.AppIDs.FilterMode == FilterMode.INCLUDE:
+                where_clause += "\nAND `app_id`=%s"
+                params.append(app_ids[0])
+            else:
+                exclude = "NOT" if filters.IDFilters.AppIDs.FilterMode == FilterMode.EXCLUDE else ""
+                app_param_string : LiteralString = ("%s, " * len(app_ids))[:-2] # take all but the trailing ', '.
+                where_clause += f"\nAND `app_id` {exclude} in ({app_param_string})"
+                params += app_ids
+
+        query = textwrap.dedent(f"""
+            SELECT *
+            FROM `{self.Config.TableLocation.Location}`
+            {where_clause}
+            ORDER BY `user_id`, `session_id`, `event_sequence_index` ASC
+        """)
+        return (query, params)
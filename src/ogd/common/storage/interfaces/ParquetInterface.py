@@ -0,0 +1,252 @@
+import logging
+from datetime import datetime, timezone
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Set, Tuple
+# 3rd-party imports
+import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:
+    # pyarrow is an optional dependency, ParquetConnector raises a clear error if it is missing.
+    pa = None
+    pc = None
+    pq = None
+## import local files
+from ogd.common.filters.collections import *
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.models.SemanticVersion import SemanticVersion
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.ParquetConnector import ParquetConnector
+from ogd.common.storage.IDType import IDType
+from ogd.common.storage.interfaces.Interface import Interface
+from ogd.common.storage.ShardType import ShardType
+from ogd.common.storage.VersionType import VersionType
+from ogd.common.utils.Logger import Logger
+
+type ParquetPredicate = Tuple[str, str, Any]
+class ParquetInterface(Interface):
+    """Interface to read events from a Parquet file, such as those written by `ParquetOuterface`.
+
+    Filters are pushed down into the read, so row groups whose statistics rule out every row are skipped,
+    and only the columns needed by the table schema's column map (and the filters) are read at all.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, config:DataTableConfig, fail_fast:bool, store:Optional[ParquetConnector]=None):
+        """Constructor for a ParquetInterface.
+
+        :param config: The config for the table to read, including the file location and table schema.
+        :type config: DataTableConfig
+        :param fail_fast: Whether to stop on the first bad row, rather than skipping it.
+        :type fail_fast: bool
+        :param store: A connector to an already-open file, defaults to None, in which case a connector is made from the config.
+        :type store: Optional[ParquetConnector], optional
+        """
+        self._store : ParquetConnector
+
+        super().__init__(config=config, fail_fast=fail_fast)
+        if store:
+            self._store = store
+        elif isinstance(self.Config.StoreConfig, FileStoreConfig):
+            self._store = ParquetConnector(config=self.Config.StoreConfig)
+        else:
+            raise ValueError(f"ParquetInterface config was for a connector other than Parquet files! Found config type {type(self.Config.StoreConfig)}")
+        self.Connector.Open(writeable=False)
+
+    # *** IMPLEMENT ABSTRACT FUNCTIONS ***
+
+    @property
+    def Connector(self) -> ParquetConnector:
+        return self._store
+
+    def _availableIDs(self, id_type:IDType, filters:DatasetFilterCollection) -> List[str]:
+        _column = "user_id" if id_type == IDType.USER else "session_id"
+        _ids = self._readColumn(column=_column, filters=filters, sessions=False, players=False, event_names=False)
+        return [str(found) for found in dict.fromkeys(_ids) if found is not None]
+
+    def _availableDates(self, filters:DatasetFilterCollection) -> Dict[str,datetime]:
+        ret_val : Dict[str,datetime] = {}
+
+        _table = self._readTable(columns={"timestamp"}, filters=filters, event_names=False, timestamps=False)
+        if _table is not None:
+            _range = pc.min_max(_table.column("timestamp")).as_py()
+            ret_val = {'min':pd.to_datetime(_range['min']) if _range['min'] is not None else pd.NaT,
+                       'max':pd.to_datetime(_range['max']) if _range['max'] is not None else pd.NaT}
+        return ret_val
+
+    def _availableVersions(self, mode:VersionType, filters:DatasetFilterCollection) -> List[SemanticVersion | str]:
+        version_col : str = "log_version" if mode==VersionType.LOG else "app_version" if mode==VersionType.APP else "app_branch"
+        _versions = self._readColumn(column=version_col, filters=filters)
+        return [SemanticVersion.FromString(str(ver)) for ver in dict.fromkeys(_versions)]
+
+    def _getEventRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
+        ret_val : List[Tuple] = []
+
+        _table = self._readTable(columns=self._projectedColumns(), filters=filters)
+        if _table is not None:
+            # rows line up with the table schema, with None for columns that weren't read.
+            _columns = [
+                _table.column(name).to_pylist() if name in _table.column_names else repeat(None, _table.num_rows)
+                for name in self.Config.TableSchema.ColumnNames
+            ]
+            ret_val = list(zip(*_columns))
+        return ret_val
+
+    def _getFeatureRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
+        return []
+
+    # *** PUBLIC STATICS ***
+
+    # *** PUBLIC METHODS ***
+
+    # *** PRIVATE STATICS ***
+
+    @classmethod
+    def _safeguardFilters(cls, filters:DatasetFilterCollection) -> None:
+        """Override of the `_safeguardFilters` function, which applies no constraints, since a Parquet file can be read in full.
+
+        :param filters: The filters for a request.
+        :type filters: DatasetFilterCollection
+        """
+        return
+
+    @staticmethod
+    def _pushdownFilters(filters:DatasetFilterCollection, sessions:bool=True, players:bool=True, event_names:bool=True, timestamps:bool=True) -> Optional[List[List[ParquetPredicate]]]:
+        """Turn the session, player, event name, and timestamp filters into a filter expression for `pq.read_table`.
+
+        The expression is in disjunctive normal form, i.e. a list of alternatives, each of which is a list of predicates that must all hold.
+
+        :param filters: The filters to apply.
+        :type filters: DatasetFilterCollection
+        :param sessions: Whether to include the session filter, defaults to True
+        :type sessions: bool, optional
+        :param players: Whether to include the player filter, defaults to True
+        :type players: bool, optional
+        :param event_names: Whether to include the event name filter, defaults to True
+        :type event_names: bool, optional
+        :param timestamps: Whether to include the timestamp filter, defaults to True
+        :type timestamps: bool, optional
+        :return: The filter expression, or None if no filters apply.
+        :rtype: Optional[List[List[ParquetPredicate]]]
+        """
+        _predicates : List[ParquetPredicate] = []
+
+        _set_filters = []
+        if sessions:
+            _set_filters.append(("session_id", filters.IDFilters.Sessions))
+        if players:
+            _set_filters.append(("user_id", filters.IDFilters.Players))
+        if event_names:
+            _set_filters.append(("event_name", filters.Events.EventNames))
+        for column, set_filter in _set_filters:
+            if set_filter.Active and set_filter.AsSet is not None:
+                match set_filter.FilterMode:
+                    case FilterMode.INCLUDE:
+                        _predicates.append((column, "in", sorted(set_filter.AsSet)))
+                    case FilterMode.EXCLUDE:
+                        _predicates.append((column, "not in", sorted(set_filter.AsSet)))
+        ret_val : List[List[ParquetPredicate]] = [_predicates]
+
+        _times = filters.Sequences.Timestamps
+        if timestamps and _times.Active and (_times.Min is not None or _times.Max is not None):
+            _min = ParquetInterface._utcKey(_times.Min) if _times.Min is not None else None
+            _max = ParquetInterface._utcKey(_times.Max) if _times.Max is not None else None
+            if _times.FilterMode == FilterMode.EXCLUDE:
+                # outside the range means before the min *or* after the max, so each is its own alternative.
+                ret_val = []
+                if _min is not None:
+                    ret_val.append(_predicates + [("timestamp", "<", _min)])
+                if _max is not None:
+                    ret_val.append(_predicates + [("timestamp", ">", _max)])
+            else:
+                if _min is not None:
+                    _predicates.append(("timestamp", ">=", _min))
+                if _max is not None:
+                    _predicates.append(("timestamp", "<=", _max))
+
+        return ret_val if any(len(alternative) > 0 for alternative in ret_val) else None
+
+    @staticmethod
+    def _utcKey(when:datetime) -> datetime:
+        # timestamps are stored without timezone, with timezone-aware values converted to UTC, so compare the same way.
+        _when = pd.Timestamp(when).to_pydatetime()
+        return _when.astimezone(timezone.utc).replace(tzinfo=None) if _when.tzinfo is not None else _when
+
+    # *** PRIVATE METHODS ***
+
+    def _getEventRowsSharded(self, filters:DatasetFilterCollection, shard_by:ShardType, max_workers:int) -> List[Tuple]:
+        """Override of the `_getEventRowsSharded` function, which retrieves the request in one read, without sharding.
+
+        Each shard would need its own interface, which would open the file and read its row groups again,
+        while the filters of the whole request are already pushed down into a single read.
+        The rows are given in the same merged order as a sharded request.
+
+        :param filters: The filters for the request.
+        :type filters: DatasetFilterCollection
+        :param shard_by: The way the request would be split into shards.
+        :type shard_by: ShardType
+        :param max_workers: The maximum number of shards that would be retrieved at once.
+        :type max_workers: int
+        :return: The rows for the request, in `user_id`, `session_id`, `event_sequence_index` order.
+        :rtype: List[Tuple]
+        """
+        Logger.Log(f"Sharding by {shard_by} is not supported for file-backed storage, {self.Connector.ResourceName} will be read without sharding.", logging.INFO, depth=3)
+        return sorted(self._getEventRows(filters=filters), key=self._rowOrderKey)
+
+    def _projectedColumns(self) -> Optional[Set[str]]:
+        """Get the names of the columns needed to build events, and to apply filters.
+
+        :return: The set of columns used by the table schema's column map, or None if all columns should be read.
+        :rtype: Optional[Set[str]]
+        """
+        ret_val : Optional[Set[str]] = None
+
+        if isinstance(self.Config.TableSchema, EventTableSchema):
+            ret_val = {"session_id", "user_id", "event_name", "timestamp"} & set(self.Config.TableSchema.ColumnNames)
+            for mapping in self.Config.TableSchema.ColumnMap.Mapping.values():
+                if isinstance(mapping, str):
+                    ret_val.add(mapping)
+                elif isinstance(mapping, list):
+                    ret_val.update(mapping)
+                elif isinstance(mapping, dict):
+                    ret_val.update(mapping.values())
+
+        return ret_val
+
+    def _readTable(self, columns:Optional[Set[str]], filters:DatasetFilterCollection, **pushdown:bool) -> Optional["pa.Table"]:
+        """Read the given columns of the rows that pass the filters.
+
+        :param columns: The names of the columns to read, or None to read all columns. Names not in the file are ignored.
+        :type columns: Optional[Set[str]]
+        :param filters: The filters for the request.
+        :type filters: DatasetFilterCollection
+        :param pushdown: Which of the filters to apply, as keyword arguments to `_pushdownFilters`.
+        :return: The table of rows read, or None if the file is not open.
+        :rtype: Optional[pa.Table]
+        """
+        ret_val = None
+
+        if self.Connector.IsOpen and self.Connector.File is not None:
+            _names = self.Connector.File.schema_arrow.names
+            _columns = [name for name in _names if columns is None or name in columns]
+            _filters = self._pushdownFilters(filters=filters, **pushdown)
+            # filters can only be pushed down for columns that exist in the file.
+            if _filters is not None:
+                _filters = [[predicate for predicate in alternative if predicate[0] in _names] for alternative in _filters]
+                _filters = _filters if all(len(alternative) > 0 for alternative in _filters) else None
+            ret_val = pq.read_table(self.Connector.StoreConfig.Filepath, columns=_columns, filters=_filters)
+            Logger.Log(f"Read {ret_val.num_rows} rows of {len(_columns)} columns from {self.Connector.StoreConfig.Filepath}", logging.DEBUG)
+        return ret_val
+
+    def _readColumn(self, column:str, filters:DatasetFilterCollection, **pushdown:bool) -> List[Any]:
+        ret_val : List[Any] = []
+
+        _table = self._readTable(columns={column}, filters=filters, **pushdown)
+        if _table is not None and column in _table.column_names:
+            ret_val = _table.column(column).to_pylist()
+        return ret_val
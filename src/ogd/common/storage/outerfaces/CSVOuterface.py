@@ -1,14 +1,9 @@
 ## import standard libraries
-import json
 import logging
-import os
-import re
 import shutil
 import sys
-from git.repo import Repo
-from git.exc import InvalidGitRepositoryError, NoSuchPathError
 from pathlib import Path
-from typing import Any, List, Optional, override, Set, Tuple
+from typing import Any, Dict, List, Optional, override, Set, Tuple
 # 3rd-party imports
 # import local files
 # from ogd import games
@@ -23,10 +18,13 @@ from ogd.common.schemas.datasets.DatasetSchema import DatasetSchema
 from ogd.common.schemas.locations.URLLocationSchema import URLLocationSchema
 from ogd.common.schemas.locations.DirectoryLocationSchema import DirectoryLocationSchema
 from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.DelimitedLineWriter import DelimitedLineWriter
+from ogd.common.storage.connectors.RepositoryIndexStore import RepositoryIndexStore
 from ogd.common.storage.outerfaces.Outerface import Outerface
-from ogd.common.utils import fileio
+from ogd.common.utils.JSONCodec import JSONCodec
 from ogd.common.utils.Logger import Logger
-from ogd.common.utils.typing import ExportRow
+from ogd.common.utils.RevisionProvider import RevisionProvider
+from ogd.common.utils.typing import ExportRow, LazyJSON
 
 class CSVOuterface(Outerface):
 
@@ -35,14 +33,55 @@ class CSVOuterface(Outerface):
     def __init__(self, table_config:DataTableConfig, export_modes:Set[ExportMode | AggregationMode],
                  repository:DatasetRepositoryConfig, dataset_key:str | DatasetKey,
                  with_separate_feature_files:bool=True, with_zipping:bool=True,
-                 store:Optional[CSVConnector]=None):
+                 store:Optional[CSVConnector]=None, with_index:bool=False, stream_compression:bool=False,
+                 stdout_fallback:bool=False, with_checkpoints:bool=False, json_passthrough:bool=False):
+        """Constructor for a CSVOuterface.
+
+        .. note:: Lines for an export mode whose file is not available used to be echoed to standard output.
+            They are now dropped, with a warning, unless `stdout_fallback` is True.
+
+        :param table_config: The config for the table to write, including the file location and table schema.
+        :type table_config: DataTableConfig
+        :param export_modes: The kinds of data to export.
+        :type export_modes: Set[ExportMode | AggregationMode]
+        :param repository: The dataset repository the files are exported to.
+            If its config gives an `OGDRevision`, that is set as the `RevisionProvider` override.
+        :type repository: DatasetRepositoryConfig
+        :param dataset_key: The key of the dataset being exported.
+        :type dataset_key: str | DatasetKey
+        :param with_separate_feature_files: Whether to write a separate file for each export mode, defaults to True
+        :type with_separate_feature_files: bool, optional
+        :param with_zipping: Whether to zip the files when the export is done, defaults to True
+        :type with_zipping: bool, optional
+        :param store: A connector to already-open files, defaults to None, in which case a connector is made from the config.
+        :type store: Optional[CSVConnector], optional
+        :param with_index: Whether to write a sidecar index next to each event file left unzipped, defaults to False
+        :type with_index: bool, optional
+        :param stream_compression: Whether to compress lines into the zip files as they are written, rather than zipping the files at the end.
+            Only applies `with_zipping`. Defaults to False
+        :type stream_compression: bool, optional
+        :param stdout_fallback: Whether to write lines for an export mode with no file to standard output, rather than dropping them, defaults to False
+        :type stdout_fallback: bool, optional
+        :param with_checkpoints: Whether to resume from the checkpoint of an earlier, unfinished export, appending to its files, defaults to False
+        :type with_checkpoints: bool, optional
+        :param json_passthrough: Whether to write unparsed `LazyJSON` payloads as their original text, defaults to False
+        :type json_passthrough: bool, optional
+        """
         self._store : CSVConnector
 
         super().__init__(table_config=table_config, export_modes=export_modes)
         self._repository                  : DatasetRepositoryConfig = repository
+        # a revision given by the repository config is reported for everything exported from this process.
+        if repository.OGDRevision:
+            RevisionProvider.SetOverride(repository.OGDRevision)
         self._dataset_key                 : DatasetKey              = dataset_key if isinstance(dataset_key, DatasetKey) else DatasetKey.FromString(dataset_key)
         self._with_separate_feature_files : bool                    = with_separate_feature_files
         self._with_zipping                : bool                    = with_zipping
+        # lines for a mode without a file are only echoed to stdout if asked for, otherwise they are dropped.
+        # stdout is already buffered, so each line goes straight through rather than piling up until a block is full.
+        self._stdout_writer               : Optional[DelimitedLineWriter] = DelimitedLineWriter(file=sys.stdout, block_size=1) if stdout_fallback else None
+        # event payloads that were never parsed can be written as their original JSON text, instead of parsing them just to print them.
+        self._json_passthrough            : bool                    = json_passthrough
         # if store:
         #     self._store = store
         # elif isinstance(self.Config.StoreConfig, FileStoreConfig):
@@ -54,15 +93,10 @@ class CSVOuterface(Outerface):
         # else:
         #     raise ValueError(f"CSVInterface config was for a connector other than CSV/TSV files! Found config type {type(self.Config.StoreConfig)}")
 
-        existing_datasets = {}
-        try:
-            file_directory = fileio.loadJSONFile(filename="file_list.json", path=self._repository.LocalDirectory.FolderPath)
-            existing_datasets = file_directory.get(self._dataset_key.GameID, {})
-        except FileNotFoundError:
-            Logger.Log("file_list.json does not exist.", logging.WARNING)
-        except json.decoder.JSONDecodeError as err:
-            Logger.Log(f"file_list.json has invalid format: {str(err)}.", logging.WARNING)
-        existing_meta = existing_datasets.get(self._dataset_key, None)
+        # only the shard for this game is read, rather than the whole file_list.json.
+        existing_meta = RepositoryIndexStore(indexing=self._repository.Indexing).DatasetMeta(game_id=self._dataset_key.GameID, dataset_id=str(self._dataset_key))
+        if existing_meta is None:
+            Logger.Log(f"No existing metadata for {self._dataset_key} in file_list.json.", logging.DEBUG)
         if store:
             self._store = store
         elif isinstance(self.Config.StoreConfig, FileStoreConfig):
@@ -70,7 +104,10 @@ class CSVOuterface(Outerface):
                 config               = self.Config.StoreConfig,
                 with_secondary_files = export_modes if with_separate_feature_files else set(),
                 with_zipping         = self._with_zipping,
-                existing_meta        = existing_meta
+                existing_meta        = existing_meta,
+                with_index           = with_index,
+                stream_compression   = stream_compression,
+                with_checkpoints     = with_checkpoints
             )
         else:
             raise ValueError(f"CSVInterface config was for a connector other than CSV/TSV files! Found config type {type(self.Config.StoreConfig)}")
@@ -109,23 +146,21 @@ class CSVOuterface(Outerface):
     @override
     def _setupGameEventsTable(self, header:List[str]) -> None:
         cols = CSVOuterface._cleanSpecialChars(vals=header)
-        cols_line = "\t".join(cols) + "\n"
-        f = self.Connector.SecondaryFiles.get(ExportMode.EVENTS.name, None)
-        if f is not None:
-            f.writelines(cols_line)
-        else:
-            Logger.Log("No raw_events file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(cols_line))
+        writer = self._writerFor(mode=ExportMode.EVENTS, file_kind="raw_events")
+        if writer is not None:
+            writer.WriteLines(["\t".join(cols) + "\n"])
+            self.Connector.StartIndex(mode=ExportMode.EVENTS, header=list(cols))
 
     @override
     def _setupDetectorEventsTable(self, header:List[str]) -> None:
         cols = CSVOuterface._cleanSpecialChars(vals=header)
-        cols_line = "\t".join(cols) + "\n"
-        if self.Connector.File is not None:
-            self.Connector.File.writelines(cols_line)
+        if self.Connector.Writer is not None:
+            self.Connector.Writer.WriteLines(["\t".join(cols) + "\n"])
+            self.Connector.StartIndex(mode=ExportMode.DETECTORS, header=list(cols))
         else:
-            Logger.Log("No processed_events file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(cols_line))
+            writer = self._fallbackWriter(file_kind="processed_events")
+            if writer is not None:
+                writer.WriteLines(["\t".join(cols) + "\n"])
 
     @override
     def _setupAllFeaturesTable(self, header:List[str]) -> None:
@@ -134,58 +169,33 @@ class CSVOuterface(Outerface):
 
     @override
     def _setupSessionTable(self, header:List[str]) -> None:
-        cols = CSVOuterface._cleanSpecialChars(vals=header)
-        cols_line = "\t".join(cols) + "\n"
-        f = self.Connector.SecondaryFiles.get(AggregationMode.SESSION.name, None)
-        if f is not None:
-            f.writelines(cols_line)
-        else:
-            Logger.Log("No session file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(cols_line))
+        writer = self._writerFor(mode=AggregationMode.SESSION, file_kind="session")
+        if writer is not None:
+            writer.WriteRows([header])
 
     @override
     def _setupPlayerTable(self, header:List[str]) -> None:
-        cols = CSVOuterface._cleanSpecialChars(vals=header)
-        cols_line = "\t".join(cols) + "\n"
-        f = self.Connector.SecondaryFiles.get(AggregationMode.PLAYER.name, None)
-        if f is not None:
-            f.writelines(cols_line)
-        else:
-            Logger.Log("No player file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(cols_line))
+        writer = self._writerFor(mode=AggregationMode.PLAYER, file_kind="player")
+        if writer is not None:
+            writer.WriteRows([header])
 
     @override
     def _setupPopulationTable(self, header:List[str]) -> None:
-        cols = CSVOuterface._cleanSpecialChars(vals=header)
-        cols_line = "\t".join(cols) + "\n"
-        f = self.Connector.SecondaryFiles.get(AggregationMode.POPULATION.name, None)
-        if f is not None:
-            f.writelines(cols_line)
-        else:
-            Logger.Log("No population file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(cols_line))
+        writer = self._writerFor(mode=AggregationMode.POPULATION, file_kind="population")
+        if writer is not None:
+            writer.WriteRows([header])
 
     @override
     def _writeGameEventLines(self, events:List[ExportRow]) -> None:
-        event_strs = [CSVOuterface._cleanSpecialChars(vals=[str(item) for item in event]) for event in events]
-        event_lines = ["\t".join(event) + "\n" for event in event_strs]
-        f = self.Connector.SecondaryFiles.get(ExportMode.EVENTS.name, None)
-        if f is not None:
-            f.writelines(event_lines)
-        else:
-            Logger.Log("No raw_events file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(event_lines))
+        writer = self._writerFor(mode=ExportMode.EVENTS, file_kind="raw_events")
+        if writer is not None:
+            self._writeRows(mode=ExportMode.EVENTS, writer=writer, rows=self._passThroughJSON(rows=events))
 
     @override
     def _writeAllEventLines(self, events:List[ExportRow]) -> None:
-        event_strs = [CSVOuterface._cleanSpecialChars(vals=[str(item) for item in event]) for event in events]
-        event_lines = ["\t".join(event) + "\n" for event in event_strs]
-        f = self.Connector.SecondaryFiles.get(ExportMode.DETECTORS.name, None)
-        if f is not None:
-            f.writelines(event_lines)
-        else:
-            Logger.Log("No processed_events file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(event_lines))
+        writer = self._writerFor(mode=ExportMode.DETECTORS, file_kind="processed_events")
+        if writer is not None:
+            self._writeRows(mode=ExportMode.DETECTORS, writer=writer, rows=self._passThroughJSON(rows=events))
 
     @override
     def _writeAllFeatureLines(self, feature_lines:List[ExportRow]) -> None:
@@ -195,42 +205,15 @@ class CSVOuterface(Outerface):
     @override
     def _writeSessionLines(self, session_lines:List[ExportRow]) -> None:
         # self._sess_count += len(sessions)
-        _clean_lines = [CSVOuterface._cleanSpecialChars(vals=feat) for feat in session_lines]
-        final_lines = ["\t".join(sess) + "\n" for sess in _clean_lines]
-        if self.Connector.File is not None:
-            self.Connector.File.writelines(final_lines)
-        f = self.Connector.SecondaryFiles.get(AggregationMode.SESSION.name, None)
-        if f is not None:
-            f.writelines(final_lines)
-        else:
-            Logger.Log("No session file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(final_lines))
+        self._writeFeatureRows(mode=AggregationMode.SESSION, rows=session_lines, file_kind="session")
 
     @override
     def _writePlayerLines(self, player_lines:List[ExportRow]) -> None:
-        _clean_lines = [CSVOuterface._cleanSpecialChars(vals=play) for play in player_lines]
-        final_lines = ["\t".join(play) + "\n" for play in _clean_lines]
-        if self.Connector.File is not None:
-            self.Connector.File.writelines(final_lines)
-        f = self.Connector.SecondaryFiles.get(AggregationMode.PLAYER.name, None)
-        if f is not None:
-            f.writelines(final_lines)
-        else:
-            Logger.Log("No player file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(final_lines))
+        self._writeFeatureRows(mode=AggregationMode.PLAYER, rows=player_lines, file_kind="player")
 
     @override
     def _writePopulationLines(self, population_lines:List[ExportRow]) -> None:
-        _clean_lines = [CSVOuterface._cleanSpecialChars(vals=pop) for pop in population_lines]
-        final_lines = ["\t".join(pop) + "\n" for pop in _clean_lines]
-        if self.Connector.File is not None:
-            self.Connector.File.writelines(final_lines)
-        f = self.Connector.SecondaryFiles.get(AggregationMode.POPULATION.name, None)
-        if f is not None:
-            f.writelines(final_lines)
-        else:
-            Logger.Log("No population file available, writing to standard output instead.", logging.WARN)
-            sys.stdout.write("".join(final_lines))
+        self._writeFeatureRows(mode=AggregationMode.POPULATION, rows=population_lines, file_kind="population")
 
     @override
     def _writeMetadata(self, dataset_schema:DatasetSchema):
@@ -254,25 +237,139 @@ class CSVOuterface(Outerface):
                                              templates_url=URLLocationSchema.FromDict(name="TemplateURL", unparsed_elements={"URL" : self._repository.TemplatesBase.Location})
             )
             self._updateFileExportList(file_indexing=_file_index, dataset_schema=dataset_schema)
+        # metadata is the last thing written for an export, so there is nothing left to resume.
+        self.Connector.ClearCheckpoint()
 
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
 
+    @override
+    def WriteHeader(self, mode:ExportMode, header:Optional[List[str]]=None):
+        if self.Connector.ResumedFrom is not None:
+            Logger.Log(f"Skipping header for {mode}, the file already has one from the export being resumed.", depth=3)
+        else:
+            super().WriteHeader(mode=mode, header=header)
+
+    def Checkpoint(self, last_session:str, session_count:int) -> None:
+        """Record that all lines for the sessions up to and including `last_session` have been written,
+        so an interrupted export can be resumed after it, when the outerface was created `with_checkpoints`.
+
+        Should only be called between sessions, once every line for the session has been written for every export mode.
+
+        :param last_session: The ID of the last session whose lines were all written.
+        :type last_session: str
+        :param session_count: The number of sessions written so far, including any from before the export was resumed.
+        :type session_count: int
+        """
+        self.Connector.SaveCheckpoint(last_session=last_session, session_count=session_count)
+
+    def RemainingSessions(self, session_ids:List[str]) -> List[str]:
+        """Get the sessions still to be exported, if the export was resumed from a checkpoint.
+
+        :param session_ids: The IDs of all sessions in the export, in the order they are exported.
+        :type session_ids: List[str]
+        :return: The IDs of the sessions after the last one checkpointed, or all of them if the export was not resumed.
+        :rtype: List[str]
+        """
+        _checkpoint = self.Connector.ResumedFrom
+        return _checkpoint.RemainingSessions(session_ids) if _checkpoint is not None else list(session_ids)
+
     # *** PROPERTIES ***
 
     # *** PRIVATE STATICS ***
 
     @staticmethod
     def _cleanSpecialChars(vals:List[Any] | Tuple[Any], tab_width:int=3) -> Tuple[str,...]:
-        ret_val : List[str] = [""]*len(vals)
         # check all return values for strings, and ensure no newlines or tabs get through, as they could throw off our outputs.
-        for i,val in enumerate(vals):
-            ret_val[i] = str(val).replace('\n', ' ').replace('\t', ' '*tab_width)
-        return tuple(ret_val)
+        _table = DelimitedLineWriter.EscapeTable(tab_width=tab_width)
+        return tuple(str(val).translate(_table) for val in vals)
+
+    @staticmethod
+    def _payloadText(value:Any) -> Any:
+        if type(value) is LazyJSON:
+            return value.JSON
+        if isinstance(value, (dict, list)):
+            return JSONCodec.Dumps(value, default=str)
+        return value
 
     # *** PRIVATE METHODS ***
 
+    def _writerFor(self, mode:ExportMode | AggregationMode, file_kind:str) -> Optional[DelimitedLineWriter]:
+        """Get the writer for the secondary file of an export mode, or the fallback writer if the file is not available.
+
+        :param mode: The export mode whose file should be written.
+        :type mode: ExportMode | AggregationMode
+        :param file_kind: A description of the kind of file, for the log message when it is not available.
+        :type file_kind: str
+        :return: The writer for the mode's file, the standard output writer, or None if lines for the mode should be dropped.
+        :rtype: Optional[DelimitedLineWriter]
+        """
+        ret_val = self.Connector.SecondaryWriters.get(mode.name, None)
+        if ret_val is None:
+            ret_val = self._fallbackWriter(file_kind=file_kind)
+        return ret_val
+
+    def _fallbackWriter(self, file_kind:str) -> Optional[DelimitedLineWriter]:
+        if self._stdout_writer is not None:
+            Logger.Log(f"No {file_kind} file available, writing to standard output instead.", logging.WARN)
+        else:
+            Logger.Log(f"No {file_kind} file available, skipping output.", logging.WARN)
+        return self._stdout_writer
+
+    def _passThroughJSON(self, rows:List[ExportRow]) -> List[ExportRow]:
+        """Swap the payloads in a batch of event rows for JSON text, if the outerface was set up for JSON pass-through.
+
+        `LazyJSON` values give their original text, and dicts and lists are encoded with `JSONCodec`,
+        so every payload in the file has the same format, whether or not it was parsed.
+        Otherwise, the rows are given back unchanged, and payloads are written in the same format as a dict.
+
+        :param rows: The event rows being written.
+        :type rows: List[ExportRow]
+        :return: The rows, with payloads replaced by JSON text if pass-through is enabled.
+        :rtype: List[ExportRow]
+        """
+        if not self._json_passthrough:
+            return rows
+        return [tuple(CSVOuterface._payloadText(value) for value in row) for row in rows]
+
+    def _writeRows(self, mode:ExportMode | AggregationMode, writer:DelimitedLineWriter, rows:List[ExportRow]) -> None:
+        """Write a batch of rows, adding them to the sidecar index of the file if the file is indexed.
+
+        :param mode: The mode of the file being written.
+        :type mode: ExportMode | AggregationMode
+        :param writer: The writer for the file.
+        :type writer: DelimitedLineWriter
+        :param rows: The rows being written.
+        :type rows: List[ExportRow]
+        """
+        index = self.Connector.Indices.get(mode.name)
+        if index is not None and writer is not self._stdout_writer:
+            # the index needs each line and where it starts, so format the batch up front and note the position before writing.
+            lines = writer.FormatLines(rows)
+            index.Observe(offset=writer.Tell(), rows=rows, lines=lines)
+            writer.WriteLines(lines)
+        else:
+            writer.WriteRows(rows)
+
+    def _writeFeatureRows(self, mode:AggregationMode, rows:List[ExportRow], file_kind:str) -> None:
+        """Write a batch of feature rows to the primary file, and to the secondary file for the aggregation mode.
+
+        The lines are formatted once, and shared by both files.
+
+        :param mode: The aggregation mode of the rows.
+        :type mode: AggregationMode
+        :param rows: The feature rows being written.
+        :type rows: List[ExportRow]
+        :param file_kind: A description of the kind of file, for the log message when it is not available.
+        :type file_kind: str
+        """
+        writers = [writer for writer in [self.Connector.Writer, self._writerFor(mode=mode, file_kind=file_kind)] if writer is not None]
+        if writers:
+            lines = writers[0].FormatLines(rows)
+            for writer in writers:
+                writer.WriteLines(lines)
+
     ## Public function to write out a tiny metadata file for indexing OGD data files.
     #  Using the paths of the exported files, and given some other variables for
     #  deriving file metadata, this simply outputs a new file_name.meta file.
@@ -280,40 +377,29 @@ class CSVOuterface(Outerface):
     #  @param num_sess      The number of sessions included in the recent export.
     def _writeMetadataFile(self, dataset_schema:DatasetSchema) -> None:
         game_dir = self._repository.LocalDirectory.FolderPath / self._dataset_key.GameID
-        match_string = f"{self._dataset_key}_\\w*\\.meta"
-        old_metas = [f for f in os.listdir(game_dir) if re.match(match_string, f)]
-        for old_meta in old_metas:
-            try:
-                Logger.Log(f"Removing old meta file, {old_meta}")
-                os.remove(game_dir / old_meta)
-            except Exception as err:
-                msg = f"Could not remove old meta file {old_meta}. {type(err)} {str(err)}"
-                Logger.Log(msg, logging.WARNING)
-        # Third, write the new meta file.
+        # First, write the new meta file, to a temporary file that replaces any file of the same name in one step.
         # calculate the path and name of the metadata file, and open/make it.
         meta_file_path : Path = game_dir / f"{self._dataset_key}_{self._generateHash()}.meta"
-        with open(meta_file_path, "w", encoding="utf-8") as meta_file :
-            meta_file.write(json.dumps(dataset_schema.AsMetadata, indent=4))
-            meta_file.close()
+        temp_file_path : Path = meta_file_path.with_name(meta_file_path.name + ".tmp")
+        with open(temp_file_path, "w", encoding="utf-8") as meta_file :
+            meta_file.write(JSONCodec.Dumps(dataset_schema.AsMetadata, indent=4))
+        temp_file_path.replace(meta_file_path)
+        # Then, remove any old meta files for the dataset, so there is never a moment with no meta file at all.
+        for old_meta in game_dir.glob(f"{self._dataset_key}_*.meta"):
+            if old_meta != meta_file_path:
+                try:
+                    Logger.Log(f"Removing old meta file, {old_meta.name}")
+                    old_meta.unlink()
+                except Exception as err:
+                    msg = f"Could not remove old meta file {old_meta.name}. {type(err)} {str(err)}"
+                    Logger.Log(msg, logging.WARNING)
 
     # ******* STUFF THAT GOES UP TO PROCESSING LEVEL *********
 
     @staticmethod
     def _generateHash():
-        ret_val    : str  = ""
-        # get hash
-        try:
-            repo = Repo(search_parent_directories=True)
-            if repo.git is not None:
-                ret_val = str(repo.git.rev_parse(repo.head.object.hexsha, short=7))
-        except InvalidGitRepositoryError as err:
-            msg = f"Code is not in a valid Git repository:\n{str(err)}"
-            Logger.Log(msg, logging.ERROR)
-        except NoSuchPathError as err:
-            msg = f"Unable to access proper file paths for Git repository:\n{str(err)}"
-            Logger.Log(msg, logging.ERROR)
-
-        return ret_val
+        # the revision is looked up once per process (or taken from the OGD_REVISION override), rather than asking git for every dataset.
+        return RevisionProvider.Current()
 
 
     ## Public function to update the list of exported files.
@@ -324,35 +410,18 @@ class CSVOuterface(Outerface):
     #  @param num_sess      The number of sessions included in the recent export.
     def _updateFileExportList(self, file_indexing:RepositoryIndexingConfig, dataset_schema:DatasetSchema) -> None:
         CSVOuterface._backupFileExportList(self._repository.LocalDirectory.FolderPath)
-        file_index = {}
-        existing_datasets = {}
-        try:
-            file_index = fileio.loadJSONFile(filename="file_list.json", path=self._repository.LocalDirectory.FolderPath)
-        except FileNotFoundError:
-            Logger.Log("file_list.json does not exist.", logging.WARNING)
-        except json.decoder.JSONDecodeError as err:
-            Logger.Log(f"file_list.json has invalid format: {str(err)}.", logging.WARNING)
-        finally:
-            if not "CONFIG" in file_index.keys():
-                Logger.Log("No CONFIG found in file_list.json, adding default CONFIG...", logging.WARNING)
-                file_index["CONFIG"] = {
-                    "files_base" : file_indexing.RemoteURL,
-                    "templates_base" : file_indexing.TemplatesURL
-                }
-            if not dataset_schema.Key.GameID in file_index.keys():
-                file_index[dataset_schema.Key.GameID] = {}
-            existing_datasets  = file_index[dataset_schema.Key.GameID]
-            with open(self._repository.LocalDirectory.FolderPath / "file_list.json", "w") as existing_csv_file:
-                Logger.Log(f"Opened file list for writing at {existing_csv_file.name}", logging.INFO)
-                existing_metadata = existing_datasets.get(dataset_schema.DatasetID, {})
-                new_meta = dataset_schema.AsMetadata
-                new_meta["population_file"] = new_meta["population_file"]   or existing_metadata.get("population_file", existing_metadata.get("population"))
-                new_meta["players_file"] = new_meta["players_file"]         or existing_metadata.get("players_file",    existing_metadata.get("players"))
-                new_meta["sessions_file"] = new_meta["sessions_file"]       or existing_metadata.get("sessions_file",   existing_metadata.get("sessions"))
-                new_meta["game_events_file"] = new_meta["game_events_file"] or existing_metadata.get("game_events",     existing_metadata.get("events", existing_metadata.get("raw_events")))
-                new_meta["all_events_file"] = new_meta["all_events_file"]   or existing_metadata.get("all_events",      existing_metadata.get("processed_events"))
-                file_index[dataset_schema.Key.GameID][dataset_schema.DatasetID] = new_meta
-                existing_csv_file.write(json.dumps(file_index, indent=4))
+
+        def _mergeMeta(existing_metadata:Dict[str, Any]) -> Dict[str, Any]:
+            new_meta = dataset_schema.AsMetadata
+            new_meta["population_file"] = new_meta["population_file"]   or existing_metadata.get("population_file", existing_metadata.get("population"))
+            new_meta["players_file"] = new_meta["players_file"]         or existing_metadata.get("players_file",    existing_metadata.get("players"))
+            new_meta["sessions_file"] = new_meta["sessions_file"]       or existing_metadata.get("sessions_file",   existing_metadata.get("sessions"))
+            new_meta["game_events_file"] = new_meta["game_events_file"] or existing_metadata.get("game_events",     existing_metadata.get("events", existing_metadata.get("raw_events")))
+            new_meta["all_events_file"] = new_meta["all_events_file"]   or existing_metadata.get("all_events",      existing_metadata.get("processed_events"))
+            return new_meta
+
+        # only this game's shard of the index is rewritten, under a lock so concurrent exports don't lose each other's updates.
+        RepositoryIndexStore(indexing=file_indexing).UpdateDataset(game_id=dataset_schema.Key.GameID, dataset_id=dataset_schema.DatasetID, update=_mergeMeta)
 
     @staticmethod
     def _backupFileExportList(data_dir:Path) -> bool:
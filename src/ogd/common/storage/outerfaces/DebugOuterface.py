@@ -1,7 +1,6 @@
 """Module for a debugging outerface."""
 
 # import standard libraries
-import json
 import logging
 from typing import List, override, Set
 
@@ -11,6 +10,7 @@ from ogd.common.models.features.AggregationMode import AggregationMode
 from ogd.common.models.features.ExportMode import ExportMode
 from ogd.common.schemas.datasets.DatasetSchema import DatasetSchema
 from ogd.common.storage.outerfaces.Outerface import Outerface
+from ogd.common.utils.JSONCodec import JSONCodec
 from ogd.common.utils.Logger import Logger
 from ogd.common.utils.typing import ExportRow
 
@@ -115,7 +115,7 @@ class DebugOuterface(Outerface):
     @override
     def _writeMetadata(self, dataset_schema:DatasetSchema):
         self._display("Metadata:")
-        self._display(json.dumps(dataset_schema.AsMetadata))
+        self._display(JSONCodec.Dumps(dataset_schema.AsMetadata))
     # *** PUBLIC STATICS ***
 
     # *** PUBLIC METHODS ***
@@ -10,6 +10,7 @@ from typing import List, Optional, Set
 from ogd.common.models.features.AggregationMode import AggregationMode
 from ogd.common.models.features.ExportMode import ExportMode
 from ogd.common.models.events.EventSet import EventSet
+from ogd.common.models.events.ColumnarEventSet import ColumnarEventSet
 from ogd.common.models.features.Feature import Feature
 from ogd.common.models.features.FeatureSet import FeatureSet
 from ogd.common.configs.DataTableConfig import DataTableConfig
@@ -185,7 +186,7 @@ class Outerface:
         else:
             Logger.Log(f"Skipping WriteLines in {type(self).__name__}, export mode {mode} is not enabled for this outerface", depth=3)
 
-    def WriteEvents(self, events:EventSet, mode:ExportMode) -> None:
+    def WriteEvents(self, events:EventSet | ColumnarEventSet, mode:ExportMode) -> None:
         if isinstance(self.Config.TableSchema, EventTableSchema):
             if mode in self.ExportModes:
                 match (mode):
@@ -4,11 +4,13 @@ from ogd.common.models.features.AggregationMode import AggregationMode
 from ogd.common.models.features.ExportMode import ExportMode
 from ogd.common.configs.storage.DatasetRepositoryConfig import DatasetRepositoryConfig
 from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
 from ogd.common.models.DatasetKey import DatasetKey
 from ogd.common.storage.outerfaces.Outerface import Outerface
 from ogd.common.storage.outerfaces.CSVOuterface import CSVOuterface
 from ogd.common.storage.outerfaces.DebugOuterface import DebugOuterface
 from ogd.common.storage.outerfaces.DictionaryOuterface import DictionaryOuterface
+from ogd.common.storage.outerfaces.ParquetOuterface import ParquetOuterface
 
 class OuterfaceFactory:
     @staticmethod
@@ -16,6 +18,8 @@ class OuterfaceFactory:
         if config.StoreConfig:
             match (config.StoreConfig.Type.upper()):
                 case "FILE" | "CSV" | "TSV":
+                    if isinstance(config.StoreConfig, FileStoreConfig) and config.StoreConfig.FileExtension == "parquet":
+                        return ParquetOuterface(table_config=config, export_modes=export_modes)
                     return CSVOuterface(table_config=config, export_modes=export_modes, repository=repository, dataset_key=dataset_id)
                 case "DEBUG":
                     return DebugOuterface(table_config=config, export_modes=export_modes)
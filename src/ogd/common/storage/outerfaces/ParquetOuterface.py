@@ -0,0 +1,274 @@
+## import standard libraries
+import logging
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, override, Set
+# 3rd-party imports
+try:
+    import pyarrow as pa
+except ModuleNotFoundError:
+    # pyarrow is an optional dependency, ParquetConnector raises a clear error if it is missing.
+    pa = None
+# import local files
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.models.features.AggregationMode import AggregationMode
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.datasets.DatasetSchema import DatasetSchema
+from ogd.common.storage.connectors.ParquetConnector import ParquetConnector
+from ogd.common.storage.outerfaces.Outerface import Outerface
+from ogd.common.utils.JSONCodec import JSONCodec
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow, LazyJSON
+
+type ValueConverter = Callable[[Any], Any]
+class ParquetOuterface(Outerface):
+    """Outerface to write events and features to Parquet files, one file per export mode.
+
+    Each file gets a typed schema, derived from the `ValueType` of the matching column in the table schema:
+    `int` and `float` columns are stored as numbers, `datetime` columns as timestamps (in UTC, if they are timezone-aware),
+    `timedelta` columns as durations, and `json` columns as JSON text.
+    Everything else, including columns with no match in the table schema (such as feature columns), is stored as text.
+    Text columns that are likely to repeat, i.e. `str` and `enum` columns, are dictionary-encoded.
+
+    Unlike a `CSVOuterface`, a ParquetOuterface is not tied to a dataset repository.
+    Its metadata is a plain `.meta` file next to the Parquet files, with no revision hash in its name,
+    and the repository's `file_list.json` is not updated.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, table_config:DataTableConfig, export_modes:Set[ExportMode | AggregationMode],
+                 store:Optional[ParquetConnector]=None, row_group_size:int=65536, compression:str="zstd"):
+        """Constructor for a ParquetOuterface.
+
+        :param table_config: The config for the table to write, including the output location and table schema.
+        :type table_config: DataTableConfig
+        :param export_modes: The export modes to enable, each of which gets its own file.
+        :type export_modes: Set[ExportMode | AggregationMode]
+        :param store: A connector to write through, defaults to None, in which case a connector is made from the config.
+        :type store: Optional[ParquetConnector], optional
+        :param row_group_size: The number of rows in each row group of the written files, defaults to 65536
+        :type row_group_size: int, optional
+        :param compression: The compression codec for the written files, defaults to "zstd"
+        :type compression: str, optional
+        """
+        self._store : ParquetConnector
+
+        super().__init__(table_config=table_config, export_modes=export_modes)
+        self._converters : Dict[str, List[ValueConverter]] = {}
+        if store:
+            self._store = store
+        elif isinstance(self.Config.StoreConfig, FileStoreConfig):
+            self._store = ParquetConnector(
+                config               = self.Config.StoreConfig,
+                with_secondary_files = export_modes,
+                row_group_size       = row_group_size,
+                compression          = compression
+            )
+        else:
+            raise ValueError(f"ParquetOuterface config was for a connector other than Parquet files! Found config type {type(self.Config.StoreConfig)}")
+        self.Connector.Open()
+
+    @property
+    def Connector(self) -> ParquetConnector:
+        return self._store
+
+    # *** IMPLEMENT ABSTRACTS ***
+
+    @override
+    def _removeExportMode(self, mode:ExportMode | AggregationMode):
+        self.Connector.RemoveSecondaryFile(mode=mode)
+        self._converters.pop(mode.name, None)
+
+    @override
+    def _setupGameEventsTable(self, header:List[str]) -> None:
+        self._startTable(mode=ExportMode.EVENTS, header=header)
+
+    @override
+    def _setupDetectorEventsTable(self, header:List[str]) -> None:
+        self._startTable(mode=ExportMode.DETECTORS, header=header)
+
+    @override
+    def _setupAllFeaturesTable(self, header:List[str]) -> None:
+        self._startTable(mode=ExportMode.FEATURES, header=header)
+
+    @override
+    def _setupSessionTable(self, header:List[str]) -> None:
+        self._startTable(mode=AggregationMode.SESSION, header=header)
+
+    @override
+    def _setupPlayerTable(self, header:List[str]) -> None:
+        self._startTable(mode=AggregationMode.PLAYER, header=header)
+
+    @override
+    def _setupPopulationTable(self, header:List[str]) -> None:
+        self._startTable(mode=AggregationMode.POPULATION, header=header)
+
+    @override
+    def _writeGameEventLines(self, events:List[ExportRow]) -> None:
+        self._writeRows(mode=ExportMode.EVENTS, rows=events)
+
+    @override
+    def _writeAllEventLines(self, events:List[ExportRow]) -> None:
+        self._writeRows(mode=ExportMode.DETECTORS, rows=events)
+
+    @override
+    def _writeAllFeatureLines(self, feature_lines:List[ExportRow]) -> None:
+        self._writeRows(mode=ExportMode.FEATURES, rows=feature_lines)
+
+    @override
+    def _writeSessionLines(self, session_lines:List[ExportRow]) -> None:
+        self._writeRows(mode=AggregationMode.SESSION, rows=session_lines)
+
+    @override
+    def _writePlayerLines(self, player_lines:List[ExportRow]) -> None:
+        self._writeRows(mode=AggregationMode.PLAYER, rows=player_lines)
+
+    @override
+    def _writePopulationLines(self, population_lines:List[ExportRow]) -> None:
+        self._writeRows(mode=AggregationMode.POPULATION, rows=population_lines)
+
+    @override
+    def _writeMetadata(self, dataset_schema:DatasetSchema):
+        """Write the dataset metadata to a `.meta` file next to the Parquet files.
+
+        The export is not added to any repository index; see the class description.
+
+        :param dataset_schema: The schema of the exported dataset.
+        :type dataset_schema: DatasetSchema
+        """
+        base_file_name : str = "_".join(self.Connector.StoreConfig.Filename.split("_")[:-1])
+        meta_file_path = self.Connector.StoreConfig.Folder / f"{base_file_name}.meta"
+        try:
+            with open(meta_file_path, "w", encoding="utf-8") as meta_file:
+                meta_file.write(JSONCodec.Dumps(dataset_schema.AsMetadata, indent=4))
+        except OSError as err:
+            Logger.Log(f"Could not write metadata file {meta_file_path}. {type(err)} {str(err)}", logging.WARNING)
+
+    # *** PUBLIC STATICS ***
+
+    # *** PUBLIC METHODS ***
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _arrowType(value_type:Optional[str]) -> "pa.DataType":
+        """Get the Parquet storage type for a column with a given `ColumnSchema.ValueType`.
+
+        :param value_type: The value type of the column, or None if the column has no match in the table schema.
+        :type value_type: Optional[str]
+        :return: The Arrow type in which to store the column.
+        :rtype: pa.DataType
+        """
+        match value_type:
+            case "int":
+                return pa.int64()
+            case "float":
+                return pa.float64()
+            case "datetime":
+                return pa.timestamp("us")
+            case "timedelta":
+                return pa.duration("us")
+            case _:
+                return pa.string()
+
+    @staticmethod
+    def _converter(value_type:Optional[str]) -> ValueConverter:
+        """Get a function to turn an exported value into a value that can be stored in a column of the given `ColumnSchema.ValueType`.
+
+        :param value_type: The value type of the column, or None if the column has no match in the table schema.
+        :type value_type: Optional[str]
+        :return: A function taking an exported value, and returning the value to store.
+        :rtype: ValueConverter
+        """
+        def _toInt(value:Any) -> Optional[int]:
+            if value is None or value == "":
+                return None
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                pass
+            # values such as "3.0" are still whole numbers, so go through float before giving up on them.
+            try:
+                _float = float(value)
+            except (TypeError, ValueError):
+                _float = None
+            if _float is not None and _float.is_integer():
+                return int(_float)
+            Logger.Log(f"Could not store value '{value}' in an int column, storing None instead.", logging.WARNING)
+            return None
+        def _toFloat(value:Any) -> Optional[float]:
+            if value is None or value == "":
+                return None
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                Logger.Log(f"Could not store value '{value}' in a float column, storing None instead.", logging.WARNING)
+                return None
+        def _toDatetime(value:Any) -> Optional[datetime]:
+            if value is None or value == "":
+                return None
+            _when = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+            return _when.astimezone(timezone.utc).replace(tzinfo=None) if _when.tzinfo is not None else _when
+        def _toTimedelta(value:Any) -> Optional[timedelta]:
+            if isinstance(value, timezone):
+                return value.utcoffset(None)
+            return value if isinstance(value, timedelta) else None
+        def _toJSON(value:Any) -> Optional[str]:
+            if value is None or isinstance(value, str):
+                return value
+            if isinstance(value, LazyJSON):
+                # write the original text back out, without parsing it.
+                return value.JSON
+            return JSONCodec.Dumps(value, default=str)
+        def _toString(value:Any) -> Optional[str]:
+            if value is None or isinstance(value, str):
+                return value
+            # enum members are stored by name, e.g. "GAME" rather than the member's value.
+            return value.name if isinstance(value, Enum) else str(value)
+
+        match value_type:
+            case "int":
+                return _toInt
+            case "float":
+                return _toFloat
+            case "datetime":
+                return _toDatetime
+            case "timedelta":
+                return _toTimedelta
+            case "json":
+                return _toJSON
+            case _:
+                return _toString
+
+    @staticmethod
+    def _isDictionaryType(value_type:Optional[str]) -> bool:
+        return value_type is not None and (value_type == "str" or value_type.startswith("enum"))
+
+    # *** PRIVATE METHODS ***
+
+    def _startTable(self, mode:ExportMode | AggregationMode, header:List[str]) -> None:
+        """Create the file for an export mode, with a schema built from the header and the table schema's column types.
+
+        :param mode: The export mode whose file should be created.
+        :type mode: ExportMode | AggregationMode
+        :param header: The column names of the file.
+        :type header: List[str]
+        """
+        _types : Dict[str, str] = { column.Name : column.ValueType for column in self.Config.TableSchema.Columns } if self.Config.TableSchema is not None else {}
+        _value_types = [_types.get(name) for name in header]
+        _schema = pa.schema([(name, self._arrowType(value_type)) for name, value_type in zip(header, _value_types)])
+        _dictionary_columns = [name for name, value_type in zip(header, _value_types) if self._isDictionaryType(value_type)]
+        if self.Connector.StartTable(mode=mode, schema=_schema, dictionary_columns=_dictionary_columns):
+            self._converters[mode.name] = [self._converter(value_type) for value_type in _value_types]
+        else:
+            Logger.Log(f"No {mode} file available, {mode} rows will not be written.", logging.WARN)
+
+    def _writeRows(self, mode:ExportMode | AggregationMode, rows:List[ExportRow]) -> None:
+        _converters = self._converters.get(mode.name)
+        if _converters is not None:
+            _rows = [tuple(convert(value) for convert, value in zip(_converters, row)) for row in rows]
+            self.Connector.WriteRows(mode=mode, rows=_rows)
+        else:
+            Logger.Log(f"No {mode} file available, skipping {len(rows)} rows.", logging.WARN)
@@ -0,0 +1,142 @@
+import importlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+# import locals
+from ogd.common.utils.Logger import Logger
+
+type JSONDecoder = Callable[[str | bytes], Any]
+
+class JSONCodec:
+    """Process-wide JSON encoding and decoding, for the places that handle JSON once per row or per file.
+
+    Decoding uses the fastest installed backend, out of `orjson`, `simdjson` and `msgspec`,
+    falling back on the standard `json` module when none are installed.
+    Any text a backend rejects is decoded again with the standard `json` module,
+    so the results, and the errors for invalid text, are always the same as `json.loads`.
+    The `OGD_JSON_BACKEND` environment variable, or `SetBackend`, chooses a particular backend, e.g. "json" to turn the fast backends off.
+
+    Encoding always gives the same text as `json.dumps`, since none of the fast backends can reproduce its separators and escaping,
+    which are part of the stored formats (event data in Parquet exports, metadata files, etc.).
+    Instead, encoders are created once for each combination of options, rather than once per call.
+    """
+    ENV_VAR  : Final[str]       = "OGD_JSON_BACKEND"
+    STDLIB   : Final[str]       = "json"
+    BACKENDS : Final[List[str]] = ["orjson", "simdjson", "msgspec", STDLIB]
+
+    _backend  : Optional[str]                                      = None
+    _decode   : JSONDecoder                                        = json.loads
+    _encoders : Dict[Tuple[bool, Optional[int]], json.JSONEncoder] = {}
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Backend() -> str:
+        """Get the name of the backend used for decoding.
+
+        :return: The backend name, one of `JSONCodec.BACKENDS`.
+        :rtype: str
+        """
+        if JSONCodec._backend is None:
+            JSONCodec.SetBackend(os.environ.get(JSONCodec.ENV_VAR))
+        return JSONCodec._backend or JSONCodec.STDLIB
+
+    @staticmethod
+    def AvailableBackends() -> List[str]:
+        """Get the names of the backends that are installed, from fastest to slowest.
+
+        :return: The installed backends, always ending with the standard `json` module.
+        :rtype: List[str]
+        """
+        return [name for name in JSONCodec.BACKENDS if JSONCodec._decoderFor(name) is not None]
+
+    @staticmethod
+    def SetBackend(name:Optional[str]) -> None:
+        """Choose the backend used for decoding.
+
+        :param name: The backend name, or None to use the fastest installed backend.
+        :type name: Optional[str]
+        """
+        _decode : Optional[JSONDecoder] = None
+        if name:
+            _decode = JSONCodec._decoderFor(name)
+            if _decode is None:
+                Logger.Log(f"JSON backend '{name}' is not available, using the fastest installed backend instead.", logging.WARN)
+        if _decode is None:
+            for backend in JSONCodec.BACKENDS:
+                _decode = JSONCodec._decoderFor(backend)
+                if _decode is not None:
+                    name = backend
+                    break
+        JSONCodec._backend = name
+        JSONCodec._decode  = _decode or json.loads
+        Logger.Log(f"Using {name} for JSON decoding.", logging.DEBUG)
+
+    @staticmethod
+    def Loads(text:str | bytes) -> Any:
+        """Decode a JSON document.
+
+        :param text: The JSON text.
+        :type text: str | bytes
+        :raises json.JSONDecodeError: If the text is not valid JSON.
+        :return: The decoded value, the same as given by `json.loads`.
+        :rtype: Any
+        """
+        if JSONCodec._backend is None:
+            JSONCodec.Backend()
+        try:
+            return JSONCodec._decode(text)
+        except (ValueError, TypeError):
+            if JSONCodec._decode is json.loads:
+                raise
+            # backends are stricter than the json module about some inputs, e.g. NaN or very large integers,
+            # so let the json module decide whether the text is really invalid.
+            return json.loads(text)
+
+    @staticmethod
+    def Dumps(value:Any, sort_keys:bool=False, indent:Optional[int]=None, default:Optional[Callable[[Any], Any]]=None) -> str:
+        """Encode a value as JSON, giving exactly the same text as `json.dumps` with the same options.
+
+        :param value: The value to encode.
+        :type value: Any
+        :param sort_keys: Whether to sort the keys of objects, defaults to False
+        :type sort_keys: bool, optional
+        :param indent: The indent for pretty-printing, or None for a single line, defaults to None
+        :type indent: Optional[int], optional
+        :param default: Function to get an encodable value for objects that can't otherwise be encoded, defaults to None
+        :type default: Optional[Callable[[Any], Any]], optional
+        :return: The JSON text.
+        :rtype: str
+        """
+        if default is not None:
+            return json.dumps(value, sort_keys=sort_keys, indent=indent, default=default)
+        _key = (sort_keys, indent)
+        _encoder = JSONCodec._encoders.get(_key)
+        if _encoder is None:
+            _encoder = json.JSONEncoder(sort_keys=sort_keys, indent=indent)
+            JSONCodec._encoders[_key] = _encoder
+        return _encoder.encode(value)
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _decoderFor(name:str) -> Optional[JSONDecoder]:
+        ret_val : Optional[JSONDecoder] = None
+
+        if name == JSONCodec.STDLIB:
+            return json.loads
+        try:
+            match name:
+                case "orjson":
+                    ret_val = importlib.import_module("orjson").loads
+                case "simdjson":
+                    ret_val = importlib.import_module("simdjson").loads
+                case "msgspec":
+                    ret_val = importlib.import_module("msgspec.json").Decoder().decode
+                case _:
+                    Logger.Log(f"Unrecognized JSON backend '{name}', expected one of {JSONCodec.BACKENDS}", logging.WARN)
+        except ModuleNotFoundError:
+            ret_val = None
+
+        return ret_val
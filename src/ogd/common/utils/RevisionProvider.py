@@ -0,0 +1,84 @@
+import logging
+import os
+import threading
+from typing import Final, Optional
+# 3rd-party imports
+from git.repo import Repo
+from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+# import locals
+from ogd.common.utils.Logger import Logger
+
+class RevisionProvider:
+    """Process-wide source for the short revision hash of the running OGD code, as recorded in dataset metadata.
+
+    The revision is taken from, in order of priority:
+    1. A value given to `SetOverride`, e.g. from a config file.
+    2. The `OGD_REVISION` environment variable, for deployments that ship without a `.git` folder.
+    3. The git repository containing the working directory, which is looked up once, and then cached for the life of the process.
+    """
+    ENV_VAR    : Final[str] = "OGD_REVISION"
+
+    _override  : Optional[str]  = None
+    _resolved  : Optional[str]  = None
+    _lock      : threading.Lock = threading.Lock()
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Current() -> str:
+        """Get the short revision hash of the running code.
+
+        :return: The revision, or an empty string if no override was given and there is no git repository to look it up in.
+        :rtype: str
+        """
+        if RevisionProvider._override is not None:
+            return RevisionProvider._override
+        _from_env = os.environ.get(RevisionProvider.ENV_VAR)
+        if _from_env:
+            return _from_env
+        if RevisionProvider._resolved is None:
+            with RevisionProvider._lock:
+                if RevisionProvider._resolved is None:
+                    RevisionProvider._resolved = RevisionProvider._lookUp()
+        return RevisionProvider._resolved
+
+    @staticmethod
+    def SetOverride(revision:Optional[str]) -> None:
+        """Set the revision to report, regardless of the environment or git repository.
+
+        :param revision: The revision to report, or None to stop overriding.
+        :type revision: Optional[str]
+        """
+        RevisionProvider._override = revision
+
+    @staticmethod
+    def Reset() -> None:
+        """Clear any override, and the cached revision, so the next call to `Current` looks the revision up again.
+        """
+        with RevisionProvider._lock:
+            RevisionProvider._override = None
+            RevisionProvider._resolved = None
+
+    # *** PRIVATE STATICS ***
+
+    @staticmethod
+    def _lookUp() -> str:
+        ret_val : str = ""
+
+        try:
+            repo = Repo(search_parent_directories=True)
+            if repo.git is not None:
+                ret_val = str(repo.git.rev_parse(repo.head.object.hexsha, short=7))
+        except InvalidGitRepositoryError as err:
+            msg = f"Code is not in a valid Git repository, and no {RevisionProvider.ENV_VAR} was given:\n{str(err)}"
+            Logger.Log(msg, logging.ERROR)
+        except NoSuchPathError as err:
+            msg = f"Unable to access proper file paths for Git repository:\n{str(err)}"
+            Logger.Log(msg, logging.ERROR)
+        except (GitCommandError, ValueError) as err:
+            msg = f"Unable to get revision from Git repository:\n{str(err)}"
+            Logger.Log(msg, logging.ERROR)
+        else:
+            Logger.Log(f"Found OGD revision {ret_val}", logging.DEBUG)
+
+        return ret_val
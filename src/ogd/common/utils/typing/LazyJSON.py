@@ -0,0 +1,120 @@
+"""LazyJSON Module
+"""
+
+# import standard libraries
+import json
+import logging
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+# import locals
+from ogd.common.utils.JSONCodec import JSONCodec
+from ogd.common.utils.Logger import Logger
+
+class LazyJSON(MutableMapping):
+    """A JSON object that is kept as its original string, and only parsed the first time its contents are needed.
+
+    Event payloads (event data, game state) arrive from storage as JSON strings, and many uses of an Event never look inside them,
+    or only write them back out again. A LazyJSON acts like a dict, but skips the cost of parsing until a key is accessed,
+    and `JSON` gives the original string back without any parsing at all, as long as the object has not been modified.
+
+    Once parsed, the keys are sorted, to match the dicts made by `conversions.ToJSON(..., sort=True)`,
+    and the string form (`str`) is the same as for the equivalent dict, so existing outputs are unchanged.
+    A string that does not hold a JSON object parses to an empty dict, with a warning.
+
+    A LazyJSON is a Mapping, not a `dict`, so code that needs a real dict, such as `json.dumps`, should use `Parsed`.
+    For that reason, `Event.FromRow` only gives LazyJSON payloads when asked to, with `lazy_payloads`.
+    """
+    __slots__ = ("_raw", "_parsed", "_name")
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, raw:str, name:str="Unnamed Element"):
+        """Constructor for a LazyJSON.
+
+        :param raw: The JSON string of the object.
+        :type raw: str
+        :param name: An identifier for the value, used for debug outputs, defaults to "Unnamed Element"
+        :type name: str, optional
+        """
+        self._raw    : Optional[str]            = raw
+        self._parsed : Optional[Dict[str, Any]] = None
+        self._name   : str                      = name
+
+    def __getitem__(self, key:str) -> Any:
+        return self.Parsed[key]
+
+    def __setitem__(self, key:str, value:Any) -> None:
+        self.Parsed[key] = value
+        # the original string no longer matches the contents.
+        self._raw = None
+
+    def __delitem__(self, key:str) -> None:
+        del self.Parsed[key]
+        self._raw = None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.Parsed)
+
+    def __len__(self) -> int:
+        return len(self.Parsed)
+
+    def __eq__(self, other:Any) -> bool:
+        if isinstance(other, LazyJSON) and self._raw is not None and self._raw == other._raw:
+            return True
+        return super().__eq__(other)
+
+    def __str__(self) -> str:
+        return str(self.Parsed)
+
+    def __repr__(self) -> str:
+        return repr(self.Parsed)
+
+    @property
+    def Parsed(self) -> Dict[str, Any]:
+        """The contents of the object, as a dict, which is parsed from the original string on first use.
+
+        :return: The parsed object.
+        :rtype: Dict[str, Any]
+        """
+        if self._parsed is None:
+            self._parsed = self._parse()
+        return self._parsed
+
+    @property
+    def IsParsed(self) -> bool:
+        return self._parsed is not None
+
+    @property
+    def Raw(self) -> Optional[str]:
+        """The original JSON string, if the object has not been modified since it was created.
+
+        :return: The original string, or None if the object has been modified.
+        :rtype: Optional[str]
+        """
+        return self._raw
+
+    @property
+    def JSON(self) -> str:
+        """The object as a JSON string; the original string if the object is unmodified, otherwise the contents encoded again.
+
+        :return: A JSON string of the object.
+        :rtype: str
+        """
+        return self._raw if self._raw is not None else JSONCodec.Dumps(self.Parsed)
+
+    # *** PRIVATE METHODS ***
+
+    def _parse(self) -> Dict[str, Any]:
+        ret_val : Dict[str, Any] = {}
+
+        try:
+            _loaded = JSONCodec.Loads(self._raw or "")
+        except json.decoder.JSONDecodeError as err:
+            Logger.Log(f"{self._name} with value '{self._raw}' could not be converted to JSON, got the following error:\n{str(err)}\nDefaulting to empty dict", logging.WARN)
+        else:
+            if isinstance(_loaded, dict):
+                ret_val = dict(sorted(_loaded.items()))
+            elif _loaded is not None:
+                Logger.Log(f"{self._name} with value '{self._raw}' was not a JSON object, defaulting to empty dict", logging.WARN)
+
+        return ret_val
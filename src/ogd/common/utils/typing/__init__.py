@@ -4,8 +4,10 @@ __all__ = [
     "Pair",
     "Version",
     "Date",
+    "LazyJSON",
     "conversions"
 ]
 
 from .typing import Map, ExportRow, Pair, Version, Date
+from .LazyJSON import LazyJSON
 from . import conversions
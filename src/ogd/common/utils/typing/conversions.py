@@ -7,20 +7,24 @@ where incoming values may be strings that must be parsed into the proper type in
 ## import standard libraries
 import builtins
 import datetime
-import json
 import logging
 import pathlib
 import re
 import typing
-from typing import Any, Dict, List, LiteralString, Optional, Type
+from typing import Any, Callable, Dict, Final, FrozenSet, List, LiteralString, Optional, Sequence, Tuple, Type
 
 from json.decoder import JSONDecodeError
 ## import 3rd-party libraries
-from pandas import Timedelta
+import numpy as np
+from pandas import Timedelta, to_datetime
 from pandas._libs.tslibs import timestamps, timedeltas
 from dateutil import parser
 ## import local files
+from ogd.common.utils.JSONCodec import JSONCodec
 from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing.LazyJSON import LazyJSON
+
+_NULL_STRINGS : Final[FrozenSet[str]] = frozenset({"NONE", "NULL", "NAN"})
 
 def Capitalize(value:Any) -> Any:
     """Stupidly simple little function to convert any given strings to upper case, but allow non-strings to pass through unchanged.
@@ -70,7 +74,7 @@ def ConvertToType(value:Any, to_type:str | Type | List[Type], name:str="Unnamed
     """
     ret_val : Any
 
-    if Capitalize(value) in [None, "NONE", "NULL", "NAN"]:
+    if value is None or (isinstance(value, str) and value.upper() in _NULL_STRINGS):
         ret_val = None
     # Handle case where there are multiple valid types accepted (i.e. got a list, and everything in list is a type/str)
     elif isinstance(to_type, List) and all(type(x) in {type, str} for x in to_type):
@@ -129,6 +133,186 @@ def ConvertToType(value:Any, to_type:str | Type | List[Type], name:str="Unnamed
                 ret_val = None
     return ret_val
 
+def ConverterFor(to_type:str | Type, name:str="Unnamed Element") -> Callable[[Any], Any]:
+    """Function to resolve a type once, and get back a function that converts values to that type.
+
+    The returned function gives the same result as `ConvertToType(value, to_type, name)`,
+    but the type-name matching is done once, up front, instead of on every call.
+    Each converter also has a fast path for values that already have the target type,
+    which is the common case for data coming out of a typed source (e.g. a database cursor).
+    This makes it appropriate for converting many values of a single column,
+    such as when decoding rows from a table.
+
+    :param to_type: The desired type of the converted values, as in `ConvertToType`.
+    :type to_type: str | Type
+    :param name: An identifier for the values, used for debug outputs, defaults to "Unnamed Element"
+    :type name: str, optional
+    :return: A function taking a single value, and returning the value converted to `to_type`, or None if the value was null-like.
+    :rtype: Callable[[Any], Any]
+    """
+    convert : Callable[[Any], Any]
+
+    match Capitalize(to_type):
+        case 'BOOL' | builtins.bool:
+            convert = lambda value : value if type(value) is bool else ToBool(name=name, value=value)
+        case 'STR' | builtins.str:
+            convert = lambda value : value if type(value) is str else ToString(name=name, value=value)
+        case 'INT' | builtins.int:
+            convert = lambda value : value if type(value) is int else ToInt(name=name, value=value)
+        case 'FLOAT' | builtins.float:
+            convert = lambda value : value if type(value) is float else ToFloat(name=name, value=value)
+        case 'PATH' | pathlib.Path:
+            convert = lambda value : ToPath(name=name, value=value)
+        case 'DATE' | datetime.date:
+            _date_parser = time.DatetimeParser(name=name)
+            def convert(value:Any) -> Optional[datetime.date]:
+                raw_dt = _date_parser.Parse(value)
+                return raw_dt.date() if raw_dt is not None else None
+        case 'DATETIME' | datetime.datetime:
+            # Each column gets its own parser, so it can remember the format of the column's strings.
+            _parser = time.DatetimeParser(name=name)
+            convert = lambda value : value if type(value) is datetime.datetime else _parser.Parse(value)
+        case 'TIMEDELTA' | datetime.timedelta:
+            convert = lambda value : value if type(value) is datetime.timedelta else time.ToTimedelta(name=name, value=value)
+        case 'TIMEZONE' | datetime.timezone:
+            # Columns of timezones tend to hold a handful of distinct strings, so remember what each one parsed to.
+            _parsed_zones : Dict[str, Optional[datetime.timezone]] = {}
+            def convert(value:Any) -> Optional[datetime.timezone]:
+                if type(value) is str:
+                    if value not in _parsed_zones:
+                        _parsed_zones[value] = time.ToTimezone(name=name, value=value)
+                    return _parsed_zones[value]
+                return time.ToTimezone(name=name, value=value)
+        case 'JSON' | 'DICT' | builtins.dict | typing.Dict:
+            convert = lambda value : value if type(value) is dict or type(value) is LazyJSON else ToJSON(name=name, value=value)
+        case 'LIST' | builtins.list | typing.List:
+            convert = lambda value : value if type(value) is list else ToList(name=name, value=value)
+        case _dummy if isinstance(_dummy, str) and _dummy.startswith('ENUM'):
+            # if the column is supposed to be an enum, for now we just stick with the string.
+            convert = str
+        case _:
+            def convert(value:Any) -> None:
+                Logger.Log(f"Requested type of {to_type} for '{name}' is unknown; defaulting to {name}=None", logging.WARNING)
+                return None
+
+    def _convertNullable(value:Any) -> Any:
+        # all of the null strings are 4 characters or fewer, so we can skip upper-casing anything longer.
+        if value is None or (isinstance(value, str) and len(value) <= 4 and value.upper() in _NULL_STRINGS):
+            return None
+        return convert(value)
+
+    return _convertNullable
+
+def ConvertColumn(values:Sequence[Any] | np.ndarray, to_type:str | Type, name:str="Unnamed Element") -> List[Any]:
+    """Function to convert a whole column of values to a specific type.
+
+    Gives the same result as calling `ConverterFor(to_type, name)` on each value,
+    but strings are converted in bulk where possible, as described in `ColumnConverterFor`.
+    When converting several batches of the same column, use `ColumnConverterFor` instead,
+    so that what is learned about the column (e.g. its datetime format) carries over between batches.
+
+    :param values: The values to convert, as a list, tuple, NumPy array, or other sequence.
+    :type values: Sequence[Any] | np.ndarray
+    :param to_type: The desired type of the converted values, as in `ConvertToType`.
+    :type to_type: str | Type
+    :param name: An identifier for the values, used for debug outputs, defaults to "Unnamed Element"
+    :type name: str, optional
+    :return: A list of the converted values, in the same order as `values`, with None for any null-like values.
+    :rtype: List[Any]
+    """
+    return ColumnConverterFor(to_type=to_type, name=name)(values)
+
+def ColumnConverterFor(to_type:str | Type, name:str="Unnamed Element") -> Callable[[Sequence[Any] | np.ndarray], List[Any]]:
+    """Function to resolve a type once, and get back a function that converts whole columns of values to that type.
+
+    The returned function makes a single pass over the values to pick out nulls, and values that already have the target type.
+    The remaining values are then converted in bulk, where the target type allows it:
+    * int, float : strings are parsed by mapping the built-in `int`/`float` over them, skipping the per-value type dispatch and logging.
+    * bool : strings are looked up in a table of true/false words.
+    * date, datetime : values are parsed with `time.DatetimeParser.ParseMany`, which uses `pandas.to_datetime` for non-ISO formats.
+    Any values that can't be converted in bulk (e.g. malformed strings, or unusual types) are converted individually, with `ConverterFor`,
+    so the results and warnings are the same as converting one value at a time.
+    A NumPy array of bools, ints or floats, when that is the target type, is simply turned into a list.
+
+    :param to_type: The desired type of the converted values, as in `ConvertToType`.
+    :type to_type: str | Type
+    :param name: An identifier for the values, used for debug outputs, defaults to "Unnamed Element"
+    :type name: str, optional
+    :return: A function taking a sequence of values, and returning a list of the values converted to `to_type`.
+    :rtype: Callable[[Sequence[Any] | np.ndarray], List[Any]]
+    """
+    convert_one  : Callable[[Any], Any] = ConverterFor(to_type=to_type, name=name)
+    exact_type   : Optional[Type]       = None
+    array_kinds  : str                  = ""
+    convert_bulk : Optional[Callable[[List[Any]], List[Any]]] = None
+    bulk_strings : bool                 = True
+
+    match Capitalize(to_type):
+        case 'BOOL' | builtins.bool:
+            exact_type, array_kinds = bool, "b"
+            convert_bulk = _boolsFromStrings
+        case 'INT' | builtins.int:
+            exact_type, array_kinds = int, "iu"
+            convert_bulk = lambda values : _numbersFromStrings(values=values, parse=int)
+        case 'FLOAT' | builtins.float:
+            exact_type, array_kinds = float, "f"
+            convert_bulk = lambda values : _numbersFromStrings(values=values, parse=float)
+        case 'STR' | builtins.str:
+            exact_type = str
+        case 'DATE' | datetime.date:
+            _date_parser = time.DatetimeParser(name=name)
+            bulk_strings = False
+            convert_bulk = lambda values : [raw_dt.date() if raw_dt is not None else None for raw_dt in _date_parser.ParseMany(values)]
+        case 'DATETIME' | datetime.datetime:
+            exact_type = datetime.datetime
+            _parser = time.DatetimeParser(name=name)
+            bulk_strings = False
+            convert_bulk = _parser.ParseMany
+
+    def _convertColumn(values:Sequence[Any] | np.ndarray) -> List[Any]:
+        if isinstance(values, np.ndarray):
+            # tolist gives back built-in Python types, so the checks below see e.g. str rather than numpy.str_.
+            if values.dtype.kind in array_kinds:
+                return values.tolist()
+            values = values.tolist()
+
+        ret_val : List[Any] = [None] * len(values)
+        # single pass to skip nulls, keep values that are already the right type, and split the rest into strings and others.
+        strings : List[int] = []
+        others  : List[int] = []
+        for i, value in enumerate(values):
+            value_type = type(value)
+            if value_type is str:
+                if len(value) <= 4 and value.upper() in _NULL_STRINGS:
+                    continue
+                if exact_type is str:
+                    ret_val[i] = value
+                else:
+                    strings.append(i)
+            elif value_type is exact_type:
+                ret_val[i] = value
+            elif value is not None:
+                others.append(i)
+
+        if convert_bulk is not None:
+            # date/time parsing handles every kind of value itself, the others only take strings in bulk.
+            _bulk_indices = strings if bulk_strings else strings + others
+            if not bulk_strings:
+                others = []
+            for i, converted in zip(_bulk_indices, convert_bulk([values[i] for i in _bulk_indices])):
+                if converted is not None:
+                    ret_val[i] = converted
+                else:
+                    others.append(i)
+        else:
+            others += strings
+        for i in others:
+            ret_val[i] = convert_one(values[i])
+
+        return ret_val
+
+    return _convertColumn
+
 def ToBool(name:str, value:Any, force:bool=False) -> Optional[bool]:
     """Attempt to turn a given value into a bool
 
@@ -336,13 +520,13 @@ def ToList(name:str, value:Any, force:bool=False) -> Optional[List]:
                 ret_val = value
             case builtins.str:
                 if value not in {'None', 'null', ''}: # watch out for nasty corner cases.
-                    ret_val = list(json.loads(value))
+                    ret_val = list(JSONCodec.Loads(value))
                 else:
                     ret_val = None
             case _:
                 base_msg : str = f"{name} was unexpected type {type(value)}, expected a list or string!"
                 if force:
-                    ret_val = list(json.loads(str(value)))
+                    ret_val = list(JSONCodec.Loads(str(value)))
                     msg = f"{base_msg} Defaulting to list(json.loads(str(value))) == {ret_val}."
                 else:
                     ret_val = None
@@ -378,15 +562,18 @@ def ToJSON(name:str, value:Any, force:bool=False, sort:bool=False) -> Optional[D
             case builtins.dict:
                 # if input was a dict already, then just give it back. Else, try to load it from string.
                 ret_val = value
+            case _lazy if _lazy is LazyJSON:
+                # a lazily-parsed object already acts like a dict, and sorts its keys when parsed, so give it back as-is.
+                ret_val = value
             case builtins.str:
                 if value not in {'None', ''}: # watch out for nasty corner cases.
-                    ret_val = json.loads(value)
+                    ret_val = JSONCodec.Loads(value)
                 else:
                     ret_val = None
             case _:
                 base_msg : str = f"{name} was unexpected type {type(value)}, expected a dict or string!"
                 if force:
-                    ret_val = json.loads(str(value))
+                    ret_val = JSONCodec.Loads(str(value))
                     msg = f"{base_msg} Defaulting to json.loads(str(value)) == {ret_val}."
                 else:
                     ret_val = None
@@ -395,7 +582,7 @@ def ToJSON(name:str, value:Any, force:bool=False, sort:bool=False) -> Optional[D
     except JSONDecodeError as err:
         Logger.Log(f"{name} with value '{value}' of type {type(value)} could not be converted to JSON, got the following error:\n{str(err)}\nDefaulting to None", logging.WARN)
         ret_val = None
-    if sort and ret_val is not None:
+    if sort and ret_val is not None and type(ret_val) is not LazyJSON:
         ret_val = dict(sorted(ret_val.items()))
     return ret_val
 
@@ -430,20 +617,20 @@ def DatetimeFromString(time_str:str) -> Optional[datetime.datetime]:
     if time_str == None or time_str == "None" or time_str == "none" or time_str == "null" or time_str == "nan":
         raise ValueError(f"Got a non-timestamp value of {time_str} when converting a datetime column from data source!")
 
-    # Approach 1: use dateutil parser to parse, assuming an iso format
+    # Approach 1: use the built-in ISO parser, which is much faster than dateutil, and handles most timestamps we see
     try:
-        ret_val = parser.isoparse(time_str)
-    # Approach 2: if dateutil threw error, try using the general parse
+        ret_val = datetime.datetime.fromisoformat(time_str)
     except ValueError:
-        Logger.Log(f"Attempted to convert a time string that was not in ISO format: {time_str}, switching to general parser instead!", logging.DEBUG)
+        # Approach 2: use dateutil parser to parse, assuming an iso format
         try:
-            ret_val = parser.parse(time_str)
+            ret_val = parser.isoparse(time_str)
+        # Approach 3: if dateutil threw error, try using the general parse
         except ValueError:
-            Logger.Log(f"Could not parse timestamp {time_str}, it did not match any expected formats!", logging.WARNING)
-        else:
-            pass
-    else:
-        pass
+            Logger.Log(f"Attempted to convert a time string that was not in ISO format: {time_str}, switching to general parser instead!", logging.DEBUG)
+            try:
+                ret_val = parser.parse(time_str)
+            except ValueError:
+                Logger.Log(f"Could not parse timestamp {time_str}, it did not match any expected formats!", logging.WARNING)
 
     return ret_val
 
@@ -503,6 +690,23 @@ def _parseToType(value:Any, to_type:str | Type, name:str="Unnamed Element") -> A
                 ret_val = None
     return ret_val
 
+def _numbersFromStrings(values:List[str], parse:Callable[[str], Any]) -> List[Any]:
+    """Parse a list of numeric strings in a single C-level pass, without the per-value type dispatch of `ToInt`/`ToFloat`.
+
+    :return: The parsed numbers, or all None if any string could not be parsed, so the strings can be handled one at a time instead.
+    :rtype: List[Any]
+    """
+    try:
+        return list(map(parse, values))
+    except (ValueError, OverflowError):
+        return [None] * len(values)
+
+_BOOL_WORDS : Final[Dict[str, bool]] = {"TRUE" : True, "YES" : True, "FALSE" : False, "NO" : False}
+def _boolsFromStrings(values:List[str]) -> List[bool]:
+    """Equivalent of calling `BoolFromString` on each string in a list, with a single dictionary lookup per string.
+    """
+    return [_BOOL_WORDS.get(value.upper(), value != "") for value in values]
+
 class time:
 
     @staticmethod
@@ -719,6 +923,165 @@ class time:
 
             return ret_val
 
+    class DatetimeParser:
+        """Parser for the datetimes of a single column, which remembers the format of the column's strings.
+
+        Strings are parsed with the following approaches, with the following priority:
+        1. Apply the built-in `datetime.fromisoformat`, which handles most timestamps we see, and is far faster than anything else.
+        2. Apply the last `strptime` format that worked for a string in the column.
+        3. Apply `DatetimeFromString`, i.e. the `dateutil` parsers, and then work out which of a set of known formats gives the same result,
+            so that approach 2 can be used for the rest of the column.
+
+        `ParseMany` handles a whole batch of values from the column at once,
+        converting any strings in a remembered format with a single vectorized call to `pandas.to_datetime`.
+        """
+
+        _DATE_FORMATS : Final[List[str]] = ["%Y%m%d", "%Y/%m/%d", "%m-%d-%Y", "%m/%d/%Y", "%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d"]
+        _TIME_FORMATS : Final[List[str]] = [" %H:%M:%S.%f", " %H:%M:%S", "T%H:%M:%S.%f", "T%H:%M:%S", ""]
+        # once this many strings in a row fail to match any known format, stop trying to find one.
+        _MAX_SNIFF_MISSES : Final[int] = 8
+        _CANDIDATES       : Optional[Tuple[str, ...]] = None
+
+        def __init__(self, name:str="Unnamed Element"):
+            """Constructor for a DatetimeParser.
+
+            :param name: An identifier for the column, used for debug outputs, defaults to "Unnamed Element"
+            :type name: str, optional
+            """
+            self._name         : str           = name
+            self._format       : Optional[str] = None
+            self._sniff_misses : int           = 0
+
+        @property
+        def Format(self) -> Optional[str]:
+            """The last `strptime` format that successfully parsed a string from the column, if any.
+
+            :return: The remembered format, or None if no strings have needed a format yet.
+            :rtype: Optional[str]
+            """
+            return self._format
+
+        def Parse(self, value:Any) -> Optional[datetime.datetime]:
+            """Parse a single value from the column.
+
+            :param value: The value to parse, typically a string. Other types are handled as in `time.ToDatetime`.
+            :type value: Any
+            :raises ValueError: If the value is a null-like string, as in `DatetimeFromString`.
+            :return: The parsed datetime, or None if the value could not be parsed.
+            :rtype: Optional[datetime.datetime]
+            """
+            ret_val : Optional[datetime.datetime] = None
+
+            if type(value) is not str:
+                ret_val = time.ToDatetime(name=self._name, value=value)
+            else:
+                try:
+                    ret_val = datetime.datetime.fromisoformat(value)
+                except ValueError:
+                    if self._format is not None:
+                        try:
+                            ret_val = datetime.datetime.strptime(value, self._format)
+                        except ValueError:
+                            pass
+                    if ret_val is None:
+                        ret_val = DatetimeFromString(time_str=value)
+                        if ret_val is not None:
+                            self._sniffFormat(time_str=value, parsed=ret_val)
+
+            return ret_val
+
+        def ParseMany(self, values:Sequence[Any]) -> List[Optional[datetime.datetime]]:
+            """Parse a batch of values from the column.
+
+            Null-like values give None, and values that are already datetimes are passed through unchanged.
+            Unlike `Parse`, no error is raised for values that could not be parsed, they simply give None.
+
+            :param values: The values to parse.
+            :type values: Sequence[Any]
+            :return: A list of the parsed datetimes, in the same order as `values`.
+            :rtype: List[Optional[datetime.datetime]]
+            """
+            ret_val : List[Optional[datetime.datetime]] = [None] * len(values)
+
+            # first pass: pick off nulls, datetimes, and ISO strings, and note the indices of anything else.
+            pending : List[int] = []
+            for i, value in enumerate(values):
+                if type(value) is datetime.datetime:
+                    ret_val[i] = value
+                elif value is None or (type(value) is str and len(value) <= 4 and value.upper() in _NULL_STRINGS):
+                    continue
+                elif type(value) is str and self._format is None:
+                    try:
+                        ret_val[i] = datetime.datetime.fromisoformat(value)
+                    except ValueError:
+                        pending.append(i)
+                else:
+                    pending.append(i)
+
+            # if nothing told us the column's format yet, parse the first leftover string on its own to find one.
+            if pending and self._format is None and type(values[pending[0]]) is str:
+                ret_val[pending[0]] = self._safeParse(values[pending[0]])
+                pending = pending[1:]
+            if pending and self._format is not None:
+                pending = self._parseVectorized(values=values, indices=pending, out=ret_val)
+            for i in pending:
+                ret_val[i] = self._safeParse(values[i])
+
+            return ret_val
+
+        def _parseVectorized(self, values:Sequence[Any], indices:List[int], out:List[Optional[datetime.datetime]]) -> List[int]:
+            """Parse the strings at the given indices using the remembered format, all at once.
+
+            :return: The indices of values that still need to be parsed individually.
+            :rtype: List[int]
+            """
+            _str_indices = [i for i in indices if type(values[i]) is str]
+            ret_val      = [i for i in indices if type(values[i]) is not str]
+            try:
+                _parsed = to_datetime([values[i] for i in _str_indices], format=self._format, errors="coerce")
+            except (ValueError, TypeError, OverflowError):
+                # e.g. mixed timezone offsets, which pandas can't put into a single array.
+                return indices
+            for i, stamp in zip(_str_indices, _parsed):
+                if stamp is None or stamp != stamp: # NaT is not equal to itself
+                    ret_val.append(i)
+                else:
+                    out[i] = stamp.to_pydatetime()
+            return ret_val
+
+        def _safeParse(self, value:Any) -> Optional[datetime.datetime]:
+            try:
+                return self.Parse(value)
+            except (ValueError, OverflowError):
+                return None
+
+        def _sniffFormat(self, time_str:str, parsed:datetime.datetime) -> None:
+            """Find a known format that gives the same datetime for a string as the general parser did, and remember it.
+
+            :param time_str: A string that was successfully parsed by the general parser.
+            :type time_str: str
+            :param parsed: The datetime the general parser got from the string.
+            :type parsed: datetime.datetime
+            """
+            if parsed.tzinfo is not None or self._sniff_misses >= time.DatetimeParser._MAX_SNIFF_MISSES:
+                return
+            for fmt in time.DatetimeParser._candidateFormats():
+                try:
+                    if datetime.datetime.strptime(time_str, fmt) == parsed:
+                        Logger.Log(f"Timestamps for {self._name} appear to have format '{fmt}', will try it first from now on.", logging.DEBUG)
+                        self._format       = fmt
+                        self._sniff_misses = 0
+                        return
+                except ValueError:
+                    pass
+            self._sniff_misses += 1
+
+        @staticmethod
+        def _candidateFormats() -> Tuple[str, ...]:
+            if time.DatetimeParser._CANDIDATES is None:
+                time.DatetimeParser._CANDIDATES = tuple(f"{date_fmt}{time_fmt}" for date_fmt in time.DatetimeParser._DATE_FORMATS for time_fmt in time.DatetimeParser._TIME_FORMATS)
+            return time.DatetimeParser._CANDIDATES
+
     class TimedeltaParser:
 
         _PATTERN = None
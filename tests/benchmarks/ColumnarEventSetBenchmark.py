@@ -0,0 +1,76 @@
+"""Benchmark for the memory use and filtering speed of a ColumnarEventSet, compared to an EventSet.
+
+Measures the memory allocated to hold a set of events as an `EventSet` of `Event` objects,
+and as a `ColumnarEventSet` built from the same events.
+Also times filtering the events by session, with a list comprehension over the `EventSet`
+against the vectorized `ColumnarEventSet.Filter`.
+
+Run from the repository root with:
+```
+python -m tests.benchmarks.ColumnarEventSetBenchmark
+```
+"""
+# import libraries
+import gc
+import logging
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Tuple
+# import ogd libraries.
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.models.events.ColumnarEventSet import ColumnarEventSet
+from ogd.common.models.events.Event import Event, EventSource
+from ogd.common.models.events.EventSet import EventSet
+from ogd.common.models.SemanticVersion import SemanticVersion
+from ogd.common.utils.Logger import Logger
+
+EVENT_COUNT : int = 100000
+REPEATS     : int = 5
+
+def _events(count:int) -> List[Event]:
+    _start = datetime(2024, 1, 1, 10, 0, 0)
+    _offset = timezone(timedelta(hours=-5))
+    _version = SemanticVersion.FromString("1.2.3")
+    return [
+        Event(app_id="AQUALAB", user_id=f"Player{i // 1000}", session_id=f"session{i // 100}",
+              app_version=_version, app_branch="main", log_version=_version,
+              timestamp=_start + timedelta(seconds=i), time_offset=_offset, event_sequence_index=i % 100,
+              event_name=["click", "hover", "complete_level", "start_level"][i % 4], event_source=EventSource.GAME,
+              event_data={"x":i, "y":i*2, "name":"foo"}, game_state={"level":i % 5}, user_data={})
+        for i in range(count)
+    ]
+
+def _measure(build:Callable[[], Any]) -> Tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    _before = tracemalloc.get_traced_memory()[0]
+    ret_val = build()
+    _after  = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ret_val, _after - _before
+
+def main() -> None:
+    Logger.std_logger.setLevel(logging.ERROR)
+    _sessions = {f"session{i}" for i in range(0, EVENT_COUNT // 100, 10)}
+    _filters  = DatasetFilterCollection(
+        id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements=_sessions))
+    )
+
+    _event_set, _event_bytes = _measure(lambda : EventSet(events=_events(EVENT_COUNT), filters=DatasetFilterCollection()))
+    _columnar_set, _columnar_bytes = _measure(lambda : ColumnarEventSet.FromEvents(events=_events(EVENT_COUNT), filters=DatasetFilterCollection()))
+
+    _list_filter = min(timeit.repeat(lambda : [event for event in _event_set if event.SessionID in _sessions], number=1, repeat=REPEATS))
+    _vec_filter  = min(timeit.repeat(lambda : _columnar_set.Filter(_filters), number=1, repeat=REPEATS))
+
+    print(f"{EVENT_COUNT} events:")
+    print(f"    EventSet memory         : {_event_bytes / 2**20:.1f} MiB")
+    print(f"    ColumnarEventSet memory : {_columnar_bytes / 2**20:.1f} MiB ({_event_bytes / _columnar_bytes:.1f}x smaller)")
+    print(f"    EventSet session filter         : {_list_filter * 1000:.2f}ms")
+    print(f"    ColumnarEventSet session filter : {_vec_filter * 1000:.2f}ms ({_list_filter / _vec_filter:.1f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+"""Benchmark for decoding table rows into Events.
+
+Compares decoding of each Event element with `TableSchema.ColumnValueFromRow`,
+which resolves the column mapping and column types on every call,
+against the compiled decoders from `EventTableSchema.Decoder`, which resolve them once per schema.
+Also times the full `Event.FromRow` conversion, against a copy of the `Event.FromRow` that used `ColumnValueFromRow`,
+and the end-to-end `Interface.GetEventSet`, against the same interface converting each row with the `ColumnValueFromRow`-based copy.
+`GetEventSet` is timed on rows already held in memory, so the time is spent on converting rows rather than reading storage,
+and once more reading the OGD_EVENT_FILE rows from a TSV file, through a `CSVInterface`.
+
+The `ColumnValueFromRow`-based copies run on the current conversion functions, so they also benefit from later speedups to
+e.g. timestamp parsing; the speedup over the original `GetEventSet` is larger than the one shown here.
+What remains of each row's conversion is mostly decoding the JSON payloads (see `JSONCodec`), and the Event fingerprint.
+
+Run from the repository root with:
+```
+python -m tests.benchmarks.EventDecodeBenchmark
+```
+"""
+# import libraries
+import datetime
+import json
+import logging
+import shutil
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.models.SemanticVersion import SemanticVersion
+from ogd.common.models.events.Event import Event, EventSource
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.StorageConnector import StorageConnector
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.interfaces.Interface import Interface
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import ExportRow, Map, conversions
+
+ROW_COUNT : int = 10000
+REPEATS   : int = 5
+
+def _fileRows(count:int) -> List[ExportRow]:
+    """Rows in the style of an OGD event file, as read by a CSVInterface."""
+    return [
+        (f"session{i // 100}", "AQUALAB", datetime.datetime(2024, 1, 1, 10, 0, i % 60), "click",
+         json.dumps({"x":i, "y":i*2, "name":"foo"}), "GAME", "1.2.3", "main", "3", "UTC+02:00",
+         "Player1", "{}", json.dumps({"level":i % 5}), i % 100)
+        for i in range(count)
+    ]
+
+def _mysqlRows(count:int) -> List[ExportRow]:
+    """Rows in the style of the OpenGameData MySQL table, as returned by a MySQLInterface."""
+    return [
+        (i, f"session{i // 100}", "Player1", "{}", datetime.datetime(2024, 1, 1, 10, 0, i % 60), i % 1000, "UTC-05:00",
+         datetime.datetime(2024, 1, 1, 10, 0, i % 60), "click", json.dumps({"x":i, "y":i*2}), "GAME", json.dumps({"level":i % 5}),
+         "12", "main", 3, i % 100, "127.0.0.1", "Mozilla/5.0")
+        for i in range(count)
+    ]
+
+def _legacyDecode(schema:EventTableSchema, rows:List[ExportRow]) -> None:
+    _map = schema.Map
+    _mappings = [
+        _map.AppIDColumn, _map.UserIDColumn, _map.SessionIDColumn, _map.AppVersionColumn, _map.AppBranchColumn,
+        _map.LogVersionColumn, _map.TimestampColumn, _map.TimeOffsetColumn, _map.EventSequenceIndexColumn,
+        _map.EventNameColumn, _map.EventSourceColumn, _map.EventDataColumn, _map.GameStateColumn, _map.UserDataColumn
+    ]
+    for row in rows:
+        for mapping in _mappings:
+            schema.ColumnValueFromRow(row=row, mapping=mapping, concatenator=".")
+
+def _compiledDecode(schema:EventTableSchema, rows:List[ExportRow]) -> None:
+    _decoder = schema.Decoder
+    _decoders = [
+        _decoder.AppID, _decoder.UserID, _decoder.SessionID, _decoder.AppVersion, _decoder.AppBranch,
+        _decoder.LogVersion, _decoder.Timestamp, _decoder.TimeOffset, _decoder.EventSequenceIndex,
+        _decoder.EventName, _decoder.EventSource, _decoder.EventData, _decoder.GameState, _decoder.UserData
+    ]
+    for row in rows:
+        for decode in _decoders:
+            if decode:
+                decode(row)
+
+def _fromRows(schema:EventTableSchema, rows:List[ExportRow]) -> None:
+    for row in rows:
+        Event.FromRow(row=row, schema=schema)
+
+def _legacyFromRow(row:ExportRow, schema:EventTableSchema, fallbacks:Map) -> Event:
+    """Copy of `Event.FromRow` from before the compiled decoders, which decoded each element with `ColumnValueFromRow`."""
+    def _value(mapping, column_name:str, expected_type:type, fallback:Any) -> Any:
+        return schema.ColumnValueFromRow(row=row, mapping=mapping, concatenator=".", column_name=column_name, expected_type=expected_type, fallback=fallback)
+    _map = schema.Map
+
+    app_id = _value(_map.AppIDColumn, "app_id", str, fallbacks.get("app_id"))
+    if not isinstance(app_id, str):
+        app_id = conversions.ToString(name="app_id", value=app_id)
+    user_id = _value(_map.UserIDColumn, "user_id", str, fallbacks.get("user_id"))
+    if user_id is not None and not isinstance(user_id, str):
+        user_id = conversions.ToString(name="user_id", value=user_id)
+    sess_id = _value(_map.SessionIDColumn, "sess_id", str, fallbacks.get("session_id"))
+    if not isinstance(sess_id, str):
+        sess_id = conversions.ToString(name="session_id", value=sess_id)
+    if Event._latest_session != sess_id:
+        Event._latest_session = sess_id
+        Event._next_index = 0
+
+    expected_types = [str, int, SemanticVersion]
+    log_ver = _value(_map.LogVersionColumn, "log_ver", SemanticVersion, fallbacks.get('log_version', "0"))
+    if not any(isinstance(log_ver, t) for t in expected_types):
+        log_ver = SemanticVersion.FromString(semver=str(log_ver))
+    app_ver = _value(_map.AppVersionColumn, "app_ver", SemanticVersion, fallbacks.get('app_version'))
+    if not any(isinstance(app_ver, t) for t in expected_types):
+        app_ver = SemanticVersion.FromString(semver=str(app_ver))
+    app_br = _value(_map.AppBranchColumn, "app_br", str, fallbacks.get('app_branch'))
+    if not isinstance(app_br, str):
+        app_br = conversions.ToString(name="app_branch", value=app_br)
+
+    tstamp = _value(_map.TimestampColumn, "timestamp", datetime.datetime, None)
+    if not isinstance(tstamp, datetime.datetime):
+        tstamp = conversions.time.ToDatetime(name="timestamp", value=tstamp, force=True)
+    offset = _value(_map.TimeOffsetColumn, "offset", str, fallbacks.get('time_offset'))
+    if isinstance(offset, datetime.timedelta):
+        offset = conversions.time.ToTimezone(name="offset", value=offset, force=True)
+    event_index = _value(_map.EventSequenceIndexColumn, "index", int, fallbacks.get('event_sequence_index', Event._next_index))
+    if not isinstance(event_index, int):
+        event_index = conversions.ToInt(name="event_sequence_index", value=event_index or Event._next_index, force=True)
+
+    ename = _value(_map.EventNameColumn, "ename", str, fallbacks.get('event_name'))
+    if not isinstance(ename, str):
+        ename = conversions.ToString(name="event_name", value=ename)
+    esrc = _value(_map.EventSourceColumn, "esrc", str, fallbacks.get('event_source', EventSource.GAME))
+    if not isinstance(esrc, EventSource):
+        esrc = EventSource.GENERATED if esrc == "GENERATED" else EventSource.GAME
+    raw_data = _value(_map.EventDataColumn, "edata", dict, fallbacks.get('event_data'))
+    edata    = conversions.ToJSON(name="event_data", value=raw_data, force=True, sort=True) or {}
+    udata     = _value(_map.UserDataColumn, "udata", dict, fallbacks.get('user_data'))
+    raw_state = _value(_map.GameStateColumn, "state", dict, fallbacks.get('game_state'))
+    state     = conversions.ToJSON(name="game_state", value=raw_state, force=True, sort=True) or {}
+
+    ret_val = Event(app_id=app_id, user_id=user_id, session_id=sess_id,
+                    timestamp=tstamp, time_offset=offset, event_sequence_index=event_index,
+                    event_name=ename, event_source=esrc, event_data=edata,
+                    app_version=app_ver, app_branch=app_br, log_version=log_ver,
+                    user_data=udata, game_state=state)
+    ret_val.ApplyFallbackDefaults(index=Event._next_index)
+    Event._next_index = (event_index or Event._next_index) + 1
+    return ret_val
+
+def _legacyFromRows(schema:EventTableSchema, rows:List[ExportRow]) -> None:
+    for row in rows:
+        _legacyFromRow(row=row, schema=schema, fallbacks={})
+
+class _RowsConnector(StorageConnector):
+    """Connector to nothing, for an interface whose rows are already in memory."""
+    def __init__(self, config:FileStoreConfig):
+        self._config = config
+        super().__init__()
+        self.Open()
+    @property
+    def StoreConfig(self) -> FileStoreConfig:
+        return self._config
+    def _open(self, writeable:bool=True) -> bool:
+        return True
+    def _close(self) -> bool:
+        return True
+
+class _RowsInterface(Interface):
+    """Interface handing back a fixed list of rows, so `GetEventSet` can be timed without reading storage."""
+    def __init__(self, config:DataTableConfig, rows:List[ExportRow]):
+        self._rows  = rows
+        self._store = _RowsConnector(config=config.StoreConfig)
+        super().__init__(config=config, fail_fast=False)
+    @property
+    def Connector(self) -> StorageConnector:
+        return self._store
+    def _availableIDs(self, id_type, filters) -> List[str]:
+        return []
+    def _availableDates(self, filters) -> Dict[str, datetime.datetime]:
+        return {}
+    def _availableVersions(self, mode, filters) -> List[SemanticVersion | str]:
+        return []
+    def _getEventRows(self, filters) -> List[Tuple]:
+        return self._rows
+    def _getFeatureRows(self, filters) -> List[Tuple]:
+        return []
+
+class _LegacyConversion:
+    """Mixin to make an interface convert rows the way `GetEventSet` did before the compiled decoders, one `_legacyFromRow` per row."""
+    def _eventsFromRows(self, rows:List[Tuple], schema:EventTableSchema, fallbacks:Map, lazy_payloads:bool=False) -> List[Event]:
+        return [_legacyFromRow(row=row, schema=schema, fallbacks=fallbacks) for row in rows]
+
+class _LegacyRowsInterface(_LegacyConversion, _RowsInterface):
+    pass
+
+class _LegacyCSVInterface(_LegacyConversion, CSVInterface):
+    pass
+
+def _tableConfig(schema_name:str, path:Path) -> DataTableConfig:
+    _store_cfg = FileStoreConfig(name="BenchmarkFile", location=path, file_credential=None)
+    return DataTableConfig(name="BenchmarkTable", store=_store_cfg, table_schema=schema_name, table_location=None)
+
+def _writeFile(schema:EventTableSchema, rows:List[ExportRow], path:Path) -> None:
+    with open(path, "w", encoding="utf-8") as _file:
+        _file.write("\t".join(schema.ColumnNames) + "\n")
+        for row in rows:
+            _file.write("\t".join(str(val) for val in row) + "\n")
+
+def _getEventSet(interface:Interface) -> int:
+    return len(interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={}))
+
+def _time(func:Callable[[EventTableSchema, List[ExportRow]], Any], schema:EventTableSchema, rows:List[ExportRow]) -> float:
+    return min(timeit.repeat(lambda : func(schema, rows), number=1, repeat=REPEATS))
+
+def main() -> None:
+    Logger.std_logger.setLevel(logging.ERROR)
+    _cases : List[Tuple[str, List[ExportRow]]] = [
+        ("OGD_EVENT_FILE",     _fileRows(ROW_COUNT)),
+        ("OPENGAMEDATA_MYSQL", _mysqlRows(ROW_COUNT)),
+    ]
+    for schema_name, rows in _cases:
+        _schema   = EventTableSchema.Load(schema_name=schema_name)
+        _legacy   = _time(_legacyDecode,   _schema, rows)
+        _compiled = _time(_compiledDecode, _schema, rows)
+        _legacy_from_row = _time(_legacyFromRows, _schema, rows)
+        _from_row        = _time(_fromRows,       _schema, rows)
+        _config = _tableConfig(schema_name=schema_name, path=Path("benchmark.tsv"))
+        _legacy_set = min(timeit.repeat(lambda : _getEventSet(_LegacyRowsInterface(config=_config, rows=rows)), number=1, repeat=REPEATS))
+        _event_set  = min(timeit.repeat(lambda : _getEventSet(_RowsInterface(config=_config, rows=rows)),       number=1, repeat=REPEATS))
+        print(f"{schema_name}, {len(rows)} rows:")
+        print(f"    ColumnValueFromRow decode : {_legacy:.3f}s")
+        print(f"    Compiled decode           : {_compiled:.3f}s ({_legacy / _compiled:.1f}x)")
+        print(f"    Legacy Event.FromRow      : {_legacy_from_row:.3f}s")
+        print(f"    Event.FromRow             : {_from_row:.3f}s ({_legacy_from_row / _from_row:.1f}x, {len(rows) / _from_row:,.0f} rows/s)")
+        print(f"    Legacy GetEventSet        : {_legacy_set:.3f}s")
+        print(f"    GetEventSet               : {_event_set:.3f}s ({_legacy_set / _event_set:.1f}x)")
+
+    # the same, but reading the rows from a file, to show how much of GetEventSet is spent outside of conversion.
+    _temp_dir = Path(tempfile.mkdtemp())
+    try:
+        _schema = EventTableSchema.Load(schema_name="OGD_EVENT_FILE")
+        _path   = _temp_dir / "BENCHMARK_events.tsv"
+        _writeFile(schema=_schema, rows=_fileRows(ROW_COUNT), path=_path)
+        _config = _tableConfig(schema_name="OGD_EVENT_FILE", path=_path)
+        _legacy_set = min(timeit.repeat(lambda : _getEventSet(_LegacyCSVInterface(config=_config, fail_fast=False, store=CSVConnector(config=_config.StoreConfig))), number=1, repeat=REPEATS))
+        _event_set  = min(timeit.repeat(lambda : _getEventSet(CSVInterface(config=_config, fail_fast=False, store=CSVConnector(config=_config.StoreConfig))),       number=1, repeat=REPEATS))
+        print(f"OGD_EVENT_FILE, {ROW_COUNT} rows, from a TSV file:")
+        print(f"    Legacy GetEventSet        : {_legacy_set:.3f}s")
+        print(f"    GetEventSet               : {_event_set:.3f}s ({_legacy_set / _event_set:.1f}x)")
+    finally:
+        shutil.rmtree(_temp_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark for JSON encoding and decoding with `JSONCodec`.
+
+Decodes event payloads with each installed backend, against the standard `json.loads`,
+and encodes BigQuery-style event params with `JSONCodec.Dumps`, against `json.dumps(..., sort_keys=True)`, which creates a new encoder on each call.
+Backends that are not installed are skipped; install `orjson`, `pysimdjson` or `msgspec` to include them.
+
+Run from the repository root with:
+```
+python -m tests.benchmarks.JSONCodecBenchmark
+```
+"""
+# import libraries
+import json
+import logging
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+# import ogd libraries.
+from ogd.common.utils.JSONCodec import JSONCodec
+from ogd.common.utils.Logger import Logger
+
+ROW_COUNT : int = 10000
+REPEATS   : int = 5
+
+def _eventData(count:int) -> List[str]:
+    """Event data in the style of an OGD event file, with a mix of numbers, strings and nested objects."""
+    return [
+        json.dumps({"x":i, "y":i*2.5, "name":"foo", "level":i % 5, "target":{"id":f"obj{i % 37}", "pos":[i % 10, i % 7]}, "success":i % 2 == 0})
+        for i in range(count)
+    ]
+
+def _eventParams(count:int) -> List[Dict[str, Any]]:
+    """Flattened event params, in the style of a Firebase table row from a BigQueryInterface."""
+    return [
+        {"ga_session_id":{"int_value":1700000000 + i // 100, "string_value":None, "double_value":None, "float_value":None},
+         "firebase_screen_class":{"int_value":None, "string_value":"UnityPlayerActivity", "double_value":None, "float_value":None},
+         "level":{"int_value":i % 5, "string_value":None, "double_value":None, "float_value":None}}
+        for i in range(count)
+    ]
+
+def _time(func:Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEATS))
+
+def main() -> None:
+    Logger.std_logger.setLevel(logging.ERROR)
+    _texts  = _eventData(ROW_COUNT)
+    _params = _eventParams(ROW_COUNT)
+
+    print(f"Decoding {ROW_COUNT} event data payloads:")
+    _baseline = _time(lambda : [json.loads(text) for text in _texts])
+    print(f"    json.loads                : {_baseline:.3f}s")
+    _decode_cases : List[Tuple[str, float]] = []
+    for backend in JSONCodec.AvailableBackends():
+        JSONCodec.SetBackend(backend)
+        _decode_cases.append((backend, _time(lambda : [JSONCodec.Loads(text) for text in _texts])))
+    JSONCodec.SetBackend(None)
+    for backend, elapsed in _decode_cases:
+        print(f"    JSONCodec.Loads ({backend:<8}): {elapsed:.3f}s ({_baseline / elapsed:.1f}x)")
+
+    print(f"Encoding {ROW_COUNT} event params with sorted keys:")
+    _baseline = _time(lambda : [json.dumps(params, sort_keys=True) for params in _params])
+    _codec    = _time(lambda : [JSONCodec.Dumps(params, sort_keys=True) for params in _params])
+    print(f"    json.dumps                : {_baseline:.3f}s")
+    print(f"    JSONCodec.Dumps           : {_codec:.3f}s ({_baseline / _codec:.1f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark for the memory use and construction time of the slotted `Event` and `Feature` models.
+
+Compares the slotted models against plain classes with the same attributes and constructor logic,
+stored in a per-instance `__dict__` as the models were before they declared `__slots__`.
+
+Run from the repository root with:
+```
+python -m tests.benchmarks.ModelSlotsBenchmark
+```
+"""
+# import libraries
+import gc
+import logging
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+# import ogd libraries.
+from ogd.common.models.events.Event import Event, EventSource
+from ogd.common.models.features.Feature import Feature
+from ogd.common.models.SemanticVersion import SemanticVersion
+from ogd.common.utils.Logger import Logger
+
+OBJECT_COUNT : int = 100000
+REPEATS      : int = 5
+
+class _DictGameData:
+    """GameData attributes held in a per-instance dict, as a baseline."""
+    def __init__(self, app_id, user_id, session_id):
+        self.app_id     = app_id
+        self.user_id    = user_id
+        self.session_id = session_id
+
+class _DictEvent(_DictGameData):
+    """Event attributes held in a per-instance dict, as a baseline."""
+    def __init__(self, app_id, user_id, session_id, app_version, app_branch, log_version, timestamp, time_offset,
+                 event_sequence_index, event_name, event_source, event_data, game_state, user_data):
+        super().__init__(app_id=app_id, user_id=user_id, session_id=session_id)
+        self.app_version          = app_version if app_version is not None else SemanticVersion(0)
+        self.app_branch           = app_branch  if app_branch  is not None else "main"
+        self.log_version          = log_version if log_version is not None else SemanticVersion(0)
+        self.timestamp            = timestamp
+        self.time_offset          = time_offset
+        self.event_sequence_index = event_sequence_index
+        self.event_name           = event_name
+        self.event_source         = event_source
+        self.event_data           = event_data
+        self.game_state           = game_state if game_state is not None else {}
+        self.user_data            = user_data if user_data is not None else {}
+        self._fingerprint         = None
+
+class _DictFeature(_DictGameData):
+    """Feature attributes held in a per-instance dict, as a baseline."""
+    def __init__(self, name, feature_type, game_unit, game_unit_index, app_id, user_id, session_id, subfeatures, values):
+        super().__init__(app_id=app_id, user_id=user_id, session_id=session_id)
+        self._name            = name
+        self._feature_type    = feature_type
+        self._game_unit       = game_unit
+        self._game_unit_index = game_unit_index
+        self._subfeatures     = subfeatures
+        self._values          = values
+
+_VERSION = SemanticVersion.FromString("1.2.3")
+_OFFSET  = timezone(timedelta(hours=-5))
+_START   = datetime(2024, 1, 1, 10, 0, 0)
+_DATA    : Dict[str, Any] = {"x":1, "y":2}
+
+def _eventArgs(i:int) -> Dict[str, Any]:
+    return {
+        "app_id":"AQUALAB", "user_id":"Player1", "session_id":"session1",
+        "app_version":_VERSION, "app_branch":"main", "log_version":_VERSION,
+        "timestamp":_START, "time_offset":_OFFSET, "event_sequence_index":i,
+        "event_name":"click", "event_source":EventSource.GAME, "event_data":_DATA,
+        "game_state":_DATA, "user_data":_DATA
+    }
+
+def _featureArgs(i:int) -> Dict[str, Any]:
+    return {
+        "name":"SessionDuration", "feature_type":"SessionDuration", "game_unit":None, "game_unit_index":None,
+        "app_id":"AQUALAB", "user_id":"Player1", "session_id":f"session{i}", "subfeatures":[], "values":[i]
+    }
+
+def _bytesPerObject(build:Callable[[], List[Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    _before = tracemalloc.get_traced_memory()[0]
+    _objects = build()
+    _after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (_after - _before) / len(_objects)
+
+def _time(build:Callable[[], List[Any]]) -> float:
+    return min(timeit.repeat(build, number=1, repeat=REPEATS))
+
+def main() -> None:
+    Logger.std_logger.setLevel(logging.ERROR)
+    _event_args   = [_eventArgs(i) for i in range(OBJECT_COUNT)]
+    _feature_args = [_featureArgs(i) for i in range(OBJECT_COUNT)]
+    _cases = [
+        ("Event",   lambda : [_DictEvent(**args) for args in _event_args],     lambda : [Event(**args) for args in _event_args]),
+        ("Feature", lambda : [_DictFeature(**args) for args in _feature_args], lambda : [Feature(**args) for args in _feature_args]),
+    ]
+    for name, dict_build, slot_build in _cases:
+        _dict_bytes = _bytesPerObject(dict_build)
+        _slot_bytes = _bytesPerObject(slot_build)
+        _dict_time  = _time(dict_build)
+        _slot_time  = _time(slot_build)
+        print(f"{name}, {OBJECT_COUNT} objects:")
+        print(f"    __dict__ memory : {_dict_bytes:.0f} bytes/object")
+        print(f"    __slots__ memory: {_slot_bytes:.0f} bytes/object ({_dict_bytes / _slot_bytes:.1f}x smaller)")
+        print(f"    __dict__ construction : {_dict_time:.3f}s")
+        print(f"    __slots__ construction: {_slot_time:.3f}s ({_dict_time / _slot_time:.1f}x)")
+
+if __name__ == '__main__':
+    main()
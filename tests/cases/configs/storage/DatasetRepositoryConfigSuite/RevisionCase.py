@@ -0,0 +1,68 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.datasets.DatasetSchema import DatasetSchema
+from ogd.common.storage.outerfaces.CSVOuterface import CSVOuterface
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.RevisionProvider import RevisionProvider
+# import locals
+from src.ogd.common.configs.storage.DatasetRepositoryConfig import DatasetRepositoryConfig
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="SchemaTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class RevisionCase(TestCase):
+    """DatasetRepositoryConfig test case for the revision given in the config, to record for exported datasets.
+
+    Fixture:
+    * An empty folder for the repository, with the `RevisionProvider` reset around each test.
+
+    Case Categories:
+    * Parsing
+        * Check the revision is parsed from the "OGD_REVISION" element, and is None when the element is missing.
+    * Exporting
+        * Check a `CSVOuterface` for the repository sets the configured revision as the `RevisionProvider` override,
+          so the metadata for a new dataset has that revision.
+    """
+    DATASET_ID = "TEST_20240101_to_20240131"
+
+    def setUp(self) -> None:
+        RevisionProvider.Reset()
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        RevisionProvider.Reset()
+        shutil.rmtree(self.temp_dir)
+
+    def _config(self, **elements) -> DatasetRepositoryConfig:
+        _elements = {"INDEXING" : {"LOCAL_DIR" : str(self.temp_dir)}, "datasets" : {}}
+        _elements.update(elements)
+        return DatasetRepositoryConfig.FromDict(name="TestRepository", unparsed_elements=_elements)
+
+    def test_OGDRevision(self):
+        self.assertEqual(self._config(OGD_REVISION="cfgrev1").OGDRevision, "cfgrev1")
+        self.assertIsNone(self._config().OGDRevision)
+
+    def test_OuterfaceOverride(self):
+        _out_cfg   = FileStoreConfig(name="OutFile", location=self.temp_dir / f"{RevisionCase.DATASET_ID}_all-events.tsv", file_credential=None)
+        _out_table = DataTableConfig(name="OutTable", store=_out_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _outerface = CSVOuterface(table_config=_out_table, export_modes={ExportMode.EVENTS}, repository=self._config(OGD_REVISION="cfgrev1"),
+                                  dataset_key=RevisionCase.DATASET_ID, with_separate_feature_files=False, with_zipping=False)
+        _outerface.Connector.Close()
+        self.assertEqual(RevisionProvider.Current(), "cfgrev1")
+        self.assertEqual(DatasetSchema.Default().OGDRevision, "cfgrev1")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# import libraries
+import logging
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.EventFilterCollection import EventFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.models.events.ColumnarEventSet import ColumnarEventSet
+from ogd.common.models.events.Event import Event, EventSource
+from ogd.common.models.events.EventSet import EventSet
+from ogd.common.models.SemanticVersion import SemanticVersion
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import LazyJSON
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="ColumnarEventSetTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class BasicCase(TestCase):
+    """ColumnarEventSet test case for conversion to and from events, and filtering.
+
+    Fixture:
+    * An `EventSet` of 30 events across 3 sessions, with alternating event names, a mix of game and generated events,
+      and both naive and timezone-aware timestamps.
+    * A `ColumnarEventSet` built from the `EventSet`.
+
+    Case Categories:
+    * Round-trip
+        * Check that events taken from the columnar set match the original events.
+        * Check that `EventLines` matches the `EventSet` output, both with and without a schema.
+        * Check that `LazyJSON` payloads are stored without being parsed, and come back as dicts.
+    * Access
+        * Check indexing by position and by event name, and the `GameEvents` subset.
+    * Filtering
+        * Check session, event name, and timestamp filters, in include and exclude modes.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _start = datetime(2024, 1, 1, 10, 0, 0)
+        _events = [
+            Event(
+                app_id="TEST", user_id=f"Player{i % 2}", session_id=f"session{i // 10}",
+                app_version=SemanticVersion.FromString("1.2"), app_branch="main", log_version="3",
+                timestamp=_start + timedelta(seconds=i) if i % 3 else (_start + timedelta(seconds=i)).replace(tzinfo=timezone(timedelta(hours=-5))),
+                time_offset=timezone(timedelta(hours=-5)), event_sequence_index=i % 10 if i != 7 else None,
+                event_name="click" if i % 2 == 0 else "hover",
+                event_source=EventSource.GAME if i % 5 else EventSource.GENERATED,
+                event_data={"i":i, "when":_start.isoformat()}, game_state={"level":i % 3}, user_data={}
+            )
+            for i in range(30)
+        ]
+        cls.event_set    = EventSet(events=_events, filters=DatasetFilterCollection())
+        cls.columnar_set = ColumnarEventSet.FromEventSet(cls.event_set)
+
+    def test_Length(self):
+        self.assertEqual(len(self.columnar_set), 30)
+
+    def test_RoundTrip(self):
+        for original, rebuilt in zip(self.event_set, self.columnar_set):
+            self.assertEqual(rebuilt.ColumnValues, original.ColumnValues)
+            self.assertEqual(rebuilt.Timestamp, original.Timestamp)
+            self.assertEqual(rebuilt.Timestamp.tzinfo, original.Timestamp.tzinfo)
+
+    def test_EventLines(self):
+        self.assertEqual(self.columnar_set.EventLines(schema=None), self.event_set.EventLines(schema=None))
+        _schema = EventTableSchema.Load(schema_name="OGD_EVENT_FILE")
+        self.assertEqual(self.columnar_set.EventLines(schema=_schema), self.event_set.EventLines(schema=_schema))
+
+    def test_LazyPayloads(self):
+        _original = self.event_set[0]
+        _lazy = Event(
+            app_id=_original.AppID, user_id=_original.UserID, session_id=_original.SessionID,
+            app_version=_original.AppVersion, app_branch=_original.AppBranch, log_version=_original.LogVersion,
+            timestamp=_original.Timestamp, time_offset=_original.TimeOffset, event_sequence_index=_original.EventSequenceIndex,
+            event_name=_original.EventName, event_source=_original.EventSource,
+            event_data=LazyJSON('{"i": 0, "when": "2024-01-01T10:00:00"}'), game_state=LazyJSON('{"level": 0}'), user_data={}
+        )
+        _columnar = ColumnarEventSet.FromEvents(events=[_lazy], filters=DatasetFilterCollection())
+        self.assertFalse(_lazy.EventData.IsParsed)
+        self.assertFalse(_lazy.GameState.IsParsed)
+        self.assertIsInstance(_columnar[0].EventData, dict)
+        self.assertEqual(_columnar[0].ColumnValues, _original.ColumnValues)
+        # each access decodes a fresh payload, so changes to a taken event are not reflected in the set.
+        _columnar[0].EventData["i"] = 100
+        self.assertEqual(_columnar[0].EventData["i"], 0)
+
+    def test_GetItem(self):
+        self.assertEqual(self.columnar_set[3].ColumnValues, self.event_set[3].ColumnValues)
+        self.assertEqual(self.columnar_set[-1].ColumnValues, self.event_set[-1].ColumnValues)
+        self.assertEqual(self.columnar_set["hover"].ColumnValues, self.event_set["hover"].ColumnValues)
+
+    def test_GameEvents(self):
+        self.assertEqual([event.ColumnValues for event in self.columnar_set.GameEvents],
+                         [event.ColumnValues for event in self.event_set.GameEvents])
+
+    def test_FilterSessions(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1"}))
+        )
+        _filtered = self.columnar_set.Filter(_filters)
+        self.assertEqual(len(_filtered), 10)
+        self.assertEqual(_filtered.SessionIDs, ["session1"])
+
+    def test_FilterEventNames(self):
+        _filters = DatasetFilterCollection(
+            event_filters=EventFilterCollection(event_name_filter=SetFilter(mode=FilterMode.EXCLUDE, set_elements={"click"}))
+        )
+        _filtered = self.columnar_set.Filter(_filters)
+        self.assertEqual(len(_filtered), 15)
+        self.assertEqual(_filtered.EventNames, ["hover"])
+
+    def test_FilterTimestamps(self):
+        _start = datetime(2024, 1, 1, 10, 0, 0)
+        _filters = DatasetFilterCollection(
+            sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=_start + timedelta(seconds=4), maximum=_start + timedelta(seconds=8))
+            )
+        )
+        _filtered = self.columnar_set.Filter(_filters)
+        # timezone-aware timestamps compare in UTC, so event 6, at 10:00:06-05:00, falls outside the range.
+        self.assertEqual([event.EventData["i"] for event in _filtered], [4, 5, 7, 8])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# import libraries
+import logging
+import unittest
+from datetime import datetime, timedelta
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.models.events.Event import Event, EventSource
+from ogd.common.models.events.EventSet import EventSet
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="EventSetTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+def _event(i:int, event_data:dict) -> Event:
+    return Event(
+        app_id="TEST", user_id="Player1", session_id=f"session{i // 10}",
+        app_version="1", app_branch="main", log_version="1",
+        timestamp=datetime(2024, 1, 1, 10, 0, 0) + timedelta(seconds=i), time_offset=None, event_sequence_index=i % 10,
+        event_name="click", event_source=EventSource.GAME, event_data=event_data, game_state={}, user_data={}
+    )
+
+class DeduplicateCase(TestCase):
+    """EventSet test case for removing duplicate events, as when merging overlapping requests.
+
+    Fixture:
+    * Two EventSets of events 0-19 and 10-29, built separately so the overlapping events are distinct objects.
+
+    Case Categories:
+    * Deduplication
+        * Check that merging the sets and deduplicating leaves each event once, in order.
+        * Check that events with a different payload, but the same identifying elements, count as duplicates.
+    """
+
+    def setUp(self) -> None:
+        self.first  = EventSet(events=[_event(i, {"i":i}) for i in range(0, 20)], filters=DatasetFilterCollection())
+        self.second = EventSet(events=[_event(i, {"i":i}) for i in range(10, 30)], filters=DatasetFilterCollection())
+
+    def test_Deduplicate_overlap(self):
+        _merged = (self.first + self.second).Deduplicate()
+        self.assertEqual(len(_merged), 30)
+        self.assertEqual([event.EventData["i"] for event in _merged], list(range(30)))
+
+    def test_Deduplicate_ignores_payload(self):
+        _merged = (self.first + [_event(5, {"i":"changed"})]).Deduplicate()
+        self.assertEqual(len(_merged), 20)
+        self.assertEqual(_merged[5].EventData, {"i":5})
+
+    def test_Deduplicate_distinct(self):
+        self.assertEqual(len(self.first.Deduplicate()), 20)
+
+if __name__ == '__main__':
+    unittest.main()
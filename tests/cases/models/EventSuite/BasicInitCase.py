@@ -1,4 +1,5 @@
 # import libraries
+import copy
 import datetime
 import logging
 from unittest import TestCase
@@ -76,6 +77,47 @@ class BasicInitCase(TestCase):
         self.assertIsInstance(self.event.AppVersion, str)
         self.assertEqual(self.event.AppVersion, "1.0")
 
+    def test_AppVersionString(self):
+        self.assertIsInstance(self.event.AppVersionString, str)
+        self.assertEqual(self.event.AppVersionString, "1.0")
+
+    def test_Slots(self):
+        """Check that Events keep their elements in slots, rather than a per-instance dict."""
+        self.assertFalse(hasattr(self.event, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.event.not_an_element = None
+
+    def test_Fingerprint(self):
+        """Check that the fingerprint is a fixed 64-bit value, the same in every process."""
+        self.assertEqual(self.event.Fingerprint, 9147383372526592849)
+
+    def test_Fingerprint_AfterSet(self):
+        """Check that setting an identifying element through its property changes the fingerprint, and setting a payload does not."""
+        _changes = {
+            "AppID"              : "JOWILDER",
+            "UserID"             : "BlueGiant",
+            "SessionID"          : "0987654321",
+            "AppVersion"         : "2.0",
+            "AppBranch"          : "dev",
+            "LogVersion"         : 4,
+            "Timestamp"          : datetime.datetime(year=2025, month=1, day=1, hour=10, minute=0, second=1),
+            "TimeOffset"         : datetime.timezone(datetime.timedelta(hours=3)),
+            "EventSequenceIndex" : 2,
+            "EventName"          : "session_end",
+            "EventSource"        : EventSource.GENERATED,
+        }
+        for prop, value in _changes.items():
+            with self.subTest(prop=prop):
+                _event = copy.copy(self.event)
+                self.assertEqual(_event.Fingerprint, self.event.Fingerprint)
+                setattr(_event, prop, value)
+                self.assertEqual(getattr(_event, prop), value)
+                self.assertNotEqual(_event.Fingerprint, self.event.Fingerprint)
+        _event = copy.copy(self.event)
+        _event.EventData = {"level":1}
+        self.assertEqual(_event.EventData, {"level":1})
+        self.assertEqual(_event.Fingerprint, self.event.Fingerprint)
+
     # TODO : tests for other props
 
     def test_ToRow_OGDMySQLFormat(self):
@@ -1,5 +1,6 @@
 # import libraries
 import datetime
+import json
 import logging
 from unittest import TestCase
 # import locals
@@ -7,7 +8,7 @@ from ogd.common.configs.TestConfig import TestConfig
 from ogd.common.models.events.Event import Event, EventSource
 from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
 from ogd.common.utils.Logger import Logger
-from ogd.common.utils.typing import Version
+from ogd.common.utils.typing import LazyJSON, Version
 # import locals
 from config.t_config import settings
 
@@ -40,4 +41,27 @@ class EmptyCase(TestCase):
             "3",             "UTC+02:00",  "GreenGiant",
             {},              {},           1
         )
-        self.assertEqual(_event.ColumnValues, _elems)
\ No newline at end of file
+        self.assertEqual(_event.ColumnValues, _elems)
+
+    def test_FromRow_TextPayloads(self):
+        """Test the FromRow function with event data and game state stored as JSON text, using the `OGD_EVENT_FILE` schema.
+
+        By default, the payloads are parsed to plain dicts, which can be encoded with `json.dumps`.
+        They are only kept as `LazyJSON` when `lazy_payloads` is set, in which case they are not parsed until read.
+        """
+        _schema = EventTableSchema.Load(schema_name="OGD_EVENT_FILE")
+        _row = (
+            "session0", "TEST", "2024-01-01T10:00:00", "click", '{"b": 1, "a": 2}', "GAME",
+            "1", "main", "1", "UTC+00:00", "Player0", "{}", '{"level": 3}', 0
+        )
+        _event = Event.FromRow(row=_row, schema=_schema)
+        self.assertIs(type(_event.EventData), dict)
+        self.assertEqual(json.dumps(_event.EventData), '{"a": 2, "b": 1}')
+        self.assertEqual(json.dumps(_event.GameState), '{"level": 3}')
+        _lazy = Event.FromRow(row=_row, schema=_schema, lazy_payloads=True)
+        self.assertIsInstance(_lazy.EventData, LazyJSON)
+        self.assertIsInstance(_lazy.GameState, LazyJSON)
+        self.assertFalse(_lazy.EventData.IsParsed)
+        self.assertEqual(_lazy.EventData.JSON, '{"b": 1, "a": 2}')
+        self.assertEqual(_lazy.EventData, _event.EventData)
+        self.assertEqual(_lazy.GameState, _event.GameState)
@@ -1,12 +1,14 @@
 # import libraries
 import logging
+import os
 import unittest
 from datetime import date
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, mock
 # import ogd libraries.
 from ogd.common.configs.TestConfig import TestConfig
 from ogd.common.models.DatasetKey import DatasetKey
+from ogd.common.utils.RevisionProvider import RevisionProvider
 from ogd.common.utils.Logger import Logger
 # import locals
 from src.ogd.common.schemas.datasets.DatasetSchema import DatasetSchema
@@ -28,6 +30,9 @@ class EmptyCase(TestCase):
         * Appropriate here since the fixture doesn't set up an object.
     * Parsing functions. 
         * We test these so as to get details of where loading fails.
+    * Default
+        * Check the default schema, as the metadata for a new dataset, has the revision of the running code.
+        * Check the default schema has an unknown revision when the running code has none.
     """
 
     @unittest.skip("Not Implemented")
@@ -45,3 +50,19 @@ class EmptyCase(TestCase):
         _schema = DatasetSchema.FromDict(name="available_buildings Schema", unparsed_elements=_dict)
         self.assertIsInstance(_schema.Name, str)
         self.assertEqual(_schema.Name, "available_buildings Schema")
+
+    def test_Default(self):
+        RevisionProvider.SetOverride("abc1234")
+        try:
+            self.assertEqual(DatasetSchema.Default().OGDRevision, "abc1234")
+        finally:
+            RevisionProvider.Reset()
+
+    def test_Default_noRevision(self):
+        _env = {key:val for key, val in os.environ.items() if key != RevisionProvider.ENV_VAR}
+        RevisionProvider.Reset()
+        try:
+            with mock.patch.dict(os.environ, _env, clear=True), mock.patch.object(RevisionProvider, "_lookUp", return_value=""):
+                self.assertEqual(DatasetSchema.Default().OGDRevision, "UNKNOWN REVISION")
+        finally:
+            RevisionProvider.Reset()
@@ -0,0 +1,96 @@
+# import libraries
+import datetime
+import logging
+import unittest
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from src.ogd.common.models.events.Event import Event
+from src.ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="SchemaTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class DecoderCase(TestCase):
+    """EventTableSchema test case for the compiled row decoder.
+
+    Fixture:
+    * Load the `OPENGAMEDATA_MYSQL` preset, which has single-column, list, dict, and null mappings.
+    * A hardcoded row matching the preset's columns.
+
+    Case Categories:
+    * Decoder functions
+        * Check that each compiled decoder gives the same value as `ColumnValueFromRow` with the same mapping.
+    * Batch decoders
+        * Check that the batch timestamp decoder parses the same timestamps as the row decoder.
+    * Caching
+        * Check that the decoder is only compiled once per schema.
+    * Type warnings
+        * Check that converting a row with `Event.FromRow` still reports decoded values of an unexpected type, as `ColumnValueFromRow` did.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_schema = EventTableSchema.Load(schema_name="OPENGAMEDATA_MYSQL")
+        cls.test_row = (
+            1, "1234567890", "Player1", '{"foo":"bar"}',
+            datetime.datetime(2024, 1, 1, 12, 30, 0), 123, "UTC-05:00", datetime.datetime(2024, 1, 1, 12, 30, 1),
+            "click", '{"x":1, "y":2}', "GAME", "null",
+            "1.2", "main", "3", 7,
+            "127.0.0.1", "Mozilla/5.0"
+        )
+
+    def test_Decoder_cached(self):
+        self.assertIs(self.test_schema.Decoder, self.test_schema.Decoder)
+
+    def test_Decoder_null_mapping(self):
+        self.assertIsNone(self.test_schema.Decoder.AppID)
+        self.assertIsNone(self.test_schema.Decoder.EventSource)
+
+    def test_Decoder_single_column(self):
+        _decoder = self.test_schema.Decoder
+        _map     = self.test_schema.Map
+        for decode, mapping in [
+            (_decoder.SessionID,          _map.SessionIDColumn),
+            (_decoder.UserID,             _map.UserIDColumn),
+            (_decoder.UserData,           _map.UserDataColumn),
+            (_decoder.TimeOffset,         _map.TimeOffsetColumn),
+            (_decoder.GameState,          _map.GameStateColumn),
+            (_decoder.AppVersion,         _map.AppVersionColumn),
+            (_decoder.LogVersion,         _map.LogVersionColumn),
+            (_decoder.EventSequenceIndex, _map.EventSequenceIndexColumn),
+        ]:
+            with self.subTest(mapping=mapping):
+                _expected = self.test_schema.ColumnValueFromRow(row=self.test_row, mapping=mapping, concatenator=".")
+                self.assertEqual(decode(self.test_row), _expected)
+
+    def test_Decoder_list_columns(self):
+        _expected = self.test_schema.ColumnValueFromRow(row=self.test_row, mapping=self.test_schema.Map.TimestampColumn, concatenator=".")
+        self.assertEqual(self.test_schema.Decoder.Timestamp(self.test_row), _expected)
+        self.assertEqual(self.test_schema.Decoder.Timestamp(self.test_row), "2024-01-01 12:30:00.123")
+
+    def test_Decoder_dict_columns(self):
+        _expected = self.test_schema.ColumnValueFromRow(row=self.test_row, mapping=self.test_schema.Map.EventDataColumn, concatenator=".")
+        _decoded  = self.test_schema.Decoder.EventData(self.test_row)
+        self.assertEqual(_decoded, _expected)
+        self.assertEqual(_decoded, {"x":1, "y":2, "server_time":datetime.datetime(2024, 1, 1, 12, 30, 1)})
+
+    def test_Decoder_batch_timestamps(self):
+        _rows = [self.test_row, self.test_row[:4] + (None,) + self.test_row[5:]]
+        _timestamps = self.test_schema.Decoder.Timestamps(_rows)
+        self.assertEqual(_timestamps[0], datetime.datetime(2024, 1, 1, 12, 30, 0, 123000))
+        self.assertIsNone(_timestamps[1])
+
+    def test_FromRow_type_warnings(self):
+        # the row's game state is "null", which decodes to None rather than the expected dict.
+        _before = self.test_schema._conversion_warnings["state"]
+        Event.FromRow(row=self.test_row, schema=self.test_schema)
+        self.assertEqual(self.test_schema._conversion_warnings["state"], _before + 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# import libraries
+import logging
+import threading
+import unittest
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.BigQueryConfig import BigQueryConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.storage.connectors.BigQueryClientRegistry import BigQueryClientRegistry
+from ogd.common.storage.connectors.BigQueryConnector import BigQueryConnector
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="BQClientRegistryTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class _FakeClient:
+    """Stand-in for a bigquery.Client, recording how it was built and whether it was closed."""
+    def __init__(self, credential_path, project):
+        self.credential_path = credential_path
+        self.project         = project
+        self.closed          = False
+
+    def close(self):
+        self.closed = True
+
+class ClientRegistryCase(TestCase):
+    """Testbed for the BigQueryClientRegistry class, using fake clients.
+
+    Fixture:
+    * A BigQueryClientRegistry whose factory creates fake clients.
+    * A BigQueryConfig for a test project and key file.
+
+    Case Categories:
+    * Sharing
+        * Check that clients are reused for the same key, from several threads, and kept separate for different keys.
+    * Lifetime
+        * Check that released clients stay open until cleared, and in-use clients survive a non-forced clear.
+    * Connector
+        * Check that BigQueryConnector gets its client from the registry, and returns it on close.
+    """
+
+    def setUp(self) -> None:
+        self.created  = []
+        self.registry = BigQueryClientRegistry(client_factory=self._createClient)
+        _elems = {
+            "DB_TYPE"    : "BIGQUERY",
+            "PROJECT_ID" : "test-project",
+            "PROJECT_KEY": "./config/test_key.json"
+        }
+        self.config = BigQueryConfig.FromDict(name="TEST_BQ", unparsed_elements=_elems)
+
+    def _createClient(self, credential_path, project):
+        ret_val = _FakeClient(credential_path=credential_path, project=project)
+        self.created.append(ret_val)
+        return ret_val
+
+    def test_SharedClient(self):
+        _first  = self.registry.Acquire(credential_path="key.json", project="proj")
+        _second = self.registry.Acquire(credential_path="key.json", project="proj")
+        self.assertIs(_first, _second)
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.registry.References(credential_path="key.json", project="proj"), 2)
+
+    def test_SeparateKeys(self):
+        _first  = self.registry.Acquire(credential_path="key.json", project="proj")
+        _second = self.registry.Acquire(credential_path="other.json", project="proj")
+        _third  = self.registry.Acquire(credential_path="key.json", project="other-proj")
+        self.assertEqual(len({id(_first), id(_second), id(_third)}), 3)
+        self.assertEqual(self.registry.ClientCount, 3)
+
+    def test_Threads(self):
+        _clients = []
+        _threads = [threading.Thread(target=lambda : _clients.append(self.registry.Acquire(credential_path="key.json", project="proj"))) for _ in range(8)]
+        for thread in _threads:
+            thread.start()
+        for thread in _threads:
+            thread.join()
+        self.assertEqual(len(self.created), 1)
+        self.assertTrue(all(client is self.created[0] for client in _clients))
+
+    def test_Lifetime(self):
+        _in_use  = self.registry.Acquire(credential_path="key.json", project="proj")
+        _unused  = self.registry.Acquire(credential_path="other.json", project="proj")
+        self.registry.Release(_unused)
+        self.assertFalse(_unused.closed)
+        self.assertIs(self.registry.Acquire(credential_path="other.json", project="proj"), _unused)
+        self.registry.Release(_unused)
+
+        self.registry.Clear()
+        self.assertTrue(_unused.closed)
+        self.assertFalse(_in_use.closed)
+        self.assertEqual(self.registry.ClientCount, 1)
+        self.registry.Clear(force=True)
+        self.assertTrue(_in_use.closed)
+        self.assertEqual(self.registry.ClientCount, 0)
+
+    def test_FactoryError(self):
+        def _fail(credential_path, project):
+            raise FileNotFoundError(credential_path)
+        _registry = BigQueryClientRegistry(client_factory=_fail)
+        self.assertIsNone(_registry.Acquire(credential_path="missing.json", project="proj"))
+        self.assertEqual(_registry.ClientCount, 0)
+
+    def test_Connector(self):
+        _connector = BigQueryConnector(config=self.config, registry=self.registry)
+        self.assertTrue(_connector.Open())
+        _client = _connector.Client
+        self.assertIsInstance(_client, _FakeClient)
+        self.assertEqual(_client.project, "test-project")
+        _other = BigQueryConnector(config=self.config, registry=self.registry)
+        _other.Open()
+        self.assertIs(_other.Client, _client)
+        _connector.Close()
+        _other.Close()
+        self.assertIsNone(_connector.Client)
+        self.assertFalse(_client.closed)
+        self.assertEqual(self.registry.References(credential_path=_client.credential_path, project="test-project"), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.ExportCheckpoint import ExportCheckpoint
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVConnectorTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class CheckpointCase(TestCase):
+    """CSVConnector test case for resuming an interrupted export from a checkpoint.
+
+    Fixture:
+    * A temporary folder, and rows for 4 sessions of 3 events each.
+
+    Case Categories:
+    * Resuming
+        * Check an export interrupted after a checkpoint, and resumed, gives the same file as an uninterrupted export.
+        * Check the sessions left to export are the ones after the checkpoint.
+        * Check a checkpoint that does not match the files is ignored.
+    * Zipping
+        * Check files are left unzipped while the export is unfinished, and zipped once the checkpoint is cleared.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.sessions = [f"session{i}" for i in range(4)]
+        self.header = ["session_id", "index"]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _connector(self, folder:Path, zipping:bool=False) -> CSVConnector:
+        folder.mkdir(exist_ok=True)
+        _config = FileStoreConfig.FromDict(name="OutFile", unparsed_elements={"PATH":str(folder / "TEST_20240101_abc1234_events.tsv")})
+        _connector = CSVConnector(config=_config, with_secondary_files={ExportMode.EVENTS}, with_zipping=zipping, with_checkpoints=True)
+        _connector.Open()
+        return _connector
+
+    def _writeSession(self, connector:CSVConnector, session_id:str, count:int=3) -> None:
+        connector.SecondaryWriters[ExportMode.EVENTS.name].WriteRows([[session_id, i] for i in range(count)])
+
+    def _events(self, folder:Path) -> str:
+        return (folder / "TEST_20240101_abc1234_game-events.tsv").read_text(encoding="utf-8")
+
+    def test_Resume(self):
+        _clean = self._connector(self.temp_dir / "clean")
+        _clean.SecondaryWriters[ExportMode.EVENTS.name].WriteRows([self.header])
+        for session_id in self.sessions:
+            self._writeSession(_clean, session_id)
+        _clean.Close()
+
+        _folder = self.temp_dir / "resumed"
+        _first = self._connector(_folder)
+        self.assertIsNone(_first.ResumedFrom)
+        _first.SecondaryWriters[ExportMode.EVENTS.name].WriteRows([self.header])
+        for count, session_id in enumerate(self.sessions[:2], start=1):
+            self._writeSession(_first, session_id)
+            _first.SaveCheckpoint(last_session=session_id, session_count=count)
+        # the run dies partway through the third session.
+        self._writeSession(_first, self.sessions[2], count=2)
+        _first.Close()
+
+        _second = self._connector(_folder)
+        self.assertIsNotNone(_second.ResumedFrom)
+        self.assertEqual(_second.ResumedFrom.LastSession, "session1")
+        self.assertEqual(_second.ResumedFrom.SessionCount, 2)
+        _remaining = _second.ResumedFrom.RemainingSessions(self.sessions)
+        self.assertEqual(_remaining, ["session2", "session3"])
+        for session_id in _remaining:
+            self._writeSession(_second, session_id)
+        _second.ClearCheckpoint()
+        _second.Close()
+
+        self.assertEqual(self._events(_folder), self._events(self.temp_dir / "clean"))
+        self.assertFalse(ExportCheckpoint.PathFor(_folder / "TEST_20240101_abc1234_events.tsv").exists())
+
+    def test_MismatchedCheckpoint(self):
+        _folder = self.temp_dir / "mismatched"
+        _first = self._connector(_folder)
+        self._writeSession(_first, "session0")
+        _first.SaveCheckpoint(last_session="session0", session_count=1)
+        _first.Close()
+        (_folder / "TEST_20240101_abc1234_game-events.tsv").write_text("", encoding="utf-8")
+
+        _second = self._connector(_folder)
+        self.assertIsNone(_second.ResumedFrom)
+        self._writeSession(_second, "session1")
+        _second.Close()
+        self.assertEqual(self._events(_folder), "session1\t0\nsession1\t1\nsession1\t2\n")
+
+    def test_Zipping(self):
+        _folder = self.temp_dir / "zipped"
+        _first = self._connector(_folder, zipping=True)
+        self._writeSession(_first, "session0")
+        _first.SaveCheckpoint(last_session="session0", session_count=1)
+        _first.Close()
+        self.assertTrue((_folder / "TEST_20240101_abc1234_game-events.tsv").is_file())
+        self.assertFalse((_folder / "TEST_20240101_abc1234_game-events.zip").exists())
+
+        _second = self._connector(_folder, zipping=True)
+        self._writeSession(_second, "session1")
+        _second.ClearCheckpoint()
+        _second.Close()
+        self.assertFalse((_folder / "TEST_20240101_abc1234_game-events.tsv").exists())
+        self.assertTrue((_folder / "TEST_20240101_abc1234_game-events.zip").is_file())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# import libraries
+import io
+import logging
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.DelimitedLineWriter import DelimitedLineWriter
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVConnectorTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class LineWriterCase(TestCase):
+    """CSVConnector test case for the buffered line writers of its files.
+
+    Fixture:
+    * A temporary folder, and a set of rows with tabs and newlines in some fields.
+
+    Case Categories:
+    * Formatting
+        * Check fields are escaped the same way as before, one line per row.
+    * Buffering
+        * Check lines stay in the buffer until a block is full, and `Tell` accounts for buffered lines.
+    * Connector
+        * Check lines written through the connector's writers reach the files, with and without streaming compression.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.rows = [[f"session{i // 10}", i, "multi\nline" if i % 3 == 0 else "tab\there", None] for i in range(100)]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_FormatLine(self):
+        _writer = DelimitedLineWriter(file=io.StringIO())
+        self.assertEqual(_writer.FormatLine(["a\tb", "c\nd", 3, None]), "a   b\tc d\t3\tNone\n")
+        _narrow = DelimitedLineWriter(file=io.StringIO(), delimiter=",", tab_width=1)
+        self.assertEqual(_narrow.FormatLine(["a\tb", 1.5]), "a b,1.5\n")
+
+    def test_Buffering(self):
+        _file = io.StringIO()
+        _writer = DelimitedLineWriter(file=_file, block_size=64)
+        _writer.WriteLines(["0123456789\n"] * 5)
+        self.assertEqual(_file.getvalue(), "")
+        _writer.WriteLines(["0123456789\n"])
+        self.assertEqual(len(_file.getvalue()), 66)
+        _writer.WriteLines(["x\n"])
+        self.assertEqual(_writer.Tell(), 68)
+        self.assertEqual(len(_file.getvalue()), 68)
+
+    def _export(self, folder:Path, stream:bool) -> Path:
+        folder.mkdir()
+        _config = FileStoreConfig.FromDict(name="OutFile", unparsed_elements={"PATH":str(folder / "TEST_20240101_abc1234_events.tsv")})
+        _connector = CSVConnector(config=_config, with_secondary_files={ExportMode.EVENTS}, with_zipping=stream, stream_compression=stream)
+        _connector.Open()
+        _writer = _connector.SecondaryWriters[ExportMode.EVENTS.name]
+        self.assertIsNotNone(_writer)
+        _writer.WriteRows(self.rows)
+        _connector.Close()
+        return folder / "TEST_20240101_abc1234_game-events.tsv"
+
+    def test_ConnectorWriters(self):
+        _expected = "".join(DelimitedLineWriter(file=io.StringIO()).FormatLines(self.rows))
+        _plain = self._export(self.temp_dir / "plain", stream=False)
+        self.assertEqual(_plain.read_text(encoding="utf-8"), _expected)
+        self._export(self.temp_dir / "streamed", stream=True)
+        with zipfile.ZipFile(self.temp_dir / "streamed" / "TEST_20240101_abc1234_game-events.zip") as _zip:
+            self.assertEqual(_zip.read("TEST_20240101/TEST_20240101_abc1234_game-events.tsv").decode("utf-8"), _expected)
+
+if __name__ == '__main__':
+    unittest.main()
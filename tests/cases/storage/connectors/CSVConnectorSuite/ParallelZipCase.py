@@ -0,0 +1,76 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.models.features.AggregationMode import AggregationMode
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVConnectorTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class ParallelZipCase(TestCase):
+    """CSVConnector test case for zipping the output files in parallel when the connector is closed.
+
+    Fixture:
+    * A connector with zipping on and two zip workers, writing a primary file and several secondary files, each with its own lines.
+
+    Case Categories:
+    * Zipping
+        * Check each file ends up in its own zip, with its own contents, and the plain files are removed.
+    * Reporting
+        * Check there is a report for each zip, with sizes matching the files.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "README.md").write_text("readme", encoding="utf-8")
+        _config = FileStoreConfig(name="OutFile", location=self.temp_dir / "TEST_20240101_abc1234_events.tsv", file_credential=None)
+        self.connector = CSVConnector(config=_config, with_secondary_files={ExportMode.DETECTORS, AggregationMode.PLAYER, AggregationMode.POPULATION},
+                                      with_zipping=True, zip_workers=2)
+        self.connector.Open()
+        self.contents = {}
+        for name, file in self.connector.SecondaryFiles.items():
+            if file is not None:
+                self.contents[name] = "".join(f"{name}\t{i}\n" for i in range(2000))
+                file.write(self.contents[name])
+        self.connector.File.write("primary\n")
+        self.connector.Close()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_Zipping(self):
+        self.assertEqual([path.name for path in self.temp_dir.iterdir() if path.suffix == ".tsv"], [])
+        for name, contents in self.contents.items():
+            with self.subTest(name=name):
+                _suffix = CSVConnector._SECONDARY_FILE_SUFFIXES[name]
+                with zipfile.ZipFile(self.temp_dir / f"TEST_20240101_abc1234_{_suffix}.zip") as _zip:
+                    self.assertEqual(_zip.read(f"TEST_20240101/TEST_20240101_abc1234_{_suffix}.tsv").decode("utf-8"), contents)
+                    self.assertEqual(_zip.read("TEST_20240101/README.md"), b"readme")
+
+    def test_Reports(self):
+        _reports = self.connector.ZipReports
+        self.assertEqual(len(_reports), len(self.contents) + 1)
+        for name, report in _reports.items():
+            with self.subTest(name=name):
+                self.assertEqual(report.ZippedBytes, (self.temp_dir / name).stat().st_size)
+                self.assertGreaterEqual(report.Seconds, 0)
+        _players = _reports["TEST_20240101_abc1234_player-features.zip"]
+        self.assertEqual(_players.RawBytes, len(self.contents[AggregationMode.PLAYER.name]))
+        self.assertLess(_players.Ratio, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
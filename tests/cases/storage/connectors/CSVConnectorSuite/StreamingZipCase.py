@@ -0,0 +1,106 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.StreamingZipWriter import StreamingZipWriter
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVConnectorTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class StreamingZipCase(TestCase):
+    """CSVConnector test case for compressing files as they are written.
+
+    Fixture:
+    * A temporary folder with a README, and a set of lines to write to a game events file.
+
+    Case Categories:
+    * Config
+        * Check the compression level is parsed from a config dictionary, and defaults to 6.
+    * Streaming
+        * Check a streaming connector produces the same zip contents as a connector that zips at close time, without leaving plain files behind.
+        * Check the writer reports uncompressed positions, and refuses writes after closing.
+        * Check the game events zip of a previous export is replaced, as when zipping at close time.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "README.md").write_text("readme", encoding="utf-8")
+        self.lines = [f"session{i // 100}\tevent{i}\t{'x' * (i % 50)}\n" for i in range(5000)]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _export(self, folder:Path, stream:bool, existing_meta:Optional[Dict]=None) -> None:
+        folder.mkdir(exist_ok=True)
+        shutil.copyfile(self.temp_dir / "README.md", folder / "README.md")
+        _config = FileStoreConfig.FromDict(name="OutFile", unparsed_elements={"PATH":str(folder / "TEST_20240101_abc1234_events.tsv"), "COMPRESSION_LEVEL":1})
+        _connector = CSVConnector(config=_config, with_secondary_files={ExportMode.EVENTS}, with_zipping=True, stream_compression=stream, existing_meta=existing_meta)
+        _connector.Open()
+        _events = _connector.SecondaryFiles[ExportMode.EVENTS.name]
+        _events.write("session_id\tevent_name\tdata\n")
+        _events.writelines(self.lines)
+        _connector.File.write("primary\n")
+        _connector.Close()
+
+    def test_CompressionLevel(self):
+        _config = FileStoreConfig.FromDict(name="OutFile", unparsed_elements={"PATH":"./data/TEST.tsv", "COMPRESSION_LEVEL":9})
+        self.assertEqual(_config.CompressionLevel, 9)
+        _default = FileStoreConfig.FromDict(name="OutFile", unparsed_elements={"PATH":"./data/TEST.tsv"})
+        self.assertEqual(_default.CompressionLevel, 6)
+
+    def test_MatchesZipAtClose(self):
+        self._export(self.temp_dir / "streamed", stream=True)
+        self._export(self.temp_dir / "zipped", stream=False)
+        for name in ["TEST_20240101_abc1234_game-events.zip", "TEST_20240101_abc1234_events.zip"]:
+            with self.subTest(name=name):
+                with zipfile.ZipFile(self.temp_dir / "streamed" / name) as streamed, zipfile.ZipFile(self.temp_dir / "zipped" / name) as zipped:
+                    self.assertEqual(sorted(streamed.namelist()), sorted(zipped.namelist()))
+                    for entry in zipped.namelist():
+                        self.assertEqual(streamed.read(entry), zipped.read(entry))
+        # streaming should leave the same files behind as zipping at close, with no plain files.
+        self.assertEqual(sorted(path.name for path in (self.temp_dir / "streamed").iterdir()),
+                         sorted(path.name for path in (self.temp_dir / "zipped").iterdir()))
+
+    def test_ExistingMeta(self):
+        for folder, stream in [(self.temp_dir / "streamed", True), (self.temp_dir / "zipped", False)]:
+            with self.subTest(stream=stream):
+                folder.mkdir()
+                _old_zip = folder / "TEST_20240101_old9999_game-events.zip"
+                with zipfile.ZipFile(_old_zip, "w") as _zip:
+                    _zip.writestr("old.tsv", "old\n")
+                self._export(folder, stream=stream, existing_meta={"game_events_file":str(_old_zip)})
+                self.assertFalse(_old_zip.exists())
+                with zipfile.ZipFile(folder / "TEST_20240101_abc1234_game-events.zip") as _zip:
+                    self.assertNotIn("old.tsv", _zip.namelist())
+        self.assertEqual(sorted(path.name for path in (self.temp_dir / "streamed").iterdir()),
+                         sorted(path.name for path in (self.temp_dir / "zipped").iterdir()))
+
+    def test_Writer(self):
+        _writer = StreamingZipWriter(zip_path=self.temp_dir / "out.zip", path_in_zip="out.tsv", compression_level=1)
+        _writer.write("é\n")
+        self.assertEqual(_writer.tell(), 3)
+        _writer.writelines(self.lines)
+        _writer.close(extra_files=[(self.temp_dir / "README.md", "README.md")])
+        with self.assertRaises(ValueError):
+            _writer.write("late\n")
+        with zipfile.ZipFile(self.temp_dir / "out.zip") as _zip:
+            self.assertEqual(_zip.read("out.tsv").decode("utf-8"), "é\n" + "".join(self.lines))
+            self.assertEqual(_zip.read("README.md"), b"readme")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+# import libraries
+import logging
+import threading
+import unittest
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.MySQLConfig import MySQLConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.storage.connectors.MySQLConnectionPool import MySQLConnectionPool
+from ogd.common.storage.connectors.MySQLConnector import MySQLConnector
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="MySQLConnectionPoolTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class _FakeConnection:
+    """Stand-in for a MySQLConnection, tracking the calls the pool makes on it."""
+    def __init__(self, host, port):
+        self.host           = host
+        self.port           = port
+        self.connected      = True
+        self.unread_result  = False
+        self.in_transaction = False
+        self.rolled_back    = False
+
+    def is_connected(self):
+        return self.connected
+
+    def consume_results(self):
+        self.unread_result = False
+
+    def rollback(self):
+        self.rolled_back    = True
+        self.in_transaction = False
+
+    def cursor(self, buffered=None):
+        return _FakeCursor()
+
+    def close(self):
+        self.connected = False
+
+class _FakeCursor:
+    def close(self):
+        pass
+
+class _FakeTunnel:
+    """Stand-in for an SSHTunnelForwarder."""
+    def __init__(self):
+        self.local_bind_port = 40000
+        self.is_active       = True
+
+    def stop(self):
+        self.is_active = False
+
+class ConnectionPoolCase(TestCase):
+    """Testbed for the MySQLConnectionPool class, using fake connections and tunnels.
+
+    Fixture:
+    * A MySQLConnectionPool with a max size of 2, whose factories create fake connections and tunnels.
+    * A direct config, and two SSH configs for different databases behind the same SSH host.
+
+    Case Categories:
+    * Reuse
+        * Check that released connections are reused, and unhealthy ones are replaced.
+    * Limits
+        * Check that the pool waits for a released connection when full, and times out.
+        * Check that idle connections are evicted after the idle timeout.
+    * Tunnels
+        * Check that SSH tunnels are shared, and stopped when no connection uses them.
+    * Connector
+        * Check that MySQLConnector borrows from and returns to the pool.
+        * Check that a connection dropped while borrowed by a MySQLConnector gives up its place in the pool when closed or reopened.
+    """
+
+    def setUp(self) -> None:
+        self.connections = []
+        self.tunnels     = []
+        self.pool = MySQLConnectionPool(max_size=2, idle_timeout=60, acquire_timeout=0.1,
+                                        connection_factory=self._connect, tunnel_factory=self._openTunnel)
+        self.direct_config = MySQLConfig.FromDict(name="DirectConfig", unparsed_elements={
+            "DB_HOST" : "127.0.0.1", "DB_PORT" : 3306, "DB_USER" : "user", "DB_PASS" : "pass"
+        })
+        _ssh = { "SSH_HOST" : "ssh.example.com", "SSH_USER" : "user", "SSH_PASS" : "pass", "SSH_PORT" : 22 }
+        self.ssh_config = MySQLConfig.FromDict(name="SSHConfig", unparsed_elements={
+            "DB_HOST" : "db.example.com", "DB_PORT" : 3306, "DB_USER" : "user", "DB_PASS" : "pass", "SSH_CONFIG" : dict(_ssh)
+        })
+        self.other_ssh_config = MySQLConfig.FromDict(name="OtherSSHConfig", unparsed_elements={
+            "DB_HOST" : "db.example.com", "DB_PORT" : 3306, "DB_USER" : "other", "DB_PASS" : "pass", "SSH_CONFIG" : dict(_ssh)
+        })
+
+    def _connect(self, config, host, port):
+        ret_val = _FakeConnection(host=host, port=port)
+        self.connections.append(ret_val)
+        return ret_val
+
+    def _openTunnel(self, config):
+        ret_val = _FakeTunnel()
+        self.tunnels.append(ret_val)
+        return ret_val
+
+    def test_Reuse(self):
+        _conn = self.pool.Acquire(self.direct_config)
+        self.assertIsNotNone(_conn)
+        self.assertEqual((_conn.host, _conn.port), ("127.0.0.1", 3306))
+        self.pool.Release(self.direct_config, _conn)
+        self.assertIs(self.pool.Acquire(self.direct_config), _conn)
+        self.assertEqual(len(self.connections), 1)
+
+    def test_ResetOnRelease(self):
+        _conn = self.pool.Acquire(self.direct_config)
+        _conn.unread_result  = True
+        _conn.in_transaction = True
+        self.pool.Release(self.direct_config, _conn)
+        self.assertFalse(_conn.unread_result)
+        self.assertTrue(_conn.rolled_back)
+
+    def test_HealthCheck(self):
+        _conn = self.pool.Acquire(self.direct_config)
+        self.pool.Release(self.direct_config, _conn)
+        _conn.connected = False
+        _replacement = self.pool.Acquire(self.direct_config)
+        self.assertIsNot(_replacement, _conn)
+        self.assertEqual(self.pool.ConnectionCount(self.direct_config), 1)
+
+    def test_MaxSize(self):
+        _first  = self.pool.Acquire(self.direct_config)
+        _second = self.pool.Acquire(self.direct_config)
+        self.assertIsNotNone(_second)
+        self.assertIsNone(self.pool.Acquire(self.direct_config))
+        # a waiting thread gets the connection as soon as it is released.
+        self.pool._acquire_timeout = 5
+        _result = []
+        _waiter = threading.Thread(target=lambda : _result.append(self.pool.Acquire(self.direct_config)))
+        _waiter.start()
+        self.pool.Release(self.direct_config, _first)
+        _waiter.join()
+        self.assertIs(_result[0], _first)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_IdleEviction(self):
+        _conn = self.pool.Acquire(self.direct_config)
+        self.pool.Release(self.direct_config, _conn)
+        self.assertEqual(self.pool.IdleCount(self.direct_config), 1)
+        self.pool._idle_timeout = 0
+        self.pool._evictIdle()
+        self.assertEqual(self.pool.IdleCount(self.direct_config), 0)
+        self.assertEqual(self.pool.ConnectionCount(self.direct_config), 0)
+        self.assertFalse(_conn.connected)
+
+    def test_SharedTunnel(self):
+        _first  = self.pool.Acquire(self.ssh_config)
+        _second = self.pool.Acquire(self.other_ssh_config)
+        self.assertEqual(len(self.tunnels), 1)
+        self.assertEqual(self.pool.TunnelCount, 1)
+        self.assertEqual((_first.host, _first.port), ("db.example.com", 40000))
+        self.pool.Release(self.ssh_config, _first, discard=True)
+        self.assertTrue(self.tunnels[0].is_active)
+        self.pool.Release(self.other_ssh_config, _second)
+        self.pool.Clear()
+        self.assertFalse(self.tunnels[0].is_active)
+        self.assertEqual(self.pool.TunnelCount, 0)
+
+    def test_Connector(self):
+        _connector = MySQLConnector(config=self.direct_config, pool=self.pool)
+        self.assertTrue(_connector.Open())
+        _conn = _connector.Connection
+        self.assertIsNotNone(_connector.Cursor)
+        _connector.Close()
+        self.assertIsNone(_connector.Connection)
+        self.assertTrue(_conn.connected)
+        self.assertEqual(self.pool.IdleCount(self.direct_config), 1)
+        # a second connector to the same database reuses the connection.
+        _other = MySQLConnector(config=self.direct_config, pool=self.pool)
+        _other.Open()
+        self.assertIs(_other.Connection, _conn)
+        _other.Close()
+
+    def test_Connector_dropped(self):
+        _connector = MySQLConnector(config=self.direct_config, pool=self.pool)
+        _connector.Open()
+        _dropped = _connector.Connection
+        _dropped.connected = False
+        self.assertFalse(_connector.IsOpen)
+        _connector.Close()
+        self.assertIsNone(_connector.Connection)
+        self.assertEqual(self.pool.ConnectionCount(self.direct_config), 0)
+        self.assertEqual(self.pool.IdleCount(self.direct_config), 0)
+        # reopening after a drop also gives up the old place, so the pool never fills with dropped connections.
+        for _ in range(3):
+            self.assertTrue(_connector.Open())
+            _connector.Connection.connected = False
+        self.assertEqual(self.pool.ConnectionCount(self.direct_config), 1)
+        _connector.Close()
+        self.assertEqual(self.pool.ConnectionCount(self.direct_config), 0)
+        self.assertEqual(len(self.connections), 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# import libraries
+import json
+import logging
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.storage.RepositoryIndexingConfig import RepositoryIndexingConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.schemas.locations.DirectoryLocationSchema import DirectoryLocationSchema
+from ogd.common.storage.connectors.RepositoryIndexStore import RepositoryIndexStore
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="RepositoryIndexStoreTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class ShardedIndexCase(TestCase):
+    """RepositoryIndexStore test case for a repository folder with an existing `file_list.json`.
+
+    Fixture:
+    * A temporary repository folder, with a `file_list.json` holding a CONFIG element and datasets for two games.
+
+    Case Categories:
+    * Reading
+        * Check reads before any update come from `file_list.json`, without writing anything to the repository folder.
+        * Check the index is split into shards on the first update, and a game's datasets are then read from its shard.
+        * Check cached shards are re-read after the shard file changes.
+        * Check changing the returned metadata does not change later reads.
+        * Check an edit to `file_list.json` made after it was split is read, rather than overwritten by the next update.
+    * Updating
+        * Check an update merges with the existing dataset metadata, and leaves other games unchanged in `file_list.json`.
+        * Check concurrent updates are all kept.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.original = {
+            "CONFIG" : {"files_base" : "https://example.org/", "templates_base" : "https://example.org/templates"},
+            "GAME_A" : {"GAME_A_20240101_to_20240131" : {"sessions_file" : "a_sessions.zip", "sessions" : 10}},
+            "GAME_B" : {"GAME_B_20240101_to_20240131" : {"sessions_file" : "b_sessions.zip", "sessions" : 20}}
+        }
+        (self.temp_dir / "file_list.json").write_text(json.dumps(self.original, indent=4), encoding="utf-8")
+        _indexing = RepositoryIndexingConfig(
+            name="TestIndexing",
+            local_dir=DirectoryLocationSchema(name="TestDir", folder_path=self.temp_dir, other_elements={}),
+            remote_url="https://example.org/",
+            templates_url="https://example.org/templates"
+        )
+        self.store = RepositoryIndexStore(indexing=_indexing)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _index(self):
+        return json.loads((self.temp_dir / "file_list.json").read_text(encoding="utf-8"))
+
+    def test_Read(self):
+        self.assertEqual(self.store.GameDatasets(game_id="GAME_A"), self.original["GAME_A"])
+        self.assertEqual(self.store.DatasetMeta(game_id="GAME_B", dataset_id="GAME_B_20240101_to_20240131"), self.original["GAME_B"]["GAME_B_20240101_to_20240131"])
+        self.assertIsNone(self.store.DatasetMeta(game_id="GAME_C", dataset_id="GAME_C_20240101_to_20240131"))
+        self.assertEqual(self.store.Config(), self.original["CONFIG"])
+        self.assertEqual([path.name for path in self.temp_dir.iterdir()], ["file_list.json"])
+
+    def test_ReadSharded(self):
+        self.store.UpdateDataset(game_id="GAME_C", dataset_id="GAME_C_20240101_to_20240131", update=lambda existing : {"sessions" : 1})
+        self.assertEqual(sorted(path.name for path in self.store.ShardFolder.iterdir()), ["CONFIG.json", "GAME_A.json", "GAME_B.json", "GAME_C.json"])
+        # write a different index into the shard, to check it is the shard that gets read.
+        (self.store.ShardFolder / "GAME_A.json").write_text(json.dumps({"GAME_A_sharded" : {"sessions" : 1}}), encoding="utf-8")
+        self.assertEqual(self.store.GameDatasets(game_id="GAME_A"), {"GAME_A_sharded" : {"sessions" : 1}})
+        self.assertEqual(self.store.Config(), self.original["CONFIG"])
+
+    def test_CacheInvalidation(self):
+        self.store.UpdateDataset(game_id="GAME_C", dataset_id="GAME_C_20240101_to_20240131", update=lambda existing : {"sessions" : 1})
+        self.store.GameDatasets(game_id="GAME_A")
+        (self.store.ShardFolder / "GAME_A.json").write_text(json.dumps({"GAME_A_new" : {"sessions" : 1, "extra" : True}}), encoding="utf-8")
+        self.assertEqual(list(self.store.GameDatasets(game_id="GAME_A").keys()), ["GAME_A_new"])
+
+    def test_ReturnsCopies(self):
+        self.store.GameDatasets(game_id="GAME_A")["GAME_A_20240101_to_20240131"]["sessions"] = 99
+        self.store.Config()["files_base"] = None
+        self.assertEqual(self.store.GameDatasets(game_id="GAME_A"), self.original["GAME_A"])
+        self.assertEqual(self.store.Config(), self.original["CONFIG"])
+        _meta = self.store.UpdateDataset(game_id="GAME_A", dataset_id="GAME_A_new", update=lambda existing : {"sessions" : 1})
+        _meta["sessions"] = 99
+        self.assertEqual(self.store.DatasetMeta(game_id="GAME_A", dataset_id="GAME_A_new"), {"sessions" : 1})
+
+    def test_ExternalEdit(self):
+        self.store.UpdateDataset(game_id="GAME_C", dataset_id="GAME_C_20240101_to_20240131", update=lambda existing : {"sessions" : 1})
+        self.store.GameDatasets(game_id="GAME_A")
+        _edited = dict(self.original)
+        _edited["GAME_A"] = {"GAME_A_20240201_to_20240229" : {"sessions" : 5}}
+        del _edited["GAME_B"]
+        (self.temp_dir / "file_list.json").write_text(json.dumps(_edited, indent=2), encoding="utf-8")
+        self.assertEqual(self.store.GameDatasets(game_id="GAME_A"), _edited["GAME_A"])
+        self.assertEqual(self.store.GameDatasets(game_id="GAME_B"), {})
+        self.store.UpdateDataset(game_id="GAME_C", dataset_id="GAME_C_20240101_to_20240131", update=lambda existing : {"sessions" : 1})
+        _index = self._index()
+        self.assertEqual(list(_index.keys()), ["CONFIG", "GAME_A", "GAME_C"])
+        self.assertEqual(_index["GAME_A"], _edited["GAME_A"])
+
+    def test_Update(self):
+        def _update(existing):
+            return {"sessions" : 11, "sessions_file" : existing.get("sessions_file")}
+        _meta = self.store.UpdateDataset(game_id="GAME_A", dataset_id="GAME_A_20240101_to_20240131", update=_update)
+        self.assertEqual(_meta, {"sessions" : 11, "sessions_file" : "a_sessions.zip"})
+        _index = self._index()
+        self.assertEqual(list(_index.keys()), ["CONFIG", "GAME_A", "GAME_B"])
+        self.assertEqual(_index["GAME_A"]["GAME_A_20240101_to_20240131"], _meta)
+        self.assertEqual(_index["GAME_B"], self.original["GAME_B"])
+
+    def test_ConcurrentUpdates(self):
+        _ids = [f"GAME_C_{i:02d}" for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda dataset_id : self.store.UpdateDataset(game_id="GAME_C", dataset_id=dataset_id, update=lambda existing : {"sessions" : 1}), _ids))
+        self.assertEqual(sorted(self._index()["GAME_C"].keys()), _ids)
+
+if __name__ == '__main__':
+    unittest.main()
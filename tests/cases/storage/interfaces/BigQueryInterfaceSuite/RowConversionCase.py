@@ -0,0 +1,69 @@
+# import libraries
+import json
+import logging
+import unittest
+from datetime import datetime, timezone
+from unittest import TestCase
+# import 3rd-party libraries
+from google.cloud.bigquery.table import Row
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.models.events.Event import Event
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.interfaces.BigQueryInterface import BigQueryInterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="BQTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class RowConversionCase(TestCase):
+    """Testbed for flattening BigQuery result rows, with no connection to BigQuery.
+
+    Fixture:
+    * A hand-made row of results, in the style of a Firebase events table, with nested event params and device records.
+
+    Case Categories:
+    * Flattening
+        * Check nested records are given as dicts with sorted keys, equal to encoding them as sorted JSON and decoding again.
+        * Check plain values, including datetimes, are passed through as-is.
+    * Decoding
+        * Check the flattened row can be made into an Event with the Firebase schema.
+    """
+    COLUMNS = ["event_name", "event_params", "device", "platform", "timestamp", "app_version", "log_version", "session_id", "fd_user_id"]
+
+    def setUp(self) -> None:
+        self.params = [
+            {"key":"level", "value":{"string_value":None, "int_value":3,    "float_value":None, "double_value":None}},
+            {"key":"area",  "value":{"string_value":"x",  "int_value":None, "float_value":None, "double_value":None}},
+        ]
+        self.device    = {"web_info":{"hostname":"host", "browser":"firefox"}, "category":"mobile"}
+        self.timestamp = datetime(2024, 1, 1, 10, 30, tzinfo=timezone.utc)
+        values = ("click", self.params, self.device, "ANDROID", self.timestamp, "1.0", 2, 123, "player1")
+        self.row = Row(values, {name:i for i, name in enumerate(RowConversionCase.COLUMNS)})
+
+    def test_Flattening(self):
+        _flat = BigQueryInterface._eventRowFromResult(self.row)
+        _expected_params = json.loads(json.dumps({param['key']:param['value'] for param in self.params}, sort_keys=True))
+        _expected_device = json.loads(json.dumps(self.device, sort_keys=True))
+        self.assertEqual(len(_flat), len(RowConversionCase.COLUMNS))
+        self.assertEqual(_flat[1], _expected_params)
+        self.assertEqual(str(_flat[1]), str(_expected_params))
+        self.assertEqual(str(_flat[2]), str(_expected_device))
+        self.assertIs(_flat[4], self.timestamp)
+        self.assertEqual(_flat[8], "player1")
+        self.assertEqual(list(BigQueryInterface._eventRowsFromResults([self.row, self.row])), [_flat, _flat])
+
+    def test_Decoding(self):
+        _schema = EventTableSchema.Load(schema_name="FIREBASE")
+        _event  = Event.FromRow(row=BigQueryInterface._eventRowFromResult(self.row), schema=_schema)
+        self.assertEqual(_event.EventName, "click")
+        self.assertEqual(_event.Timestamp, self.timestamp)
+        self.assertEqual(list(_event.EventData.keys()), ["area", "level"])
+        self.assertEqual(_event.EventData["level"]["int_value"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
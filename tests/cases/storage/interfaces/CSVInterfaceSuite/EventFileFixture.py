@@ -0,0 +1,91 @@
+"""Shared fixture for the CSVInterface test cases, which generates small event files in the OGD_EVENT_FILE format.
+
+By default, event `i` is in session `i // 10` with sequence index `i % 10`, belongs to player `i // 20`,
+is timestamped `i` seconds after 10:00 on 2024-01-01, and alternates between "click" and "hover" events.
+Cases override individual columns where they need something different.
+"""
+# import libraries
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+# import ogd libraries.
+from ogd.common.schemas.tables.EventMapSchema import EventMapSchema
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+
+COLUMNS : List[str] = EventTableSchema.Load(schema_name="OGD_EVENT_FILE").ColumnNames
+START   : datetime  = datetime(2024, 1, 1, 10, 0, 0)
+
+def EventRow(i:int, session_size:int=10, **overrides:Any) -> Dict[str, Any]:
+    """Generate the column values for the `i`-th event of a fixture file.
+
+    :param i: The number of the event in the file.
+    :type i: int
+    :param session_size: The number of events in each session, defaults to 10
+    :type session_size: int, optional
+    :param overrides: Values to use in place of the defaults, keyed by column name.
+    :type overrides: Any
+    :return: A mapping of column names to values for the event.
+    :rtype: Dict[str, Any]
+    """
+    ret_val : Dict[str, Any] = {
+        "session_id"  : f"session{i // session_size}",               "app_id"      : "TEST",
+        "timestamp"   : (START + timedelta(seconds=i)).isoformat(),  "event_name"  : "click" if i % 2 == 0 else "hover",
+        "event_data"  : json.dumps({"i":i}),                         "event_source": "GAME",
+        "app_version" : "1",                                         "app_branch"  : "main",
+        "log_version" : "1",                                         "offset"      : "UTC+00:00",
+        "user_id"     : f"Player{i // 20}",                          "user_data"   : "{}",
+        "game_state"  : "{}",                                        "index"       : i % session_size
+    }
+    ret_val.update(overrides)
+    return ret_val
+
+def EventLine(row:Dict[str, Any], columns:List[str]=COLUMNS) -> str:
+    """Format a generated event as a line of a TSV file.
+
+    :param row: The column values of the event, as given by `EventRow`.
+    :type row: Dict[str, Any]
+    :param columns: The columns to write, in order, defaults to the OGD_EVENT_FILE columns.
+    :type columns: List[str], optional
+    :return: The tab-separated line, with a trailing newline.
+    :rtype: str
+    """
+    return "\t".join(str(row[col]) for col in columns) + "\n"
+
+def WriteEventFile(path:Path, rows:List[Dict[str, Any]], extra_columns:List[str]=[]) -> Path:
+    """Write a TSV event file with a header, and one line per generated event.
+
+    :param path: The path of the file to write.
+    :type path: Path
+    :param rows: The events to write, as given by `EventRow`.
+    :type rows: List[Dict[str, Any]]
+    :param extra_columns: Columns to write after the OGD_EVENT_FILE columns, which each row must also have, defaults to []
+    :type extra_columns: List[str], optional
+    :return: The path of the written file.
+    :rtype: Path
+    """
+    _columns = COLUMNS + extra_columns
+    with open(path, "w", encoding="utf-8") as _file:
+        _file.write("\t".join(_columns) + "\n")
+        _file.writelines(EventLine(row, columns=_columns) for row in rows)
+    return path
+
+def UnindexedSchema() -> EventTableSchema:
+    """Make a table schema for the fixture files, whose column map has no column for the event sequence index,
+    so events are given fallback indices as they are converted.
+
+    :return: The OGD_EVENT_FILE table schema, without a mapping for the event sequence index.
+    :rtype: EventTableSchema
+    """
+    _column_map = {
+        "session_id"  : "session_id",  "app_id"      : "app_id",      "timestamp"  : "timestamp",
+        "event_name"  : "event_name",  "event_data"  : "event_data",  "event_source" : "event_source",
+        "app_version" : "app_version", "app_branch"  : "app_branch",  "log_version"  : "log_version",
+        "time_offset" : "offset",      "user_id"     : "user_id",     "user_data"    : "user_data",
+        "game_state"  : "game_state",  "event_sequence_index" : None
+    }
+    return EventTableSchema(
+        name="UnindexedTableSchema",
+        column_map=EventMapSchema.FromDict(name="ColumnMap", unparsed_elements=_column_map),
+        columns=EventTableSchema.Load(schema_name="OGD_EVENT_FILE").Columns
+    )
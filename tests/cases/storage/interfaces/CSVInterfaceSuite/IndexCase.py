@@ -0,0 +1,134 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.CSVIndex import CSVIndex
+from ogd.common.storage.IDType import IDType
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.VersionType import VersionType
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import COLUMNS, EventRow
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class IndexCase(TestCase):
+    """CSVInterface test case for files with a sidecar index.
+
+    Fixture:
+    * A game events file in the OGD_EVENT_FILE format, written through a `CSVConnector` with indexing on,
+      with 3 sessions of 10, 10, and 5 events in two batches, where the third session is split across both batches.
+    * A `CSVInterface` opened on the file, using the index, and one ignoring it.
+
+    Case Categories:
+    * Index contents
+        * Check the index is saved next to the file, and records sessions, versions, and event names.
+        * Check a stale index is ignored.
+    * Metadata
+        * Check IDs, dates, and versions from the index match those from scanning the file.
+    * Session fetch
+        * Check events for selected sessions, read by seeking, match those from scanning the file.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _rows = [
+            tuple(EventRow(i, app_version="1" if i < 10 else "2")[col] for col in COLUMNS)
+            for i in range(25)
+        ]
+        # write the third session in pieces, around the second, so it has more than one byte range.
+        _batches = [_rows[:10] + _rows[20:22], _rows[10:20] + _rows[22:]]
+
+        _out_cfg = FileStoreConfig(name="OutFile", location=self.temp_dir / "TEST_dataset_all-events.tsv", file_credential=None)
+        _writer  = CSVConnector(config=_out_cfg, with_secondary_files={ExportMode.EVENTS}, with_index=True)
+        _writer.Open()
+        _file = _writer.SecondaryFiles[ExportMode.EVENTS.name]
+        _file.write("\t".join(COLUMNS) + "\n")
+        _index = _writer.StartIndex(mode=ExportMode.EVENTS, header=COLUMNS)
+        for batch in _batches:
+            _lines = ["\t".join(str(item) for item in row) + "\n" for row in batch]
+            _index.Observe(offset=_file.tell(), rows=batch, lines=_lines)
+            _file.writelines(_lines)
+        _writer.Close()
+
+        self.path = self.temp_dir / "TEST_dataset_game-events.tsv"
+        _store_cfg = FileStoreConfig(name="TestFile", location=self.path, file_credential=None)
+        self.table_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.indexed  = CSVInterface(config=self.table_cfg, fail_fast=True, extension="tsv")
+        self.scanning = CSVInterface(config=self.table_cfg, fail_fast=True, extension="tsv", use_index=False)
+
+    def tearDown(self) -> None:
+        self.indexed.Connector.Close()
+        self.scanning.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_IndexContents(self):
+        self.assertTrue(CSVIndex.PathFor(self.path).is_file())
+        _index = self.indexed.Index
+        self.assertIsNotNone(_index)
+        self.assertEqual(_index.SessionIDs, ["session0", "session2", "session1"])
+        self.assertEqual(len(_index.SessionRanges(["session2"])), 2)
+        self.assertEqual(_index.AppVersions, ["1", "2"])
+        self.assertEqual(_index.EventNames, ["click", "hover"])
+        self.assertIsNone(self.scanning.Index)
+
+    def test_StaleIndex(self):
+        with open(self.path, "a", encoding="utf-8") as _file:
+            _file.write("extra\n")
+        self.assertIsNone(CSVIndex.Load(self.path))
+
+    def test_AvailableIDs(self):
+        _filters = DatasetFilterCollection(
+            sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=datetime(2024, 1, 1, 10, 0, 15), maximum=datetime(2024, 1, 1, 10, 0, 30))
+            )
+        )
+        self.assertEqual(sorted(self.indexed._availableIDs(id_type=IDType.SESSION, filters=_filters)),
+                         sorted(self.scanning._availableIDs(id_type=IDType.SESSION, filters=_filters)))
+        self.assertEqual(self.indexed._availableIDs(id_type=IDType.USER, filters=DatasetFilterCollection()), ["Player0", "Player1"])
+
+    def test_AvailableDates(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1"}))
+        )
+        self.assertEqual(self.indexed._availableDates(filters=_filters), self.scanning._availableDates(filters=_filters))
+
+    def test_AvailableVersions(self):
+        for mode in [VersionType.APP, VersionType.LOG, VersionType.BRANCH]:
+            self.assertEqual(sorted(str(ver) for ver in self.indexed._availableVersions(mode=mode, filters=DatasetFilterCollection())),
+                             sorted(str(ver) for ver in self.scanning._availableVersions(mode=mode, filters=DatasetFilterCollection())))
+
+    def test_SessionFetch(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session2", "session0"}))
+        )
+        _seeked  = self.indexed.GetEventSet(filters=_filters, fallbacks={})
+        _scanned = self.scanning.GetEventSet(filters=_filters, fallbacks={})
+        self.assertEqual(len(_seeked), 15)
+        self.assertEqual(sorted(event.EventData["i"] for event in _seeked), sorted(event.EventData["i"] for event in _scanned))
+        # seeking should not load the whole file.
+        self.assertIsNone(self.indexed._data)
+
+if __name__ == '__main__':
+    unittest.main()
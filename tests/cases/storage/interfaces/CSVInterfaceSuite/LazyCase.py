@@ -0,0 +1,116 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.EventFilterCollection import EventFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import EventRow, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class LazyCase(TestCase):
+    """CSVInterface test case for lazy mode, where the file is read in chunks with filters applied to each chunk.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events,
+      plus an extra column that is not part of the table schema.
+    * A lazy `CSVInterface` with a chunk size of 4, and an eager `CSVInterface`, both opened on the file.
+
+    Case Categories:
+    * Consistency
+        * Check that lazy and eager interfaces give the same events, with and without filters.
+    * Filtering
+        * Check session, player, event name, and timestamp filters in lazy mode.
+    * Projection
+        * Check that only the mapped columns are read, and rows still line up with the table schema.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _path = self.temp_dir / "TEST_events.tsv"
+        WriteEventFile(_path, rows=[EventRow(i, remote_addr="127.0.0.1") for i in range(25)], extra_columns=["remote_addr"])
+        _store_cfg = FileStoreConfig(name="TestFile", location=_path, file_credential=None)
+        _table_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.lazy  = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg), lazy=True, chunk_size=4)
+        self.eager = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg))
+
+    def tearDown(self) -> None:
+        self.lazy.Connector.Close()
+        self.eager.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def _eventIndices(self, interface:CSVInterface, filters:DatasetFilterCollection):
+        return [event.EventData["i"] for event in interface.GetEventSet(filters=filters, fallbacks={})]
+
+    def test_MatchesEager(self):
+        _lazy  = self.lazy.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        _eager = self.eager.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        self.assertEqual(len(_lazy), 25)
+        self.assertEqual([event.ColumnValues for event in _lazy], [event.ColumnValues for event in _eager])
+        # lazy mode should never load the whole file.
+        self.assertIsNone(self.lazy._data)
+
+    def test_SessionAndPlayerFilters(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(
+                session_filter=SetFilter(mode=FilterMode.EXCLUDE, set_elements={"session0"}),
+                player_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"Player0"})
+            )
+        )
+        self.assertEqual(self._eventIndices(self.lazy, _filters), list(range(10, 20)))
+
+    def test_EventNameFilter(self):
+        _filters = DatasetFilterCollection(
+            event_filters=EventFilterCollection(event_name_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"hover"}))
+        )
+        self.assertEqual(self._eventIndices(self.lazy, _filters), list(range(1, 25, 2)))
+
+    def test_TimestampFilter(self):
+        _start = datetime(2024, 1, 1, 10, 0, 0)
+        _filters = DatasetFilterCollection(
+            sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=_start + timedelta(seconds=3), maximum=_start + timedelta(seconds=6))
+            )
+        )
+        self.assertEqual(self._eventIndices(self.lazy, _filters), [3, 4, 5, 6])
+        self.assertEqual(self._eventIndices(self.eager, _filters), [3, 4, 5, 6])
+        # timezone-aware filters are compared in UTC.
+        _aware = DatasetFilterCollection(
+            sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=(_start + timedelta(seconds=22)).replace(tzinfo=timezone.utc), maximum=None)
+            )
+        )
+        self.assertEqual(self._eventIndices(self.lazy, _aware), [22, 23, 24])
+
+    def test_Projection(self):
+        _columns = self.lazy._projectedColumns()
+        self.assertIsNotNone(_columns)
+        self.assertNotIn("remote_addr", _columns)
+        _rows = list(self.lazy._iterEventRows(filters=DatasetFilterCollection(), batch_size=10))
+        self.assertEqual(len(_rows), 25)
+        self.assertTrue(all(len(row) == len(self.lazy.Config.TableSchema.ColumnNames) for row in _rows))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.EventFilterCollection import EventFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.connectors.MappedTSVScanner import MappedTSVScanner
+from ogd.common.storage.IDType import IDType
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.VersionType import VersionType
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import EventRow, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class MappedCase(TestCase):
+    """CSVInterface test case for mapped mode, where the file is scanned through a memory map.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events,
+      two players, and two app versions.
+    * A mapped `CSVInterface` and an eager `CSVInterface`, both opened on the file.
+
+    Case Categories:
+    * Scanner
+        * Check the scanner reads the header, returns requested fields as text, and applies predicates.
+    * Consistency
+        * Check that mapped and eager interfaces give the same events, IDs, dates, and versions, with and without filters.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _path = self.temp_dir / "TEST_events.tsv"
+        WriteEventFile(_path, rows=[EventRow(i, app_version="1" if i < 10 else "2") for i in range(25)])
+        _store_cfg = FileStoreConfig(name="TestFile", location=_path, file_credential=None)
+        _table_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.mapped = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg), mapped=True)
+        self.eager  = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg))
+        self.filters = [
+            DatasetFilterCollection(),
+            DatasetFilterCollection(id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1"}))),
+            DatasetFilterCollection(id_filters=IDFilterCollection(player_filter=SetFilter(mode=FilterMode.EXCLUDE, set_elements={"Player0"}))),
+            DatasetFilterCollection(event_filters=EventFilterCollection(event_name_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"hover"}))),
+            DatasetFilterCollection(sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=datetime(2024, 1, 1, 10, 0, 5), maximum=datetime(2024, 1, 1, 10, 0, 12))
+            )),
+        ]
+
+    def tearDown(self) -> None:
+        self.mapped.Connector.Close()
+        self.eager.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_Scanner(self):
+        with MappedTSVScanner(file=self.mapped.Connector.File) as scanner:
+            self.assertEqual(scanner.Header, EventTableSchema.Load(schema_name="OGD_EVENT_FILE").ColumnNames)
+            _found = list(scanner.Scan(columns=["user_id", "session_id", None, "not_a_column"], where={"session_id":lambda field : field == "session2"}))
+        self.assertEqual(_found, [("Player1", "session2", None, None)] * 5)
+
+    def test_GetEventSet(self):
+        for filters in self.filters:
+            with self.subTest(filters=filters):
+                _mapped = self.mapped.GetEventSet(filters=filters, fallbacks={})
+                _eager  = self.eager.GetEventSet(filters=filters, fallbacks={})
+                self.assertGreater(len(_mapped), 0)
+                self.assertEqual([event.ColumnValues for event in _mapped], [event.ColumnValues for event in _eager])
+        self.assertIsNone(self.mapped._data)
+
+    def test_AvailableIDs(self):
+        for filters in self.filters:
+            with self.subTest(filters=filters):
+                self.assertEqual(self.mapped._availableIDs(id_type=IDType.SESSION, filters=filters),
+                                 self.eager._availableIDs(id_type=IDType.SESSION, filters=filters))
+        self.assertEqual(self.mapped._availableIDs(id_type=IDType.USER, filters=DatasetFilterCollection()), ["Player0", "Player1"])
+
+    def test_AvailableDates(self):
+        for filters in self.filters[1:3]:
+            with self.subTest(filters=filters):
+                self.assertEqual(self.mapped._availableDates(filters=filters), self.eager._availableDates(filters=filters))
+        _dates = self.mapped._availableDates(filters=DatasetFilterCollection())
+        self.assertEqual((_dates['min'], _dates['max']), (datetime(2024, 1, 1, 10, 0, 0), datetime(2024, 1, 1, 10, 0, 24)))
+
+    def test_AvailableVersions(self):
+        for mode in [VersionType.APP, VersionType.LOG, VersionType.BRANCH]:
+            self.assertEqual([str(ver) for ver in self.mapped._availableVersions(mode=mode, filters=DatasetFilterCollection())],
+                             [str(ver) for ver in self.eager._availableVersions(mode=mode, filters=DatasetFilterCollection())])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# import libraries
+import contextlib
+import io
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.DatasetRepositoryConfig import DatasetRepositoryConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.storage.RepositoryIndexingConfig import RepositoryIndexingConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.locations.DirectoryLocationSchema import DirectoryLocationSchema
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.outerfaces.CSVOuterface import CSVOuterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import COLUMNS, EventRow, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class OuterfaceFallbackCase(TestCase):
+    """CSVInterface test case for events exported by a `CSVOuterface` for an export mode that has no file.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events, read with a `CSVInterface`.
+    * An empty dataset repository, to export the events to with a `CSVOuterface` that has no separate file for events.
+
+    Case Categories:
+    * Standard output fallback
+        * Check that nothing is written to standard output by default.
+        * Check that the events are written to standard output when the fallback is enabled.
+    """
+    DATASET_ID = "TEST_20240101_to_20240131"
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _tsv_path = WriteEventFile(self.temp_dir / "TEST_source.tsv", rows=[EventRow(i) for i in range(25)])
+        _tsv_cfg   = FileStoreConfig(name="TSVFile", location=_tsv_path, file_credential=None)
+        _tsv_table = DataTableConfig(name="TSVTable", store=_tsv_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _tsv = CSVInterface(config=_tsv_table, fail_fast=True, extension="tsv")
+        self.events = _tsv.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        _tsv.Connector.Close()
+
+        self.out_dir = self.temp_dir / "export"
+        self.out_dir.mkdir()
+        _indexing = RepositoryIndexingConfig(
+            name="TestIndexing",
+            local_dir=DirectoryLocationSchema(name="TestDir", folder_path=self.temp_dir, other_elements={}),
+            remote_url="https://example.org/",
+            templates_url="https://example.org/templates"
+        )
+        self.repository = DatasetRepositoryConfig(name="TestRepository", indexing=_indexing, datasets={})
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _export(self, stdout_fallback:bool) -> str:
+        _stdout = io.StringIO()
+        with contextlib.redirect_stdout(_stdout):
+            _out_cfg   = FileStoreConfig(name="OutFile", location=self.out_dir / f"{OuterfaceFallbackCase.DATASET_ID}_abc1234_all-events.tsv", file_credential=None)
+            _out_table = DataTableConfig(name="OutTable", store=_out_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+            _outerface = CSVOuterface(table_config=_out_table, export_modes={ExportMode.EVENTS}, repository=self.repository,
+                                      dataset_key=OuterfaceFallbackCase.DATASET_ID, with_separate_feature_files=False, with_zipping=False,
+                                      stdout_fallback=stdout_fallback)
+            _outerface.WriteHeader(mode=ExportMode.EVENTS, header=COLUMNS)
+            _outerface.WriteEvents(events=self.events, mode=ExportMode.EVENTS)
+            _outerface.Connector.Close()
+        return _stdout.getvalue()
+
+    def test_NoFallback(self):
+        self.assertEqual(self._export(stdout_fallback=False), "")
+
+    def test_StdoutFallback(self):
+        _lines = self._export(stdout_fallback=True).splitlines()
+        self.assertEqual(len(_lines), 26)
+        self.assertEqual(_lines[0].split("\t"), COLUMNS)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.DatasetRepositoryConfig import DatasetRepositoryConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.storage.RepositoryIndexingConfig import RepositoryIndexingConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.models.events.EventSet import EventSet
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.locations.DirectoryLocationSchema import DirectoryLocationSchema
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.CSVIndex import CSVIndex
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.outerfaces.CSVOuterface import CSVOuterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import COLUMNS, EventRow, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class OuterfaceIndexCase(TestCase):
+    """CSVInterface test case for reading back a game events file indexed while it was exported by a `CSVOuterface`.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events, read with a `CSVInterface`.
+    * The same events, exported in two batches by a `CSVOuterface` with indexing on, to an empty dataset repository.
+
+    Case Categories:
+    * Unzipped export
+        * Check the game events file has an up-to-date index, and a `CSVInterface` reading it by seeking gives the same events as scanning.
+    * Zipped export
+        * Check no index is left next to the zip file, including an index from an earlier, unzipped export.
+    """
+    DATASET_ID = "TEST_20240101_to_20240131"
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _tsv_path = self.temp_dir / "TEST_source.tsv"
+        self.columns = COLUMNS
+        WriteEventFile(_tsv_path, rows=[EventRow(i) for i in range(25)])
+        _tsv_cfg   = FileStoreConfig(name="TSVFile", location=_tsv_path, file_credential=None)
+        _tsv_table = DataTableConfig(name="TSVTable", store=_tsv_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _tsv = CSVInterface(config=_tsv_table, fail_fast=True, extension="tsv")
+        self.events = list(_tsv.GetEventSet(filters=DatasetFilterCollection(), fallbacks={}).Events)
+        _tsv.Connector.Close()
+
+        self.out_dir = self.temp_dir / "export"
+        self.out_dir.mkdir()
+        _indexing = RepositoryIndexingConfig(
+            name="TestIndexing",
+            local_dir=DirectoryLocationSchema(name="TestDir", folder_path=self.temp_dir, other_elements={}),
+            remote_url="https://example.org/",
+            templates_url="https://example.org/templates"
+        )
+        self.repository = DatasetRepositoryConfig(name="TestRepository", indexing=_indexing, datasets={})
+        self.game_events_path = self.out_dir / f"{OuterfaceIndexCase.DATASET_ID}_abc1234_game-events.tsv"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _export(self, with_zipping:bool) -> None:
+        _out_cfg   = FileStoreConfig(name="OutFile", location=self.out_dir / f"{OuterfaceIndexCase.DATASET_ID}_abc1234_all-events.tsv", file_credential=None)
+        _out_table = DataTableConfig(name="OutTable", store=_out_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _outerface = CSVOuterface(table_config=_out_table, export_modes={ExportMode.EVENTS}, repository=self.repository,
+                                  dataset_key=OuterfaceIndexCase.DATASET_ID, with_zipping=with_zipping, with_index=True)
+        _outerface.WriteHeader(mode=ExportMode.EVENTS, header=self.columns)
+        # write the sessions in two batches, to check the offsets of the second batch.
+        _outerface.WriteEvents(events=EventSet(events=self.events[:15], filters=DatasetFilterCollection()), mode=ExportMode.EVENTS)
+        _outerface.WriteEvents(events=EventSet(events=self.events[15:], filters=DatasetFilterCollection()), mode=ExportMode.EVENTS)
+        _outerface.Connector.Close()
+
+    def test_UnzippedExport(self):
+        self._export(with_zipping=False)
+        _index = CSVIndex.Load(self.game_events_path)
+        self.assertIsNotNone(_index)
+        self.assertEqual(sorted(_index.SessionIDs), ["session0", "session1", "session2"])
+
+        _store_cfg = FileStoreConfig(name="GameEvents", location=self.game_events_path, file_credential=None)
+        _table_cfg = DataTableConfig(name="GameEventsTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _indexed  = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv")
+        _scanning = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", use_index=False)
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1", "session2"}))
+        )
+        try:
+            self.assertIsNotNone(_indexed.Index)
+            self.assertTrue(_indexed._canSeekSessions(filters=_filters))
+            _seeked  = _indexed.GetEventSet(filters=_filters, fallbacks={})
+            _scanned = _scanning.GetEventSet(filters=_filters, fallbacks={})
+            self.assertEqual(len(_seeked), 15)
+            self.assertEqual([event.Fingerprint for event in _seeked], [event.Fingerprint for event in _scanned])
+            self.assertEqual([event.Fingerprint for event in _seeked], [event.Fingerprint for event in self.events[10:]])
+        finally:
+            _indexed.Connector.Close()
+            _scanning.Connector.Close()
+
+    def test_ZippedExport(self):
+        self._export(with_zipping=False)
+        self.assertTrue(CSVIndex.PathFor(self.game_events_path).is_file())
+        self._export(with_zipping=True)
+        self.assertTrue(self.game_events_path.with_suffix(".zip").is_file())
+        self.assertFalse(self.game_events_path.is_file())
+        self.assertFalse(CSVIndex.PathFor(self.game_events_path).is_file())
+
+if __name__ == '__main__':
+    unittest.main()
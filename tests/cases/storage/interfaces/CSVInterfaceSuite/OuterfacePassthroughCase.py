@@ -0,0 +1,105 @@
+# import libraries
+import json
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.DatasetRepositoryConfig import DatasetRepositoryConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.storage.RepositoryIndexingConfig import RepositoryIndexingConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.models.events.EventSet import EventSet
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.locations.DirectoryLocationSchema import DirectoryLocationSchema
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.outerfaces.CSVOuterface import CSVOuterface
+from ogd.common.utils.Logger import Logger
+from ogd.common.utils.typing import LazyJSON
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import COLUMNS, START, EventRow, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class OuterfacePassthroughCase(TestCase):
+    """CSVInterface test case for events read with lazy payloads, and exported by a `CSVOuterface` with JSON pass-through.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events,
+      whose event data has unsorted keys, read with a `CSVInterface` with lazy payloads.
+    * The event data of the second session replaced by parsed dicts, so the events have a mix of lazy and parsed payloads.
+    * An empty dataset repository, to export the events to.
+
+    Case Categories:
+    * Lazy payloads
+        * Check that events read with lazy payloads from the OGD_EVENT_FILE format keep their payloads as unparsed `LazyJSON`.
+    * Pass-through
+        * Check that lazy payloads are written as their original text, and parsed payloads as JSON text, rather than as a Python dict.
+    """
+    DATASET_ID = "TEST_20240101_to_20240131"
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _rows = [EventRow(i, event_data=json.dumps({"b":i, "a":2})) for i in range(25)]
+        _tsv_path = WriteEventFile(self.temp_dir / "TEST_source.tsv", rows=_rows)
+        _tsv_cfg   = FileStoreConfig(name="TSVFile", location=_tsv_path, file_credential=None)
+        _tsv_table = DataTableConfig(name="TSVTable", store=_tsv_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _tsv = CSVInterface(config=_tsv_table, fail_fast=True, extension="tsv")
+        self.events = list(_tsv.GetEventSet(filters=DatasetFilterCollection(), fallbacks={}, lazy_payloads=True).Events)
+        _tsv.Connector.Close()
+
+        self.out_dir = self.temp_dir / "export"
+        self.out_dir.mkdir()
+        _indexing = RepositoryIndexingConfig(
+            name="TestIndexing",
+            local_dir=DirectoryLocationSchema(name="TestDir", folder_path=self.temp_dir, other_elements={}),
+            remote_url="https://example.org/",
+            templates_url="https://example.org/templates"
+        )
+        self.repository = DatasetRepositoryConfig(name="TestRepository", indexing=_indexing, datasets={})
+        self.game_events_path = self.out_dir / f"{OuterfacePassthroughCase.DATASET_ID}_abc1234_game-events.tsv"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_LazyPayloads(self):
+        self.assertEqual(len(self.events), 25)
+        for event in self.events:
+            self.assertIsInstance(event.EventData, LazyJSON)
+            self.assertIsInstance(event.GameState, LazyJSON)
+            self.assertFalse(event.EventData.IsParsed)
+
+    def test_MixedPayloads(self):
+        for i, event in enumerate(self.events[10:20], start=10):
+            event.EventData = {"b":i, "a":2, "when":START}
+        _out_cfg   = FileStoreConfig(name="OutFile", location=self.out_dir / f"{OuterfacePassthroughCase.DATASET_ID}_abc1234_all-events.tsv", file_credential=None)
+        _out_table = DataTableConfig(name="OutTable", store=_out_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _outerface = CSVOuterface(table_config=_out_table, export_modes={ExportMode.EVENTS}, repository=self.repository,
+                                  dataset_key=OuterfacePassthroughCase.DATASET_ID, with_zipping=False, json_passthrough=True)
+        _outerface.WriteHeader(mode=ExportMode.EVENTS, header=COLUMNS)
+        _outerface.WriteEvents(events=EventSet(events=self.events, filters=DatasetFilterCollection()), mode=ExportMode.EVENTS)
+        _outerface.Connector.Close()
+
+        with open(self.game_events_path, encoding="utf-8") as _file:
+            _lines = _file.read().splitlines()[1:]
+        self.assertEqual(len(_lines), 25)
+        _data_col, _state_col = COLUMNS.index("event_data"), COLUMNS.index("game_state")
+        for i, line in enumerate(_lines):
+            _fields = line.split("\t")
+            with self.subTest(event=i):
+                if 10 <= i < 20:
+                    self.assertEqual(json.loads(_fields[_data_col]), {"b":i, "a":2, "when":str(START)})
+                else:
+                    self.assertEqual(_fields[_data_col], json.dumps({"b":i, "a":2}))
+                self.assertEqual(_fields[_state_col], "{}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.models.events.Event import Event
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import EventRow, UnindexedSchema, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class ParallelConvertCase(TestCase):
+    """CSVInterface test case for converting rows to events in worker processes, with the `workers` option of `GetEventSet`.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 10 sessions of 10 events.
+    * Two `CSVInterface`s opened on the file, one failing fast and one not.
+    * A third `CSVInterface` on the file, whose schema has no column for the event sequence index.
+
+    Case Categories:
+    * Consistency
+        * Check that parallel conversion gives the same events, in the same order, as serial conversion.
+        * Check that, with no sequence index column, parallel conversion gives the same fallback indices as serial conversion.
+    * Errors
+        * Check that bad rows are skipped and counted when not failing fast, and raise when failing fast.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _path = self.temp_dir / "TEST_events.tsv"
+        WriteEventFile(_path, rows=[EventRow(i, event_name="click", user_id="Player1") for i in range(100)])
+        _store_cfg = FileStoreConfig(name="TestFile", location=_path, file_credential=None)
+        _table_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.interface      = CSVInterface(config=_table_cfg, fail_fast=False, extension="tsv", store=CSVConnector(config=_store_cfg))
+        self.fast_interface = CSVInterface(config=_table_cfg, fail_fast=True,  extension="tsv", store=CSVConnector(config=_store_cfg))
+        _unindexed_cfg    = DataTableConfig(name="TestTable", store=_store_cfg, table_schema=UnindexedSchema(), table_location=None)
+        self.unindexed_interface = CSVInterface(config=_unindexed_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg))
+
+    def tearDown(self) -> None:
+        self.interface.Connector.Close()
+        self.fast_interface.Connector.Close()
+        self.unindexed_interface.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_GetEventSet_workers(self):
+        _serial   = self.interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        _parallel = self.interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={}, workers=2)
+        self.assertEqual(len(_parallel), 100)
+        self.assertEqual([event.Fingerprint for event in _parallel], [event.Fingerprint for event in _serial])
+
+    def test_GetEventSet_workers_unindexed(self):
+        # leave conversion state from an earlier request, in the session the file starts with.
+        _rows = self.unindexed_interface._getEventRows(filters=DatasetFilterCollection())
+        Event.FromRow(row=_rows[0], schema=self.unindexed_interface.Config.TableSchema)
+        _serial   = self.unindexed_interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        _parallel = self.unindexed_interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={}, workers=4)
+        self.assertEqual([event.EventSequenceIndex for event in _serial], [i % 10 for i in range(100)])
+        self.assertEqual([(event.SessionID, event.EventSequenceIndex) for event in _parallel], [(event.SessionID, event.EventSequenceIndex) for event in _serial])
+
+    def test_eventsFromRowsParallel_skips(self):
+        _rows = self.interface._getEventRows(filters=DatasetFilterCollection())
+        _rows[5] = _rows[5][:2]
+        _events = self.interface._eventsFromRowsParallel(rows=_rows, schema=self.interface.Config.TableSchema, fallbacks={}, workers=2)
+        self.assertEqual(len(_events), 99)
+
+    def test_eventsFromRowsParallel_fail_fast(self):
+        _rows = self.fast_interface._getEventRows(filters=DatasetFilterCollection())
+        _rows[5] = _rows[5][:2]
+        with self.assertRaises(IndexError):
+            self.fast_interface._eventsFromRowsParallel(rows=_rows, schema=self.fast_interface.Config.TableSchema, fallbacks={}, workers=2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
+from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.ShardType import ShardType
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import EventRow, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class ShardCase(TestCase):
+    """CSVInterface test case for retrieving events in shards with `GetEventSet`.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 6 sessions from 3 players, written out of order.
+    * A `CSVInterface` opened on the file.
+
+    Case Categories:
+    * Shard splitting
+        * Check that a timestamp range is split into one shard per day, with no overlap at midnight.
+        * Check that a session set is split into the requested number of shards.
+    * Sharded retrieval
+        * Check that a request sharded by session gives the same events as an unsharded request, merged in user, session, index order.
+        * Check that the file is read in one pass, without opening an interface for each shard.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _path = self.temp_dir / "TEST_events.tsv"
+        WriteEventFile(_path, rows=[EventRow(i, session_size=5, event_name="click", user_id=f"Player{i % 3}") for i in reversed(range(30))])
+        _store_cfg = FileStoreConfig(name="TestFile", location=_path, file_credential=None)
+        _table_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.interface = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg))
+
+    def tearDown(self) -> None:
+        self.interface.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_shardFilters_day(self):
+        _filters = DatasetFilterCollection(
+            sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=datetime(2024, 1, 1, 12), maximum=datetime(2024, 1, 3, 6))
+            )
+        )
+        _shards = CSVInterface._shardFilters(filters=_filters, shard_by=ShardType.DAY, shard_count=4)
+        self.assertEqual(len(_shards), 3)
+        self.assertEqual(_shards[0].Sequences.Timestamps.Min, datetime(2024, 1, 1, 12))
+        self.assertEqual(_shards[0].Sequences.Timestamps.Max, datetime(2024, 1, 1, 23, 59, 59, 999999))
+        self.assertEqual(_shards[1].Sequences.Timestamps.Min, datetime(2024, 1, 2))
+        self.assertEqual(_shards[2].Sequences.Timestamps.Max, datetime(2024, 1, 3, 6))
+
+    def test_shardFilters_session(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={f"session{i}" for i in range(6)}))
+        )
+        _shards = CSVInterface._shardFilters(filters=_filters, shard_by=ShardType.SESSION, shard_count=4)
+        self.assertEqual(len(_shards), 3)
+        self.assertEqual(set().union(*(shard.IDFilters.Sessions.AsSet for shard in _shards)), {f"session{i}" for i in range(6)})
+
+    def test_GetEventSet_sharded(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={f"session{i}" for i in range(6)}))
+        )
+        with mock.patch.object(CSVInterface, "_shardInterface") as _shard_interface:
+            _sharded = self.interface.GetEventSet(filters=_filters, fallbacks={}, shard_by=ShardType.SESSION, shard_workers=3)
+        _shard_interface.assert_not_called()
+        _unsharded = self.interface.GetEventSet(filters=_filters, fallbacks={})
+        self.assertEqual(len(_sharded), 30)
+        self.assertEqual(sorted(event.Fingerprint for event in _sharded), sorted(event.Fingerprint for event in _unsharded))
+        _keys = [(event.UserID, event.SessionID, event.EventSequenceIndex) for event in _sharded]
+        self.assertEqual(_keys, sorted(_keys))
+
+if __name__ == '__main__':
+    unittest.main()
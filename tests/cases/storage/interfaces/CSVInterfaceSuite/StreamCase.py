@@ -0,0 +1,88 @@
+# import libraries
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.models.events.Event import Event
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.CSVConnector import CSVConnector
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+from tests.cases.storage.interfaces.CSVInterfaceSuite.EventFileFixture import EventRow, UnindexedSchema, WriteEventFile
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="CSVInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class StreamCase(TestCase):
+    """CSVInterface test case for streaming events with `GetEventStream`.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events.
+    * A `CSVInterface` opened on the file.
+
+    Case Categories:
+    * Batching
+        * Check that events come back in batches of at most `batch_size`.
+    * Consistency
+        * Check that the stream gives the same events, in the same order, as `GetEventSet`.
+        * Check that fallback sequence indices start over for each stream, whatever was converted before.
+    * Filtering
+        * Check that filters are applied to each chunk of the file.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _path = self.temp_dir / "TEST_events.tsv"
+        WriteEventFile(_path, rows=[EventRow(i, user_id="Player1") for i in range(25)])
+        _store_cfg = FileStoreConfig(name="TestFile", location=_path, file_credential=None)
+        _table_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.interface = CSVInterface(config=_table_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg))
+        _unindexed_cfg = DataTableConfig(name="TestTable", store=_store_cfg, table_schema=UnindexedSchema(), table_location=None)
+        self.unindexed_interface = CSVInterface(config=_unindexed_cfg, fail_fast=True, extension="tsv", store=CSVConnector(config=_store_cfg))
+
+    def tearDown(self) -> None:
+        self.interface.Connector.Close()
+        self.unindexed_interface.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_GetEventStream_batches(self):
+        _batches = list(self.interface.GetEventStream(filters=DatasetFilterCollection(), fallbacks={}, batch_size=10))
+        self.assertEqual([len(batch) for batch in _batches], [10, 10, 5])
+
+    def test_GetEventStream_matches_GetEventSet(self):
+        _streamed = [event for batch in self.interface.GetEventStream(filters=DatasetFilterCollection(), fallbacks={}, batch_size=7) for event in batch]
+        _full     = self.interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        self.assertEqual(len(_streamed), len(_full))
+        self.assertEqual([event.Hash for event in _streamed], [event.Hash for event in _full])
+
+    def test_GetEventStream_unindexed(self):
+        # leave conversion state from an earlier request, in the session the file starts with.
+        _rows = self.unindexed_interface._getEventRows(filters=DatasetFilterCollection())
+        Event.FromRow(row=_rows[0], schema=self.unindexed_interface.Config.TableSchema)
+        _streamed = [event for batch in self.unindexed_interface.GetEventStream(filters=DatasetFilterCollection(), fallbacks={}, batch_size=7) for event in batch]
+        self.assertEqual([event.EventSequenceIndex for event in _streamed], [i % 10 for i in range(25)])
+
+    def test_GetEventStream_filtered(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1"}))
+        )
+        _streamed = [event for batch in self.interface.GetEventStream(filters=_filters, fallbacks={}, batch_size=4) for event in batch]
+        self.assertEqual(len(_streamed), 10)
+        self.assertTrue(all(event.SessionID == "session1" for event in _streamed))
+
+if __name__ == '__main__':
+    unittest.main()
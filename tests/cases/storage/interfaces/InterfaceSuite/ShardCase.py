@@ -0,0 +1,153 @@
+# import libraries
+import logging
+import threading
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.DataStoreConfig import DataStoreConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.connectors.StorageConnector import StorageConnector
+from ogd.common.storage.interfaces.Interface import Interface
+from ogd.common.storage.ShardType import ShardType
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="InterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class _StubConnector(StorageConnector):
+    def __init__(self, config:DataStoreConfig):
+        super().__init__()
+        self._config = config
+        self.Open()
+
+    @property
+    def StoreConfig(self) -> DataStoreConfig:
+        return self._config
+
+    def _open(self, writeable:bool=True) -> bool:
+        return True
+
+    def _close(self) -> bool:
+        self._is_open = False
+        return True
+
+class _StubInterface(Interface):
+    """Interface over a list of rows held in memory, which records each request it gets, and fails on request for a given session."""
+    rows         : List[Tuple] = []
+    failing      : str         = ""
+    requests     : List[List[str]] = []
+    thread_names : List[str]   = []
+    interfaces   : List[int]   = []
+
+    def __init__(self, config:DataTableConfig, fail_fast:bool):
+        super().__init__(config=config, fail_fast=fail_fast)
+        self._store = _StubConnector(config=config.StoreConfig)
+
+    @property
+    def Connector(self) -> StorageConnector:
+        return self._store
+
+    def _availableIDs(self, id_type, filters):
+        return []
+
+    def _availableDates(self, filters):
+        return {}
+
+    def _availableVersions(self, mode, filters):
+        return []
+
+    def _getEventRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
+        _sessions = sorted(filters.IDFilters.Sessions.AsSet or [])
+        _StubInterface.requests.append(_sessions)
+        _StubInterface.thread_names.append(threading.current_thread().name)
+        _StubInterface.interfaces.append(id(self))
+        if _StubInterface.failing in _sessions:
+            raise ValueError(f"Could not retrieve {_StubInterface.failing}")
+        return [row for row in _StubInterface.rows if row[0] in _sessions]
+
+    def _getFeatureRows(self, filters:DatasetFilterCollection) -> List[Tuple]:
+        return []
+
+class ShardCase(TestCase):
+    """Interface test case for retrieving events in shards with `GetEventSet`, through the base class's concurrent shard path.
+
+    Fixture:
+    * A stub `Interface` subclass, which gives rows from an in-memory list of 6 sessions from 3 players, in reverse order,
+      and records the sessions of each request it gets.
+
+    Case Categories:
+    * Sharded retrieval
+        * Check that a request sharded by session is retrieved as several requests, on worker threads, each through its own interface.
+        * Check that the rows of all shards are merged in user, session, index order.
+    * Errors
+        * Check that an error in one shard is raised when failing fast, and that the shard is skipped otherwise.
+    """
+
+    def setUp(self) -> None:
+        _columns = EventTableSchema.Load(schema_name="OGD_EVENT_FILE").ColumnNames
+        _start = datetime(2024, 1, 1, 10, 0, 0)
+        _rows : List[Dict] = [
+            {
+                "session_id"  : f"session{i // 5}",                      "app_id"      : "TEST",
+                "timestamp"   : (_start + timedelta(seconds=i)).isoformat(), "event_name" : "click",
+                "event_data"  : "{}",                                     "event_source": "GAME",
+                "app_version" : "1",                                      "app_branch"  : "main",
+                "log_version" : "1",                                      "offset"      : "UTC+00:00",
+                "user_id"     : f"Player{i % 3}",                         "user_data"   : "{}",
+                "game_state"  : "{}",                                     "index"       : i % 5
+            }
+            for i in reversed(range(30))
+        ]
+        _StubInterface.rows         = [tuple(row[col] for col in _columns) for row in _rows]
+        _StubInterface.failing      = ""
+        _StubInterface.requests     = []
+        _StubInterface.thread_names = []
+        _StubInterface.interfaces   = []
+        _store_cfg = FileStoreConfig(name="StubFile", location=Path("TEST_stub.tsv"), file_credential=None)
+        self.table_cfg = DataTableConfig(name="StubTable", store=_store_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={f"session{i}" for i in range(6)}))
+        )
+
+    def test_GetEventSet_sharded(self):
+        _interface = _StubInterface(config=self.table_cfg, fail_fast=True)
+        _sharded = _interface.GetEventSet(filters=self.filters, fallbacks={}, shard_by=ShardType.SESSION, shard_workers=3)
+        self.assertEqual(sorted(_StubInterface.requests), [["session0", "session1"], ["session2", "session3"], ["session4", "session5"]])
+        self.assertNotIn(threading.current_thread().name, _StubInterface.thread_names)
+        self.assertNotIn(id(_interface), _StubInterface.interfaces)
+        self.assertEqual(len(_sharded), 30)
+        _keys = [(event.UserID, event.SessionID, event.EventSequenceIndex) for event in _sharded]
+        self.assertEqual(_keys, sorted(_keys))
+
+        _unsharded = _interface.GetEventSet(filters=self.filters, fallbacks={})
+        self.assertEqual(sorted(event.Fingerprint for event in _sharded), sorted(event.Fingerprint for event in _unsharded))
+
+    def test_GetEventSet_sharded_failFast(self):
+        _StubInterface.failing = "session3"
+        _interface = _StubInterface(config=self.table_cfg, fail_fast=True)
+        with self.assertRaises(ValueError):
+            _interface.GetEventSet(filters=self.filters, fallbacks={}, shard_by=ShardType.SESSION, shard_workers=3)
+
+    def test_GetEventSet_sharded_skipFailed(self):
+        _StubInterface.failing = "session3"
+        _interface = _StubInterface(config=self.table_cfg, fail_fast=False)
+        _sharded = _interface.GetEventSet(filters=self.filters, fallbacks={}, shard_by=ShardType.SESSION, shard_workers=3)
+        self.assertEqual(sorted({event.SessionID for event in _sharded}), ["session0", "session1", "session4", "session5"])
+        self.assertEqual(len(_sharded), 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# import libraries
+import logging
+import unittest
+from typing import List, Optional, Tuple
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.storage.interfaces.MySQLInterface import MySQLInterface
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="MySQLInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class _FakeCursor:
+    """Stand-in for an unbuffered MySQL cursor, which hands back a fixed result in `fetchmany` batches."""
+    def __init__(self, rows:List[Tuple]):
+        self._rows = rows
+        self._position = 0
+        self.fetch_sizes : List[int] = []
+        self.executed    : Optional[Tuple[str, Optional[Tuple]]] = None
+
+    def execute(self, query:str, params:Optional[Tuple]) -> None:
+        self.executed = (query, params)
+
+    def fetchmany(self, size:int) -> List[Tuple]:
+        self.fetch_sizes.append(size)
+        batch = self._rows[self._position:self._position + size]
+        self._position += len(batch)
+        return batch
+
+class QueryBatchesCase(TestCase):
+    """MySQLInterface test case for the `QueryBatches` function, which reads query results a batch at a time.
+
+    Fixture:
+    * A fake cursor with a result of 25 rows, so no database connection is needed.
+
+    Case Categories:
+    * Batching
+        * Check that results come back in batches of at most `batch_size`, covering every row.
+    * Laziness
+        * Check that batches are only fetched as they are consumed.
+    """
+
+    def setUp(self) -> None:
+        self.rows   = [(i, f"session{i // 10}") for i in range(25)]
+        self.cursor = _FakeCursor(rows=self.rows)
+
+    def test_QueryBatches_batches(self):
+        _batches = list(MySQLInterface.QueryBatches(cursor=self.cursor, query="SELECT 1", params=("a",), batch_size=10))
+        self.assertEqual([len(batch) for batch in _batches], [10, 10, 5])
+        self.assertEqual([row for batch in _batches for row in batch], self.rows)
+        self.assertEqual(self.cursor.executed, ("SELECT 1", ("a",)))
+
+    def test_QueryBatches_lazy(self):
+        _batches = MySQLInterface.QueryBatches(cursor=self.cursor, query="SELECT 1", params=None, batch_size=10)
+        self.assertEqual(self.cursor.fetch_sizes, [])
+        next(_batches)
+        self.assertEqual(self.cursor.fetch_sizes, [10])
+
+if __name__ == '__main__':
+    unittest.main()
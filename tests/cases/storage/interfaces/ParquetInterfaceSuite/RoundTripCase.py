@@ -0,0 +1,184 @@
+# import libraries
+import json
+import logging
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime
+from pathlib import Path
+from unittest import TestCase
+# import 3rd-party libraries
+try:
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:
+    pq = None
+# import ogd libraries.
+from ogd.common.configs.DataTableConfig import DataTableConfig
+from ogd.common.configs.storage.FileStoreConfig import FileStoreConfig
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.filters.collections.DatasetFilterCollection import DatasetFilterCollection
+from ogd.common.filters.collections.EventFilterCollection import EventFilterCollection
+from ogd.common.filters.collections.IDFilterCollection import IDFilterCollection
+from ogd.common.filters.collections.SequencingFilterCollection import SequencingFilterCollection
+from ogd.common.filters.FilterMode import FilterMode
+from ogd.common.filters.RangeFilter import RangeFilter
+from ogd.common.filters.SetFilter import SetFilter
+from ogd.common.models.features.ExportMode import ExportMode
+from ogd.common.schemas.tables.EventTableSchema import EventTableSchema
+from ogd.common.storage.IDType import IDType
+from ogd.common.storage.interfaces.CSVInterface import CSVInterface
+from ogd.common.storage.interfaces.ParquetInterface import ParquetInterface
+from ogd.common.storage.outerfaces.ParquetOuterface import ParquetOuterface
+from ogd.common.storage.ShardType import ShardType
+from ogd.common.storage.VersionType import VersionType
+from ogd.common.utils.Logger import Logger
+# import locals
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="ParquetInterfaceTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class RoundTripCase(TestCase):
+    """ParquetInterface test case for events written by a ParquetOuterface.
+
+    Fixture:
+    * A small, generated event file in the OGD_EVENT_FILE format, with 3 sessions of 10, 10, and 5 events, read with a `CSVInterface`.
+    * The same events, written to a Parquet file by a `ParquetOuterface` with a row group size of 10, and read with a `ParquetInterface`.
+
+    Case Categories:
+    * File format
+        * Check the file has typed columns, dictionary-encoded text columns, and multiple row groups.
+        * Check values are converted for their columns, with None for values that do not fit the column type.
+    * Consistency
+        * Check that events read back match the events written, with and without filters.
+        * Check that a sharded request is read in one pass, in merged order.
+    * Metadata
+        * Check IDs, dates, and versions.
+    """
+
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _tsv_path = self.temp_dir / "TEST_events.tsv"
+        _columns = EventTableSchema.Load(schema_name="OGD_EVENT_FILE").ColumnNames
+        with open(_tsv_path, "w", encoding="utf-8") as _file:
+            _file.write("\t".join(_columns) + "\n")
+            for i in range(25):
+                _row = {
+                    "session_id"  : f"session{i // 10}",      "app_id"      : "TEST",
+                    "timestamp"   : f"2024-01-01T10:00:{i:02d}", "event_name" : "click" if i % 2 == 0 else "hover",
+                    "event_data"  : json.dumps({"i":i}),        "event_source": "GAME",
+                    "app_version" : "1" if i < 10 else "2",      "app_branch"  : "main",
+                    "log_version" : "1",                         "offset"      : "UTC+00:00",
+                    "user_id"     : f"Player{i // 20}",          "user_data"   : "{}",
+                    "game_state"  : "{}",                        "index"       : i % 10
+                }
+                _file.write("\t".join(str(_row[col]) for col in _columns) + "\n")
+        _tsv_cfg = FileStoreConfig(name="TSVFile", location=_tsv_path, file_credential=None)
+        _tsv_table = DataTableConfig(name="TSVTable", store=_tsv_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _tsv = CSVInterface(config=_tsv_table, fail_fast=True, extension="tsv")
+        self.events = _tsv.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        _tsv.Connector.Close()
+
+        _out_cfg = FileStoreConfig(name="OutFile", location=self.temp_dir / "TEST_dataset_events.parquet", file_credential=None)
+        _out_table = DataTableConfig(name="OutTable", store=_out_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        _outerface = ParquetOuterface(table_config=_out_table, export_modes={ExportMode.EVENTS}, row_group_size=10)
+        _outerface.WriteHeader(mode=ExportMode.EVENTS, header=_columns)
+        _outerface.WriteEvents(events=self.events, mode=ExportMode.EVENTS)
+        _outerface.Connector.Close()
+
+        self.path = self.temp_dir / "TEST_dataset_game-events.parquet"
+        _in_cfg = FileStoreConfig(name="InFile", location=self.path, file_credential=None)
+        _in_table = DataTableConfig(name="InTable", store=_in_cfg, table_schema="OGD_EVENT_FILE", table_location=None)
+        self.interface = ParquetInterface(config=_in_table, fail_fast=True)
+
+    def tearDown(self) -> None:
+        self.interface.Connector.Close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_FileFormat(self):
+        _file = pq.ParquetFile(self.path)
+        _schema = _file.schema_arrow
+        self.assertEqual(str(_schema.field("timestamp").type), "timestamp[us]")
+        self.assertEqual(str(_schema.field("index").type), "int64")
+        self.assertEqual(str(_schema.field("event_data").type), "string")
+        self.assertEqual(_file.metadata.num_rows, 25)
+        self.assertEqual(_file.metadata.num_row_groups, 3)
+        _session_col = _schema.names.index("session_id")
+        self.assertIn("RLE_DICTIONARY", _file.metadata.row_group(0).column(_session_col).encodings)
+
+    def test_Converters(self):
+        _toInt = ParquetOuterface._converter("int")
+        self.assertEqual(_toInt("3"), 3)
+        self.assertEqual(_toInt("3.0"), 3)
+        self.assertIsNone(_toInt("3.5"))
+        self.assertIsNone(_toInt("three"))
+        self.assertIsNone(_toInt(""))
+        _toFloat = ParquetOuterface._converter("float")
+        self.assertEqual(_toFloat("3.5"), 3.5)
+        self.assertIsNone(_toFloat("three"))
+        _toJSON = ParquetOuterface._converter("json")
+        self.assertEqual(_toJSON({"b":1, "a":datetime(2024, 1, 1)}), json.dumps({"b":1, "a":"2024-01-01 00:00:00"}))
+        self.assertEqual(_toJSON("{}"), "{}")
+
+    def test_MatchesWritten(self):
+        _read = self.interface.GetEventSet(filters=DatasetFilterCollection(), fallbacks={})
+        self.assertEqual(len(_read), 25)
+        for written, read in zip(self.events.Events, _read.Events):
+            self.assertEqual(read.SessionID, written.SessionID)
+            self.assertEqual(read.Timestamp, written.Timestamp)
+            self.assertEqual(read.EventData, written.EventData)
+            self.assertEqual(read.EventSequenceIndex, written.EventSequenceIndex)
+
+    def test_Filters(self):
+        _cases = [
+            (DatasetFilterCollection(id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1"}))),
+             list(range(10, 20))),
+            (DatasetFilterCollection(id_filters=IDFilterCollection(player_filter=SetFilter(mode=FilterMode.EXCLUDE, set_elements={"Player0"}))),
+             list(range(20, 25))),
+            (DatasetFilterCollection(event_filters=EventFilterCollection(event_name_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"hover"}))),
+             list(range(1, 25, 2))),
+            (DatasetFilterCollection(sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.INCLUDE, minimum=datetime(2024, 1, 1, 10, 0, 5), maximum=datetime(2024, 1, 1, 10, 0, 12))
+             )),
+             list(range(5, 13))),
+            (DatasetFilterCollection(sequence_filters=SequencingFilterCollection(
+                timestamp_filter=RangeFilter(mode=FilterMode.EXCLUDE, minimum=datetime(2024, 1, 1, 10, 0, 2), maximum=datetime(2024, 1, 1, 10, 0, 22))
+             )),
+             [0, 1, 23, 24]),
+        ]
+        for filters, expected in _cases:
+            with self.subTest(filters=filters):
+                _read = self.interface.GetEventSet(filters=filters, fallbacks={})
+                self.assertEqual([event.EventData["i"] for event in _read], expected)
+
+    def test_GetEventSet_sharded(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session0", "session1", "session2"}))
+        )
+        with mock.patch.object(ParquetInterface, "_shardInterface") as _shard_interface:
+            _sharded = self.interface.GetEventSet(filters=_filters, fallbacks={}, shard_by=ShardType.SESSION, shard_workers=3)
+        _shard_interface.assert_not_called()
+        self.assertEqual(len(_sharded), 25)
+        _keys = [(event.UserID, event.SessionID, event.EventSequenceIndex) for event in _sharded]
+        self.assertEqual(_keys, sorted(_keys))
+
+    def test_AvailableIDs(self):
+        self.assertEqual(self.interface._availableIDs(id_type=IDType.SESSION, filters=DatasetFilterCollection()), ["session0", "session1", "session2"])
+        self.assertEqual(self.interface._availableIDs(id_type=IDType.USER, filters=DatasetFilterCollection()), ["Player0", "Player1"])
+
+    def test_AvailableDates(self):
+        _filters = DatasetFilterCollection(
+            id_filters=IDFilterCollection(session_filter=SetFilter(mode=FilterMode.INCLUDE, set_elements={"session1"}))
+        )
+        _dates = self.interface._availableDates(filters=_filters)
+        self.assertEqual((_dates['min'], _dates['max']), (datetime(2024, 1, 1, 10, 0, 10), datetime(2024, 1, 1, 10, 0, 19)))
+
+    def test_AvailableVersions(self):
+        self.assertEqual([str(ver) for ver in self.interface._availableVersions(mode=VersionType.APP, filters=DatasetFilterCollection())], ["1", "2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""JSONCodec test suite.
+
+This class contains only static members, so we use a StaticCase.
+"""
+import json
+import unittest
+from unittest import TestCase
+# local import(s)
+from ogd.common.utils.JSONCodec import JSONCodec
+
+class JSONCodecCase(TestCase):
+    """JSONCodec test case, run once with each installed backend.
+
+    Case Categories:
+    * Decoding
+        * Check each backend gives the same values as `json.loads`, including for inputs some backends reject.
+        * Check invalid JSON raises the same error as `json.loads`.
+    * Encoding
+        * Check the encoded text is identical to `json.dumps`, for each combination of options.
+    """
+    PAYLOADS = [
+        '{"y": 2, "x": {"nested": [1, 2.5, null, true]}, "name": "caf\\u00e9"}',
+        '{"big": 123456789012345678901234567890, "nan": NaN}',
+        '[]',
+        '"text"',
+    ]
+
+    def tearDown(self) -> None:
+        JSONCodec.SetBackend(None)
+
+    def test_Loads(self):
+        for backend in JSONCodec.AvailableBackends():
+            JSONCodec.SetBackend(backend)
+            for payload in JSONCodecCase.PAYLOADS:
+                with self.subTest(backend=backend, payload=payload):
+                    # compare re-encoded text, so NaN compares equal to itself.
+                    self.assertEqual(json.dumps(JSONCodec.Loads(payload)), json.dumps(json.loads(payload)))
+            with self.subTest(backend=backend, payload="invalid"):
+                with self.assertRaises(json.JSONDecodeError):
+                    JSONCodec.Loads('{"unclosed": 1')
+
+    def test_Dumps(self):
+        _value = {"y": 2, "x": {"nested": [1, 2.5, None, True]}, "name": "café"}
+        for sort_keys in (False, True):
+            for indent in (None, 4):
+                with self.subTest(sort_keys=sort_keys, indent=indent):
+                    self.assertEqual(JSONCodec.Dumps(_value, sort_keys=sort_keys, indent=indent), json.dumps(_value, sort_keys=sort_keys, indent=indent))
+        self.assertEqual(JSONCodec.Dumps({"obj":object}, default=str), json.dumps({"obj":object}, default=str))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""RevisionProvider test suite.
+
+This class contains only static members, so we use a StaticCase.
+"""
+import os
+import unittest
+from unittest import TestCase, mock
+# local import(s)
+from ogd.common.utils.RevisionProvider import RevisionProvider
+
+class RevisionProviderCase(TestCase):
+    """RevisionProvider test case, resetting the provider around each test.
+
+    Case Categories:
+    * Overrides
+        * Check an explicit override wins over the environment, and the environment wins over git.
+    * Caching
+        * Check the git lookup only happens once per process.
+    """
+
+    def setUp(self) -> None:
+        RevisionProvider.Reset()
+
+    def tearDown(self) -> None:
+        RevisionProvider.Reset()
+
+    def test_Overrides(self):
+        with mock.patch.dict(os.environ, {RevisionProvider.ENV_VAR : "envrev1"}):
+            self.assertEqual(RevisionProvider.Current(), "envrev1")
+            RevisionProvider.SetOverride("cfgrev2")
+            self.assertEqual(RevisionProvider.Current(), "cfgrev2")
+            RevisionProvider.SetOverride(None)
+            self.assertEqual(RevisionProvider.Current(), "envrev1")
+
+    def test_Caching(self):
+        _env = {key:val for key, val in os.environ.items() if key != RevisionProvider.ENV_VAR}
+        with mock.patch.dict(os.environ, _env, clear=True), mock.patch.object(RevisionProvider, "_lookUp", return_value="abc1234") as _lookup:
+            self.assertEqual(RevisionProvider.Current(), "abc1234")
+            self.assertEqual(RevisionProvider.Current(), "abc1234")
+            self.assertEqual(_lookup.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
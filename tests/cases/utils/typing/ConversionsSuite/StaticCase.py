@@ -4,6 +4,8 @@ import logging
 import unittest
 from pathlib import Path
 from unittest import TestCase
+# import 3rd-party libraries
+import numpy as np
 # import ogd libraries.
 from ogd.common.configs.TestConfig import TestConfig
 from ogd.common.utils.Logger import Logger
@@ -30,6 +32,55 @@ class ConvertToTypeCase(TestCase):
     def test_null_values(self):
         pass
 
+class ConverterForCase(TestCase):
+    def test_null_values(self):
+        _convert = conversions.ConverterFor(to_type="int", name="ConverterVal")
+        for _val in [None, "None", "null", "NaN"]:
+            self.assertIsNone(_convert(_val))
+
+    def test_matches_ConvertToType(self):
+        _cases = [
+            ("str", 10), ("str", "foo"),
+            ("int", "10"), ("int", 10.4), ("int", 10),
+            ("float", "1.5"), ("float", 2),
+            ("bool", "yes"), ("bool", 0),
+            ("datetime", "2024-01-01T12:00:00"),
+            ("timezone", "UTC+02:00"), ("timezone", "UTC+02:00"),
+            ("json", '{"foo":"bar"}'), ("json", {"foo":"bar"}),
+            ("enum('GAME', 'GENERATED')", "GAME"),
+        ]
+        for _type, _val in _cases:
+            with self.subTest(to_type=_type, value=_val):
+                _convert = conversions.ConverterFor(to_type=_type, name="ConverterVal")
+                self.assertEqual(_convert(_val), conversions.ConvertToType(value=_val, to_type=_type, name="ConverterVal"))
+
+class ConvertColumnCase(TestCase):
+    def test_matches_ConverterFor(self):
+        _cases = [
+            ("int",      ["10", None, "NULL", 10, 10.4, "-3", "1.5", " 7"]),
+            ("float",    ["1.5", "nan", 2, " 3", "1e3", "abc"]),
+            ("bool",     ["yes", "No", "TRUE", "false", "", "other", 0, 1.0, True]),
+            ("str",      ["foo", 10, None, "None"]),
+            ("datetime", ["2024-01-01T12:00:00", "01/02/2025 12:34:56", "01/03/2025 00:00:00", None, datetime.datetime(2020, 1, 1)]),
+            ("date",     ["2024-01-01T12:00:00", "2025/01/02", "null"]),
+            ("json",     ['{"foo":"bar"}', {"foo":"bar"}, "None"]),
+        ]
+        for _type, _vals in _cases:
+            with self.subTest(to_type=_type):
+                _convert = conversions.ConverterFor(to_type=_type, name="ColumnVal")
+                self.assertEqual(conversions.ConvertColumn(values=_vals, to_type=_type, name="ColumnVal"), [_convert(_val) for _val in _vals])
+
+    def test_numpy_array(self):
+        _ints = conversions.ConvertColumn(values=np.array([1, 2, 3]), to_type="int")
+        self.assertEqual(_ints, [1, 2, 3])
+        self.assertTrue(all(type(_val) is int for _val in _ints))
+        self.assertEqual(conversions.ConvertColumn(values=np.array(["1.5", "NaN", "2"]), to_type="float"), [1.5, None, 2.0])
+
+    def test_column_converter_keeps_format(self):
+        _convert = conversions.ColumnConverterFor(to_type="datetime", name="ColumnVal")
+        self.assertEqual(_convert(["01/02/2025 12:34:56"]), [datetime.datetime(2025, 1, 2, 12, 34, 56)])
+        self.assertEqual(_convert(["01/03/2025 00:00:01", "01/04/2025 00:00:02"]), [datetime.datetime(2025, 1, 3, 0, 0, 1), datetime.datetime(2025, 1, 4, 0, 0, 2)])
+
 class ToBoolCase(TestCase):
     def test_normal_bool_true(self):
         _bool = conversions.ToBool(name="ParseBoolVal", value=True)
@@ -177,6 +228,34 @@ class ToDatetimeCase(TestCase):
         self.assertIsInstance(_dt, datetime.datetime)
         self.assertEqual(_dt, datetime.datetime(2025, 1, 2, 0, 0, 0, 0))
 
+class DatetimeParserCase(TestCase):
+    def test_iso_string(self):
+        _parser = conversions.time.DatetimeParser(name="ParserVal")
+        self.assertEqual(_parser.Parse("2025-01-02T12:34:56.789000"), datetime.datetime(2025, 1, 2, 12, 34, 56, 789000))
+        self.assertIsNone(_parser.Format)
+
+    def test_remembers_format(self):
+        _parser = conversions.time.DatetimeParser(name="ParserVal")
+        self.assertEqual(_parser.Parse("01/02/2025 12:34:56.789000"), datetime.datetime(2025, 1, 2, 12, 34, 56, 789000))
+        self.assertEqual(_parser.Format, "%m/%d/%Y %H:%M:%S.%f")
+        self.assertEqual(_parser.Parse("03/04/2025 01:02:03.000004"), datetime.datetime(2025, 3, 4, 1, 2, 3, 4))
+
+    def test_parse_many(self):
+        _parser = conversions.time.DatetimeParser(name="ParserVal")
+        _vals = ["2025/01/02 12:34:56", None, "null", datetime.datetime(2020, 1, 1), "2025/01/03 00:00:01", "2025-01-04", "not a time"]
+        _expected = [
+            datetime.datetime(2025, 1, 2, 12, 34, 56), None, None, datetime.datetime(2020, 1, 1),
+            datetime.datetime(2025, 1, 3, 0, 0, 1), datetime.datetime(2025, 1, 4), None
+        ]
+        _parsed = _parser.ParseMany(_vals)
+        self.assertEqual(_parsed, _expected)
+        self.assertTrue(all(_dt is None or type(_dt) is datetime.datetime for _dt in _parsed))
+
+    def test_parse_many_matches_parse(self):
+        _vals = [f"{month:02d}-{day:02d}-2024 {day:02d}:30:00.{day:06d}" for month in range(1, 13) for day in range(1, 29)]
+        _parsed = conversions.time.DatetimeParser(name="ParserVal").ParseMany(_vals)
+        self.assertEqual(_parsed, [conversions.time.ToDatetime(name="ToDatetimeVal", value=_val) for _val in _vals])
+
 class ToTimedeltaCase(TestCase):
     def test_normal_timedelta(self):
         _val = datetime.timedelta(hours=1)
@@ -0,0 +1,70 @@
+# import libraries
+import logging
+import pickle
+import unittest
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from src.ogd.common.utils.typing.LazyJSON import LazyJSON
+from config.t_config import settings
+
+def setUpModule():
+    _testing_cfg = TestConfig.FromDict(name="LazyJSONTestConfig", unparsed_elements=settings)
+    _level       = logging.DEBUG if _testing_cfg.Verbose else logging.INFO
+    Logger.std_logger.setLevel(_level)
+
+class BasicInitCase(TestCase):
+    """LazyJSON test case where a LazyJSON is initialized from a JSON object string.
+
+    Fixture:
+    * A fresh LazyJSON for each test, from a hardcoded string with unsorted keys.
+
+    Case Categories:
+    * Laziness
+        * Check the string is not parsed until the contents are needed, and the original string is passed through unparsed.
+    * Mapping behavior
+        * Check the object acts like the equivalent sorted dict, including its string form.
+    * Modification
+        * Check modifying the object stops the original string from being passed through.
+    * Bad inputs
+        * Check strings that are not JSON objects give an empty dict.
+    """
+
+    RAW = '{"y": 2, "x": {"nested": [1, 2]}}'
+
+    def setUp(self) -> None:
+        self.lazy = LazyJSON(raw=BasicInitCase.RAW, name="TestJSON")
+
+    def test_Lazy(self):
+        self.assertFalse(self.lazy.IsParsed)
+        self.assertEqual(self.lazy.JSON, BasicInitCase.RAW)
+        self.assertFalse(self.lazy.IsParsed)
+        _copy = pickle.loads(pickle.dumps(self.lazy))
+        self.assertFalse(_copy.IsParsed)
+        self.assertEqual(_copy.Raw, BasicInitCase.RAW)
+
+    def test_Mapping(self):
+        _expected = {"x": {"nested": [1, 2]}, "y": 2}
+        self.assertEqual(self.lazy["y"], 2)
+        self.assertTrue(self.lazy.IsParsed)
+        self.assertEqual(self.lazy, _expected)
+        self.assertEqual(_expected, self.lazy)
+        self.assertEqual(list(self.lazy.keys()), ["x", "y"])
+        self.assertEqual(str(self.lazy), str(_expected))
+        self.assertEqual(self.lazy.get("z", "default"), "default")
+        self.assertEqual(dict(self.lazy), _expected)
+
+    def test_Modification(self):
+        self.lazy["z"] = 3
+        self.assertIsNone(self.lazy.Raw)
+        self.assertEqual(self.lazy.JSON, '{"x": {"nested": [1, 2]}, "y": 2, "z": 3}')
+
+    def test_BadInputs(self):
+        self.assertEqual(LazyJSON(raw="{not json", name="TestJSON"), {})
+        self.assertEqual(LazyJSON(raw="[1, 2]", name="TestJSON"), {})
+        self.assertEqual(LazyJSON(raw="null", name="TestJSON"), {})
+
+if __name__ == '__main__':
+    unittest.main()